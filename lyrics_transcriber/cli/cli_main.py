@@ -79,6 +79,17 @@ def create_arg_parser() -> argparse.ArgumentParser:
         default=0,
         help="Offset subtitle timing by N milliseconds (positive or negative). Default: 0",
     )
+    output_group.add_argument(
+        "--review_port",
+        type=int,
+        default=8000,
+        help="Port for the review web server; 0 picks a free port, and a busy port falls back to a free one. Default: 8000",
+    )
+    output_group.add_argument(
+        "--compact_corrections_json",
+        action="store_true",
+        help="Write the corrections JSON in a compact, de-duplicated format which is smaller and faster to reload",
+    )
 
     # Feature control group
     feature_group = parser.add_argument_group("Feature Control")
@@ -89,9 +100,48 @@ def create_arg_parser() -> argparse.ArgumentParser:
     feature_group.add_argument("--skip_lrc", action="store_true", help="Skip generating LRC file")
     feature_group.add_argument("--skip_cdg", action="store_true", help="Skip generating CDG karaoke files")
     feature_group.add_argument("--skip_video", action="store_true", help="Skip rendering karaoke video")
+    feature_group.add_argument(
+        "--skip_stage_cache", action="store_true", help="Recompute every pipeline stage instead of reusing cached stage results"
+    )
     feature_group.add_argument(
         "--video_resolution", choices=["4k", "1080p", "720p", "360p"], default="360p", help="Resolution of the karaoke video. Default: 360p"
     )
+    feature_group.add_argument(
+        "--video_audio_policy",
+        choices=["auto", "encode"],
+        default="auto",
+        help="auto: copy the input audio into videos when possible instead of re-encoding it; encode: always re-encode. Default: auto",
+    )
+    feature_group.add_argument(
+        "--segment_resize_mode",
+        choices=["characters", "width"],
+        default="characters",
+        help="Split long lyric lines by character count, or by their rendered width in the karaoke font. Default: characters",
+    )
+    feature_group.add_argument(
+        "--video_stall_timeout",
+        type=float,
+        default=300.0,
+        help="Kill a video encode whose progress stalls for this many seconds (0 to never kill). Default: 300",
+    )
+    feature_group.add_argument(
+        "--skip_static_fast_path",
+        action="store_true",
+        help="Render instrumental breaks and other spans with unchanging subtitles at full cost like the rest of the video",
+    )
+    feature_group.add_argument(
+        "--video_render_chunks",
+        type=int,
+        default=1,
+        help="Render the karaoke video in N parts encoded in parallel, then join them losslessly. Default: 1",
+    )
+    feature_group.add_argument(
+        "--video_extra_resolutions",
+        nargs="+",
+        choices=["4k", "1080p", "720p", "360p"],
+        default=[],
+        help="Also render the karaoke video at these resolutions, in the same FFmpeg run as the main video",
+    )
 
     return parser
 
@@ -156,7 +206,14 @@ def create_configs(args: argparse.Namespace, env_config: Dict[str, str]) -> tupl
         output_dir=str(args.output_dir) if args.output_dir else os.getcwd(),
         cache_dir=str(args.cache_dir),
         video_resolution=args.video_resolution,
+        video_render_chunks=args.video_render_chunks,
+        video_audio_policy=args.video_audio_policy,
+        video_stall_timeout=args.video_stall_timeout,
+        segment_resize_mode=args.segment_resize_mode,
+        video_static_fast_path=not args.skip_static_fast_path,
+        video_extra_resolutions=args.video_extra_resolutions,
         subtitle_offset_ms=args.subtitle_offset,
+        compact_corrections_json=args.compact_corrections_json,
         fetch_lyrics=not args.skip_lyrics_fetch,
         run_transcription=not args.skip_transcription,
         run_correction=not args.skip_correction,
@@ -164,6 +221,8 @@ def create_configs(args: argparse.Namespace, env_config: Dict[str, str]) -> tupl
         generate_lrc=not args.skip_lrc,
         generate_cdg=not args.skip_cdg,
         render_video=not args.skip_video,
+        stage_cache_enabled=not args.skip_stage_cache,
+        review_server_port=args.review_port,
     )
 
     return transcriber_config, lyrics_config, output_config
@@ -1,6 +1,6 @@
 import os
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 
 @dataclass
@@ -27,6 +27,8 @@ class OutputConfig:
 
     output_styles_json: str
     default_max_line_length: int = 36
+    # "characters" splits long lyric lines by character count; "width" by their rendered width in the karaoke font
+    segment_resize_mode: str = "characters"
     styles: Dict[str, Any] = field(default_factory=dict)
     output_dir: Optional[str] = os.getcwd()
     cache_dir: str = os.getenv(
@@ -44,4 +46,29 @@ class OutputConfig:
     generate_cdg: bool = True
     render_video: bool = True
     video_resolution: str = "360p"
+    # Split the final video render into this many parts, cut at screen boundaries and encoded in parallel
+    video_render_chunks: int = 1
+    # Encode spans whose subtitles don't change (e.g. instrumental breaks) cheaply as separate segments
+    video_static_fast_path: bool = True
+    # Further resolutions of the final video, rendered in the same FFmpeg run (drawing the subtitles only once)
+    video_extra_resolutions: List[str] = field(default_factory=list)
+    # "auto" copies the input audio into the video when the container accepts its codec, otherwise encodes it
+    # once to a cached file shared by all outputs; "encode" re-encodes the audio in every render
+    video_audio_policy: str = "auto"
+    # Kill a video encode whose FFmpeg output hasn't advanced for this many seconds (None or 0 never kills)
+    video_stall_timeout: Optional[float] = 300.0
     subtitle_offset_ms: int = 0
+    # Write the corrections JSON in the compact, de-duplicated format (loaders accept both formats)
+    compact_corrections_json: bool = False
+
+    # Content-addressed cache of per-stage results, stored under cache_dir/stage_cache
+    stage_cache_enabled: bool = True
+    stage_cache_backend: str = "local"  # "local" or "object" (local-disk stand-in for an object store)
+    stage_cache_max_size_mb: int = 5120
+
+    # Rendered review preview videos, stored under cache_dir/previews; least recently used are evicted past this size
+    preview_cache_max_size_mb: int = 1024
+
+    # Address of the review server; port 0 picks a free port, and a busy port falls back to a free one
+    review_server_host: str = "127.0.0.1"
+    review_server_port: int = 8000
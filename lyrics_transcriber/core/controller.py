@@ -3,7 +3,7 @@ import logging
 import json
 from dataclasses import dataclass, field
 from typing import Dict, Optional, List
-from lyrics_transcriber.types import LyricsData, TranscriptionResult, CorrectionResult
+from lyrics_transcriber.types import LyricsData, TranscriptionData, TranscriptionResult, CorrectionResult
 from lyrics_transcriber.transcribers.base_transcriber import BaseTranscriber
 from lyrics_transcriber.transcribers.audioshake import AudioShakeTranscriber, AudioShakeConfig
 from lyrics_transcriber.transcribers.whisper import WhisperTranscriber, WhisperConfig
@@ -14,6 +14,9 @@ from lyrics_transcriber.lyrics.musixmatch import MusixmatchProvider
 from lyrics_transcriber.output.generator import OutputGenerator
 from lyrics_transcriber.correction.corrector import LyricsCorrector
 from lyrics_transcriber.core.config import TranscriberConfig, LyricsConfig, OutputConfig
+from lyrics_transcriber.core.stage_cache import StageCache
+from lyrics_transcriber.utils import serialization
+from lyrics_transcriber.utils.audio_fingerprint import AudioFingerprint
 from lyrics_transcriber.lyrics.file_provider import FileProvider
 
 
@@ -32,6 +35,7 @@ class LyricsControllerResult:
     lrc_filepath: Optional[str] = None
     ass_filepath: Optional[str] = None
     video_filepath: Optional[str] = None
+    video_audio: Optional[Dict[str, str]] = None  # How the video's audio was produced: {"mode": ..., "codec": ...}
     mp3_filepath: Optional[str] = None
     cdg_filepath: Optional[str] = None
     cdg_zip_filepath: Optional[str] = None
@@ -61,6 +65,7 @@ class LyricsTranscriber:
         lyrics_providers: Optional[Dict[str, BaseLyricsProvider]] = None,
         corrector: Optional[LyricsCorrector] = None,
         output_generator: Optional[OutputGenerator] = None,
+        stage_cache: Optional[StageCache] = None,
         logger: Optional[logging.Logger] = None,
         log_level: int = logging.DEBUG,
         log_formatter: Optional[logging.Formatter] = None,
@@ -113,9 +118,12 @@ class LyricsTranscriber:
         self._load_styles()
 
         # Initialize components (with dependency injection)
+        self.stage_cache = stage_cache or StageCache.from_config(self.output_config, logger=self.logger)
         self.transcribers = transcribers or self._initialize_transcribers()
         self.lyrics_providers = lyrics_providers or self._initialize_lyrics_providers()
-        self.corrector = corrector or LyricsCorrector(cache_dir=self.output_config.cache_dir, logger=self.logger)
+        self.corrector = corrector or LyricsCorrector(
+            cache_dir=self.output_config.cache_dir, stage_cache=self.stage_cache, logger=self.logger
+        )
         self.output_generator = output_generator or self._initialize_output_generator()
 
         # Log enabled features
@@ -219,6 +227,7 @@ class LyricsTranscriber:
             cache_dir=self.output_config.cache_dir,
             audio_filepath=self.audio_filepath,
             max_line_length=max_line_length,
+            use_lookup_index=True,
         )
 
         if provider_config.lyrics_file and os.path.exists(provider_config.lyrics_file):
@@ -248,7 +257,13 @@ class LyricsTranscriber:
 
     def _initialize_output_generator(self) -> OutputGenerator:
         """Initialize output generation service."""
-        return OutputGenerator(config=self.output_config, logger=self.logger)
+        return OutputGenerator(config=self.output_config, logger=self.logger, stage_cache=self.stage_cache)
+
+    def _get_audio_hash(self) -> Optional[str]:
+        """Fingerprint the input audio for use in stage cache keys."""
+        if not self.audio_filepath or not os.path.isfile(self.audio_filepath):
+            return None
+        return AudioFingerprint.md5(self.audio_filepath, cache_dir=self.output_config.cache_dir, logger=self.logger)
 
     def process(self) -> LyricsControllerResult:
         """Main processing method that orchestrates the entire workflow."""
@@ -290,10 +305,9 @@ class LyricsTranscriber:
         if os.path.exists(corrections_json_path):
             self.logger.info(f"Found existing corrections JSON: {corrections_json_path}")
             try:
-                with open(corrections_json_path, "r", encoding="utf-8") as f:
-                    corrections_data = json.load(f)
+                corrections_data = serialization.load_file(corrections_json_path)
 
-                # Reconstruct CorrectionResult from JSON
+                # Reconstruct CorrectionResult from JSON (verbose or compact format)
                 self.results.transcription_corrected = CorrectionResult.from_dict(corrections_data)
                 self.logger.info("Successfully loaded existing corrections data")
 
@@ -330,6 +344,8 @@ class LyricsTranscriber:
         else:
             self.logger.warning("No corrected transcription or lyrics available. Skipping output generation.")
 
+        self.stage_cache.log_stats()
+        self.stage_cache.flush()
         self.logger.info("Processing completed successfully")
         return self.results
 
@@ -339,7 +355,13 @@ class LyricsTranscriber:
 
         for name, provider in self.lyrics_providers.items():
             try:
-                result = provider.fetch_lyrics(self.artist, self.title)
+                cache_key = StageCache.make_key("fetch", name, self.artist, self.title, provider.get_cache_inputs())
+                result = self.stage_cache.get_or_compute(
+                    cache_key,
+                    lambda: provider.fetch_lyrics(self.artist, self.title),
+                    encode=lambda lyrics: lyrics.to_dict(),
+                    decode=LyricsData.from_dict,
+                )
                 if result:
                     self.results.lyrics_results[name] = result
                     self.logger.info(f"Successfully fetched lyrics from {name}")
@@ -357,7 +379,13 @@ class LyricsTranscriber:
 
         for name, transcriber_info in self.transcribers.items():
             self.logger.info(f"Running transcription with {name}")
-            result = transcriber_info["instance"].transcribe(self.audio_filepath)
+            cache_key = StageCache.make_key("transcribe", name, self._get_audio_hash(), transcriber_info["instance"].get_cache_inputs())
+            result = self.stage_cache.get_or_compute(
+                cache_key,
+                lambda: transcriber_info["instance"].transcribe(self.audio_filepath),
+                encode=lambda transcription: transcription.to_compact_dict(),
+                decode=TranscriptionData.from_dict,
+            )
             if result:
                 # Add the transcriber name and priority to the result
                 self.results.transcription_results.append(
@@ -372,6 +400,8 @@ class LyricsTranscriber:
         """Run lyrics correction using transcription and internet lyrics."""
         self.logger.info("Starting lyrics correction process")
 
+        corrector = None
+
         # Check if we have reference lyrics to work with
         if not self.results.lyrics_results:
             self.logger.warning("No reference lyrics available for correction - using raw transcription")
@@ -421,7 +451,12 @@ class LyricsTranscriber:
             enabled_handlers = metadata.get("enabled_handlers", None)
 
             # Create corrector with enabled handlers
-            corrector = LyricsCorrector(cache_dir=self.output_config.cache_dir, enabled_handlers=enabled_handlers, logger=self.logger)
+            corrector = LyricsCorrector(
+                cache_dir=self.output_config.cache_dir,
+                enabled_handlers=enabled_handlers,
+                stage_cache=self.stage_cache,
+                logger=self.logger,
+            )
 
             corrected_data = corrector.run(
                 transcription_results=self.results.transcription_results,
@@ -445,6 +480,7 @@ class LyricsTranscriber:
                 output_config=self.output_config,
                 audio_filepath=self.audio_filepath,
                 logger=self.logger,
+                corrector=corrector,
             )
             reviewed_data = review_server.start()
 
@@ -471,6 +507,7 @@ class LyricsTranscriber:
         self.results.lrc_filepath = output_files.lrc
         self.results.ass_filepath = output_files.ass
         self.results.video_filepath = output_files.video
+        self.results.video_audio = output_files.video_audio
         self.results.original_txt = output_files.original_txt
         self.results.corrected_txt = output_files.corrected_txt
         self.results.corrections_json = output_files.corrections_json
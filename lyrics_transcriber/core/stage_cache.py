@@ -0,0 +1,523 @@
+import atexit
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+from lyrics_transcriber.utils import serialization
+
+
+# Stages of the pipeline that can be served from the stage cache
+PIPELINE_STAGES = ("transcribe", "fetch", "anchors", "gaps", "corrections", "resize", "ass", "cdg", "video")
+
+# Caches with unsaved LRU updates, flushed when the process exits
+_open_caches: "weakref.WeakSet[StageCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_caches() -> None:
+    for cache in list(_open_caches):
+        cache.flush()
+
+
+class StageCacheStorage(ABC):
+    """Storage backend for stage cache entries.
+
+    Keys are of the form "<stage>/<digest>". Backends only need to map keys to
+    files on local disk; the stage cache handles hashing, accounting and eviction.
+    """
+
+    @abstractmethod
+    def path_for(self, key: str) -> Path:
+        """Return the local path where the entry for a key is stored."""
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def index_path(self) -> Path:
+        """Return the path of the JSON index used for LRU bookkeeping."""
+        pass  # pragma: no cover
+
+    def exists(self, key: str) -> bool:
+        """Check if an entry exists for a key."""
+        return self.path_for(key).is_file()
+
+    def read_bytes(self, key: str) -> Optional[bytes]:
+        """Read an entry as bytes, or None if it doesn't exist."""
+        try:
+            return self.path_for(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def write_bytes(self, key: str, data: bytes) -> int:
+        """Atomically write an entry and return its size in bytes."""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp_")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return len(data)
+
+    def write_file(self, key: str, src_path: str, link: bool = False) -> int:
+        """Atomically copy (or hard-link, if link is set) a file into storage and return its size in bytes."""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp_")
+        os.close(fd)
+        try:
+            self._link_or_copy(src_path, temp_path, link)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return path.stat().st_size
+
+    def read_file(self, key: str, dest_path: str, link: bool = False) -> bool:
+        """Copy (or hard-link, if link is set) an entry out of storage to dest_path. Returns False if it doesn't exist."""
+        path = self.path_for(key)
+        if not path.is_file():
+            return False
+        dest_dir = os.path.dirname(os.path.abspath(dest_path))
+        os.makedirs(dest_dir, exist_ok=True)
+        if not link:
+            shutil.copyfile(path, dest_path)
+            return True
+        # Replace dest_path rather than writing into it, since it may itself be linked to another entry
+        fd, temp_path = tempfile.mkstemp(dir=dest_dir, prefix=".tmp_")
+        os.close(fd)
+        try:
+            self._link_or_copy(str(path), temp_path, link)
+            os.replace(temp_path, dest_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return True
+
+    @staticmethod
+    def _link_or_copy(src_path: str, dest_path: str, link: bool) -> None:
+        """Hard-link src_path to dest_path if asked to, copying when linking isn't possible (e.g. across filesystems)."""
+        if link:
+            os.remove(dest_path)
+            try:
+                os.link(src_path, dest_path)
+                return
+            except OSError:
+                pass
+        shutil.copyfile(src_path, dest_path)
+
+    def delete(self, key: str) -> None:
+        """Delete an entry if it exists."""
+        try:
+            self.path_for(key).unlink()
+        except FileNotFoundError:
+            pass
+
+
+class LocalDirectoryStorage(StageCacheStorage):
+    """Stores entries as plain files in a local directory, one subdirectory per stage."""
+
+    def __init__(self, root_dir: Union[str, Path]):
+        self.root_dir = Path(root_dir)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, key: str) -> Path:
+        stage, digest = key.split("/", 1)
+        return self.root_dir / stage / digest
+
+    def index_path(self) -> Path:
+        return self.root_dir / "index.json"
+
+
+class ObjectStoreStorage(StageCacheStorage):
+    """Local-disk stand-in for an object store bucket.
+
+    Objects are laid out as <root>/<bucket>/<stage>/<xx>/<digest>, mirroring the
+    sharded prefix layout we'd use in a real bucket, so the cache can be pointed
+    at a synced/mounted bucket directory without changes.
+    """
+
+    def __init__(self, root_dir: Union[str, Path], bucket: str = "lyrics-transcriber"):
+        self.root_dir = Path(root_dir)
+        self.bucket = bucket
+        (self.root_dir / self.bucket).mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, key: str) -> Path:
+        stage, digest = key.split("/", 1)
+        return self.root_dir / self.bucket / stage / digest[:2] / digest
+
+    def index_path(self) -> Path:
+        return self.root_dir / self.bucket / "_index.json"
+
+
+@dataclass
+class StageStats:
+    """Hit/miss counters for a single pipeline stage."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+@dataclass
+class CacheStats:
+    """Aggregated stage cache statistics."""
+
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    total_bytes: int = 0
+    entry_count: int = 0
+
+    def for_stage(self, stage: str) -> StageStats:
+        if stage not in self.stages:
+            self.stages[stage] = StageStats()
+        return self.stages[stage]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stages": {stage: stats.to_dict() for stage, stats in self.stages.items()},
+            "total_bytes": self.total_bytes,
+            "entry_count": self.entry_count,
+        }
+
+
+class StageCache:
+    """Content-addressed cache for pipeline stage results.
+
+    Every stage result is keyed by a hash of the stage name, its inputs and the
+    config that affects it, so a re-run only recomputes stages whose inputs changed.
+    Values are either JSON-serializable data or file artifacts (ASS, CDG, video).
+    Total size is bounded, with least-recently-used entries evicted first.
+    """
+
+    # Hits only bump an entry's last access time, so the index is rewritten for them at most this often
+    INDEX_SAVE_INTERVAL = 30.0
+
+    def __init__(
+        self,
+        storage: StageCacheStorage,
+        max_size_bytes: int = 5 * 1024**3,
+        enabled: bool = True,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.storage = storage
+        self.max_size_bytes = max_size_bytes
+        self.enabled = enabled
+        self.logger = logger or logging.getLogger(__name__)
+        self.stats = CacheStats()
+        self._lock = threading.RLock()
+        self._index: Dict[str, Dict[str, Any]] = self._load_index()
+        self._index_dirty = False
+        self._index_saved_at = time.monotonic()
+        self._refresh_totals()
+        _open_caches.add(self)
+
+    @classmethod
+    def from_config(cls, config: Any, logger: Optional[logging.Logger] = None) -> "StageCache":
+        """Create a stage cache from an OutputConfig."""
+        root_dir = os.path.join(config.cache_dir, "stage_cache")
+        backend = getattr(config, "stage_cache_backend", "local")
+        if backend == "object":
+            storage = ObjectStoreStorage(root_dir)
+        elif backend == "local":
+            storage = LocalDirectoryStorage(root_dir)
+        else:
+            raise ValueError(f"Unknown stage cache backend: {backend}. Must be one of: local, object")
+
+        return cls(
+            storage=storage,
+            max_size_bytes=int(getattr(config, "stage_cache_max_size_mb", 5120)) * 1024 * 1024,
+            enabled=getattr(config, "stage_cache_enabled", True),
+            logger=logger,
+        )
+
+    # Keys
+
+    @staticmethod
+    def make_key(stage: str, *inputs: Any) -> str:
+        """Compute a content-addressed key from a stage name and its inputs/config.
+
+        Inputs must be JSON-serializable (dicts are hashed with sorted keys).
+        """
+        hasher = hashlib.sha256()
+        hasher.update(stage.encode("utf-8"))
+        for value in inputs:
+            hasher.update(b"\x00")
+            hasher.update(json.dumps(value, sort_keys=True, default=str, separators=(",", ":")).encode("utf-8"))
+        return f"{stage}/{hasher.hexdigest()}"
+
+    # Data entries
+
+    def get(self, key: str) -> Optional[Any]:
+        """Load a JSON value for a key, or None on a miss."""
+        stage = self._stage_of(key)
+        if not self.enabled:
+            return None
+        data = self.storage.read_bytes(key)
+        if data is None:
+            self._record_miss(stage, key)
+            return None
+        try:
+            value = serialization.loads(data)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Stage cache entry {key} is corrupted, discarding: {e}")
+            self.invalidate(key)
+            self._record_miss(stage, key)
+            return None
+        self._record_hit(stage, key)
+        return value
+
+    def put(self, key: str, value: Any) -> bool:
+        """Store a JSON-serializable value. Returns False if the value couldn't be cached."""
+        stage = self._stage_of(key)
+        if not self.enabled:
+            return False
+        try:
+            data = serialization.dumps(value)
+            size = self.storage.write_bytes(key, data)
+        except (TypeError, ValueError, OSError) as e:
+            self.logger.warning(f"Failed to write stage cache entry for {stage}: {e}")
+            with self._lock:
+                self.stats.for_stage(stage).errors += 1
+            return False
+        self._record_write(stage, key, size)
+        return True
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        encode: Callable[[Any], Any] = lambda value: value,
+        decode: Callable[[Any], Any] = lambda value: value,
+    ) -> Any:
+        """Return the decoded cached value for key, computing and storing it on a miss."""
+        cached = self.get(key)
+        if cached is not None:
+            try:
+                return decode(cached)
+            except Exception as e:
+                self.logger.warning(f"Failed to decode stage cache entry {key}, recomputing: {e}")
+                self.invalidate(key)
+
+        value = compute()
+        if value is not None:
+            try:
+                encoded = encode(value)
+            except Exception as e:
+                self.logger.warning(f"Failed to encode {self._stage_of(key)} result for stage cache: {e}")
+            else:
+                self.put(key, encoded)
+        return value
+
+    # File artifacts
+
+    def get_file(self, key: str, dest_path: str, link: bool = False) -> bool:
+        """Restore a cached file artifact to dest_path. Returns True on a hit.
+
+        With link, dest_path is hard-linked to the entry instead of copied where the filesystem allows
+        it, so it must be replaced rather than rewritten in place (see detach_file).
+        """
+        stage = self._stage_of(key)
+        if not self.enabled:
+            return False
+        try:
+            found = self.storage.read_file(key, dest_path, link=link)
+        except OSError as e:
+            self.logger.warning(f"Failed to restore stage cache artifact {key}: {e}")
+            found = False
+        if found:
+            self._record_hit(stage, key)
+        else:
+            self._record_miss(stage, key)
+        return found
+
+    def put_file(self, key: str, src_path: str, link: bool = False) -> bool:
+        """Store a file artifact. Returns False if it couldn't be cached.
+
+        With link, the entry is hard-linked to src_path instead of copied where the filesystem allows
+        it, which avoids writing large artifacts (videos) twice.
+        """
+        stage = self._stage_of(key)
+        if not self.enabled or not src_path or not os.path.isfile(src_path):
+            return False
+        if os.path.getsize(src_path) > self.max_size_bytes:
+            self.logger.debug(f"Not caching {stage} artifact larger than the stage cache limit: {src_path}")
+            return False
+        try:
+            size = self.storage.write_file(key, src_path, link=link)
+        except OSError as e:
+            self.logger.warning(f"Failed to write stage cache artifact for {stage}: {e}")
+            with self._lock:
+                self.stats.for_stage(stage).errors += 1
+            return False
+        self._record_write(stage, key, size)
+        return True
+
+    @staticmethod
+    def detach_file(path: str) -> None:
+        """Remove a file that shares its data with a linked cache entry, before it is written again.
+
+        Writers like FFmpeg truncate an existing output file in place, which would also overwrite the
+        cache entry it's linked to. Unlinking it first gives the new output a file of its own.
+        """
+        try:
+            if os.stat(path).st_nlink > 1:
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    # Maintenance
+
+    def invalidate(self, key: str) -> None:
+        """Remove an entry from the cache."""
+        with self._lock:
+            self.storage.delete(key)
+            self._index.pop(key, None)
+            self._refresh_totals()
+            self._save_index()
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            for key in list(self._index):
+                self.storage.delete(key)
+            self._index = {}
+            self._refresh_totals()
+            self._save_index()
+
+    def iter_entries(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate over (key, metadata) pairs for all tracked entries."""
+        with self._lock:
+            return iter(list(self._index.items()))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss statistics as a dictionary."""
+        with self._lock:
+            return self.stats.to_dict()
+
+    def log_stats(self) -> None:
+        """Log a one-line summary per stage."""
+        with self._lock:
+            for stage, stats in sorted(self.stats.stages.items()):
+                self.logger.info(
+                    f"Stage cache [{stage}]: {stats.hits} hits, {stats.misses} misses, "
+                    f"{stats.writes} writes, {stats.evictions} evictions"
+                )
+            self.logger.info(f"Stage cache size: {self.stats.total_bytes / (1024 * 1024):.1f} MB in {self.stats.entry_count} entries")
+
+    def flush(self) -> None:
+        """Save access times recorded by cache hits that haven't been written to the index yet."""
+        with self._lock:
+            if self._index_dirty:
+                self._save_index()
+
+    # Internal helpers
+
+    @staticmethod
+    def _stage_of(key: str) -> str:
+        return key.split("/", 1)[0]
+
+    def _record_hit(self, stage: str, key: str) -> None:
+        self.logger.debug(f"Stage cache hit for {stage}: {key}")
+        with self._lock:
+            self.stats.for_stage(stage).hits += 1
+            entry = self._index.get(key)
+            if entry is None:
+                # Entry written by another process; start tracking it
+                entry = {"size": self._entry_size(key)}
+                self._index[key] = entry
+                self._refresh_totals()
+            entry["last_access"] = time.time()
+            self._index_dirty = True
+            if time.monotonic() - self._index_saved_at >= self.INDEX_SAVE_INTERVAL:
+                self._save_index()
+
+    def _record_miss(self, stage: str, key: str) -> None:
+        self.logger.debug(f"Stage cache miss for {stage}: {key}")
+        with self._lock:
+            self.stats.for_stage(stage).misses += 1
+
+    def _record_write(self, stage: str, key: str, size: int) -> None:
+        with self._lock:
+            self.stats.for_stage(stage).writes += 1
+            self._index[key] = {"size": size, "last_access": time.time()}
+            self._refresh_totals()
+            self._evict_if_needed(protect=key)
+            self._save_index()
+
+    def _entry_size(self, key: str) -> int:
+        try:
+            return self.storage.path_for(key).stat().st_size
+        except OSError:
+            return 0
+
+    def _refresh_totals(self) -> None:
+        self.stats.total_bytes = sum(entry.get("size", 0) for entry in self._index.values())
+        self.stats.entry_count = len(self._index)
+
+    def _evict_if_needed(self, protect: Optional[str] = None) -> None:
+        """Evict least-recently-used entries until the cache fits within max_size_bytes."""
+        if self.stats.total_bytes <= self.max_size_bytes:
+            return
+
+        for key, entry in sorted(self._index.items(), key=lambda item: item[1].get("last_access", 0)):
+            if self.stats.total_bytes <= self.max_size_bytes:
+                break
+            if key == protect:
+                continue
+            self.storage.delete(key)
+            del self._index[key]
+            self.stats.total_bytes -= entry.get("size", 0)
+            self.stats.entry_count -= 1
+            self.stats.for_stage(self._stage_of(key)).evictions += 1
+            self.logger.debug(f"Evicted stage cache entry: {key}")
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        index_path = self.storage.index_path()
+        try:
+            with open(index_path, "r") as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, OSError) as e:
+            self.logger.warning(f"Stage cache index {index_path} is unreadable, starting fresh: {e}")
+            return {}
+        # Drop entries whose files were removed behind our back
+        return {key: entry for key, entry in index.items() if self.storage.exists(key)}
+
+    def _save_index(self) -> None:
+        index_path = self.storage.index_path()
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = index_path.with_name(f".{index_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(temp_path, "w") as f:
+                json.dump(self._index, f)
+            os.replace(temp_path, index_path)
+            self._index_dirty = False
+            self._index_saved_at = time.monotonic()
+        except OSError as e:
+            self.logger.warning(f"Failed to save stage cache index: {e}")
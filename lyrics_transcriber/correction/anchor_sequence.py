@@ -13,6 +13,7 @@ from lyrics_transcriber.types import LyricsData, PhraseScore, PhraseType, Anchor
 from lyrics_transcriber.correction.phrase_analyzer import PhraseAnalyzer
 from lyrics_transcriber.correction.text_utils import clean_text
 from lyrics_transcriber.utils.word_utils import WordUtils
+from lyrics_transcriber.utils import serialization
 
 
 class AnchorSequenceTimeoutError(Exception):
@@ -41,6 +42,7 @@ class AnchorSequenceFinder:
         self.logger = logger or logging.getLogger(__name__)
         self.phrase_analyzer = PhraseAnalyzer(logger=self.logger)
         self.used_positions = {}
+        self._anchor_index: Optional[Tuple[str, Dict[str, Any]]] = None  # (index key, index) most recently used
 
         # Initialize cache directory
         self.cache_dir = Path(cache_dir)
@@ -140,15 +142,13 @@ class AnchorSequenceFinder:
         self.logger.debug(f"Saving to cache: {cache_path}")
         # Convert to dictionary format that matches the expected loading format
         cache_data = [{"anchor": anchor.anchor.to_dict(), "phrase_score": anchor.phrase_score.to_dict()} for anchor in anchors]
-        with open(cache_path, "w") as f:
-            json.dump(cache_data, f, indent=2)
+        serialization.dump_file(cache_data, cache_path)
 
     def _load_from_cache(self, cache_path: Path) -> Optional[List[ScoredAnchor]]:
         """Load results from cache if available."""
         try:
             self.logger.debug(f"Attempting to load from cache: {cache_path}")
-            with open(cache_path, "r") as f:
-                cached_data = json.load(f)
+            cached_data = serialization.load_file(cache_path)
 
             self.logger.info("Loading anchors from cache")
             try:
@@ -184,6 +184,202 @@ class AnchorSequenceFinder:
             self.logger.error(f"Unexpected error loading cache: {type(e).__name__}: {e}")
             return None
 
+    def _get_index_key(self, transcribed: str, transcription_result: TranscriptionResult) -> str:
+        """Generate the key of the match index, which depends on the transcription only."""
+        trans_words_with_ids = [f"{w.text}:{w.id}" for s in transcription_result.result.segments for w in s.words]
+        input_str = f"{transcribed}|" f"{','.join(trans_words_with_ids)}|" f"{self.min_sequence_length}"
+        return hashlib.md5(input_str.encode()).hexdigest()
+
+    @staticmethod
+    def _get_source_fingerprint(lyrics: LyricsData) -> str:
+        """Identify a reference source by its words, independent of the name it was added under."""
+        words_with_ids = [f"{w.text}:{w.id}" for s in lyrics.segments for w in s.words]
+        return hashlib.md5(",".join(words_with_ids).encode()).hexdigest()
+
+    def _can_use_index(self) -> bool:
+        """Whether a full search records every source's matches, so they can be indexed per source.
+
+        That holds when a single matching source is enough to create an anchor (the default); otherwise
+        matches in too few sources are discarded. The one-match-per-iteration mode used with very low
+        iteration limits may also stop before all matches are found.
+        """
+        return self.min_sources <= 1 and self.max_iterations_per_ngram > 10
+
+    def _load_anchor_index(self, index_key: str) -> Optional[Dict[str, Any]]:
+        """Load the match index for a transcription, from memory if it was used last, else from the cache dir.
+
+        The index holds, per source fingerprint, the n-gram lengths searched and the matches found for each
+        ({n: {transcription position: reference position}}), plus the phrase score of every candidate anchor
+        keyed by (n, transcription position).
+        """
+        if self._anchor_index and self._anchor_index[0] == index_key:
+            return self._anchor_index[1]
+
+        try:
+            data = serialization.load_file(self.cache_dir / f"anchor_index_{index_key}.json")
+            index = {
+                "sources": {
+                    fingerprint: {
+                        "lengths": set(source["lengths"]),
+                        "matches": {int(n): dict(pairs) for n, pairs in source["matches"].items()},
+                    }
+                    for fingerprint, source in data["sources"].items()
+                },
+                "scores": {(n, pos): PhraseScore.from_dict(score) for n, pos, score in data["scores"]},
+            }
+        except FileNotFoundError:
+            return None
+        except (KeyError, TypeError, ValueError) as e:
+            self.logger.debug(f"Ignoring invalid anchor index: {e}")
+            return None
+
+        self._anchor_index = (index_key, index)
+        return index
+
+    def _save_anchor_index(self, index_key: str, index: Dict[str, Any]) -> None:
+        """Keep the index in memory and write it to the cache dir."""
+        self._anchor_index = (index_key, index)
+        data = {
+            "sources": {
+                fingerprint: {
+                    "lengths": sorted(source["lengths"]),
+                    "matches": {str(n): sorted(matches.items()) for n, matches in source["matches"].items()},
+                }
+                for fingerprint, source in index["sources"].items()
+            },
+            "scores": [[n, pos, score.to_dict()] for (n, pos), score in index["scores"].items()],
+        }
+        serialization.dump_file(data, self.cache_dir / f"anchor_index_{index_key}.json")
+
+    def _index_candidates(
+        self, index_key: str, references: Dict[str, LyricsData], scored_anchors: List[ScoredAnchor], n_gram_lengths: range
+    ) -> None:
+        """Record the matches and scores of a full search, so later searches with other sources can reuse them."""
+        index = self._load_anchor_index(index_key) or {"sources": {}, "scores": {}}
+        fingerprints = {source: self._get_source_fingerprint(lyrics) for source, lyrics in references.items()}
+        for fingerprint in fingerprints.values():
+            index["sources"][fingerprint] = {"lengths": set(n_gram_lengths), "matches": {n: {} for n in n_gram_lengths}}
+
+        for scored_anchor in scored_anchors:
+            anchor = scored_anchor.anchor
+            n = len(anchor.transcribed_word_ids)
+            for source, pos in anchor.reference_positions.items():
+                index["sources"][fingerprints[source]]["matches"][n][anchor.transcription_position] = pos
+            index["scores"][(n, anchor.transcription_position)] = scored_anchor.phrase_score
+
+        self._save_anchor_index(index_key, index)
+
+    @staticmethod
+    def _match_source(trans_words: List[str], source_words: List[str], lengths: List[int]) -> Dict[int, Dict[int, int]]:
+        """Match transcription n-grams of each length against a single reference source.
+
+        Gives the same matches _process_ngram_length finds for this source: each transcription n-gram is
+        matched to the first occurrence of that n-gram in the source.
+        """
+        matches = {}
+        for n in sorted(lengths):
+            first_occurrences = {}
+            for pos in range(len(source_words) - n + 1):
+                first_occurrences.setdefault(tuple(source_words[pos : pos + n]), pos)
+
+            matches[n] = {}
+            for trans_pos in range(len(trans_words) - n + 1):
+                pos = first_occurrences.get(tuple(trans_words[trans_pos : trans_pos + n]))
+                if pos is not None:
+                    matches[n][trans_pos] = pos
+
+            if not matches[n]:
+                # No shared n-gram of this length means there's no longer one either
+                matches.update({longer: {} for longer in lengths if longer > n})
+                break
+        return matches
+
+    def _find_anchors_from_index(
+        self,
+        transcribed: str,
+        references: Dict[str, LyricsData],
+        transcription_result: TranscriptionResult,
+        index_key: str,
+    ) -> Optional[List[ScoredAnchor]]:
+        """Find anchors using indexed matches for known sources, matching and scoring only what's new.
+
+        Candidate anchors are rebuilt by merging each source's matches, exactly as the full search would
+        produce them, and phrase scores (which depend only on the transcription) are reused, so adding a
+        source costs one indexed pass over that source plus scoring any anchors it alone contributes.
+        Returns None if the index doesn't apply, in which case the full search should run.
+        """
+        if not self._can_use_index():
+            return None
+        index = self._load_anchor_index(index_key)
+        if index is None:
+            return None
+
+        fingerprints = {source: self._get_source_fingerprint(lyrics) for source, lyrics in references.items()}
+        new_sources = [source for source, fingerprint in fingerprints.items() if fingerprint not in index["sources"]]
+        if len(new_sources) == len(references):
+            return None
+        self.logger.info(f"🔍 ANCHOR SEARCH: Reusing indexed matches, matching new sources only: {new_sources}")
+
+        all_words = [w for segment in transcription_result.result.segments for w in segment.words]
+        trans_words = [w.text.lower().strip('.,?!"\n') for w in all_words]
+        ref_texts_clean = {
+            source: self._clean_text(" ".join(w.text for s in lyrics.segments for w in s.words)).split()
+            for source, lyrics in references.items()
+        }
+        ref_words = {source: [w for s in lyrics.segments for w in s.words] for source, lyrics in references.items()}
+
+        valid_ref_lengths = [len(words) for words in ref_texts_clean.values() if len(words) >= self.min_sequence_length]
+        if not valid_ref_lengths:
+            self.logger.warning("🔍 ANCHOR SEARCH: ❌ No reference sources long enough for anchor detection")
+            return []
+        max_length = min(len(trans_words), min(valid_ref_lengths))
+        n_gram_lengths = range(max_length, self.min_sequence_length - 1, -1)
+
+        source_matches = {}
+        for source, fingerprint in fingerprints.items():
+            entry = index["sources"].setdefault(fingerprint, {"lengths": set(), "matches": {}})
+            missing_lengths = [n for n in n_gram_lengths if n not in entry["lengths"]]
+            if missing_lengths:
+                entry["matches"].update(self._match_source(trans_words, ref_texts_clean[source], missing_lengths))
+                entry["lengths"].update(missing_lengths)
+            source_matches[source] = entry["matches"]
+
+        # Same anchors, in the same order, as the full search: by descending length, then transcription position
+        candidate_anchors = []
+        for n in n_gram_lengths:
+            matches_by_source = {source: matches.get(n, {}) for source, matches in source_matches.items()}
+            for trans_pos in sorted(set().union(*matches_by_source.values())):
+                matches = {source: positions[trans_pos] for source, positions in matches_by_source.items() if trans_pos in positions}
+                candidate_anchors.append(
+                    AnchorSequence(
+                        id=WordUtils.generate_id(key=f"anchor:{n}:{trans_pos}"),
+                        transcribed_word_ids=[w.id for w in all_words[trans_pos : trans_pos + n]],
+                        transcription_position=trans_pos,
+                        reference_positions=matches,
+                        reference_word_ids={source: [w.id for w in ref_words[source][pos : pos + n]] for source, pos in matches.items()},
+                        confidence=len(matches) / len(ref_texts_clean),
+                    )
+                )
+
+        self._attach_transcribed_words(candidate_anchors, transcription_result)
+        scored_anchors = []
+        for anchor in candidate_anchors:
+            score_key = (len(anchor.transcribed_word_ids), anchor.transcription_position)
+            if score_key not in index["scores"]:
+                index["scores"][score_key] = self._score_anchor_inline(anchor, transcribed)
+            scored_anchors.append(ScoredAnchor(anchor=anchor, phrase_score=index["scores"][score_key]))
+
+        self._save_anchor_index(index_key, index)
+        return self._select_non_overlapping(scored_anchors)
+
+    def _score_anchor_inline(self, anchor: AnchorSequence, context: str) -> PhraseScore:
+        """Score a single anchor in this process, falling back to a neutral score if scoring fails."""
+        try:
+            return self._score_sequence([w.text for w in anchor.transcribed_words], context)
+        except Exception as e:
+            self.logger.warning(f"Failed to score anchor at position {anchor.transcription_position}: {e}")
+            return PhraseScore(phrase_type=PhraseType.COMPLETE, natural_break_score=1.0, length_score=1.0)
+
     def _process_ngram_length(
         self,
         n: int,
@@ -280,7 +476,8 @@ class AnchorSequenceFinder:
                     used_trans_positions.add(trans_pos)
 
                     anchor = AnchorSequence(
-                        id=WordUtils.generate_id(),
+                        # Keyed id: this may run in a worker process, where sequential allocation isn't reproducible
+                        id=WordUtils.generate_id(key=f"anchor:{n}:{trans_pos}"),
                         transcribed_word_ids=transcribed_word_ids,
                         transcription_position=trans_pos,
                         reference_positions=matches,
@@ -346,6 +543,14 @@ class AnchorSequenceFinder:
                         except:
                             self.logger.error("Could not serialize first cached anchor for logging")
 
+            # Matches against sources seen before for this transcription are indexed; only new sources need matching
+            index_key = self._get_index_key(transcribed, transcription_result)
+            indexed_anchors = self._find_anchors_from_index(transcribed, references, transcription_result, index_key)
+            if indexed_anchors is not None:
+                self._save_to_cache(cache_path, indexed_anchors)
+                self.logger.info(f"🔍 ANCHOR SEARCH: ✅ Found {len(indexed_anchors)} anchors from index in {time.time() - start_time:.1f}s")
+                return indexed_anchors
+
             # If not in cache or cache format invalid, perform the computation
             self.logger.info(f"🔍 ANCHOR SEARCH: ❌ Cache miss - computing anchors with timeout {self.timeout_seconds}s")
             self.logger.info(f"🔍 ANCHOR SEARCH: Finding anchor sequences for transcription with length {len(transcribed)}")
@@ -409,6 +614,7 @@ class AnchorSequenceFinder:
 
             # Process n-gram lengths in parallel with timeout
             candidate_anchors = []
+            failed_lengths = []  # Lengths with missing results, which mustn't be recorded in the index
             pool_timeout = max(60, self.timeout_seconds // 2) if self.timeout_seconds > 0 else 300  # Use half the total timeout for pool operations
             
             # Check timeout before parallel processing
@@ -464,6 +670,7 @@ class AnchorSequenceFinder:
                         except Exception as e:
                             self.logger.warning(f"🔍 ANCHOR SEARCH: ⚠️ n-gram length {n_gram_length} failed or timed out: {str(e)}")
                             results.append([])  # Add empty result to maintain order
+                            failed_lengths.append(n_gram_length)
                             
                             # Add failed result to batch for logging
                             batch_results.append((n_gram_length, 0))
@@ -486,6 +693,7 @@ class AnchorSequenceFinder:
                 self.logger.error(f"🔍 ANCHOR SEARCH: ❌ Parallel processing failed: {str(e)}")
                 # Fall back to sequential processing with timeout checks
                 self.logger.info("🔍 ANCHOR SEARCH: 🔄 Falling back to sequential processing")
+                failed_lengths = []
                 for n in n_gram_lengths:
                     try:
                         # Check timeout more leniently during sequential processing
@@ -494,6 +702,7 @@ class AnchorSequenceFinder:
                             # Allow more time for sequential processing (up to 2x the original timeout)
                             if elapsed_time > (self.timeout_seconds * 2.0):
                                 self.logger.warning(f"🔍 ANCHOR SEARCH: ⏰ Sequential processing timeout for n-gram {n}")
+                                failed_lengths.extend(length for length in n_gram_lengths if length <= n)
                                 break
                         
                         self.logger.info(f"🔍 ANCHOR SEARCH: 🔄 Sequential processing n-gram length {n}")
@@ -505,6 +714,7 @@ class AnchorSequenceFinder:
                         self.logger.info(f"🔍 ANCHOR SEARCH: ✅ Sequential n-gram {n} completed - found {len(anchors)} anchors")
                     except Exception as e:
                         self.logger.warning(f"🔍 ANCHOR SEARCH: ⚠️ Sequential processing failed for n-gram length {n}: {str(e)}")
+                        failed_lengths.append(n)
                         continue
 
             self.logger.info(f"🔍 ANCHOR SEARCH: ✅ Found {len(candidate_anchors)} candidate anchors in {time.time() - start_time:.1f}s")
@@ -513,7 +723,11 @@ class AnchorSequenceFinder:
             self._check_timeout(start_time, "overlap filtering start")
             self.logger.info(f"🔍 ANCHOR SEARCH: 🔄 Starting overlap filtering...")
             
-            filtered_anchors = self._remove_overlapping_sequences(candidate_anchors, transcribed, transcription_result)
+            filtering_start = time.time()
+            scored_anchors = self._score_anchors(candidate_anchors, transcribed, transcription_result) if candidate_anchors else []
+            if self._can_use_index() and not failed_lengths:
+                self._index_candidates(index_key, references, scored_anchors, n_gram_lengths)
+            filtered_anchors = self._select_non_overlapping(scored_anchors, filtering_start)
             self.logger.info(f"🔍 ANCHOR SEARCH: ✅ Filtering completed - {len(filtered_anchors)} final anchors")
 
             # Save to cache
@@ -609,6 +823,12 @@ class AnchorSequenceFinder:
 
         self.logger.info(f"🔍 FILTERING: Scoring {len(anchors)} anchors")
 
+        start_time = time.time()
+        scored_anchors = self._score_anchors(anchors, context, transcription_result)
+        return self._select_non_overlapping(scored_anchors, start_time)
+
+    def _attach_transcribed_words(self, anchors: List[AnchorSequence], transcription_result: TranscriptionResult) -> None:
+        """Set transcribed_words (used for scoring) on each anchor from the transcription's words."""
         # Create word map for scoring
         word_map = {w.id: w for s in transcription_result.result.segments for w in s.words}
         self.logger.debug(f"🔍 FILTERING: Created word map with {len(word_map)} words")
@@ -650,6 +870,10 @@ class AnchorSequenceFinder:
                         for i, word_id in enumerate(anchor.transcribed_word_ids)
                     ]
 
+    def _score_anchors(self, anchors: List[AnchorSequence], context: str, transcription_result: TranscriptionResult) -> List[ScoredAnchor]:
+        """Score anchors by phrase quality, in parallel worker processes."""
+        self._attach_transcribed_words(anchors, transcription_result)
+
         start_time = time.time()
 
         # Try different pool sizes with timeout
@@ -719,14 +943,22 @@ class AnchorSequenceFinder:
         parallel_time = time.time() - start_time
         self.logger.info(f"🔍 FILTERING: ✅ Parallel scoring completed in {parallel_time:.2f}s, scored {len(scored_anchors)} anchors")
 
-        # Sort and filter as before
+        return scored_anchors
+
+    def _select_non_overlapping(self, scored_anchors: List[ScoredAnchor], start_time: Optional[float] = None) -> List[ScoredAnchor]:
+        """Greedily keep the highest priority anchors that don't overlap an already kept anchor."""
+        start_time = start_time or time.time()
+        # Sort by priority, then filter
         self.logger.info(f"🔍 FILTERING: 🔄 Sorting anchors by priority...")
         scored_anchors.sort(key=self._get_sequence_priority, reverse=True)
         self.logger.info(f"🔍 FILTERING: ✅ Sorting completed")
 
         self.logger.info(f"🔍 FILTERING: 🔄 Filtering {len(scored_anchors)} overlapping sequences")
         filtered_scored = []
-        
+        # Positions taken by kept anchors, so each overlap check (same rules as _sequences_overlap) is a set lookup
+        used_trans_positions = set()
+        used_ref_positions = {}
+
         for i, scored_anchor in enumerate(scored_anchors):
             # Check timeout every 100 anchors using our timeout mechanism (more lenient)
             if i % 100 == 0 and i > 0:
@@ -740,14 +972,17 @@ class AnchorSequenceFinder:
                 
                 self.logger.debug(f"🔍 FILTERING: Progress: {i}/{len(scored_anchors)} processed, {len(filtered_scored)} kept")
             
-            overlaps = False
-            for existing in filtered_scored:
-                if self._sequences_overlap(scored_anchor.anchor, existing.anchor):
-                    overlaps = True
-                    break
+            anchor = scored_anchor.anchor
+            trans_range = range(anchor.transcription_position, anchor.transcription_position + len(anchor.transcribed_word_ids))
+            overlaps = any(pos in used_trans_positions for pos in trans_range) or any(
+                pos in used_ref_positions.get(source, ()) for source, pos in anchor.reference_positions.items()
+            )
 
             if not overlaps:
                 filtered_scored.append(scored_anchor)
+                used_trans_positions.update(trans_range)
+                for source, pos in anchor.reference_positions.items():
+                    used_ref_positions.setdefault(source, set()).add(pos)
 
         self.logger.info(f"🔍 FILTERING: ✅ Filtering completed - kept {len(filtered_scored)} non-overlapping anchors out of {len(scored_anchors)}")
         return filtered_scored
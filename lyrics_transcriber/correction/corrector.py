@@ -1,8 +1,10 @@
-from typing import List, Optional, Tuple, Union, Dict, Any
+from typing import List, Optional, Tuple, Union, Dict, Any, FrozenSet
+from dataclasses import dataclass, field
 import logging
 from pathlib import Path
 from copy import deepcopy
 import os
+import hashlib
 
 from lyrics_transcriber.correction.handlers.levenshtein import LevenshteinHandler
 from lyrics_transcriber.correction.handlers.llm import LLMHandler
@@ -13,9 +15,12 @@ from lyrics_transcriber.correction.handlers.sound_alike import SoundAlikeHandler
 from lyrics_transcriber.correction.handlers.syllables_match import SyllablesMatchHandler
 from lyrics_transcriber.correction.handlers.word_count_match import WordCountMatchHandler
 from lyrics_transcriber.types import (
+    AnchorSequence,
     CorrectionStep,
     GapSequence,
     LyricsData,
+    PhraseScore,
+    ScoredAnchor,
     TranscriptionResult,
     CorrectionResult,
     LyricsSegment,
@@ -27,6 +32,16 @@ from lyrics_transcriber.correction.handlers.base import GapCorrectionHandler
 from lyrics_transcriber.correction.handlers.extend_anchor import ExtendAnchorHandler
 from lyrics_transcriber.utils.word_utils import WordUtils
 from lyrics_transcriber.correction.handlers.llm_providers import OllamaProvider, OpenAIProvider
+from lyrics_transcriber.core.stage_cache import StageCache
+
+
+@dataclass(frozen=True)
+class _GapPlan:
+    """What a previous run already established about a gap, so rerun_corrections can skip that work."""
+
+    known_failures: FrozenSet[str] = frozenset()  # Handler IDs that ran on the gap and made no corrections
+    reuse_handler_id: Optional[str] = None  # Handler ID that corrected the gap
+    reuse_corrections: List[WordCorrection] = field(default_factory=list)
 
 
 class LyricsCorrector:
@@ -40,11 +55,13 @@ class LyricsCorrector:
         handlers: Optional[List[GapCorrectionHandler]] = None,
         enabled_handlers: Optional[List[str]] = None,
         anchor_finder: Optional[AnchorSequenceFinder] = None,
+        stage_cache: Optional[StageCache] = None,
         logger: Optional[logging.Logger] = None,
     ):
         self.logger = logger or logging.getLogger(__name__)
         self._anchor_finder = anchor_finder
         self._cache_dir = Path(cache_dir)
+        self.stage_cache = stage_cache
 
         # Define default enabled handlers - excluding LLM, Repeat, SoundAlike, and Levenshtein
         DEFAULT_ENABLED_HANDLERS = [
@@ -120,6 +137,8 @@ class LyricsCorrector:
             }
             for handler_id, handler in all_handlers
         ]
+        # Handler instances by ID, in chain order, so the enabled set can change without re-creating them
+        self._handler_registry = all_handlers
 
         if handlers:
             self.handlers = handlers
@@ -128,6 +147,19 @@ class LyricsCorrector:
             handler_filter = enabled_handlers if enabled_handlers is not None else DEFAULT_ENABLED_HANDLERS
             self.handlers = [h[1] for h in all_handlers if h[0] in handler_filter]
 
+    def set_enabled_handlers(self, enabled_handlers: List[str]) -> None:
+        """Switch the active handler chain, reusing the existing handler instances (and their loaded models)."""
+        self.handlers = [handler for handler_id, handler in self._handler_registry if handler_id in enabled_handlers]
+        for handler_info in self.all_handlers:
+            handler_info["enabled"] = handler_info["id"] in enabled_handlers
+
+    def _handler_id(self, handler: GapCorrectionHandler) -> str:
+        """Get the registry ID of a handler instance, falling back to its name or class name."""
+        for handler_id, registered in self._handler_registry:
+            if registered is handler:
+                return handler_id
+        return getattr(handler, "name", handler.__class__.__name__)
+
     @property
     def anchor_finder(self) -> AnchorSequenceFinder:
         """Lazy load the anchor finder instance, initializing it if not already set."""
@@ -146,27 +178,149 @@ class LyricsCorrector:
             self.logger.error("No transcription results available")
             raise ValueError("No primary transcription data available")
 
-        # Store reference lyrics for use in word map
-        self.reference_lyrics = lyrics_results
+        # Allocate ids for new anchors, gaps and corrected words deterministically from the inputs,
+        # so rerunning on the same transcription and references reproduces the same ids
+        with WordUtils.id_scope(self._id_scope_seed(transcription_results, lyrics_results)):
+            # Store reference lyrics for use in word map
+            self.reference_lyrics = lyrics_results
+
+            # Get primary transcription
+            primary_transcription_result = sorted(transcription_results, key=lambda x: x.priority)[0]
+            primary_transcription = primary_transcription_result.result
+            transcribed_text = " ".join(" ".join(w.text for w in segment.words) for segment in primary_transcription.segments)
+
+            # Find anchor sequences and gaps
+            self.logger.debug("Finding anchor sequences and gaps")
+            if self.stage_cache:
+                anchor_sequences, gap_sequences, corrections_key = self._find_anchors_and_gaps_cached(
+                    transcribed_text, lyrics_results, primary_transcription_result
+                )
+            else:
+                anchor_sequences = self.anchor_finder.find_anchors(transcribed_text, lyrics_results, primary_transcription_result)
+                gap_sequences = self.anchor_finder.find_gaps(transcribed_text, anchor_sequences, lyrics_results, primary_transcription_result)
+
+            # Store anchor sequences for use in correction handlers
+            self._anchor_sequences = anchor_sequences
+
+            # Process corrections with metadata
+            if self.stage_cache:
+                corrections_key = StageCache.make_key(
+                    "corrections",
+                    corrections_key,
+                    [getattr(handler, "name", handler.__class__.__name__) for handler in self.handlers],
+                    metadata.get("audio_file_hash") if metadata else None,
+                )
+                corrections, corrected_segments, correction_steps, word_id_map, segment_id_map = self.stage_cache.get_or_compute(
+                    corrections_key,
+                    lambda: self._process_corrections(primary_transcription.segments, gap_sequences, metadata=metadata),
+                    encode=self._encode_corrections,
+                    decode=self._decode_corrections,
+                )
+            else:
+                corrections, corrected_segments, correction_steps, word_id_map, segment_id_map = self._process_corrections(
+                    primary_transcription.segments, gap_sequences, metadata=metadata
+                )
+
+            return self._build_correction_result(
+                primary_transcription.segments,
+                lyrics_results,
+                anchor_sequences,
+                gap_sequences,
+                (corrections, corrected_segments, correction_steps, word_id_map, segment_id_map),
+            )
+
+    def rerun_corrections(
+        self,
+        correction_result: CorrectionResult,
+        previously_enabled: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> CorrectionResult:
+        """Re-run the handler chain after the enabled handlers changed, reusing everything else.
 
-        # Get primary transcription
-        primary_transcription_result = sorted(transcription_results, key=lambda x: x.priority)[0]
-        primary_transcription = primary_transcription_result.result
-        transcribed_text = " ".join(" ".join(w.text for w in segment.words) for segment in primary_transcription.segments)
+        Anchors and gaps are taken from correction_result rather than recomputed. For each gap, handlers
+        that previously ran and failed on it are skipped, and if the handler that corrected it before is
+        still the first candidate its corrections are reused. Only newly enabled handlers, and the
+        handlers after a winner that was disabled, actually run.
 
-        # Find anchor sequences and gaps
-        self.logger.debug("Finding anchor sequences and gaps")
-        anchor_sequences = self.anchor_finder.find_anchors(transcribed_text, lyrics_results, primary_transcription_result)
-        gap_sequences = self.anchor_finder.find_gaps(transcribed_text, anchor_sequences, lyrics_results, primary_transcription_result)
+        Args:
+            correction_result: Result of a previous run() over the same transcription and references
+            previously_enabled: Handler IDs enabled for that run (defaults to its metadata)
+            metadata: Metadata passed to handlers, as for run()
+        """
+        if previously_enabled is None:
+            previously_enabled = (correction_result.metadata or {}).get("enabled_handlers") or []
 
-        # Store anchor sequences for use in correction handlers
-        self._anchor_sequences = anchor_sequences
+        self.reference_lyrics = correction_result.reference_lyrics
+        self._anchor_sequences = correction_result.anchor_sequences
+        gap_plans = self._plan_gap_reruns(correction_result, previously_enabled)
+        self.logger.info(f"Re-running handlers over {len(correction_result.gap_sequences)} existing gaps")
 
-        # Process corrections with metadata
-        corrections, corrected_segments, correction_steps, word_id_map, segment_id_map = self._process_corrections(
-            primary_transcription.segments, gap_sequences, metadata=metadata
+        # Seed from the current state as well as the inputs, so new ids can't repeat ids of reused corrections
+        seed = hashlib.sha1(self._id_scope_seed([], correction_result.reference_lyrics).encode("utf-8"))
+        for segment in correction_result.original_segments:
+            for word in segment.words:
+                seed.update(word.id.encode("utf-8"))
+        for correction in correction_result.corrections:
+            seed.update(f"{correction.word_id}:{correction.corrected_word_id}".encode("utf-8"))
+        seed.update(",".join(self._handler_id(handler) for handler in self.handlers).encode("utf-8"))
+        with WordUtils.id_scope(f"rerun:{seed.hexdigest()}"):
+            processed = self._process_corrections(
+                correction_result.original_segments, correction_result.gap_sequences, metadata=metadata, gap_plans=gap_plans
+            )
+        return self._build_correction_result(
+            correction_result.original_segments,
+            correction_result.reference_lyrics,
+            correction_result.anchor_sequences,
+            correction_result.gap_sequences,
+            processed,
         )
 
+    def _plan_gap_reruns(self, correction_result: CorrectionResult, previously_enabled: List[str]) -> Dict[str, "_GapPlan"]:
+        """Work out, per gap, which handlers are known to fail and which earlier outcome can be reused."""
+        chain_order = {handler_id: position for position, (handler_id, _) in enumerate(self._handler_registry)}
+        previously_enabled = [handler_id for handler_id in previously_enabled if handler_id in chain_order]
+        steps_by_words = {tuple(step.affected_word_ids): step for step in correction_result.correction_steps}
+        class_names = {handler_id: handler.__class__.__name__ for handler_id, handler in self._handler_registry}
+
+        gap_plans = {}
+        for gap in correction_result.gap_sequences:
+            step = steps_by_words.get(tuple(gap.transcribed_word_ids))
+            if step is None:
+                # Every previously enabled handler ran on this gap and made no corrections
+                gap_plans[gap.id] = _GapPlan(known_failures=frozenset(previously_enabled))
+                continue
+
+            winner = self._step_handler_id(step, previously_enabled, class_names)
+            if winner is None:
+                continue  # Can't tell which handler won; run the full chain for this gap
+            gap_plans[gap.id] = _GapPlan(
+                known_failures=frozenset(h for h in previously_enabled if chain_order[h] < chain_order[winner]),
+                reuse_handler_id=winner,
+                reuse_corrections=step.corrections,
+            )
+        return gap_plans
+
+    @staticmethod
+    def _step_handler_id(step: CorrectionStep, previously_enabled: List[str], class_names: Dict[str, str]) -> Optional[str]:
+        """Identify which enabled handler produced a correction step, or None if ambiguous."""
+        # LLM handlers share a class, but record their own ID on each correction
+        correction_handlers = {c.handler for c in step.corrections if c.handler}
+        candidates = [h for h in previously_enabled if h in correction_handlers]
+        if len(candidates) != 1:
+            candidates = [h for h in previously_enabled if class_names[h] == step.handler_name]
+        return candidates[0] if len(candidates) == 1 else None
+
+    def _build_correction_result(
+        self,
+        original_segments: List[LyricsSegment],
+        lyrics_results: Dict[str, LyricsData],
+        anchor_sequences: List[ScoredAnchor],
+        gap_sequences: List[GapSequence],
+        processed: Tuple[List[WordCorrection], List[LyricsSegment], List[CorrectionStep], Dict[str, str], Dict[str, str]],
+    ) -> CorrectionResult:
+        """Assemble a CorrectionResult from the output of _process_corrections."""
+        corrections, corrected_segments, correction_steps, word_id_map, segment_id_map = processed
+
         # Calculate correction ratio
         total_words = sum(len(segment.words) for segment in corrected_segments)
         corrections_made = len(corrections)
@@ -176,7 +330,7 @@ class LyricsCorrector:
         enabled_handlers = [getattr(handler, "name", handler.__class__.__name__) for handler in self.handlers]
 
         return CorrectionResult(
-            original_segments=primary_transcription.segments,
+            original_segments=original_segments,
             corrected_segments=corrected_segments,
             corrections=corrections,
             corrections_made=corrections_made,
@@ -198,6 +352,107 @@ class LyricsCorrector:
             segment_id_map=segment_id_map,
         )
 
+    @staticmethod
+    def _id_scope_seed(transcription_results: List[TranscriptionResult], lyrics_results: Dict[str, LyricsData]) -> str:
+        """Build an id scope seed from the ids of every input word."""
+        hasher = hashlib.sha1()
+        for transcription_result in sorted(transcription_results, key=lambda x: (x.priority, x.name)):
+            hasher.update(transcription_result.name.encode("utf-8"))
+            for word in transcription_result.result.words or [w for s in transcription_result.result.segments for w in s.words]:
+                hasher.update(word.id.encode("utf-8"))
+        for source, lyrics in sorted(lyrics_results.items()):
+            hasher.update(source.encode("utf-8"))
+            for segment in lyrics.segments:
+                for word in segment.words:
+                    hasher.update(word.id.encode("utf-8"))
+        return f"corrections:{hasher.hexdigest()}"
+
+    def _find_anchors_and_gaps_cached(
+        self, transcribed_text: str, lyrics_results: Dict[str, LyricsData], transcription_result: TranscriptionResult
+    ) -> Tuple[List[ScoredAnchor], List[GapSequence], str]:
+        """Find anchors and gaps through the stage cache.
+
+        Returns the anchors, the gaps and the gaps stage key, which the corrections stage key builds on.
+        """
+        transcribed_words = [w for s in transcription_result.result.segments for w in s.words]
+        anchors_key = StageCache.make_key(
+            "anchors",
+            transcribed_text,
+            [(w.id, w.text) for w in transcribed_words],
+            {source: [(w.id, w.text) for s in lyrics.segments for w in s.words] for source, lyrics in lyrics_results.items()},
+            {
+                "min_sequence_length": getattr(self.anchor_finder, "min_sequence_length", None),
+                "min_sources": getattr(self.anchor_finder, "min_sources", None),
+            },
+        )
+        word_texts = {w.id: w.text for w in transcribed_words}
+
+        anchor_sequences = self.stage_cache.get_or_compute(
+            anchors_key,
+            lambda: self.anchor_finder.find_anchors(transcribed_text, lyrics_results, transcription_result),
+            encode=self._encode_anchors,
+            decode=lambda data: self._decode_anchors(data, word_texts),
+        )
+
+        gaps_key = StageCache.make_key("gaps", anchors_key)
+        gap_sequences = self.stage_cache.get_or_compute(
+            gaps_key,
+            lambda: self.anchor_finder.find_gaps(transcribed_text, anchor_sequences, lyrics_results, transcription_result),
+            encode=lambda gaps: [g.to_dict() for g in gaps],
+            decode=lambda data: [GapSequence.from_dict(g) for g in data],
+        )
+        return anchor_sequences, gap_sequences, gaps_key
+
+    @staticmethod
+    def _encode_anchors(anchors: List[ScoredAnchor]) -> List[Dict[str, Any]]:
+        """Serialize scored anchors for the stage cache, keeping only ID-based fields."""
+        encoded = []
+        for scored in anchors:
+            anchor_data = scored.anchor.to_dict()
+            # Drop the backwards-compatible text fields, which would make from_dict regenerate word IDs
+            for key in ("words", "text", "length"):
+                anchor_data.pop(key, None)
+            encoded.append({"anchor": anchor_data, "phrase_score": scored.phrase_score.to_dict()})
+        return encoded
+
+    @staticmethod
+    def _decode_anchors(data: List[Dict[str, Any]], word_texts: Dict[str, str]) -> List[ScoredAnchor]:
+        """Deserialize scored anchors from the stage cache, restoring word text from the transcription."""
+        anchors = []
+        for item in data:
+            anchor = AnchorSequence.from_dict(item["anchor"])
+            if all(word_id in word_texts for word_id in anchor.transcribed_word_ids):
+                anchor._words = [word_texts[word_id] for word_id in anchor.transcribed_word_ids]
+            anchors.append(ScoredAnchor(anchor=anchor, phrase_score=PhraseScore.from_dict(item["phrase_score"])))
+        return anchors
+
+    @staticmethod
+    def _encode_corrections(
+        result: Tuple[List[WordCorrection], List[LyricsSegment], List[CorrectionStep], Dict[str, str], Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """Serialize the output of _process_corrections for the stage cache."""
+        corrections, corrected_segments, correction_steps, word_id_map, segment_id_map = result
+        return {
+            "corrections": [c.to_dict() for c in corrections],
+            "corrected_segments": [s.to_dict() for s in corrected_segments],
+            "correction_steps": [step.to_dict() for step in correction_steps],
+            "word_id_map": word_id_map,
+            "segment_id_map": segment_id_map,
+        }
+
+    @staticmethod
+    def _decode_corrections(
+        data: Dict[str, Any]
+    ) -> Tuple[List[WordCorrection], List[LyricsSegment], List[CorrectionStep], Dict[str, str], Dict[str, str]]:
+        """Deserialize the output of _process_corrections from the stage cache."""
+        return (
+            [WordCorrection.from_dict(c) for c in data["corrections"]],
+            [LyricsSegment.from_dict(s) for s in data["corrected_segments"]],
+            [CorrectionStep.from_dict(step) for step in data["correction_steps"]],
+            data["word_id_map"],
+            data["segment_id_map"],
+        )
+
     def _preserve_formatting(self, original: str, new_word: str) -> str:
         """Preserve original word's formatting when applying correction."""
         # Find leading/trailing whitespace
@@ -206,7 +461,11 @@ class LyricsCorrector:
         return leading_space + new_word.strip() + trailing_space
 
     def _process_corrections(
-        self, segments: List[LyricsSegment], gap_sequences: List[GapSequence], metadata: Optional[Dict[str, Any]] = None
+        self,
+        segments: List[LyricsSegment],
+        gap_sequences: List[GapSequence],
+        metadata: Optional[Dict[str, Any]] = None,
+        gap_plans: Optional[Dict[str, "_GapPlan"]] = None,
     ) -> Tuple[List[WordCorrection], List[LyricsSegment], List[CorrectionStep], Dict[str, str], Dict[str, str]]:
         """Process corrections using handlers.
 
@@ -223,6 +482,8 @@ class LyricsCorrector:
         This two-pass approach separates the concerns of:
         a) Finding and making corrections (gap-centric)
         b) Applying those corrections to the original text (segment-centric)
+
+        gap_plans (see rerun_corrections) lets a gap skip handlers whose outcome is already known.
         """
         self.logger.info(f"Starting correction process with {len(gap_sequences)} gaps")
         correction_steps = []
@@ -230,6 +491,11 @@ class LyricsCorrector:
         word_id_map = {}
         segment_id_map = {}
 
+        # Index transcribed words by ID once, so per-gap lookups don't rescan every segment.
+        # The input segments are never modified here (corrections are applied to copies),
+        # so the index stays valid for the whole pass.
+        word_locations = self._build_word_locations(segments)
+
         # Create word map for handlers - include both transcribed and reference words
         word_map = {w.id: w for s in segments for w in s.words}  # Transcribed words
 
@@ -255,23 +521,38 @@ class LyricsCorrector:
             self.logger.debug(f"Gap text: '{' '.join(w.text for w in gap_words)}'")
 
             # Try each handler in order
+            plan = gap_plans.get(gap.id) if gap_plans else None
             for handler in self.handlers:
                 handler_name = handler.__class__.__name__
-                can_handle, handler_data = handler.can_handle(gap, base_handler_data)
+                handler_id = self._handler_id(handler) if plan else None
+                if plan and handler_id in plan.known_failures:
+                    self.logger.debug(f"Handler {handler_name} already known not to correct this gap")
+                    continue
+
+                if plan and handler_id == plan.reuse_handler_id:
+                    # Same handler won this gap last time and nothing earlier in the chain changed
+                    can_handle, handler_data = True, None
+                else:
+                    can_handle, handler_data = handler.can_handle(gap, base_handler_data)
 
                 if can_handle:
                     # Merge base handler data with specific handler data
                     handler_data = {**base_handler_data, **(handler_data or {})}
 
-                    corrections = handler.handle(gap, handler_data)
+                    if plan and handler_id == plan.reuse_handler_id:
+                        corrections = deepcopy(plan.reuse_corrections)
+                    else:
+                        corrections = handler.handle(gap, handler_data)
                     if corrections:
                         self.logger.info(f"Handler {handler_name} made {len(corrections)} corrections")
                         # Track affected IDs
-                        affected_word_ids = [w.id for w in self._get_affected_words(gap, segments)]
-                        affected_segment_ids = [s.id for s in self._get_affected_segments(gap, segments)]
+                        affected_segments = self._get_affected_segments(gap, segments, word_locations)
+                        affected_word_ids = [w.id for w in self._get_affected_words(gap, segments, word_map)]
+                        affected_segment_ids = [s.id for s in affected_segments]
 
                         # Apply corrections and get updated segments
-                        updated_segments = self._apply_corrections_to_segments(self._get_affected_segments(gap, segments), corrections)
+                        updated_segments = self._apply_corrections_to_segments(affected_segments, corrections)
+                        updated_word_ids = {w.id for s in updated_segments for w in s.words}
 
                         # Update ID maps
                         for correction in corrections:
@@ -279,7 +560,7 @@ class LyricsCorrector:
                                 word_id_map[correction.word_id] = correction.corrected_word_id
 
                         # Map segment IDs
-                        for old_seg, new_seg in zip(self._get_affected_segments(gap, segments), updated_segments):
+                        for old_seg, new_seg in zip(affected_segments, updated_segments):
                             segment_id_map[old_seg.id] = new_seg.id
 
                         # Create correction step
@@ -288,10 +569,10 @@ class LyricsCorrector:
                             affected_word_ids=affected_word_ids,
                             affected_segment_ids=affected_segment_ids,
                             corrections=corrections,
-                            segments_before=self._get_affected_segments(gap, segments),
+                            segments_before=affected_segments,
                             segments_after=updated_segments,
                             created_word_ids=[w.id for w in self._get_new_words(updated_segments, affected_word_ids)],
-                            deleted_word_ids=[id for id in affected_word_ids if not self._word_exists(id, updated_segments)],
+                            deleted_word_ids=[id for id in affected_word_ids if id not in updated_word_ids],
                         )
                         correction_steps.append(step)
                         all_corrections.extend(corrections)
@@ -315,6 +596,7 @@ class LyricsCorrector:
 
     def _get_new_words(self, segments: List[LyricsSegment], original_word_ids: List[str]) -> List[Word]:
         """Find words that were created during correction."""
+        original_word_ids = set(original_word_ids)
         return [w for s in segments for w in s.words if w.id not in original_word_ids]
 
     def _word_exists(self, word_id: str, segments: List[LyricsSegment]) -> bool:
@@ -323,9 +605,6 @@ class LyricsCorrector:
 
     def _apply_corrections_to_segments(self, segments: List[LyricsSegment], corrections: List[WordCorrection]) -> List[LyricsSegment]:
         """Apply corrections to create new segments."""
-        # Create word ID map for quick lookup
-        word_map = {w.id: w for s in segments for w in s.words}
-
         # Group corrections by original_position to handle splits
         correction_map = {}
         for c in corrections:
@@ -396,8 +675,29 @@ class LyricsCorrector:
 
         return corrected_segments
 
-    def _get_affected_segments(self, gap: GapSequence, segments: List[LyricsSegment]) -> List[LyricsSegment]:
-        """Get segments that contain words from the gap sequence."""
+    @staticmethod
+    def _build_word_locations(segments: List[LyricsSegment]) -> Dict[str, Tuple[int, int]]:
+        """Map each word ID to its (segment index, word index) position."""
+        return {word.id: (segment_idx, word_idx) for segment_idx, segment in enumerate(segments) for word_idx, word in enumerate(segment.words)}
+
+    def _get_affected_segments(
+        self, gap: GapSequence, segments: List[LyricsSegment], word_locations: Optional[Dict[str, Tuple[int, int]]] = None
+    ) -> List[LyricsSegment]:
+        """Get segments that contain words from the gap sequence.
+
+        With a word_locations index (see _build_word_locations) this is proportional to the gap
+        size rather than the number of segments.
+        """
+        if word_locations is not None:
+            segment_indices = {word_locations[word_id][0] for word_id in gap.transcribed_word_ids if word_id in word_locations}
+            if not segment_indices:
+                return []
+            # Same result as the scan below: the contiguous run of segments starting at the first affected one
+            end = start = min(segment_indices)
+            while end + 1 in segment_indices:
+                end += 1
+            return segments[start : end + 1]
+
         affected_segments = []
         gap_word_ids = set(gap.transcribed_word_ids)
 
@@ -410,10 +710,13 @@ class LyricsCorrector:
 
         return affected_segments
 
-    def _get_affected_words(self, gap: GapSequence, segments: List[LyricsSegment]) -> List[Word]:
+    def _get_affected_words(
+        self, gap: GapSequence, segments: List[LyricsSegment], word_map: Optional[Dict[str, Word]] = None
+    ) -> List[Word]:
         """Get words that are part of the gap sequence."""
-        # Create a map of word IDs to Word objects for quick lookup
-        word_map = {w.id: w for s in segments for w in s.words}
+        # Create a map of word IDs to Word objects for quick lookup, unless the caller already has one
+        if word_map is None:
+            word_map = {w.id: w for s in segments for w in s.words}
 
         # Get the actual Word objects using the IDs
         return [word_map[word_id] for word_id in gap.transcribed_word_ids]
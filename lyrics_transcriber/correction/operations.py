@@ -14,7 +14,9 @@ These operations handle dynamic updates to correction results including:
 import json
 import hashlib
 import logging
-from typing import Dict, Any, List, Optional
+import os
+import threading
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
 from lyrics_transcriber.types import (
@@ -28,12 +30,23 @@ from lyrics_transcriber.types import (
 )
 from lyrics_transcriber.correction.corrector import LyricsCorrector
 from lyrics_transcriber.lyrics.user_input_provider import UserInputProvider
+from lyrics_transcriber.output.ffmpeg_progress import FFmpegProgress
 from lyrics_transcriber.output.generator import OutputGenerator
+from lyrics_transcriber.output.preview_cache import PreviewCache
 from lyrics_transcriber.core.config import OutputConfig
+from lyrics_transcriber.utils.audio_fingerprint import AudioFingerprint
 
 
 class CorrectionOperations:
     """Static methods for common correction operations."""
+
+    # Preview generators and caches are reused across requests; generators are keyed by their styles
+    # file version so edited styles take effect, and a lock per generator serializes its renders
+    MAX_PREVIEW_GENERATORS = 4
+    PREVIEW_WINDOW_PADDING_SECONDS = 2.0
+    _preview_generators: Dict[Tuple, Tuple[OutputGenerator, threading.Lock]] = {}
+    _preview_caches: Dict[Tuple, PreviewCache] = {}
+    _preview_lock = threading.Lock()
     
     @staticmethod
     def update_correction_result_with_data(
@@ -104,10 +117,14 @@ class CorrectionOperations:
         source: str,
         lyrics_text: str,
         cache_dir: str,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        corrector: Optional[LyricsCorrector] = None,
     ) -> CorrectionResult:
         """
         Add a new lyrics source and rerun correction.
+
+        Anchor search only has to match the new source: matches against the existing sources are
+        reused from the anchor finder's per-transcription index (see AnchorSequenceFinder.find_anchors).
         
         Args:
             correction_result: Current correction result
@@ -115,6 +132,7 @@ class CorrectionOperations:
             lyrics_text: The lyrics text content
             cache_dir: Cache directory for correction operations
             logger: Optional logger instance
+            corrector: Optional long-lived corrector to reuse, keeping its handlers and anchor index loaded
             
         Returns:
             Updated CorrectionResult with new lyrics source and corrections
@@ -171,11 +189,14 @@ class CorrectionOperations:
         
         # Rerun correction with updated reference lyrics
         logger.info("Running correction with updated reference lyrics")
-        corrector = LyricsCorrector(
-            cache_dir=cache_dir,
-            enabled_handlers=enabled_handlers,
-            logger=logger,
-        )
+        if corrector is None:
+            corrector = LyricsCorrector(
+                cache_dir=cache_dir,
+                enabled_handlers=enabled_handlers,
+                logger=logger,
+            )
+        elif enabled_handlers is not None:
+            corrector.set_enabled_handlers(enabled_handlers)
         
         updated_result = corrector.run(
             transcription_results=[TranscriptionResult(name="original", priority=1, result=transcription_data)],
@@ -203,16 +224,21 @@ class CorrectionOperations:
         correction_result: CorrectionResult,
         enabled_handlers: List[str],
         cache_dir: str,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        corrector: Optional[LyricsCorrector] = None,
     ) -> CorrectionResult:
         """
         Update enabled correction handlers and rerun correction.
+
+        Anchors and gaps are reused from the current result and only the handler chain is re-run,
+        skipping handlers whose outcome for a gap is already known (see LyricsCorrector.rerun_corrections).
         
         Args:
             correction_result: Current correction result
             enabled_handlers: List of handler names to enable
             cache_dir: Cache directory for correction operations
             logger: Optional logger instance
+            corrector: Optional long-lived corrector to reuse, avoiding reloading handler models
             
         Returns:
             Updated CorrectionResult with new handler configuration
@@ -229,25 +255,20 @@ class CorrectionOperations:
         updated_metadata = (correction_result.metadata or {}).copy()
         updated_metadata["enabled_handlers"] = enabled_handlers
         
-        # Create TranscriptionData from original segments
-        transcription_data = TranscriptionData(
-            segments=correction_result.original_segments,
-            words=[word for segment in correction_result.original_segments for word in segment.words],
-            text="\n".join(segment.text for segment in correction_result.original_segments),
-            source="original",
-        )
-        
         # Rerun correction with updated handlers
         logger.info("Running correction with updated handlers")
-        corrector = LyricsCorrector(
-            cache_dir=cache_dir,
-            enabled_handlers=enabled_handlers,
-            logger=logger,
-        )
-        
-        updated_result = corrector.run(
-            transcription_results=[TranscriptionResult(name="original", priority=1, result=transcription_data)],
-            lyrics_results=correction_result.reference_lyrics,
+        if corrector is None:
+            corrector = LyricsCorrector(
+                cache_dir=cache_dir,
+                enabled_handlers=enabled_handlers,
+                logger=logger,
+            )
+        else:
+            corrector.set_enabled_handlers(enabled_handlers)
+
+        updated_result = corrector.rerun_corrections(
+            correction_result,
+            previously_enabled=(correction_result.metadata or {}).get("enabled_handlers"),
             metadata=updated_metadata,
         )
         
@@ -274,11 +295,19 @@ class CorrectionOperations:
         audio_filepath: str,
         artist: Optional[str] = None,
         title: Optional[str] = None,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        time_window: Optional[Tuple[float, float]] = None,
+        segment_ids: Optional[List[str]] = None,
+        padding_seconds: float = PREVIEW_WINDOW_PADDING_SECONDS,
+        progress_callback: Optional[Callable[[FFmpegProgress], None]] = None,
     ) -> Dict[str, Any]:
         """
         Generate a preview video with current corrections.
         
+        By default the whole song is rendered. Passing time_window, or the segment_ids of the edited
+        segments, renders only that part of the song (plus padding_seconds either side), which is
+        much faster for checking a single edit.
+        
         Args:
             correction_result: Current correction result
             updated_data: Updated correction data for preview
@@ -287,66 +316,172 @@ class CorrectionOperations:
             artist: Optional artist name
             title: Optional title
             logger: Optional logger instance
+            time_window: Optional (start, end) in seconds of song time to render
+            segment_ids: Optional IDs of corrected segments to render; ignored if time_window is given
+            padding_seconds: Context added before and after the window
+            progress_callback: Optional callback receiving live FFmpeg metrics while the video encodes;
+                an exception raised by it stops the render
             
         Returns:
-            Dict with status, preview_hash, and video_path
+            Dict with status, preview_hash, video_path and preview_window ([start, end] or None)
             
         Raises:
-            ValueError: If preview video generation fails
+            ValueError: If preview video generation fails or the window is invalid
         """
         if not logger:
             logger = logging.getLogger(__name__)
             
         logger.info("Generating preview video with corrected data")
-        
-        # Create temporary correction result with updated data
-        temp_correction = CorrectionOperations.update_correction_result_with_data(
-            correction_result, updated_data
-        )
-        
-        # Generate a unique hash for this preview
-        preview_data = json.dumps(updated_data, sort_keys=True).encode("utf-8")
-        preview_hash = hashlib.md5(preview_data).hexdigest()[:12]
-        
-        # Set up preview config
-        preview_config = OutputConfig(
-            output_dir=str(Path(output_config.output_dir) / "previews"),
-            cache_dir=output_config.cache_dir,
-            output_styles_json=output_config.output_styles_json,
-            video_resolution="360p",  # Force 360p for preview
-            render_video=True,
-            generate_cdg=False,
-            generate_plain_text=False,
-            generate_lrc=False,
-            fetch_lyrics=False,
-            run_transcription=False,
-            run_correction=False,
+
+        preview_window = CorrectionOperations._get_preview_window(
+            updated_data, time_window, segment_ids, padding_seconds, output_config.subtitle_offset_ms
         )
         
-        # Create previews directory
-        preview_dir = Path(output_config.output_dir) / "previews"
-        preview_dir.mkdir(exist_ok=True)
-        
-        # Initialize output generator
-        output_generator = OutputGenerator(config=preview_config, logger=logger, preview_mode=True)
-        
-        # Generate preview outputs
-        preview_outputs = output_generator.generate_outputs(
-            transcription_corrected=temp_correction,
-            lyrics_results={},  # Empty dict since we don't need lyrics results for preview
-            output_prefix=f"preview_{preview_hash}",
-            audio_filepath=audio_filepath,
-            artist=artist,
-            title=title,
+        # Generate a unique hash for this preview, covering everything the rendered video depends on
+        preview_hash = CorrectionOperations._get_preview_hash(
+            updated_data, output_config, audio_filepath, artist, title, logger, preview_window=preview_window
         )
-        
-        if not preview_outputs.video:
-            raise ValueError("Preview video generation failed")
-            
-        logger.info(f"Generated preview video: {preview_outputs.video}")
+
+        def render() -> str:
+            # Create temporary correction result with updated data
+            temp_correction = CorrectionOperations.update_correction_result_with_data(
+                correction_result, updated_data
+            )
+
+            output_generator, generator_lock = CorrectionOperations._get_preview_generator(output_config, logger)
+            with generator_lock:
+                output_generator.video.progress_callback = progress_callback
+                try:
+                    # Generate preview outputs
+                    preview_outputs = output_generator.generate_outputs(
+                        transcription_corrected=temp_correction,
+                        lyrics_results={},  # Empty dict since we don't need lyrics results for preview
+                        output_prefix=f"preview_{preview_hash}",
+                        audio_filepath=audio_filepath,
+                        artist=artist,
+                        title=title,
+                        preview_window=preview_window,
+                    )
+                finally:
+                    output_generator.video.progress_callback = None
+
+            if not preview_outputs.video:
+                raise ValueError("Preview video generation failed")
+            return preview_outputs.video
+
+        preview_cache = CorrectionOperations._get_preview_cache(output_config, logger)
+        video_path, rendered = preview_cache.get_or_render(preview_hash, render)
+        if rendered:
+            logger.info(f"Generated preview video: {video_path}")
         
         return {
             "status": "success",
             "preview_hash": preview_hash,
-            "video_path": preview_outputs.video
-        } 
\ No newline at end of file
+            "video_path": video_path,
+            "preview_window": list(preview_window) if preview_window else None,
+        }
+
+    @staticmethod
+    def _get_preview_window(
+        updated_data: Dict[str, Any],
+        time_window: Optional[Tuple[float, float]],
+        segment_ids: Optional[List[str]],
+        padding_seconds: float,
+        subtitle_offset_ms: int = 0,
+    ) -> Optional[Tuple[float, float]]:
+        """Resolve the part of the song to render, or None to render the whole song.
+
+        Segment times are shifted by the subtitle offset so the window covers where the edited lines are shown.
+        """
+        if time_window is not None:
+            start, end = (float(value) for value in time_window)
+        elif segment_ids:
+            wanted = set(segment_ids)
+            segments = [s for s in updated_data.get("corrected_segments", []) if s.get("id") in wanted]
+            if not segments:
+                raise ValueError(f"No corrected segments found for preview: {sorted(wanted)}")
+            offset = (subtitle_offset_ms or 0) / 1000
+            start = min(s["start_time"] for s in segments) + offset
+            end = max(s["end_time"] for s in segments) + offset
+        else:
+            return None
+
+        if end <= start:
+            raise ValueError(f"Invalid preview time window: {start}-{end}")
+        return (round(max(0.0, start - padding_seconds), 3), round(end + padding_seconds, 3))
+
+    @staticmethod
+    def _get_preview_hash(
+        updated_data: Dict[str, Any],
+        output_config: OutputConfig,
+        audio_filepath: str,
+        artist: Optional[str],
+        title: Optional[str],
+        logger: logging.Logger,
+        preview_window: Optional[Tuple[float, float]] = None,
+    ) -> str:
+        """Hash the preview inputs: the edited data, the audio, the styles file, the title/artist and the window."""
+        preview_hash = hashlib.md5(json.dumps(updated_data, sort_keys=True).encode("utf-8"))
+        if audio_filepath and os.path.isfile(audio_filepath):
+            preview_hash.update(AudioFingerprint.md5(audio_filepath, cache_dir=output_config.cache_dir, logger=logger).encode("utf-8"))
+        styles_path = output_config.output_styles_json
+        if styles_path and os.path.isfile(styles_path):
+            with open(styles_path, "rb") as f:
+                preview_hash.update(hashlib.md5(f.read()).hexdigest().encode("utf-8"))
+        preview_hash.update(json.dumps([artist, title]).encode("utf-8"))
+        if preview_window is not None:
+            preview_hash.update(json.dumps(list(preview_window)).encode("utf-8"))
+        return preview_hash.hexdigest()[:12]
+
+    @staticmethod
+    def _get_preview_generator(output_config: OutputConfig, logger: logging.Logger) -> Tuple[OutputGenerator, threading.Lock]:
+        """Get a preview OutputGenerator, creating one only when the directories or styles file changed.
+
+        Creating a generator reloads and rescales the styles and probes ffmpeg for NVENC support.
+        """
+        styles_path = output_config.output_styles_json
+        try:
+            styles_version = os.stat(styles_path).st_mtime_ns if styles_path else None
+        except OSError:
+            styles_version = None
+        key = (output_config.output_dir, output_config.cache_dir, styles_path, styles_version)
+
+        with CorrectionOperations._preview_lock:
+            if key not in CorrectionOperations._preview_generators:
+                # Set up preview config
+                preview_config = OutputConfig(
+                    output_dir=str(Path(output_config.output_dir) / "previews"),
+                    cache_dir=output_config.cache_dir,
+                    output_styles_json=output_config.output_styles_json,
+                    video_resolution="360p",  # Force 360p for preview
+                    render_video=True,
+                    generate_cdg=False,
+                    generate_plain_text=False,
+                    generate_lrc=False,
+                    fetch_lyrics=False,
+                    run_transcription=False,
+                    run_correction=False,
+                )
+
+                # Create previews directory
+                Path(preview_config.output_dir).mkdir(parents=True, exist_ok=True)
+
+                if len(CorrectionOperations._preview_generators) >= CorrectionOperations.MAX_PREVIEW_GENERATORS:
+                    CorrectionOperations._preview_generators.pop(next(iter(CorrectionOperations._preview_generators)))
+                CorrectionOperations._preview_generators[key] = (
+                    OutputGenerator(config=preview_config, logger=logger, preview_mode=True),
+                    threading.Lock(),
+                )
+            return CorrectionOperations._preview_generators[key]
+
+    @staticmethod
+    def _get_preview_cache(output_config: OutputConfig, logger: logging.Logger) -> PreviewCache:
+        """Get the shared preview cache for this cache directory."""
+        preview_dir = Path(output_config.cache_dir) / "previews"
+        key = (str(preview_dir), output_config.preview_cache_max_size_mb)
+        with CorrectionOperations._preview_lock:
+            if key not in CorrectionOperations._preview_caches:
+                CorrectionOperations._preview_caches[key] = PreviewCache(
+                    preview_dir, max_size_mb=output_config.preview_cache_max_size_mb, logger=logger
+                )
+            return CorrectionOperations._preview_caches[key] 
\ No newline at end of file
@@ -1,14 +1,25 @@
 from dataclasses import dataclass
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import json
 import hashlib
 from pathlib import Path
 import os
+import re
+import time
+import unicodedata
+import requests
 from abc import ABC, abstractmethod
 from lyrics_transcriber.types import LyricsData, LyricsSegment, Word
 from karaoke_lyrics_processor import KaraokeLyricsProcessor
 from lyrics_transcriber.utils.word_utils import WordUtils
+from lyrics_transcriber.utils import serialization
+from lyrics_transcriber.utils.audio_fingerprint import AudioFingerprint
+from lyrics_transcriber.lyrics.http_client import ProviderHttpClient
+from lyrics_transcriber.lyrics.lookup_index import LyricsLookupIndex
+
+# Featured-artist credits, which vary between sources: "Artist feat. X", "Title (ft. X)", "Title [featuring X]"
+_FEATURING_RE = re.compile(r"\s*[\(\[]\s*(?:feat\.?|ft\.?|featuring)\s[^\)\]]*[\)\]]|\s+(?:feat\.?|ft\.?|featuring)\s.*$", re.IGNORECASE)
 
 
 @dataclass
@@ -22,6 +33,9 @@ class LyricsProviderConfig:
     cache_dir: Optional[str] = None
     audio_filepath: Optional[str] = None
     max_line_length: int = 36  # Config parameter for KaraokeLyricsProcessor
+    http_client: Optional[ProviderHttpClient] = None  # Defaults to the shared pooled client
+    negative_cache_ttl: Optional[float] = 7 * 24 * 3600  # Seconds to remember "no lyrics found"; None or 0 disables
+    use_lookup_index: bool = False  # Skip songs other providers agree have no lyrics, via LyricsLookupIndex
 
 
 class BaseLyricsProvider(ABC):
@@ -32,61 +46,137 @@ class BaseLyricsProvider(ABC):
         self.cache_dir = Path(config.cache_dir) if config.cache_dir else None
         self.audio_filepath = config.audio_filepath
         self.max_line_length = config.max_line_length
+        self.http = config.http_client or ProviderHttpClient.shared()
+        self.negative_cache_ttl = config.negative_cache_ttl
+        self.lookup_index = None
+        self._fetch_inconclusive = False
         if self.cache_dir:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if config.use_lookup_index:
+                self.lookup_index = LyricsLookupIndex(self.cache_dir, logger=self.logger)
             self.logger.debug(f"Initialized {self.__class__.__name__} with cache dir: {self.cache_dir}")
 
     def fetch_lyrics(self, artist: str, title: str) -> Optional[LyricsData]:
         """Fetch lyrics for a given artist and title, using cache if available."""
-        if not self.cache_dir:
-            return self._fetch_and_convert_result(artist, title)
+        # Scope word/segment ids to this song so repeated fetches produce identical ids
+        with WordUtils.id_scope(f"{self.get_name()}:{artist.lower()}:{title.lower()}"):
+            if not self.cache_dir:
+                return self._fetch_and_convert_result(artist, title)
+
+            # Use normalized artist and title for cache key instead of audio file hash
+            cache_key = self._get_artist_title_hash(artist, title)
+            converted_cache_path = self._get_cache_path(cache_key, "converted")
+            raw_cache_path = self._get_cache_path(cache_key, "raw")
+
+            # Check converted cache first, then raw, under the normalized key and then the exact key older versions used
+            for key in (cache_key, self._get_legacy_artist_title_hash(artist, title)):
+                cached_converted_path = self._get_cache_path(key, "converted")
+                converted_data = self._load_from_cache(cached_converted_path)
+                if converted_data:
+                    self.logger.info(f"Using cached converted lyrics for {artist} - {title} from file: {cached_converted_path}")
+                    return LyricsData.from_dict(converted_data)
+
+                cached_raw_path = self._get_cache_path(key, "raw")
+                raw_data = self._load_from_cache(cached_raw_path)
+                if raw_data:
+                    self.logger.info(f"Using cached raw lyrics for {artist} - {title} from file: {cached_raw_path}")
+                    converted_result = self._convert_result_format(raw_data)
+                    self._save_to_cache(converted_cache_path, converted_result.to_dict())
+                    return converted_result
+
+            if self._is_known_unavailable(cache_key):
+                self.logger.info(f"Skipping {self.get_name()} lookup for {artist} - {title}: no lyrics found when last checked")
+                return None
+            if self.lookup_index and self.lookup_index.is_unavailable_elsewhere(cache_key, self.get_name(), self.negative_cache_ttl):
+                self.logger.info(f"Skipping {self.get_name()} lookup for {artist} - {title}: other providers recently found no lyrics")
+                return None
+
+            # If not in cache, fetch from source
+            self._fetch_inconclusive = False
+            raw_result = self._fetch_data_from_source(artist, title)
+            if raw_result:
+                # Save raw API response
+                self._save_to_cache(raw_cache_path, raw_result)
+                converted_result = self._convert_result_format(raw_result)
+                self._save_to_cache(converted_cache_path, converted_result.to_dict())
+                self._record_lookup(cache_key, artist, title, found=True)
+                return converted_result
+
+            # Only remember definite misses; errors and missing credentials should be retried next run
+            if not self._fetch_inconclusive:
+                self._record_lookup(cache_key, artist, title, found=False)
+            return None
 
-        # Use artist and title for cache key instead of audio file hash
-        cache_key = self._get_artist_title_hash(artist, title)
+    def get_cache_inputs(self) -> Dict[str, Any]:
+        """Settings and inputs besides artist and title that change the lyrics returned, for stage cache keys."""
+        return {"max_line_length": self.max_line_length}
 
-        # Check converted cache first
-        converted_cache_path = self._get_cache_path(cache_key, "converted")
-        converted_data = self._load_from_cache(converted_cache_path)
-        if converted_data:
-            self.logger.info(f"Using cached converted lyrics for {artist} - {title} from file: {converted_cache_path}")
-            return LyricsData.from_dict(converted_data)
-
-        # Check raw cache next
-        raw_cache_path = self._get_cache_path(cache_key, "raw")
-        raw_data = self._load_from_cache(raw_cache_path)
-        if raw_data:
-            self.logger.info(f"Using cached raw lyrics for {artist} - {title} from file: {raw_cache_path}")
-            converted_result = self._convert_result_format(raw_data)
-            self._save_to_cache(converted_cache_path, converted_result.to_dict())
-            return converted_result
-
-        # If not in cache, fetch from source
-        raw_result = self._fetch_data_from_source(artist, title)
-        if raw_result:
-            # Save raw API response
-            self._save_to_cache(raw_cache_path, raw_result)
-            converted_result = self._convert_result_format(raw_result)
-            self._save_to_cache(converted_cache_path, converted_result.to_dict())
-            return converted_result
+    def _report_fetch_error(self, message: str, error: Optional[Exception] = None) -> None:
+        """Log a failed lookup and keep it out of the negative cache, since it may succeed on a later run.
 
-        return None
+        A 404 from the source is a definite "not found", so it is still cached.
+        """
+        self.logger.error(message)
+        response = getattr(error, "response", None) if isinstance(error, requests.exceptions.RequestException) else None
+        if response is None or response.status_code != 404:
+            self._fetch_inconclusive = True
+
+    def _mark_fetch_inconclusive(self) -> None:
+        """Keep the current lookup's miss out of the negative cache, e.g. because the provider isn't configured."""
+        self._fetch_inconclusive = True
+
+    def _is_known_unavailable(self, cache_key: str) -> bool:
+        """True if a recent lookup of this song by this provider found no lyrics, per the negative cache."""
+        if not self.negative_cache_ttl:
+            return False
+        negative_data = self._load_from_cache(self._get_cache_path(cache_key, "negative"))
+        return bool(negative_data) and time.time() - negative_data.get("checked_at", 0) < self.negative_cache_ttl
+
+    def _record_lookup(self, cache_key: str, artist: str, title: str, found: bool) -> None:
+        """Remember the outcome of a network lookup in the negative cache and lookup index."""
+        negative_cache_path = self._get_cache_path(cache_key, "negative")
+        if found:
+            if os.path.exists(negative_cache_path):
+                os.remove(negative_cache_path)
+        elif self.negative_cache_ttl:
+            self._save_to_cache(negative_cache_path, {"artist": artist, "title": title, "checked_at": time.time()})
+        if self.lookup_index:
+            self.lookup_index.record(cache_key, self.get_name(), found, artist, title)
 
     def _get_file_hash(self, filepath: str) -> str:
         """Calculate MD5 hash of a file."""
-        self.logger.debug(f"Calculating hash for file: {filepath}")
-        md5_hash = hashlib.md5()
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                md5_hash.update(chunk)
-        hash_result = md5_hash.hexdigest()
-        self.logger.debug(f"File hash: {hash_result}")
-        return hash_result
+        return AudioFingerprint.md5(filepath, cache_dir=self.cache_dir, logger=self.logger)
 
     def _get_artist_title_hash(self, artist: str, title: str) -> str:
-        """Calculate MD5 hash of the artist and title."""
+        """Calculate MD5 hash of the normalized artist and title, so trivial variations share a cache entry."""
+        normalized_artist, normalized_title = self._normalize_artist_title(artist, title)
+        combined = f"{normalized_artist}_{normalized_title}"
+        return hashlib.md5(combined.encode()).hexdigest()
+
+    def _get_legacy_artist_title_hash(self, artist: str, title: str) -> str:
+        """Calculate the exact (lowercased) artist/title MD5 used as cache key by older versions."""
         combined = f"{artist.lower()}_{title.lower()}"
         return hashlib.md5(combined.encode()).hexdigest()
 
+    @staticmethod
+    def _normalize_artist_title(artist: str, title: str) -> Tuple[str, str]:
+        """Normalize artist and title for cache keys.
+
+        Drops featured-artist credits, accents, punctuation and a leading "The", casefolds, treats "&" as
+        "and" and collapses whitespace, e.g. "The Beatles" / "Let It Be!" and "beatles" / "let it be" match.
+        """
+
+        def normalize(text: str) -> str:
+            text = _FEATURING_RE.sub("", text)
+            text = unicodedata.normalize("NFKD", text)
+            text = "".join(char for char in text if not unicodedata.combining(char)).casefold()
+            text = text.replace("&", " and ")
+            text = re.sub(r"[^\w\s]", "", text)
+            text = " ".join(text.split())
+            return text[4:] if text.startswith("the ") else text
+
+        return normalize(artist), normalize(title)
+
     def _get_cache_path(self, cache_key: str, suffix: str) -> str:
         """Get the cache file path for a given cache key and suffix."""
         return os.path.join(self.cache_dir, f"{self.get_name().lower()}_{cache_key}_{suffix}.json")
@@ -94,18 +184,16 @@ class BaseLyricsProvider(ABC):
     def _save_to_cache(self, cache_path: str, data: Dict[str, Any]) -> None:
         """Save data to cache."""
         self.logger.debug(f"Saving lyrics to cache: {cache_path}")
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        serialization.dump_file(data, cache_path)
         self.logger.debug("Cache save completed")
 
     def _load_from_cache(self, cache_path: str) -> Optional[Dict[str, Any]]:
         """Load data from cache if it exists."""
         self.logger.debug(f"Attempting to load from cache: {cache_path}")
         try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.logger.debug("Lyrics loaded from cache")
-                return data
+            data = serialization.load_file(cache_path)
+            self.logger.debug("Lyrics loaded from cache")
+            return data
         except FileNotFoundError:
             self.logger.debug("Cache file not found")
             return None
@@ -1,8 +1,11 @@
 from pathlib import Path
+import hashlib
 import logging
+import os
 from typing import Optional, Dict, Any
 from .base_lyrics_provider import BaseLyricsProvider, LyricsProviderConfig
 from lyrics_transcriber.types import LyricsData, LyricsMetadata
+from lyrics_transcriber.utils.audio_fingerprint import AudioFingerprint
 from karaoke_lyrics_processor import KaraokeLyricsProcessor
 
 
@@ -12,10 +15,30 @@ class FileProvider(BaseLyricsProvider):
     def __init__(self, config: LyricsProviderConfig, logger: Optional[logging.Logger] = None):
         super().__init__(config, logger)
         self.config = config  # Store the config for use in other methods
+        self.negative_cache_ttl = None  # A missing or unreadable file says nothing about whether the song has lyrics
         self.logger.debug(f"FileProvider initialized with config: {config}")
         self.title = None  # Initialize title
         self.artist = None  # Initialize artist
 
+    def get_cache_inputs(self) -> Dict[str, Any]:
+        return {**super().get_cache_inputs(), "lyrics_file": self._get_lyrics_file_fingerprint()}
+
+    def _get_artist_title_hash(self, artist: str, title: str) -> str:
+        """Cache key of the lyrics, which depend on the file's contents rather than just the song."""
+        song_key = super()._get_artist_title_hash(artist, title)
+        return hashlib.md5(f"{song_key}_{self._get_lyrics_file_fingerprint()}".encode()).hexdigest()
+
+    def _get_legacy_artist_title_hash(self, artist: str, title: str) -> str:
+        # Older entries didn't record which file they came from, so they can't be trusted
+        return self._get_artist_title_hash(artist, title)
+
+    def _get_lyrics_file_fingerprint(self) -> Optional[str]:
+        """Path and content hash of the lyrics file, or None if there is no readable file."""
+        if not self.config.lyrics_file or not os.path.isfile(self.config.lyrics_file):
+            return None
+        file_hash = AudioFingerprint.md5(self.config.lyrics_file, logger=self.logger)
+        return f"{os.path.realpath(self.config.lyrics_file)}:{file_hash}"
+
     def get_lyrics(self, artist: str, title: str) -> Optional[LyricsData]:
         """Get lyrics for the specified artist and title."""
         self.title = title  # Store title for use in other methods
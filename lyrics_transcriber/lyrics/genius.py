@@ -39,6 +39,7 @@ class GeniusProvider(BaseLyricsProvider):
         # Fall back to direct Genius API
         if not self.client:
             self.logger.warning("No Genius API token provided and RapidAPI failed")
+            self._mark_fetch_inconclusive()
             return None
 
         self.logger.info(f"Searching Genius for {artist} - {title}")
@@ -48,7 +49,7 @@ class GeniusProvider(BaseLyricsProvider):
                 self.logger.info("Found lyrics on Genius")
                 return song.to_dict()
         except Exception as e:
-            self.logger.error(f"Error fetching from Genius: {str(e)}")
+            self._report_fetch_error(f"Error fetching from Genius: {str(e)}", e)
         return None
 
     def _fetch_from_rapidapi(self, artist: str, title: str) -> Optional[Dict[str, Any]]:
@@ -68,7 +69,7 @@ class GeniusProvider(BaseLyricsProvider):
             }
             
             self.logger.debug(f"Making RapidAPI search request for '{artist} {title}'")
-            search_response = requests.get(search_url, headers=headers, params=search_params, timeout=10)
+            search_response = self.http.get(search_url, headers=headers, params=search_params)
             search_response.raise_for_status()
             
             search_data = search_response.json()
@@ -97,7 +98,7 @@ class GeniusProvider(BaseLyricsProvider):
             lyrics_params = {"id": str(song_id)}
             
             self.logger.debug(f"Making RapidAPI lyrics request for song ID {song_id}")
-            lyrics_response = requests.get(lyrics_url, headers=headers, params=lyrics_params, timeout=10)
+            lyrics_response = self.http.get(lyrics_url, headers=headers, params=lyrics_params)
             lyrics_response.raise_for_status()
             
             lyrics_data = lyrics_response.json()
@@ -125,10 +126,10 @@ class GeniusProvider(BaseLyricsProvider):
             return rapidapi_response
             
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"RapidAPI request failed: {str(e)}")
+            self._report_fetch_error(f"RapidAPI request failed: {str(e)}", e)
             return None
         except Exception as e:
-            self.logger.error(f"Error fetching from RapidAPI: {str(e)}")
+            self._report_fetch_error(f"Error fetching from RapidAPI: {str(e)}", e)
             return None
 
     def _extract_lyrics_from_rapidapi_response(self, lyrics_data: Dict[str, Any]) -> Optional[str]:
@@ -0,0 +1,164 @@
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@dataclass
+class RetryPolicy:
+    """When and how long to wait before retrying a failed provider request."""
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5  # seconds
+    backoff_max: float = 8.0  # seconds
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+
+    def delay(self, attempt: int) -> float:
+        """Backoff before retry number attempt + 1, with full jitter so parallel clients don't retry in lockstep."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2**attempt)))
+
+
+class ProviderHttpClient:
+    """Shared HTTP client for lyrics providers.
+
+    Requests go through one pooled requests.Session, so repeated calls to a provider reuse their
+    TCP/TLS connections. Connection errors, timeouts and retryable status codes (429, 5xx) are retried
+    with jittered exponential backoff, honouring Retry-After. Requests are rate limited per host: a
+    minimum interval between requests can be configured, and a 429 pauses further requests to that host
+    until its Retry-After has passed.
+
+    Providers use ProviderHttpClient.shared() unless one is injected via LyricsProviderConfig.http_client,
+    e.g. a client pointed at a local stub server in tests.
+    """
+
+    DEFAULT_TIMEOUT = 10  # seconds
+
+    _shared: Optional["ProviderHttpClient"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        retry_policy: Optional[RetryPolicy] = None,
+        min_interval: float = 0.0,
+        host_min_intervals: Optional[Dict[str, float]] = None,
+        pool_size: int = 10,
+        logger: Optional[logging.Logger] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the client.
+
+        Args:
+            session: Session to send requests with; a pooled session is created if not given
+            timeout: Default request timeout in seconds
+            retry_policy: Retry behaviour (defaults to RetryPolicy())
+            min_interval: Minimum seconds between requests to the same host
+            host_min_intervals: Per-host overrides of min_interval
+            pool_size: Connections kept open per host
+            logger: Optional logger instance
+            sleep: Function used to wait, replaceable in tests
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.min_interval = min_interval
+        self.host_min_intervals = host_min_intervals or {}
+        self.sleep = sleep
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self._host_next_allowed: Dict[str, float] = {}
+        self._host_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "ProviderHttpClient":
+        """The process-wide client used by providers that weren't given one."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request with retries; see request()."""
+        return self.request("GET", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, retrying transient failures.
+
+        Returns the last response once it succeeds or retries are exhausted (callers still check the
+        status, e.g. with raise_for_status()). Raises the last connection error or timeout if every
+        attempt failed that way; other request errors are raised immediately.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        host = urlsplit(url).netloc
+        policy = self.retry_policy
+        send = getattr(self.session, method.lower())
+
+        for attempt in range(policy.max_attempts):
+            self._wait_for_host(host)
+            last_attempt = attempt == policy.max_attempts - 1
+            try:
+                response = send(url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if last_attempt:
+                    raise
+                delay = policy.delay(attempt)
+                self.logger.warning(f"Request to {host} failed ({e}), retrying in {delay:.1f}s ({attempt + 1}/{policy.max_attempts})")
+                self.sleep(delay)
+                continue
+
+            if response.status_code not in policy.retry_statuses or last_attempt:
+                return response
+
+            retry_after = self._retry_after(response)
+            delay = retry_after if retry_after is not None else policy.delay(attempt)
+            response.close()  # Release the connection back to the pool before retrying
+            if response.status_code == 429:
+                self._block_host(host, delay)
+            self.logger.warning(f"{host} returned {response.status_code}, retrying in {delay:.1f}s ({attempt + 1}/{policy.max_attempts})")
+            if response.status_code != 429:
+                self.sleep(delay)
+        return response
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _wait_for_host(self, host: str) -> None:
+        """Sleep until the host may be contacted again, then reserve the next slot."""
+        interval = self.host_min_intervals.get(host, self.min_interval)
+        with self._host_lock:
+            now = time.monotonic()
+            start = max(now, self._host_next_allowed.get(host, 0.0))
+            self._host_next_allowed[host] = start + interval
+        if start > now:
+            self.sleep(start - now)
+
+    def _block_host(self, host: str, seconds: float) -> None:
+        with self._host_lock:
+            until = time.monotonic() + seconds
+            self._host_next_allowed[host] = max(self._host_next_allowed.get(host, 0.0), until)
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), capped at the backoff maximum."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except (TypeError, ValueError):
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return max(0.0, min(seconds, self.retry_policy.backoff_max))
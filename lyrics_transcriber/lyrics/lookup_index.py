@@ -0,0 +1,95 @@
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from lyrics_transcriber.utils import serialization
+
+
+class LyricsLookupIndex:
+    """Records, per normalized song key, which providers have lyrics for a song and which don't.
+
+    The index is a single JSON file in the cache dir shared by all providers (and all runs using that
+    cache dir), mapping song key -> provider name -> {"found": bool, "checked_at": unix time}. When a
+    provider's own "no lyrics" result for a song expires, it checks whether other providers agree the
+    song has no lyrics before going back to the network: if at least MIN_CONSENSUS of them recently
+    found none and no provider has ever found any, the song is almost certainly an instrumental or
+    obscure track, and the lookup is skipped to save API quota. A provider that has never looked the
+    song up is never skipped, since it may be the one source that has it. The parsed index is reused
+    until the file changes.
+    """
+
+    FILENAME = "lyrics_lookup_index.json"
+    MIN_CONSENSUS = 2
+
+    _lock = threading.Lock()  # Guards read-modify-write of the index file across provider instances
+    _parsed: Dict[str, Tuple[Tuple[int, int], Dict[str, Dict[str, Any]]]] = {}  # path -> (file version, index)
+
+    def __init__(self, cache_dir: Union[str, Path], logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger(__name__)
+        self.path = os.path.join(cache_dir, self.FILENAME)
+
+    def get(self, key: str, provider: str) -> Optional[Dict[str, Any]]:
+        """Return the recorded outcome of a provider's lookup for key, if any."""
+        return self._load().get(key, {}).get(provider)
+
+    def is_unavailable_elsewhere(self, key: str, provider: str, ttl: Optional[float]) -> bool:
+        """True if provider already looked key up and other providers agree there are no lyrics for it.
+
+        That is, provider's own lookup found none, at least MIN_CONSENSUS other providers found none
+        within the last ttl seconds, and no provider has found lyrics for key.
+        """
+        if not ttl:
+            return False
+        outcomes = {name: entry for name, entry in self._load().get(key, {}).items() if not name.startswith("_")}
+        if provider not in outcomes or any(entry.get("found") for entry in outcomes.values()):
+            return False
+        now = time.time()
+        recent_misses = [name for name, entry in outcomes.items() if name != provider and now - entry.get("checked_at", 0) < ttl]
+        return len(recent_misses) >= self.MIN_CONSENSUS
+
+    def record(self, key: str, provider: str, found: bool, artist: str, title: str) -> None:
+        """Record the outcome of a provider's lookup for key."""
+        with self._lock:
+            index = self._read()
+            song = index.setdefault(key, {})
+            song["_query"] = {"artist": artist, "title": title}
+            song[provider] = {"found": found, "checked_at": time.time()}
+            self._save(index)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """The parsed index, re-read only when the file has changed since it was last parsed."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return {}
+        version = (stat.st_mtime_ns, stat.st_size)
+        parsed = self._parsed.get(self.path)
+        if parsed and parsed[0] == version:
+            return parsed[1]
+        index = self._read()
+        self._parsed[self.path] = (version, index)
+        return index
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            index = serialization.load_file(self.path)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError:
+            self.logger.warning(f"Lyrics lookup index {self.path} is corrupted, starting a new one")
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _save(self, index: Dict[str, Dict[str, Any]]) -> None:
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            serialization.dump_file(index, tmp_path)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write lyrics lookup index {self.path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
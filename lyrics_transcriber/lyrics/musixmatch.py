@@ -16,6 +16,7 @@ class MusixmatchProvider(BaseLyricsProvider):
         """Fetch raw song data from Musixmatch via RapidAPI."""
         if not self.rapidapi_key:
             self.logger.warning("No RapidAPI key provided for Musixmatch")
+            self._mark_fetch_inconclusive()
             return None
 
         self.logger.info(f"Fetching lyrics from Musixmatch for {artist} - {title}")
@@ -30,7 +31,7 @@ class MusixmatchProvider(BaseLyricsProvider):
             }
             
             self.logger.debug(f"Making Musixmatch API request to: {url}")
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.http.get(url, headers=headers)
             response.raise_for_status()
             
             data = response.json()
@@ -50,10 +51,10 @@ class MusixmatchProvider(BaseLyricsProvider):
             return data
             
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Musixmatch API request failed: {str(e)}")
+            self._report_fetch_error(f"Musixmatch API request failed: {str(e)}", e)
             return None
         except Exception as e:
-            self.logger.error(f"Error fetching from Musixmatch: {str(e)}")
+            self._report_fetch_error(f"Error fetching from Musixmatch: {str(e)}", e)
             return None
 
     def _convert_result_format(self, raw_data: Dict[str, Any]) -> LyricsData:
@@ -1,7 +1,6 @@
 import logging
 from typing import Optional, Dict, Any
 import syrics.api
-import time
 import requests
 
 from lyrics_transcriber.types import LyricsData, LyricsMetadata, LyricsSegment, Word
@@ -20,8 +19,9 @@ class SpotifyProvider(BaseLyricsProvider):
 
         # Only initialize syrics client if rapidapi_key is not set
         if self.cookie and not self.rapidapi_key:
-            max_retries = 5
-            retry_delay = 5  # seconds
+            # Same backoff policy as the provider HTTP client
+            retry_policy = self.http.retry_policy
+            max_retries = retry_policy.max_attempts
 
             for attempt in range(max_retries):
                 try:
@@ -31,8 +31,9 @@ class SpotifyProvider(BaseLyricsProvider):
                     if attempt == max_retries - 1:  # Last attempt
                         self.logger.error(f"Failed to initialize Spotify client after {max_retries} attempts: {str(e)}")
                         break
-                    self.logger.warning(f"Attempt {attempt + 1}/{max_retries} failed, retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
+                    retry_delay = retry_policy.delay(attempt)
+                    self.logger.warning(f"Attempt {attempt + 1}/{max_retries} failed, retrying in {retry_delay:.1f} seconds...")
+                    self.http.sleep(retry_delay)
 
     def _fetch_data_from_source(self, artist: str, title: str) -> Optional[Dict[str, Any]]:
         """Fetch raw data from Spotify APIs using RapidAPI or syrics library."""
@@ -46,6 +47,7 @@ class SpotifyProvider(BaseLyricsProvider):
         # Fall back to syrics library
         if not self.client:
             self.logger.warning("No Spotify cookie provided and RapidAPI failed")
+            self._mark_fetch_inconclusive()
             return None
 
         try:
@@ -53,7 +55,12 @@ class SpotifyProvider(BaseLyricsProvider):
             search_query = f"{title} - {artist}"
             search_results = self.client.search(search_query, type="track", limit=1)
 
-            track_data = search_results["tracks"]["items"][0]
+            tracks = search_results["tracks"]["items"]
+            if not tracks:
+                self.logger.warning(f"No Spotify track found for {artist} - {title}")
+                return None
+
+            track_data = tracks[0]
             self.logger.debug(
                 f"Found track: {track_data['artists'][0]['name']} - {track_data['name']} " f"({track_data['external_urls']['spotify']})"
             )
@@ -65,7 +72,7 @@ class SpotifyProvider(BaseLyricsProvider):
 
             return {"track_data": track_data, "lyrics_data": lyrics_data}
         except Exception as e:
-            self.logger.error(f"Error fetching from Spotify: {str(e)}")
+            self._report_fetch_error(f"Error fetching from Spotify: {str(e)}", e)
             return None
 
     def _fetch_from_rapidapi(self, artist: str, title: str) -> Optional[Dict[str, Any]]:
@@ -83,7 +90,7 @@ class SpotifyProvider(BaseLyricsProvider):
             }
             
             self.logger.debug(f"Making RapidAPI search request for '{artist} {title}'")
-            search_response = requests.get(search_url, headers=headers, params=search_params, timeout=10)
+            search_response = self.http.get(search_url, headers=headers, params=search_params)
             search_response.raise_for_status()
             
             search_data = search_response.json()
@@ -109,7 +116,7 @@ class SpotifyProvider(BaseLyricsProvider):
             }
             
             self.logger.debug(f"Making RapidAPI lyrics request for track ID {track_id}")
-            lyrics_response = requests.get(lyrics_url, headers=headers, params=lyrics_params, timeout=10)
+            lyrics_response = self.http.get(lyrics_url, headers=headers, params=lyrics_params)
             lyrics_response.raise_for_status()
             
             lyrics_data = lyrics_response.json()
@@ -126,10 +133,10 @@ class SpotifyProvider(BaseLyricsProvider):
             return rapidapi_response
             
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"RapidAPI request failed: {str(e)}")
+            self._report_fetch_error(f"RapidAPI request failed: {str(e)}", e)
             return None
         except Exception as e:
-            self.logger.error(f"Error fetching from RapidAPI: {str(e)}")
+            self._report_fetch_error(f"Error fetching from RapidAPI: {str(e)}", e)
             return None
 
     def _convert_result_format(self, raw_data: Dict[str, Any]) -> LyricsData:
@@ -1,5 +1,5 @@
 #!/usr/bin/env python
-import os, re, sys, functools, collections
+import os, re, sys, functools, collections, operator
 from lyrics_transcriber.output.ass.event import Event
 from lyrics_transcriber.output.ass.style import Style
 from lyrics_transcriber.output.ass.formatters import Formatters
@@ -118,6 +118,7 @@ class ASS:
     __re_draw_command_split = re.compile(r"\s+")
     __re_draw_commands_ord_min = ord("a")
     __re_draw_commands_ord_max = ord("z")
+    __compiled_formats = {}  # (Style or Event class, format fields) -> function formatting a line's fields
 
     @classmethod
     def __split_line(cls, line, split_time, naive):
@@ -447,59 +448,76 @@ class ASS:
         return self
 
     def write(self, filename, comments=None):
-        # Generate source
-        source = [
-            "[Script Info]\n",
-        ]
+        # Stream the lines straight to the file instead of building the whole document in memory first
+        with open(filename, "w", encoding="utf-8", newline="") as f:
+            f.writelines(self.iter_lines(comments))
+
+        # Done
+        return self
+
+    def to_string(self, comments=None):
+        # The same document as write() produces, for callers that don't need a file
+        return "".join(self.iter_lines(comments))
+
+    def iter_lines(self, comments=None):
+        # Script info
+        yield "[Script Info]\n"
 
         # Comments
         if comments is None:
             # Default comment
-            source.extend(
-                [
-                    "; Script generated by {0:s}\n".format(
-                        self.__re_filename_format[0].sub(self.__re_filename_format[1], os.path.split(__file__)[1])
-                    ),
-                ]
+            yield "; Script generated by {0:s}\n".format(
+                self.__re_filename_format[0].sub(self.__re_filename_format[1], os.path.split(__file__)[1])
             )
         else:
             # Custom comments
-            source.extend(["; {0:s}".format(c) for c in comments])
+            for c in comments:
+                yield "; {0:s}".format(c)
 
-        # Script info
         for entry in self.script_info_ordered:
             if entry.key in self.script_info:
-                source.append("{0:s}: {1:s}\n".format(entry.key, entry.value))
+                yield "{0:s}: {1:s}\n".format(entry.key, entry.value)
 
-        source.append("\n")
+        yield "\n"
 
         # Styles
-        source.append("[V4+ Styles]\n")
-        source.append("Format: {0:s}\n".format(", ".join(self.styles_format)))
+        yield "[V4+ Styles]\n"
+        yield "Format: {0:s}\n".format(", ".join(self.styles_format))
+        format_style = self.__compile_format(Style, self.styles_format)
         for style in self.styles:
-            style_list = []
-            for key in self.styles_format:
-                style_list.append(style.get(key))
-            source.append("{0:s}: {1:s}\n".format(style.type, ",".join(style_list)))
-        source.append("\n")
+            yield style.type + ": " + format_style(style) + "\n"
+        yield "\n"
 
         # Events
-        source.append("[Events]\n")
-        source.append("Format: {0:s}\n".format(", ".join(self.events_format)))
+        yield "[Events]\n"
+        yield "Format: {0:s}\n".format(", ".join(self.events_format))
+        format_event = self.__compile_format(Event, self.events_format)
         for event in self.events:
             if event.Start >= 0 and event.End >= 0:
-                event_list = []
-                for key in self.events_format:
-                    event_list.append(event.get(key))
-                source.append("{0:s}: {1:s}\n".format(event.type, ",".join(event_list)))
-
-        # Write file
-        f = open(filename, "wb")
-        s = f.write(("".join(source)).encode("utf-8"))
-        f.close()
+                yield event.type + ": " + format_event(event) + "\n"
 
-        # Done
-        return self
+    @classmethod
+    def __compile_format(cls, target_class, format_keys):
+        # Build a function formatting the fields of one Format line, resolving attributes and formatters
+        # once per format instead of once per field of every line
+        key = (target_class, tuple(format_keys))
+        compiled = cls.__compiled_formats.get(key)
+        if compiled is not None:
+            return compiled
+
+        names = [name if name in target_class.formatters else target_class.aliases.get(name, name) for name in format_keys]
+        if not names or any(name not in target_class.formatters for name in names):
+            # Unknown fields; fall back to the generic lookup
+            compiled = lambda instance: ",".join([instance.get(name) for name in format_keys])
+        else:
+            get_values = operator.attrgetter(*names)
+            to_strs = [target_class.formatters[name][1] for name in names]
+            if len(names) == 1:
+                compiled = lambda instance: to_strs[0](get_values(instance))
+            else:
+                compiled = lambda instance: ",".join([to_str(value) for to_str, value in zip(to_strs, get_values(instance))])
+        cls.__compiled_formats[key] = compiled
+        return compiled
 
     def write_srt(self, filename, **kwargs):
         # Parse kwargs
@@ -1125,6 +1143,19 @@ class ASS:
         # Done
         return self
 
+    def extend(self, events):
+        # Add many events at once; styles already in the file are looked up once per distinct style
+        known_styles = set(map(id, self.styles))
+        for event in events:
+            if event.Style.fake or id(event.Style) in known_styles:
+                self.events.append(event)
+            else:
+                self.add(event)
+                known_styles.add(id(event.Style))
+
+        # Done
+        return self
+
     def add_style(self, style):
         self.styles.append(style)
 
@@ -89,7 +89,8 @@ class Formatters:
 
     @classmethod
     def timecode_to_str(cls, val, *args):
-        return cls.timecode_to_str_generic(val, 2)
+        # Same as timecode_to_str_generic(val, 2), without building the format strings for every call
+        return "{0:d}:{1:02d}:{2:05.2f}".format(int(val // 3600), int((val // 60) % 60), val % 60)
 
     @classmethod
     def str_to_timecode(cls, val, *args):
@@ -2,9 +2,10 @@ from dataclasses import dataclass
 from typing import Optional, Tuple, List
 import logging
 from datetime import timedelta
-from PIL import Image, ImageDraw, ImageFont
+from PIL import ImageFont
 import os
 
+from lyrics_transcriber.output.text_width import TextWidthModel
 from lyrics_transcriber.types import LyricsSegment
 from lyrics_transcriber.output.ass.event import Event
 from lyrics_transcriber.output.ass.style import Style
@@ -25,19 +26,21 @@ class LyricsLine:
         if self.logger is None:
             self.logger = logging.getLogger(__name__)
 
+    # ASS renders fonts about 70% of their actual size
+    ASS_FONT_SCALE = 0.70
+
     def _get_font(self, style: Style) -> ImageFont.FreeTypeFont:
         """Get the font for text measurements."""
-        # ASS renders fonts about 70% of their actual size
-        ASS_FONT_SCALE = 0.70
-
         # Scale down the font size to match ASS rendering
-        adjusted_size = int(style.Fontsize * ASS_FONT_SCALE)
+        adjusted_size = int(style.Fontsize * self.ASS_FONT_SCALE)
         self.logger.debug(f"Adjusting font size from {style.Fontsize} to {adjusted_size} to match ASS rendering")
 
         try:
-            # Use the Fontpath property from Style class
+            # Use the Fontpath property from Style class; the loaded font is shared by all lines
             if style.Fontpath and os.path.exists(style.Fontpath):
-                return ImageFont.truetype(style.Fontpath, size=adjusted_size)
+                text_width = TextWidthModel.for_font(style.Fontpath, adjusted_size, logger=self.logger)
+                if text_width is not None:
+                    return text_width.font
             self.logger.warning(f"Could not load font {style.Fontpath}, using default")
             return ImageFont.load_default()
         except (OSError, AttributeError) as e:
@@ -46,12 +49,8 @@ class LyricsLine:
 
     def _get_text_dimensions(self, text: str, font: ImageFont.FreeTypeFont) -> Tuple[int, int]:
         """Get the pixel dimensions of rendered text."""
-        # Create an image the same size as the video frame
-        img = Image.new("RGB", (self.screen_config.video_width, self.screen_config.video_height), color="black")
-        draw = ImageDraw.Draw(img)
-
-        # Get the bounding box
-        bbox = draw.textbbox((0, 0), text, font=font)
+        # The bounding box ImageDraw.textbbox would report on a video frame, without drawing a frame
+        bbox = font.getbbox(text, mode="L")
         width = bbox[2] - bbox[0]
         height = bbox[3] - bbox[1]
 
@@ -0,0 +1,103 @@
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Optional, Tuple
+
+from lyrics_transcriber.types import LyricsSegment, Word
+
+
+class ShiftedWord:
+    """A Word seen with its times moved by an offset, without copying the word."""
+
+    __slots__ = ("_word", "_offset")
+
+    def __init__(self, word: Word, offset: float):
+        self._word = word
+        self._offset = offset
+
+    @property
+    def start_time(self) -> float:
+        return max(0, self._word.start_time + self._offset)
+
+    @property
+    def end_time(self) -> float:
+        return self._word.end_time + self._offset
+
+    def __getattr__(self, name):
+        if name in self.__slots__:
+            raise AttributeError(name)
+        return getattr(self._word, name)
+
+
+class ShiftedSegment:
+    """A LyricsSegment seen with its (and its words') times moved by an offset, without copying it."""
+
+    __slots__ = ("_segment", "_offset", "_words")
+
+    def __init__(self, segment: LyricsSegment, offset: float):
+        self._segment = segment
+        self._offset = offset
+        self._words = None
+
+    @classmethod
+    def shift_all(cls, segments: List[LyricsSegment], offset: float) -> List[LyricsSegment]:
+        """Return the segments moved by offset seconds; with no offset, the segments themselves."""
+        if not offset:
+            return segments
+        return [cls(segment, offset) for segment in segments]
+
+    @property
+    def start_time(self) -> float:
+        return max(0, self._segment.start_time + self._offset)
+
+    @property
+    def end_time(self) -> float:
+        return self._segment.end_time + self._offset
+
+    @property
+    def words(self) -> List[ShiftedWord]:
+        if self._words is None:
+            self._words = [ShiftedWord(word, self._offset) for word in self._segment.words]
+        return self._words
+
+    def __getattr__(self, name):
+        if name in self.__slots__:
+            raise AttributeError(name)
+        return getattr(self._segment, name)
+
+
+class IntervalIndex:
+    """Half-open [start, end) time intervals, looked up by bisection instead of scanning every interval."""
+
+    def __init__(self, intervals: Iterable[Tuple[float, float]]):
+        self.intervals = sorted(intervals)
+        self._starts = [start for start, _ in self.intervals]
+
+        # Index of the latest-ending interval among the first i + 1, and of the earliest-ending from i on
+        self._latest_end_before: List[int] = []
+        for i, (_, end) in enumerate(self.intervals):
+            if i and self.intervals[self._latest_end_before[-1]][1] >= end:
+                self._latest_end_before.append(self._latest_end_before[-1])
+            else:
+                self._latest_end_before.append(i)
+        self._earliest_end_from: List[int] = [0] * len(self.intervals)
+        for i in range(len(self.intervals) - 1, -1, -1):
+            later = self._earliest_end_from[i + 1] if i + 1 < len(self.intervals) else None
+            self._earliest_end_from[i] = later if later is not None and self.intervals[later][1] < self.intervals[i][1] else i
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def containing(self, time: float) -> Optional[Tuple[float, float]]:
+        """An interval with start <= time < end, if any."""
+        i = bisect_right(self._starts, time) - 1
+        if i < 0:
+            return None
+        interval = self.intervals[self._latest_end_before[i]]
+        return interval if interval[1] > time else None
+
+    def within(self, start: float, end: float) -> Optional[Tuple[float, float]]:
+        """An interval lying entirely inside [start, end], if any."""
+        i = bisect_left(self._starts, start)
+        if i == len(self.intervals):
+            return None
+        interval = self.intervals[self._earliest_end_from[i]]
+        return interval if interval[1] <= end else None
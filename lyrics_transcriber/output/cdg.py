@@ -18,14 +18,16 @@ from lyrics_transcriber.types import LyricsSegment
 class CDGGenerator:
     """Generates CD+G (CD Graphics) format karaoke files."""
 
-    def __init__(self, output_dir: str, logger: Optional[logging.Logger] = None):
+    def __init__(self, output_dir: str, logger: Optional[logging.Logger] = None, cache_dir: Optional[str] = None):
         """Initialize CDGGenerator.
 
         Args:
             output_dir: Directory where output files will be written
             logger: Optional logger instance
+            cache_dir: Optional directory where preprocessed background images are kept between songs
         """
         self.output_dir = output_dir
+        self.cache_dir = cache_dir
         self.logger = logger or logging.getLogger(__name__)
         self.cdg_visible_width = 280
 
@@ -188,7 +190,7 @@ class CDGGenerator:
 
     def _compose_cdg(self, toml_file: str) -> None:
         """Compose CDG using KaraokeComposer."""
-        kc = KaraokeComposer.from_file(toml_file, logger=self.logger)
+        kc = KaraokeComposer.from_file(toml_file, logger=self.logger, cache_dir=self.cache_dir)
         kc.compose()
         # kc.create_mp4(height=1080, fps=30)
 
@@ -4,6 +4,7 @@ import itertools as it
 import operator
 from pathlib import Path
 import re
+import subprocess
 import sys
 import tomllib
 from typing import NamedTuple, Self, TYPE_CHECKING, cast, Iterable, TypeVar
@@ -27,6 +28,9 @@ from .utils import *
 
 import logging
 
+from lyrics_transcriber.utils.image_cache import ImageAssetCache
+from lyrics_transcriber.utils.media_probe import MediaProbe
+
 ASS_REQUIREMENTS = True
 try:
     import ass
@@ -203,10 +207,14 @@ class KaraokeComposer:
         config: Settings,
         relative_dir: "StrOrBytesPath | Path" = "",
         logger=None,
+        cache_dir: "StrOrBytesPath | Path | None" = None,
     ):
         self.config = config
         self.relative_dir = Path(relative_dir)
         self.logger = logger or logging.getLogger(__name__)
+        # Where preprocessed assets, such as quantized background images,
+        # are kept between songs; without it they are reused only in-process
+        self.cache_dir = cache_dir
         
         self.logger.debug("loading config settings")
 
@@ -422,6 +430,7 @@ class KaraokeComposer:
         cls,
         file: "FileDescriptorOrPath",
         logger=None,
+        cache_dir: "StrOrBytesPath | Path | None" = None,
     ) -> Self:
         converter = Converter(prefer_attrib_converters=True)
         relative_dir = Path(file).parent
@@ -430,6 +439,7 @@ class KaraokeComposer:
                 converter.structure(tomllib.load(stream), Settings),
                 relative_dir=relative_dir,
                 logger=logger,
+                cache_dir=cache_dir,
             )
 
     @classmethod
@@ -776,7 +786,7 @@ class KaraokeComposer:
                 raise RuntimeError("page mode doesn't support more than one lyric set")
 
             self.logger.debug("loading song file")
-            song: AudioSegment = AudioSegment.from_file(file_relative_to(self.config.file, self.relative_dir))
+            song: AudioSegment = self._load_song(file_relative_to(self.config.file, self.relative_dir))
             self.logger.info("song file loaded")
 
             self.lyric_packet_indices: set[int] = set()
@@ -928,6 +938,33 @@ class KaraokeComposer:
             self.logger.error(f"Error in compose: {str(e)}", exc_info=True)
             raise
 
+    def _load_song(self, song_path: "StrOrBytesPath | Path") -> AudioSegment:
+        # pydub parses WAV files in-process, without any subprocess,
+        # so leave those to it.
+        if Path(song_path).suffix.lower() == ".wav":
+            return AudioSegment.from_file(song_path)
+
+        # For other formats pydub runs ffprobe before decoding. The
+        # stream layout is already known to the shared media probe, so
+        # decode with a single ffmpeg call instead.
+        info = MediaProbe.probe(song_path, cache_dir=self.cache_dir, logger=self.logger)
+        if info is None or not info.sample_rate or not info.channels:
+            return AudioSegment.from_file(song_path)
+
+        cmd = [
+            "ffmpeg",
+            "-v", "error",
+            "-i", str(song_path),
+            "-vn",
+            "-f", "s16le",
+            "-acodec", "pcm_s16le",
+            "-ar", str(info.sample_rate),
+            "-ac", str(info.channels),
+            "-",
+        ]  # fmt: skip
+        pcm = subprocess.run(cmd, capture_output=True, check=True).stdout
+        return AudioSegment(data=pcm, sample_width=2, frame_rate=info.sample_rate, channels=info.channels)
+
     def _compose_lyric(
         self,
         lyric: LyricInfo,
@@ -1823,8 +1860,25 @@ class KaraokeComposer:
         if partial_palette is None:
             partial_palette = []
 
+        # The same backgrounds are used for every song (and every
+        # instrumental), so quantized images are cached by content and
+        # palette
+        return ImageAssetCache.get_image(
+            file_relative_to(image_path, self.relative_dir),
+            "cdg_background",
+            (partial_palette,),
+            lambda source_path: self._quantize_image(source_path, partial_palette),
+            cache_dir=self.cache_dir,
+            logger=self.logger,
+        )
+
+    def _quantize_image(
+        self,
+        image_path: "StrOrBytesPath | Path",
+        partial_palette: list[RGBColor],
+    ):
         self.logger.debug("loading image")
-        image_rgba = Image.open(file_relative_to(image_path, self.relative_dir)).convert("RGBA")
+        image_rgba = Image.open(image_path).convert("RGBA")
         image = image_rgba.convert("RGB")
 
         # REVIEW How many colors should I allow? Should I make this
@@ -0,0 +1,162 @@
+import logging
+import subprocess
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class FFmpegProgress:
+    """A snapshot of a running FFmpeg encode, parsed from its -progress output."""
+
+    output_path: str = ""
+    frame: int = 0
+    fps: float = 0.0
+    speed: Optional[float] = None  # Multiple of real time
+    bitrate_kbps: Optional[float] = None
+    total_size: Optional[int] = None  # Bytes written so far
+    out_time: float = 0.0  # Seconds of output written so far
+    duration: Optional[float] = None  # Expected output duration in seconds, when known
+    elapsed: float = 0.0  # Wall-clock seconds since FFmpeg started
+    finished: bool = False
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """Share of the output written (0-1), if the expected duration is known."""
+        if not self.duration:
+            return None
+        return min(1.0, self.out_time / self.duration)
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated seconds until the encode finishes, at its average speed so far."""
+        if not self.duration or self.out_time <= 0 or self.elapsed <= 0:
+            return None
+        return max(0.0, (self.duration - self.out_time) * self.elapsed / self.out_time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "fraction": self.fraction, "eta": self.eta}
+
+
+class FFmpegStalledError(subprocess.CalledProcessError):
+    """FFmpeg was killed by the watchdog because its encode stopped making progress."""
+
+
+class FFmpegProgressRunner:
+    """Runs FFmpeg with -progress output, reporting live metrics and killing encodes that stall.
+
+    FFmpeg writes a block of key=value lines to stdout about twice a second; each block is parsed into
+    an FFmpegProgress and passed to on_progress. With a stall_timeout, a watchdog thread kills FFmpeg
+    once its output time hasn't advanced (at min_speed or faster, if given) for that many seconds, and
+    FFmpegStalledError is raised. Other failures raise subprocess.CalledProcessError with FFmpeg's
+    error output, like subprocess.check_output. An exception raised by on_progress kills FFmpeg and
+    propagates, which lets callers cancel an encode.
+    """
+
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        on_progress: Optional[Callable[[FFmpegProgress], None]] = None,
+        stall_timeout: Optional[float] = None,
+        min_speed: float = 0.0,
+    ):
+        self.logger = logger or logging.getLogger(__name__)
+        self.on_progress = on_progress
+        self.stall_timeout = stall_timeout
+        self.min_speed = min_speed
+
+    def run(self, cmd: List[str], duration: Optional[float] = None) -> FFmpegProgress:
+        """Run an FFmpeg command to completion and return its final progress."""
+        cmd = [cmd[0], "-progress", "pipe:1", "-nostats", *cmd[1:]]
+        progress = FFmpegProgress(output_path=cmd[-1], duration=duration)
+        started = time.monotonic()
+        last_advance = [started]
+        stalled = threading.Event()
+        done = threading.Event()
+
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+        stderr_lines: List[str] = []
+        # Drained on its own thread, so a chatty FFmpeg can't block on a full stderr pipe
+        stderr_thread = threading.Thread(target=lambda: stderr_lines.extend(process.stderr), daemon=True)
+        stderr_thread.start()
+        watchdog = None
+        if self.stall_timeout:
+            watchdog = threading.Thread(target=self._watch, args=(process, last_advance, stalled, done), daemon=True)
+            watchdog.start()
+
+        try:
+            block: Dict[str, str] = {}
+            for line in process.stdout:
+                key, _, value = line.strip().partition("=")
+                if key != "progress":
+                    block[key] = value
+                    continue
+                previous_out_time = progress.out_time
+                self._update(progress, block, time.monotonic() - started, finished=value == "end")
+                block = {}
+                if progress.out_time > previous_out_time and (not self.min_speed or (progress.speed or 0.0) >= self.min_speed):
+                    last_advance[0] = time.monotonic()
+                if self.on_progress:
+                    self.on_progress(progress)
+            returncode = process.wait()
+        finally:
+            done.set()
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            stderr_thread.join(timeout=5)
+            if watchdog:
+                watchdog.join(timeout=5)
+
+        stderr = "".join(stderr_lines)
+        if stalled.is_set():
+            raise FFmpegStalledError(returncode, cmd, output=f"FFmpeg stalled for {self.stall_timeout}s and was killed\n{stderr}")
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd, output=stderr)
+        progress.elapsed = time.monotonic() - started
+        progress.finished = True
+        return progress
+
+    def _watch(self, process: subprocess.Popen, last_advance: List[float], stalled: threading.Event, done: threading.Event) -> None:
+        interval = min(1.0, self.stall_timeout / 4)
+        while not done.wait(interval):
+            if time.monotonic() - last_advance[0] > self.stall_timeout:
+                self.logger.error(f"FFmpeg made no progress for {self.stall_timeout}s, killing it")
+                stalled.set()
+                process.kill()
+                return
+
+    @staticmethod
+    def _update(progress: FFmpegProgress, block: Dict[str, str], elapsed: float, finished: bool) -> None:
+        """Apply one -progress block to progress. FFmpeg reports "N/A" for values it doesn't know yet."""
+
+        def number(key: str, suffix: str = "") -> Optional[float]:
+            value = block.get(key, "").strip()
+            if suffix and value.endswith(suffix):
+                value = value[: -len(suffix)]
+            try:
+                return float(value)
+            except ValueError:
+                return None
+
+        frame = number("frame")
+        fps = number("fps")
+        # out_time_ms is in microseconds too, despite its name
+        out_time_us = number("out_time_us")
+        if out_time_us is None:
+            out_time_us = number("out_time_ms")
+        total_size = number("total_size")
+
+        if frame is not None:
+            progress.frame = int(frame)
+        if fps is not None:
+            progress.fps = fps
+        if out_time_us is not None and out_time_us >= 0:
+            progress.out_time = out_time_us / 1_000_000
+        if total_size is not None:
+            progress.total_size = int(total_size)
+        progress.speed = number("speed", "x")
+        progress.bitrate_kbps = number("bitrate", "kbits/s")
+        progress.elapsed = elapsed
+        progress.finished = finished
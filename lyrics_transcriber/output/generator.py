@@ -1,18 +1,25 @@
 from dataclasses import dataclass
+import functools
 import os
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import json
 
-from lyrics_transcriber.types import LyricsData
+from lyrics_transcriber.types import LyricsData, LyricsSegment
 from lyrics_transcriber.correction.corrector import CorrectionResult
 from lyrics_transcriber.output.plain_text import PlainTextGenerator
 from lyrics_transcriber.output.lyrics_file import LyricsFileGenerator
 from lyrics_transcriber.output.subtitles import SubtitlesGenerator
-from lyrics_transcriber.output.video import VideoGenerator
+from lyrics_transcriber.output.video import VideoGenerator, VideoOutputTarget
 from lyrics_transcriber.output.segment_resizer import SegmentResizer
+from lyrics_transcriber.output.text_width import TextWidthModel
+from lyrics_transcriber.output.ass.lyrics_line import LyricsLine
 from lyrics_transcriber.output.cdg import CDGGenerator
 from lyrics_transcriber.core.config import OutputConfig
+from lyrics_transcriber.core.stage_cache import StageCache
+from lyrics_transcriber.utils import serialization
+from lyrics_transcriber.utils.audio_fingerprint import AudioFingerprint
+from lyrics_transcriber.utils.image_cache import ImageAssetCache
 
 
 @dataclass
@@ -22,6 +29,8 @@ class OutputPaths:
     lrc: Optional[str] = None
     ass: Optional[str] = None
     video: Optional[str] = None
+    extra_videos: Optional[List[str]] = None
+    video_audio: Optional[Dict[str, str]] = None  # How the video's audio was produced: {"mode": ..., "codec": ...}
     original_txt: Optional[str] = None
     corrected_txt: Optional[str] = None
     corrections_json: Optional[str] = None
@@ -38,6 +47,7 @@ class OutputGenerator:
         config: OutputConfig,
         logger: Optional[logging.Logger] = None,
         preview_mode: bool = False,
+        stage_cache: Optional[StageCache] = None,
     ):
         """
         Initialize OutputGenerator with configuration.
@@ -46,9 +56,11 @@ class OutputGenerator:
             config: OutputConfig instance with required paths and settings
             logger: Optional logger instance
             preview_mode: Boolean indicating if the generator is in preview mode
+            stage_cache: Optional stage cache used to reuse resize, ASS, CDG and video results
         """
         self.config = config
         self.logger = logger or logging.getLogger(__name__)
+        self.stage_cache = stage_cache
 
         self.logger.info(f"Initializing OutputGenerator with config: {self.config}")
 
@@ -82,7 +94,7 @@ class OutputGenerator:
         self.lyrics_file = LyricsFileGenerator(self.config.output_dir, self.logger)
 
         if self.config.generate_cdg:
-            self.cdg = CDGGenerator(self.config.output_dir, self.logger)
+            self.cdg = CDGGenerator(self.config.output_dir, self.logger, cache_dir=self.config.cache_dir)
 
         self.preview_mode = preview_mode
         if self.config.render_video:
@@ -113,7 +125,10 @@ class OutputGenerator:
         # Get max_line_length from styles if available, otherwise use config default
         max_line_length = self.config.styles.get("karaoke", {}).get("max_line_length", self.config.default_max_line_length)
         self.logger.info(f"Using max_line_length: {max_line_length}")
-        self.segment_resizer = SegmentResizer(max_line_length=max_line_length, logger=self.logger)
+        text_width, max_line_width = self._get_line_width_model() if self.config.segment_resize_mode == "width" else (None, None)
+        self.segment_resizer = SegmentResizer(
+            max_line_length=max_line_length, logger=self.logger, text_width=text_width, max_line_width=max_line_width
+        )
 
         if self.config.render_video:
             # Initialize subtitle generator with potentially scaled values
@@ -125,6 +140,7 @@ class OutputGenerator:
                 styles=self.config.styles,
                 subtitle_offset_ms=self.config.subtitle_offset_ms,
                 logger=self.logger,
+                cache_dir=self.config.cache_dir,
             )
 
             self.video = VideoGenerator(
@@ -133,7 +149,12 @@ class OutputGenerator:
                 video_resolution=self.video_resolution_num,
                 styles=self.config.styles,
                 logger=self.logger,
+                render_chunks=self.config.video_render_chunks,
+                static_fast_path=self.config.video_static_fast_path,
+                audio_policy=self.config.video_audio_policy,
+                stall_timeout=self.config.video_stall_timeout,
             )
+            self.video_audio: Dict[str, Dict[str, str]] = {}  # Video path -> how its audio was produced
 
         # Log the configured directories
         self.logger.debug(f"Initialized OutputGenerator with output_dir: {self.config.output_dir}")
@@ -147,8 +168,12 @@ class OutputGenerator:
         audio_filepath: str,
         artist: Optional[str] = None,
         title: Optional[str] = None,
+        preview_window: Optional[Tuple[float, float]] = None,
     ) -> OutputPaths:
-        """Generate all requested output formats."""
+        """Generate all requested output formats.
+
+        In preview mode, preview_window optionally limits the rendered video to (start, end) seconds.
+        """
         outputs = OutputPaths()
 
         try:
@@ -156,16 +181,17 @@ class OutputGenerator:
             if transcription_corrected:
 
                 # Resize corrected segments
-                resized_segments = self.segment_resizer.resize_segments(transcription_corrected.corrected_segments)
+                resized_segments = self._resize_segments(transcription_corrected.corrected_segments)
                 transcription_corrected.resized_segments = resized_segments
 
                 # For preview, we only need to generate ASS and video
                 if self.preview_mode:
                     # Generate ASS subtitles for preview
-                    outputs.ass = self.subtitle.generate_ass(transcription_corrected.resized_segments, output_prefix, audio_filepath)
+                    outputs.ass = self._generate_ass(transcription_corrected.resized_segments, output_prefix, audio_filepath)
 
                     # Generate preview video
-                    outputs.video = self.video.generate_preview_video(outputs.ass, audio_filepath, output_prefix)
+                    outputs.video = self._generate_video(outputs.ass, audio_filepath, output_prefix, time_window=preview_window)
+                    outputs.video_audio = self.video_audio.get(outputs.video)
 
                     return outputs
 
@@ -187,19 +213,22 @@ class OutputGenerator:
 
                 # Generate CDG file if requested
                 if self.config.generate_cdg:
-                    outputs.cdg, outputs.mp3, outputs.cdg_zip = self.cdg.generate_cdg(
+                    outputs.cdg, outputs.mp3, outputs.cdg_zip = self._generate_cdg(
                         segments=resized_segments,
-                        audio_file=audio_filepath,
+                        audio_filepath=audio_filepath,
                         title=title or output_prefix,
                         artist=artist or "",
-                        cdg_styles=self.config.styles["cdg"],
                     )
 
                 # Generate video if requested
                 if self.config.render_video:
                     # Generate ASS subtitles
-                    outputs.ass = self.subtitle.generate_ass(resized_segments, output_prefix, audio_filepath)
-                    outputs.video = self.video.generate_video(outputs.ass, audio_filepath, output_prefix)
+                    outputs.ass = self._generate_ass(resized_segments, output_prefix, audio_filepath)
+                    extra_targets = self._get_extra_video_targets(output_prefix)
+                    outputs.video = self._generate_video(outputs.ass, audio_filepath, output_prefix, extra_targets=extra_targets)
+                    outputs.video_audio = self.video_audio.get(outputs.video)
+                    if extra_targets:
+                        outputs.extra_videos = [target.output_path for target in extra_targets]
 
             return outputs
 
@@ -207,6 +236,184 @@ class OutputGenerator:
             self.logger.error(f"Failed to generate outputs: {str(e)}")
             raise
 
+    def _audio_hash(self, audio_filepath: str) -> Optional[str]:
+        """Hash the audio file for use in stage cache keys."""
+        if not audio_filepath or not os.path.isfile(audio_filepath):
+            return None
+        return AudioFingerprint.md5(audio_filepath, cache_dir=self.config.cache_dir, logger=self.logger)
+
+    def _resize_segments(self, segments: List[LyricsSegment]) -> List[LyricsSegment]:
+        """Resize segments, reusing a cached result if the segments and line length are unchanged."""
+        if not self.stage_cache:
+            return self.segment_resizer.resize_segments(segments)
+
+        key_inputs = [[s.to_dict() for s in segments], self.segment_resizer.max_line_length]
+        if self.segment_resizer.max_line_width:
+            karaoke_styles = self.config.styles.get("karaoke", {})
+            key_inputs += [self.segment_resizer.max_line_width, karaoke_styles.get("font_path"), self.font_size]
+        key = StageCache.make_key("resize", *key_inputs)
+        return self.stage_cache.get_or_compute(
+            key,
+            lambda: self.segment_resizer.resize_segments(segments),
+            encode=lambda resized: [s.to_dict() for s in resized],
+            decode=lambda data: [LyricsSegment.from_dict(s) for s in data],
+        )
+
+    def _get_line_width_model(self) -> Tuple[Optional[TextWidthModel], Optional[float]]:
+        """The karaoke font's width model and the width available to a subtitle line, in pixels."""
+        karaoke_styles = self.config.styles.get("karaoke", {})
+        if karaoke_styles.get("text_case_transform", "none") != "none":
+            # Lines are measured as written, so case transforms would render wider or narrower than measured
+            self.logger.warning("Width-based line breaking doesn't support text_case_transform, measuring lines in characters")
+            return None, None
+        font_size = int(self.font_size * LyricsLine.ASS_FONT_SCALE)
+        text_width = TextWidthModel.for_font(karaoke_styles.get("font_path"), font_size, logger=self.logger)
+        if text_width is None:
+            self.logger.warning("Karaoke font unavailable, measuring lines in characters")
+            return None, None
+        margins = int(karaoke_styles.get("margin_l", 0)) + int(karaoke_styles.get("margin_r", 0))
+        max_line_width = self.video_resolution_num[0] - margins
+        self.logger.info(f"Breaking lines by rendered width: at most {max_line_width}px at font size {font_size}")
+        return text_width, max_line_width
+
+    def _generate_ass(self, segments: List[LyricsSegment], output_prefix: str, audio_filepath: str) -> str:
+        """Generate ASS subtitles, restoring a cached file if the inputs are unchanged."""
+        if not self.stage_cache:
+            return self.subtitle.generate_ass(segments, output_prefix, audio_filepath)
+
+        key = StageCache.make_key(
+            "ass",
+            [s.to_dict() for s in segments],
+            self._audio_hash(audio_filepath),
+            self.config.styles.get("karaoke", {}),
+            self.video_resolution_num,
+            self.font_size,
+            self.line_height,
+            self.config.subtitle_offset_ms,
+        )
+        output_path = self.subtitle._get_output_path(f"{output_prefix} (Karaoke)", "ass")
+        if self.stage_cache.get_file(key, output_path):
+            self.logger.info(f"Reused cached ASS subtitles: {output_path}")
+            return output_path
+
+        output_path = self.subtitle.generate_ass(segments, output_prefix, audio_filepath)
+        self.stage_cache.put_file(key, output_path)
+        return output_path
+
+    def _get_extra_video_targets(self, output_prefix: str) -> List[VideoOutputTarget]:
+        """Extra resolutions of the final video, rendered alongside it from the same filter graph."""
+        targets = []
+        for resolution in self.config.video_extra_resolutions:
+            dimensions = self._get_video_params(resolution)[0]
+            if dimensions == self.video_resolution_num:
+                continue
+            output_path = self.video._get_output_path(f"{output_prefix} (With Vocals) {resolution}", "mkv")
+            targets.append(VideoOutputTarget(output_path=output_path, resolution=dimensions))
+        return targets
+
+    def _generate_video(
+        self,
+        ass_path: str,
+        audio_filepath: str,
+        output_prefix: str,
+        time_window: Optional[Tuple[float, float]] = None,
+        extra_targets: Optional[List[VideoOutputTarget]] = None,
+    ) -> str:
+        """Render the (preview) video, restoring cached files if the subtitles, audio and styles are unchanged."""
+        if self.preview_mode and time_window is not None:
+            render = functools.partial(self.video.generate_preview_video, time_window=time_window)
+        elif self.preview_mode:
+            render = self.video.generate_preview_video
+        elif extra_targets:
+            render = functools.partial(self.video.generate_video, extra_targets=extra_targets)
+        else:
+            render = self.video.generate_video
+        if not self.stage_cache or not os.path.isfile(ass_path):
+            return self._render_video(render, ass_path, audio_filepath, output_prefix)
+
+        key_inputs = [
+            # Memoized by file version, so re-rendering with unchanged subtitles or background doesn't re-read them
+            AudioFingerprint.md5(ass_path, logger=self.logger),
+            self._audio_hash(audio_filepath),
+            self.config.styles.get("karaoke", {}),
+            self._referenced_file_hashes(self.config.styles.get("karaoke", {})),
+            self.video_resolution_num,
+            self.preview_mode,
+            self.config.video_audio_policy,
+        ]
+        if self.preview_mode and time_window is not None:
+            key_inputs.append(list(time_window))
+        if extra_targets:
+            key_inputs.append([[target.resolution, target.video_codec, target.video_bitrate] for target in extra_targets])
+        key = StageCache.make_key("video", *key_inputs)
+        extra_keys = [StageCache.make_key("video", key, target.resolution) for target in extra_targets or []]
+        if self.preview_mode:
+            output_path = os.path.join(self.config.cache_dir, f"{output_prefix}_preview.mp4")
+        else:
+            output_path = self.video._get_output_path(f"{output_prefix} (With Vocals)", "mkv")
+        audio_key = StageCache.make_key("video", key, "audio")
+        extra_paths = [target.output_path for target in extra_targets or []]
+        # Videos are hard-linked to their cache entries rather than copied, so they're only written once
+        if self.stage_cache.get_file(key, output_path, link=True) and all(
+            self.stage_cache.get_file(extra_key, extra_path, link=True) for extra_key, extra_path in zip(extra_keys, extra_paths)
+        ):
+            self.logger.info(f"Reused cached video: {output_path}")
+            self.video_audio[output_path] = self.stage_cache.get(audio_key)
+            return output_path
+
+        for path in [output_path, *extra_paths]:
+            StageCache.detach_file(path)
+        output_path = self._render_video(render, ass_path, audio_filepath, output_prefix)
+        self.stage_cache.put_file(key, output_path, link=True)
+        if self.video_audio.get(output_path):
+            self.stage_cache.put(audio_key, self.video_audio[output_path])
+        for extra_key, extra_path in zip(extra_keys, extra_paths):
+            self.stage_cache.put_file(extra_key, extra_path, link=True)
+        return output_path
+
+    def _render_video(self, render, ass_path: str, audio_filepath: str, output_prefix: str) -> str:
+        """Run a video render and record how its audio was produced."""
+        output_path = render(ass_path, audio_filepath, output_prefix)
+        audio = self.video.audio_handling.get(output_path)
+        self.video_audio[output_path] = audio.to_dict() if audio else None
+        return output_path
+
+    def _generate_cdg(self, segments: List[LyricsSegment], audio_filepath: str, title: str, artist: str) -> tuple:
+        """Generate CDG files, restoring the cached CDG ZIP if the inputs are unchanged."""
+        cdg_styles = self.config.styles["cdg"]
+        if not self.stage_cache:
+            return self.cdg.generate_cdg(segments=segments, audio_file=audio_filepath, title=title, artist=artist, cdg_styles=cdg_styles)
+
+        key = StageCache.make_key(
+            "cdg",
+            [s.to_dict() for s in segments],
+            self._audio_hash(audio_filepath),
+            title,
+            artist,
+            cdg_styles,
+            self._referenced_file_hashes(cdg_styles),
+        )
+        zip_path = os.path.join(self.cdg.output_dir, self.cdg._get_safe_filename(artist, title, "Karaoke", "zip"))
+        if self.stage_cache.get_file(key, zip_path):
+            self.cdg._extract_cdg_files(zip_path)
+            cdg_file, mp3_file = self.cdg._get_cdg_path(artist, title), self.cdg._get_mp3_path(artist, title)
+            self.cdg._verify_output_files(cdg_file, mp3_file)
+            self.logger.info(f"Reused cached CDG files: {zip_path}")
+            return cdg_file, mp3_file, zip_path
+
+        cdg_file, mp3_file, zip_path = self.cdg.generate_cdg(
+            segments=segments, audio_file=audio_filepath, title=title, artist=artist, cdg_styles=cdg_styles
+        )
+        self.stage_cache.put_file(key, zip_path)
+        return cdg_file, mp3_file, zip_path
+
+    @staticmethod
+    def _referenced_file_hashes(styles: Dict[str, Any]) -> Dict[str, str]:
+        """Content hashes of the files (images, fonts) a style section points to, so replacing one changes stage keys."""
+        return {
+            name: ImageAssetCache.source_hash(value) for name, value in sorted(styles.items()) if isinstance(value, str) and os.path.isfile(value)
+        }
+
     def _get_output_path(self, output_prefix: str, extension: str) -> str:
         """Generate full output path for a file."""
         return os.path.join(self.config.output_dir or self.config.cache_dir, f"{output_prefix}.{extension}")
@@ -243,13 +450,16 @@ class OutputGenerator:
         return resolution_dims, font_size, line_height
 
     def write_corrections_data(self, correction_result: CorrectionResult, output_prefix: str) -> str:
-        """Write corrections data to JSON file."""
+        """Write corrections data to JSON file, in the compact format if enabled in the config."""
         self.logger.info("Writing corrections data JSON")
         output_path = self._get_output_path(f"{output_prefix} (Lyrics Corrections)", "json")
 
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(correction_result.to_dict(), f, indent=2, ensure_ascii=False)
+            if self.config.compact_corrections_json:
+                serialization.dump_file(correction_result.to_compact_dict(), output_path)
+            else:
+                with open(output_path, "w", encoding="utf-8") as f:
+                    json.dump(correction_result.to_dict(), f, indent=2, ensure_ascii=False)
             self.logger.info(f"Corrections data JSON generated: {output_path}")
             return output_path
         except Exception as e:
@@ -0,0 +1,96 @@
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, Union
+
+
+class PreviewCache:
+    """Rendered preview videos, looked up by preview hash and bounded in total size.
+
+    Previews are stored as preview_{hash}.mp4 in one directory, so a preview rendered earlier (in this
+    session or a previous one) is returned without re-rendering. Concurrent requests for the same hash
+    share a single render. File modification times record last use, and the least recently used
+    previews are deleted once the directory grows past max_size_mb.
+    """
+
+    def __init__(self, preview_dir: Union[str, Path], max_size_mb: int = 500, logger: Optional[logging.Logger] = None):
+        self.preview_dir = Path(preview_dir)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._render_locks: Dict[str, threading.Lock] = {}
+
+    def path_for(self, preview_hash: str) -> Path:
+        return self.preview_dir / f"preview_{preview_hash}.mp4"
+
+    def get(self, preview_hash: str) -> Optional[str]:
+        """Return the cached preview's path, marking it as recently used, or None if not cached."""
+        path = self.path_for(preview_hash)
+        try:
+            if path.stat().st_size == 0:
+                return None
+            os.utime(path)
+        except OSError:
+            return None
+        return str(path)
+
+    def get_or_render(self, preview_hash: str, render: Callable[[], str]) -> Tuple[str, bool]:
+        """Return (path, rendered): the cached preview, or the output of render() moved into the cache.
+
+        If another thread is already rendering this hash, wait for it and reuse its file.
+        """
+        with self._lock:
+            render_lock = self._render_locks.setdefault(preview_hash, threading.Lock())
+
+        try:
+            with render_lock:
+                if cached := self.get(preview_hash):
+                    self.logger.info(f"Reusing cached preview video: {cached}")
+                    return cached, False
+
+                rendered_path = render()
+                return self._store(preview_hash, rendered_path), True
+        finally:
+            with self._lock:
+                if self._render_locks.get(preview_hash) is render_lock and not render_lock.locked():
+                    del self._render_locks[preview_hash]
+
+    def evict(self, protect: Optional[str] = None) -> int:
+        """Delete least recently used previews until under the size limit; returns the number deleted."""
+        entries = []
+        for path in self.preview_dir.glob("preview_*.mp4"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_size_bytes:
+                break
+            if protect is not None and path == self.path_for(protect):
+                continue
+            try:
+                path.unlink()
+            except OSError as e:
+                self.logger.debug(f"Failed to evict preview {path}: {e}")
+                continue
+            total -= size
+            removed += 1
+            self.logger.debug(f"Evicted preview video: {path}")
+        return removed
+
+    def _store(self, preview_hash: str, rendered_path: str) -> str:
+        """Move a freshly rendered preview into the cache directory and enforce the size limit."""
+        self.preview_dir.mkdir(parents=True, exist_ok=True)
+        cached_path = self.path_for(preview_hash)
+        if Path(rendered_path).resolve() != cached_path.resolve():
+            tmp_path = cached_path.with_suffix(".mp4.tmp")
+            shutil.move(rendered_path, tmp_path)
+            os.replace(tmp_path, cached_path)
+        self.evict(protect=preview_hash)
+        return str(cached_path)
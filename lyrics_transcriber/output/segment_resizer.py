@@ -2,6 +2,7 @@ import logging
 import re
 from typing import List, Optional
 
+from lyrics_transcriber.output.text_width import TextWidthModel
 from lyrics_transcriber.types import LyricsSegment, Word
 from lyrics_transcriber.utils.word_utils import WordUtils
 
@@ -13,6 +14,10 @@ class SegmentResizer:
     a maximum line length. It attempts to split at natural break points like sentence endings,
     commas, or conjunctions to maintain readability.
 
+    By default lines are measured in characters. Given a TextWidthModel and a max_line_width, lines
+    are measured in rendered pixels instead, which suits proportional fonts, and oversized segments
+    are split into the fewest lines that fit, choosing the best break points for all of them at once.
+
     Example:
         resizer = SegmentResizer(max_line_length=36)
         segments = [
@@ -33,14 +38,34 @@ class SegmentResizer:
         # ]
     """
 
-    def __init__(self, max_line_length: int = 36, logger: Optional[logging.Logger] = None):
+    # Break tiers, matching the priorities of _find_break_points; a break after the last word of a
+    # sentence is best, a break with no natural boundary worst
+    SENTENCE_ENDINGS = (".", "!", "?")
+    CONJUNCTIONS = ("and", "but", "or")
+    MINOR_WORDS = ("in", "at", "the", "a")
+    NO_BREAK_TIER = 5
+    LINE_COST = 1000.0  # Per line, so the fewest lines always win
+    TIER_COST = 20.0
+    SLACK_COST = 10.0
+
+    def __init__(
+        self,
+        max_line_length: int = 36,
+        logger: Optional[logging.Logger] = None,
+        text_width: Optional[TextWidthModel] = None,
+        max_line_width: Optional[float] = None,
+    ):
         """Initialize the SegmentResizer.
 
         Args:
             max_line_length: Maximum allowed length for a single line of text
             logger: Optional logger for debugging information
+            text_width: Optional model of the rendered text widths of the subtitle font
+            max_line_width: Maximum rendered width of a line in pixels; used together with text_width
         """
         self.max_line_length = max_line_length
+        self.text_width = text_width if max_line_width else None
+        self.max_line_width = max_line_width if text_width else None
         self.logger = logger or logging.getLogger(__name__)
 
     def resize_segments(self, segments: List[LyricsSegment]) -> List[LyricsSegment]:
@@ -68,8 +93,8 @@ class SegmentResizer:
         for segment_idx, segment in enumerate(segments):
             cleaned_segment = self._create_cleaned_segment(segment)
 
-            # Only split if the segment is longer than max_line_length
-            if len(cleaned_segment.text) <= self.max_line_length:
+            # Only split if the segment is longer than max_line_length (or wider than max_line_width)
+            if self._fits(cleaned_segment.text):
                 resized_segments.append(cleaned_segment)
                 continue
 
@@ -134,7 +159,10 @@ class SegmentResizer:
         segment_text = self._clean_text(segment.text)
 
         self.logger.info(f"Processing oversized segment {segment_idx}: '{segment_text}'")
-        split_lines = self._process_segment_text(segment_text)
+        if self.text_width is not None:
+            split_lines = self._break_lines_by_width(segment_text)
+        else:
+            split_lines = self._process_segment_text(segment_text)
         self.logger.debug(f"Split into {len(split_lines)} lines: {split_lines}")
 
         return self._create_segments_from_lines(segment_text, split_lines, segment.words)
@@ -235,13 +263,78 @@ class SegmentResizer:
         """Create a new segment from a list of words."""
         cleaned_text = self._clean_text(line)
         return LyricsSegment(
-            id=WordUtils.generate_id(),  # Generate new ID for split segments
+            id=WordUtils.generate_id(key=f"segment:{words[0].id}:{words[-1].id}"),  # Stable ID for split segments
             text=cleaned_text,
             words=words,
             start_time=words[0].start_time,
             end_time=words[-1].end_time,
         )
 
+    def _fits(self, text: str) -> bool:
+        """Check if text fits on one line."""
+        if self.text_width is not None:
+            return self.text_width.width(text) <= self.max_line_width
+        return len(text) <= self.max_line_length
+
+    def _break_lines_by_width(self, text: str) -> List[str]:
+        """Split text into lines no wider than max_line_width, choosing all break points in one pass.
+
+        Dynamic programming over the words: best[j] is the lowest cost of laying out the first j words,
+        where each line costs LINE_COST, plus TIER_COST per break tier (so breaks at sentence ends and
+        commas are preferred, as in _find_break_points), plus SLACK_COST for unused width (so lines are
+        balanced). Words are measured once and line widths come from prefix sums. A word wider than a
+        line on its own gets a line of its own.
+        """
+        words = text.split()
+        if not words:
+            return []
+        space = self.text_width.advance(" ")
+        prefix = [0.0]
+        for word in words:
+            prefix.append(prefix[-1] + self.text_width.width(word))
+
+        count = len(words)
+        best = [0.0] + [float("inf")] * count
+        previous_break = [0] * (count + 1)
+        for end in range(1, count + 1):
+            tier = self._break_tier(words, end)
+            for start in range(end - 1, -1, -1):
+                width = prefix[end] - prefix[start] + space * (end - start - 1)
+                if width > self.max_line_width and start < end - 1:
+                    break  # Adding earlier words only makes the line wider
+                slack = max(0.0, self.max_line_width - width) / self.max_line_width
+                cost = best[start] + self.LINE_COST + self.TIER_COST * tier + self.SLACK_COST * slack * slack
+                if cost < best[end]:
+                    best[end] = cost
+                    previous_break[end] = start
+
+        lines: List[str] = []
+        end = count
+        while end > 0:
+            start = previous_break[end]
+            lines.append(" ".join(words[start:end]))
+            end = start
+        lines.reverse()
+        self.logger.debug(f"Split '{text}' by width into {len(lines)} lines: {lines}")
+        return lines
+
+    def _break_tier(self, words: List[str], end: int) -> int:
+        """Tier of a break after words[end - 1]; 0 is the most natural. The end of the text costs nothing."""
+        if end == len(words):
+            return 0
+        last_word, next_word = words[end - 1], words[end]
+        if last_word.endswith(self.SENTENCE_ENDINGS):
+            return 0
+        if last_word.endswith(";") or next_word == "-":
+            return 1
+        if last_word.endswith(","):
+            return 2
+        if next_word in self.CONJUNCTIONS:
+            return 3
+        if next_word in self.MINOR_WORDS:
+            return 4
+        return self.NO_BREAK_TIER
+
     def _process_segment_text(self, text: str) -> List[str]:
         """Process segment text to determine optimal split points."""
         self.logger.debug(f"Processing segment text: '{text}'")
@@ -1,11 +1,12 @@
+import heapq
 import os
 import logging
+import threading
+from collections import OrderedDict
 from typing import List, Optional, Tuple, Union
-import subprocess
-import json
 
 from lyrics_transcriber.output.ass.section_screen import SectionScreen
-from lyrics_transcriber.types import LyricsSegment, Word
+from lyrics_transcriber.types import LyricsSegment
 from lyrics_transcriber.output.ass import LyricsScreen, LyricsLine
 from lyrics_transcriber.output.ass.ass import ASS
 from lyrics_transcriber.output.ass.style import Style
@@ -13,11 +14,19 @@ from lyrics_transcriber.output.ass.constants import ALIGN_TOP_CENTER
 from lyrics_transcriber.output.ass import LyricsScreen
 from lyrics_transcriber.output.ass.section_detector import SectionDetector
 from lyrics_transcriber.output.ass.config import ScreenConfig
+from lyrics_transcriber.output.ass.screen_layout import IntervalIndex, ShiftedSegment
+from lyrics_transcriber.utils.media_probe import MediaProbe
 
 
 class SubtitlesGenerator:
     """Handles generation of subtitle files in various formats."""
 
+    MAX_SCREEN_PLANS = 16
+
+    # Screen layouts by segment timings, shared across generators (e.g. preview and final renders)
+    _screen_plans: "OrderedDict[Tuple, Tuple[Tuple[int, ...], ...]]" = OrderedDict()
+    _screen_plans_lock = threading.Lock()
+
     def __init__(
         self,
         output_dir: str,
@@ -27,6 +36,7 @@ class SubtitlesGenerator:
         styles: dict,
         subtitle_offset_ms: int = 0,
         logger: Optional[logging.Logger] = None,
+        cache_dir: Optional[str] = None,
     ):
         """Initialize SubtitleGenerator.
 
@@ -38,8 +48,10 @@ class SubtitlesGenerator:
             styles: Dictionary of style configurations
             subtitle_offset_ms: Offset for subtitle timing in milliseconds
             logger: Optional logger instance
+            cache_dir: Optional directory where probed audio metadata is kept between runs
         """
         self.output_dir = output_dir
+        self.cache_dir = cache_dir
         self.video_resolution = video_resolution
         self.font_size = font_size
         self.styles = styles
@@ -87,22 +99,19 @@ class SubtitlesGenerator:
         return os.path.join(self.output_dir, f"{output_prefix}.{extension}")
 
     def _get_audio_duration(self, audio_filepath: str, segments: Optional[List[LyricsSegment]] = None) -> float:
-        """Get audio duration using ffprobe."""
-        try:
-            probe_cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "json", audio_filepath]
-            probe_output = subprocess.check_output(probe_cmd, universal_newlines=True)
-            probe_data = json.loads(probe_output)
-            duration = float(probe_data["format"]["duration"])
-            self.logger.debug(f"Detected audio duration: {duration:.2f}s")
+        """Get audio duration from the shared media probe."""
+        info = MediaProbe.probe(audio_filepath, cache_dir=self.cache_dir, logger=self.logger)
+        if info and info.duration is not None:
+            self.logger.debug(f"Detected audio duration: {info.duration:.2f}s")
+            return info.duration
+
+        self.logger.error(f"Failed to get audio duration of {audio_filepath}")
+        # Fallback to last segment end time plus buffer
+        if segments:
+            duration = segments[-1].end_time + 30.0
+            self.logger.warning(f"Using fallback duration: {duration:.2f}s")
             return duration
-        except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError) as e:
-            self.logger.error(f"Failed to get audio duration: {e}")
-            # Fallback to last segment end time plus buffer
-            if segments:
-                duration = segments[-1].end_time + 30.0
-                self.logger.warning(f"Using fallback duration: {duration:.2f}s")
-                return duration
-            return 0.0
+        return 0.0
 
     def generate_ass(self, segments: List[LyricsSegment], output_prefix: str, audio_filepath: str) -> str:
         self.logger.info("Generating ASS format subtitles")
@@ -130,39 +139,19 @@ class SubtitlesGenerator:
         """Create screens from segments with detailed logging."""
         self.logger.debug("Creating screens from segments")
 
-        # Apply timing offset to segments if needed
-        if self.subtitle_offset_ms != 0:
+        # Apply timing offset to segments if needed; the segments are viewed with shifted times, not copied
+        offset_seconds = self.subtitle_offset_ms / 1000.0
+        if offset_seconds:
             self.logger.info(f"Subtitle offset: {self.subtitle_offset_ms}ms")
-
-            offset_seconds = self.subtitle_offset_ms / 1000.0
-            segments = [
-                LyricsSegment(
-                    id=seg.id,  # Preserve original segment ID
-                    text=seg.text,
-                    words=[
-                        Word(
-                            id=word.id,  # Preserve original word ID
-                            text=word.text,
-                            start_time=max(0, word.start_time + offset_seconds),
-                            end_time=word.end_time + offset_seconds,
-                            confidence=word.confidence,
-                            created_during_correction=getattr(word, "created_during_correction", False),  # Preserve correction flag
-                        )
-                        for word in seg.words
-                    ],
-                    start_time=max(0, seg.start_time + offset_seconds),
-                    end_time=seg.end_time + offset_seconds,
-                )
-                for seg in segments
-            ]
-            self.logger.info(f"Applied {self.subtitle_offset_ms}ms offset to segment timings")
+        shifted_segments = ShiftedSegment.shift_all(segments, offset_seconds)
 
         # Create section screens and get instrumental boundaries
-        section_screens = self._create_section_screens(segments, song_duration)
+        section_screens = self._create_section_screens(shifted_segments, song_duration)
         instrumental_times = self._get_instrumental_times(section_screens)
 
-        # Create regular lyric screens
-        lyric_screens = self._create_lyric_screens(segments, instrumental_times)
+        # Create regular lyric screens, reusing the layout of earlier renders of these segments
+        plan = self._get_screen_plan(segments, offset_seconds, song_duration, instrumental_times)
+        lyric_screens = self._build_lyric_screens(shifted_segments, plan)
 
         # Merge and process all screens
         all_screens = self._merge_and_process_screens(section_screens, lyric_screens)
@@ -189,48 +178,103 @@ class SubtitlesGenerator:
 
         return instrumental_times
 
+    def _get_screen_plan(
+        self, segments: List[LyricsSegment], offset: float, song_duration: float, instrumental_times: List[Tuple[float, float]]
+    ) -> Tuple[Tuple[int, ...], ...]:
+        """Which segments go on which lyric screen, shared by all renders of the same segments.
+
+        An offset moves every segment by the same amount, so the layout is planned in the segments' own
+        timing and reused when only the offset changes (e.g. between preview and final renders). Offsets
+        that push segments before 0s clamp their start times and get a layout of their own.
+        """
+        layout_offset = offset if offset and any(segment.start_time + offset < 0 for segment in segments) else 0.0
+        key = (layout_offset, self.config.max_visible_lines, tuple((s.id, s.start_time, s.end_time) for s in segments))
+        with self._screen_plans_lock:
+            plan = self._screen_plans.get(key)
+            if plan is not None:
+                self._screen_plans.move_to_end(key)
+                self.logger.debug("Reusing screen layout")
+                return plan
+
+        if layout_offset != offset:
+            instrumental_times = self._get_instrumental_times(self._create_section_screens(segments, song_duration))
+        plan = self._plan_lyric_screens(ShiftedSegment.shift_all(segments, layout_offset), instrumental_times)
+        with self._screen_plans_lock:
+            self._screen_plans[key] = plan
+            while len(self._screen_plans) > self.MAX_SCREEN_PLANS:
+                self._screen_plans.popitem(last=False)
+        return plan
+
+    @classmethod
+    def clear_screen_plans(cls) -> None:
+        """Forget all remembered screen layouts."""
+        with cls._screen_plans_lock:
+            cls._screen_plans.clear()
+
     def _create_lyric_screens(self, segments: List[LyricsSegment], instrumental_times: List[Tuple[float, float]]) -> List[LyricsScreen]:
         """Create regular lyric screens, handling instrumental boundaries."""
-        screens: List[LyricsScreen] = []
-        current_screen: Optional[LyricsScreen] = None
+        return self._build_lyric_screens(segments, self._plan_lyric_screens(segments, instrumental_times))
+
+    def _plan_lyric_screens(
+        self, segments: List[LyricsSegment], instrumental_times: List[Tuple[float, float]]
+    ) -> Tuple[Tuple[int, ...], ...]:
+        """Group segments into screens in one pass, returning the segment indices on each screen."""
+        instrumentals = IntervalIndex(instrumental_times)
+        screens: List[List[int]] = []
 
         for i, segment in enumerate(segments):
             self.logger.debug(f"Processing segment {i}: {segment.start_time:.2f}s - {segment.end_time:.2f}s")
 
             # Skip segments in instrumental sections
-            if self._is_in_instrumental_section(segment, instrumental_times):
+            if self._is_in_instrumental_section(segment, instrumentals):
                 continue
 
             # Check if we need a new screen
-            if self._should_start_new_screen(current_screen, segment, instrumental_times):
-                # fmt: off
-                current_screen = LyricsScreen(
-                    video_size=self.video_resolution,
-                    line_height=self.config.line_height,
-                    config=self.config,
-                    logger=self.logger
-                )
-                # fmt: on
-                screens.append(current_screen)
+            previous_segment = segments[screens[-1][-1]] if screens else None
+            if not screens or len(screens[-1]) >= self.config.max_visible_lines or (
+                self._follows_instrumental(previous_segment, segment, instrumentals)
+            ):
+                screens.append([])
                 self.logger.debug("  Created new screen")
 
-            # Add line to current screen
-            line = LyricsLine(logger=self.logger, segment=segment, screen_config=self.config)
-            current_screen.lines.append(line)
-            self.logger.debug(f"  Added line to screen (now has {len(current_screen.lines)} lines)")
+            screens[-1].append(i)
+            self.logger.debug(f"  Added line to screen (now has {len(screens[-1])} lines)")
+
+        return tuple(tuple(screen) for screen in screens)
 
+    def _build_lyric_screens(self, segments: List[LyricsSegment], plan: Tuple[Tuple[int, ...], ...]) -> List[LyricsScreen]:
+        """Create the lyric screens of a screen plan."""
+        screens: List[LyricsScreen] = []
+        for segment_indices in plan:
+            # fmt: off
+            screen = LyricsScreen(
+                video_size=self.video_resolution,
+                line_height=self.config.line_height,
+                config=self.config,
+                logger=self.logger
+            )
+            # fmt: on
+            screen.lines.extend(LyricsLine(logger=self.logger, segment=segments[i], screen_config=self.config) for i in segment_indices)
+            screens.append(screen)
         return screens
 
-    def _is_in_instrumental_section(self, segment: LyricsSegment, instrumental_times: List[Tuple[float, float]]) -> bool:
+    def _is_in_instrumental_section(
+        self, segment: LyricsSegment, instrumental_times: Union[IntervalIndex, List[Tuple[float, float]]]
+    ) -> bool:
         """Check if a segment falls within any instrumental section."""
-        for inst_start, inst_end in instrumental_times:
-            if segment.start_time >= inst_start and segment.start_time < inst_end:
-                self.logger.debug(f"  Skipping segment - falls within instrumental {inst_start:.2f}s - {inst_end:.2f}s")
-                return True
+        if not isinstance(instrumental_times, IntervalIndex):
+            instrumental_times = IntervalIndex(instrumental_times)
+        instrumental = instrumental_times.containing(segment.start_time)
+        if instrumental is not None:
+            self.logger.debug(f"  Skipping segment - falls within instrumental {instrumental[0]:.2f}s - {instrumental[1]:.2f}s")
+            return True
         return False
 
     def _should_start_new_screen(
-        self, current_screen: Optional[LyricsScreen], segment: LyricsSegment, instrumental_times: List[Tuple[float, float]]
+        self,
+        current_screen: Optional[LyricsScreen],
+        segment: LyricsSegment,
+        instrumental_times: Union[IntervalIndex, List[Tuple[float, float]]],
     ) -> bool:
         """Determine if a new screen should be started."""
         if current_screen is None:
@@ -241,20 +285,31 @@ class SubtitlesGenerator:
 
         # Check if this segment is first after any instrumental section
         if current_screen.lines:
-            prev_segment = current_screen.lines[-1].segment
-            for inst_start, inst_end in instrumental_times:
-                if prev_segment.end_time <= inst_start and segment.start_time >= inst_end:
-                    self.logger.debug(f"  Forcing new screen - first segment after instrumental {inst_start:.2f}s - {inst_end:.2f}s")
-                    return True
+            if not isinstance(instrumental_times, IntervalIndex):
+                instrumental_times = IntervalIndex(instrumental_times)
+            return self._follows_instrumental(current_screen.lines[-1].segment, segment, instrumental_times)
 
         return False
 
+    def _follows_instrumental(self, previous_segment: Optional[LyricsSegment], segment: LyricsSegment, instrumentals: IntervalIndex) -> bool:
+        """Check if an instrumental section lies between the previous segment and this one."""
+        if previous_segment is None or not instrumentals:
+            return False
+        instrumental = instrumentals.within(previous_segment.end_time, segment.start_time)
+        if instrumental is not None:
+            self.logger.debug(f"  Forcing new screen - first segment after instrumental {instrumental[0]:.2f}s - {instrumental[1]:.2f}s")
+            return True
+        return False
+
     def _merge_and_process_screens(
         self, section_screens: List[SectionScreen], lyric_screens: List[LyricsScreen]
     ) -> List[Union[SectionScreen, LyricsScreen]]:
         """Merge section and lyric screens in chronological order."""
-        # Sort all screens by start time
-        return sorted(section_screens + lyric_screens, key=lambda s: s.start_ts)
+        start_ts = lambda screen: screen.start_ts
+        # Both lists normally come out in order already, so a linear merge suffices; ties keep sections first
+        if all(start_ts(a) <= start_ts(b) for screens in (section_screens, lyric_screens) for a, b in zip(screens, screens[1:])):
+            return list(heapq.merge(section_screens, lyric_screens, key=start_ts))
+        return sorted(section_screens + lyric_screens, key=start_ts)
 
     def _log_final_screens(self, screens: List[Union[SectionScreen, LyricsScreen]]) -> None:
         """Log details of all final screens."""
@@ -367,8 +422,7 @@ class SubtitlesGenerator:
             if isinstance(screen, SectionScreen):
                 # Create section marker events (returns tuple of ([event], []))
                 section_events, _ = screen.as_ass_events(style=style)
-                for event in section_events:  # Now we're iterating over the list of events
-                    ass_file.add(event)
+                ass_file.extend(section_events)
 
                 previous_instrumental_end = screen.end_time
                 active_lines = []
@@ -391,7 +445,6 @@ class SubtitlesGenerator:
                 previous_instrumental_end = None
 
             # Add all events to ASS file
-            for event in events:
-                ass_file.add(event)
+            ass_file.extend(events)
 
         return ass_file
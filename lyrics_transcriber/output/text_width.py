@@ -0,0 +1,63 @@
+import logging
+import os
+import threading
+from typing import Dict, Optional, Tuple, Union
+
+from PIL import ImageFont
+
+
+class TextWidthModel:
+    """Rendered pixel widths of text in one font and size, from a cached table of glyph advances.
+
+    Each character is measured once with FreeType; the width of a line is then the sum of its glyph
+    advances (kerning is ignored, which is well within a pixel or two per line). Models are shared per
+    font file and size, so the segment resizer and the subtitle renderer load and measure a font once
+    per process instead of once per line.
+    """
+
+    _models: Dict[Tuple[str, int], "TextWidthModel"] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, font: Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]):
+        self.font = font
+        self._advances: Dict[str, float] = {}
+
+    @classmethod
+    def for_font(cls, font_path: Optional[str], font_size: int, logger: Optional[logging.Logger] = None) -> Optional["TextWidthModel"]:
+        """Return the shared model of a font file at a size, or None if the font can't be loaded."""
+        logger = logger or logging.getLogger(__name__)
+        if not font_path or not os.path.isfile(font_path):
+            logger.warning(f"Could not load font {font_path} for text measurement")
+            return None
+
+        key = (os.path.realpath(font_path), int(font_size))
+        with cls._lock:
+            model = cls._models.get(key)
+        if model is not None:
+            return model
+
+        try:
+            font = ImageFont.truetype(font_path, size=int(font_size))
+        except OSError as e:
+            logger.warning(f"Could not load font {font_path} for text measurement: {e}")
+            return None
+        with cls._lock:
+            return cls._models.setdefault(key, cls(font))
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget all shared models."""
+        with cls._lock:
+            cls._models.clear()
+
+    def advance(self, char: str) -> float:
+        """Horizontal advance of one character, in pixels."""
+        advance = self._advances.get(char)
+        if advance is None:
+            advance = self._advances[char] = self.font.getlength(char)
+        return advance
+
+    def width(self, text: str) -> float:
+        """Rendered width of a single line of text, in pixels."""
+        advances = self._advances
+        return sum(advances[char] if char in advances else self.advance(char) for char in text)
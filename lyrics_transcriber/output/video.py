@@ -1,13 +1,92 @@
 import logging
 import os
-import json
+import shutil
 import subprocess
-from typing import List, Optional, Tuple
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+from lyrics_transcriber.output.ffmpeg_progress import FFmpegProgress, FFmpegProgressRunner
+from lyrics_transcriber.utils.audio_fingerprint import AudioFingerprint
+from lyrics_transcriber.utils.image_cache import ImageAssetCache
+from lyrics_transcriber.utils.media_probe import MediaProbe
+
+# ASS override tags that change the rendered subtitle from frame to frame: per-word karaoke highlights,
+# animated transforms and moves, and complex fades
+_DYNAMIC_TAGS_RE = re.compile(r"\\(?:k|kf|ko)\d|\\t\(|\\move\(|\\fade\(")
+_FADE_TAG_RE = re.compile(r"\\fad\((\d+),\s*(\d+)\)")
+# A single karaoke sweep across the whole line, as used by section screens
+_SWEEP_TAG_RE = re.compile(r"\\K\d")
+
+
+@dataclass(frozen=True)
+class RenderSegment:
+    """A span of the final video that is encoded on its own before the spans are joined."""
+
+    start: float  # Seconds
+    end: float  # Seconds
+    kind: str = "dynamic"  # How much the subtitles change: "dynamic", "slow", "static" or "empty"
+
+
+@dataclass(frozen=True)
+class VideoOutputTarget:
+    """One file produced alongside the final video by a multi-output render."""
+
+    output_path: str
+    resolution: Optional[Tuple[int, int]] = None  # Defaults to the generator's video resolution
+    video_codec: Optional[str] = None  # Defaults to the generator's encoder (NVENC or libx264)
+    video_bitrate: Optional[str] = None  # e.g. "2000k"; defaults to the final video's encoder settings
+    audio_path: Optional[str] = None  # Audio track, e.g. an instrumental; defaults to the job's audio
+    audio_codec: Optional[str] = None  # Defaults to the generator's audio policy (stream copy where possible)
+    audio_bitrate: Optional[str] = None  # e.g. "192k", for lossy audio codecs
+
+
+@dataclass(frozen=True)
+class AudioHandling:
+    """How the audio track of a rendered video was produced."""
+
+    # "copy": the input stream is copied as-is; "intermediate": encoded once to a cached file that every
+    # output copies from; "encode": encoded by each render
+    mode: str
+    codec: str  # Codec of the audio in the output
+    source_path: str  # Audio file the render reads
+
+    @property
+    def codec_args(self) -> List[str]:
+        """FFmpeg output options for the audio stream."""
+        return ["-c:a", self.codec] if self.mode == "encode" else ["-c:a", "copy"]
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"mode": self.mode, "codec": self.codec}
 
 
 class VideoGenerator:
     """Handles generation of video files with lyrics overlay."""
 
+    FRAME_RATE = 30  # Frame rate of the final video
+    MIN_CHUNK_SECONDS = 10.0  # Shortest part a chunked render splits the video into
+    MIN_FAST_PATH_SECONDS = 3.0  # Shortest span rendered by the static fast path rather than as a dynamic span
+    STILL_CLIP_FRAMES = 60  # Length of the background-only clip repeated for spans without subtitles
+
+    _SPAN_KINDS = ["empty", "static", "slow", "dynamic"]  # In order of rendering cost
+    _SUBTITLE_FRAME_RATES = {"static": 1, "slow": 10}  # Rate subtitles are drawn at in fast-path spans
+
+    AUDIO_POLICIES = ("auto", "encode")
+    # Audio codecs (as named by ffprobe) each output container can hold without re-encoding. MP4 is
+    # limited to what browsers play, since the review previews are MP4.
+    _CONTAINER_AUDIO_CODECS = {
+        # Compressed codecs only: uncompressed PCM (e.g. WAV input) goes to a FLAC intermediate rather than being copied
+        "mkv": {"flac", "mp3", "aac", "opus", "vorbis", "alac", "ac3", "eac3"},
+        "mp4": {"aac", "mp3"},
+    }
+    _ENCODE_AUDIO_CODECS = {"mkv": "flac", "mp4": "aac"}  # Codec each container is encoded to when copying isn't possible
+    _INTERMEDIATE_AUDIO_FORMATS = {"flac": ("flac", []), "aac": ("m4a", ["-b:a", "192k"])}  # codec -> (extension, options)
+
     def __init__(
         self,
         output_dir: str,
@@ -15,6 +94,11 @@ class VideoGenerator:
         video_resolution: Tuple[int, int],
         styles: dict,
         logger: Optional[logging.Logger] = None,
+        render_chunks: int = 1,
+        static_fast_path: bool = False,
+        audio_policy: str = "encode",
+        progress_callback: Optional[Callable[[FFmpegProgress], None]] = None,
+        stall_timeout: Optional[float] = None,
     ):
         """Initialize VideoGenerator.
 
@@ -24,14 +108,31 @@ class VideoGenerator:
             video_resolution: Tuple of (width, height) for video resolution
             styles: Dictionary of output video & CDG styling configuration
             logger: Optional logger instance
+            render_chunks: Number of parts the final video is split into and encoded in parallel (1 renders in one process)
+            static_fast_path: Render spans where the subtitles don't change, such as instrumental breaks, as cheap separate segments
+            audio_policy: "encode" re-encodes the audio in every render; "auto" copies the input audio stream when the
+                output container accepts its codec, and otherwise encodes it once to a cached intermediate file
+            progress_callback: Called with live FFmpeg metrics (FFmpegProgress) while videos are encoded
+            stall_timeout: Kill an FFmpeg encode whose output hasn't advanced for this many seconds
         """
         if not all(x > 0 for x in video_resolution):
             raise ValueError("Video resolution dimensions must be greater than 0")
+        if render_chunks < 1:
+            raise ValueError("Number of video render chunks must be at least 1")
+        if audio_policy not in self.AUDIO_POLICIES:
+            raise ValueError(f"Invalid audio policy: {audio_policy}. Must be one of: {', '.join(self.AUDIO_POLICIES)}")
 
         self.output_dir = output_dir
         self.cache_dir = cache_dir
         self.video_resolution = video_resolution
         self.styles = styles
+        self.render_chunks = render_chunks
+        self.static_fast_path = static_fast_path
+        self.audio_policy = audio_policy
+        self.audio_handling: Dict[str, AudioHandling] = {}  # Output path -> how its audio was produced
+        self.progress_callback = progress_callback
+        self.stall_timeout = stall_timeout
+        self.render_metrics: deque = deque(maxlen=100)  # Final FFmpegProgress.to_dict() of recent encodes
         self.logger = logger or logging.getLogger(__name__)
 
         # Get background settings from styles, with defaults
@@ -219,13 +320,16 @@ class VideoGenerator:
                 "-rc", "vbr",
             ]
 
-    def generate_video(self, ass_path: str, audio_path: str, output_prefix: str) -> str:
+    def generate_video(
+        self, ass_path: str, audio_path: str, output_prefix: str, extra_targets: Optional[List[VideoOutputTarget]] = None
+    ) -> str:
         """Generate MP4 video with lyrics overlay.
 
         Args:
             ass_path: Path to ASS subtitles file
             audio_path: Path to audio file
             output_prefix: Prefix for output filename
+            extra_targets: Further videos (other resolutions, codecs or audio tracks) rendered in the same FFmpeg run
 
         Returns:
             Path to generated video file
@@ -238,6 +342,9 @@ class VideoGenerator:
             raise FileNotFoundError(f"Subtitles file not found: {ass_path}")
         if not os.path.isfile(audio_path):
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        for target in extra_targets or []:
+            if target.audio_path and not os.path.isfile(target.audio_path):
+                raise FileNotFoundError(f"Audio file not found: {target.audio_path}")
 
         try:
             # Create a temporary copy of the ASS file with a unique filename
@@ -251,8 +358,21 @@ class VideoGenerator:
             shutil.copy2(ass_path, temp_ass_path)
             self.logger.debug(f"Created temporary ASS file: {temp_ass_path}")
 
-            cmd = self._build_ffmpeg_command(temp_ass_path, audio_path, output_path)
-            self._run_ffmpeg_command(cmd)
+            # The segmented render produces a single file, so extra targets share one filter graph instead
+            segments = [] if extra_targets else self._plan_segments(temp_ass_path, audio_path)
+            if extra_targets:
+                targets = [VideoOutputTarget(output_path=output_path)] + list(extra_targets)
+                self.logger.info(f"Rendering {len(targets)} videos from one filter graph")
+                audio = self._prepare_target_audio(audio_path, targets)
+                cmd = self._build_multi_output_ffmpeg_command(temp_ass_path, audio_path, targets, audio)
+                self._run_ffmpeg_command(cmd, duration=self._render_duration(audio_path))
+            else:
+                audio = self._prepare_audio(audio_path, [output_path])[0]
+                if len(segments) > 1:
+                    self._generate_video_in_segments(temp_ass_path, audio, output_path, segments)
+                else:
+                    cmd = self._build_ffmpeg_command(temp_ass_path, audio.source_path, output_path, audio.codec_args)
+                    self._run_ffmpeg_command(cmd, duration=self._render_duration(audio_path))
             self.logger.info(f"Video generated: {output_path}")
 
             # Clean up temporary file
@@ -270,18 +390,27 @@ class VideoGenerator:
                     pass
             raise
 
-    def generate_preview_video(self, ass_path: str, audio_path: str, output_prefix: str) -> str:
+    def generate_preview_video(
+        self, ass_path: str, audio_path: str, output_prefix: str, time_window: Optional[Tuple[float, float]] = None
+    ) -> str:
         """Generate lower resolution MP4 preview video with lyrics overlay.
 
         Args:
             ass_path: Path to ASS subtitles file
             audio_path: Path to audio file
             output_prefix: Prefix for output filename
+            time_window: Optional (start, end) in seconds; only this part of the song is rendered
 
         Returns:
             Path to generated preview video file
         """
-        self.logger.info("Generating preview video with lyrics overlay")
+        if time_window is not None:
+            start, end = time_window
+            if start < 0 or end <= start:
+                raise ValueError(f"Invalid preview time window: {time_window}")
+            self.logger.info(f"Generating preview video with lyrics overlay for {start:.2f}s-{end:.2f}s")
+        else:
+            self.logger.info("Generating preview video with lyrics overlay")
         output_path = os.path.join(self.cache_dir, f"{output_prefix}_preview.mp4")
 
         # Check input files exist before running FFmpeg
@@ -299,11 +428,19 @@ class VideoGenerator:
             temp_ass_path = os.path.join(self.cache_dir, f"temp_preview_subtitles_{safe_prefix}_{timestamp}.ass")
             import shutil
 
-            shutil.copy2(ass_path, temp_ass_path)
-            self.logger.debug(f"Created temporary ASS file: {temp_ass_path}")
+            if time_window is not None:
+                kept = self._trim_ass_events(ass_path, temp_ass_path, *time_window)
+                self.logger.debug(f"Created temporary ASS file with {kept} events in the preview window: {temp_ass_path}")
+            else:
+                shutil.copy2(ass_path, temp_ass_path)
+                self.logger.debug(f"Created temporary ASS file: {temp_ass_path}")
 
-            cmd = self._build_preview_ffmpeg_command(temp_ass_path, audio_path, output_path)
-            self._run_ffmpeg_command(cmd)
+            audio = self._prepare_audio(audio_path, [output_path])[0]
+            # Encoding in the render uses a low bitrate for speed; copies and the cached intermediate keep theirs
+            audio_args = audio.codec_args + (["-b:a", "96k"] if audio.mode == "encode" else [])
+            cmd = self._build_preview_ffmpeg_command(temp_ass_path, audio.source_path, output_path, time_window=time_window, audio_args=audio_args)
+            duration = time_window[1] - time_window[0] if time_window is not None else self._render_duration(audio_path)
+            self._run_ffmpeg_command(cmd, duration=duration)
             self.logger.info(f"Preview video generated: {output_path}")
 
             # Clean up temporary file
@@ -326,38 +463,38 @@ class VideoGenerator:
         return os.path.join(self.output_dir, f"{output_prefix}.{extension}")
 
     def _resize_background_image(self, input_path: str) -> str:
-        """Resize background image to match target resolution and save to temp file."""
-        target_width, target_height = self.video_resolution
+        """Fit the background image to the target resolution, reusing an earlier resized copy if there is one.
 
-        # Get current image dimensions using ffprobe
+        Resized images are kept in the shared image asset cache, keyed by the image content and target size,
+        so repeated and concurrent renders don't resize (or overwrite) each other's backgrounds. Images PIL
+        can read are resized in-process; anything else falls back to FFmpeg.
+        """
+        target_size = tuple(self.video_resolution)
         try:
-            probe_cmd = [
-                "ffprobe",
-                "-v",
-                "error",
-                "-select_streams",
-                "v:0",
-                "-show_entries",
-                "stream=width,height",
-                "-of",
-                "json",
-                input_path,
-            ]
-            probe_output = subprocess.check_output(probe_cmd, universal_newlines=True)
-            probe_data = json.loads(probe_output)
-            current_width = probe_data["streams"][0]["width"]
-            current_height = probe_data["streams"][0]["height"]
-
-            # If dimensions already match, return original path
-            if current_width == target_width and current_height == target_height:
-                self.logger.debug("Background image already at target resolution")
-                return input_path
-
-        except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError) as e:
-            self.logger.warning(f"Failed to get image dimensions: {e}")
-            # Continue with resize attempt if probe fails
+            with Image.open(input_path) as image:
+                current_size = image.size
+            create = self._fit_background_image
+        except OSError as e:
+            self.logger.debug(f"PIL can't read background image, using FFmpeg: {e}")
+            current_size = self._probe_image_size(input_path)
+            create = self._fit_background_image_with_ffmpeg
+
+        # If dimensions already match, use the original image
+        if current_size == target_size:
+            self.logger.debug("Background image already at target resolution")
+            return input_path
+
+        return ImageAssetCache.get_path(input_path, "video_background", target_size, create, self.cache_dir, self.logger)
+
+    def _fit_background_image(self, input_path: str, output_path: str) -> None:
+        """Scale an image to fit the video resolution, keeping its aspect ratio, and pad it with black."""
+        with Image.open(input_path) as image:
+            fitted = ImageOps.pad(image.convert("RGB"), tuple(self.video_resolution), method=Image.Resampling.BICUBIC, color="black")
+        fitted.save(output_path, format="PNG")
 
-        temp_path = os.path.join(self.cache_dir, "resized_background.png")
+    def _fit_background_image_with_ffmpeg(self, input_path: str, output_path: str) -> None:
+        """FFmpeg equivalent of _fit_background_image, for images PIL can't read."""
+        target_width, target_height = self.video_resolution
         cmd = [
             "ffmpeg",
             "-y",
@@ -366,16 +503,24 @@ class VideoGenerator:
             "-vf",
             f"scale={target_width}:{target_height}:force_original_aspect_ratio=decrease,"
             f"pad={target_width}:{target_height}:(ow-iw)/2:(oh-ih)/2",
-            temp_path,
+            output_path,
         ]
 
         try:
             subprocess.check_output(cmd, stderr=subprocess.STDOUT, universal_newlines=True)
-            return temp_path
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Failed to resize background image: {e.output}")
             raise
 
+    def _probe_image_size(self, input_path: str) -> Optional[Tuple[int, int]]:
+        """Return the (width, height) of an image from the shared media probe, or None if it can't tell."""
+        info = MediaProbe.probe(input_path, cache_dir=self.cache_dir, logger=self.logger)
+        if not info or info.width is None or info.height is None:
+            self.logger.warning(f"Failed to get image dimensions of {input_path}")
+            # Continue with resize attempt if probe fails
+            return None
+        return info.width, info.height
+
     def _build_ass_filter(self, ass_path: str) -> str:
         """Build ASS filter with font directory support."""
         ass_filter = f"ass={ass_path}"
@@ -391,10 +536,11 @@ class VideoGenerator:
         
         return ass_filter
 
-    def _build_ffmpeg_command(self, ass_path: str, audio_path: str, output_path: str) -> List[str]:
-        """Build FFmpeg command for video generation with hardware acceleration when available."""
-        width, height = self.video_resolution
+    def _build_ffmpeg_command(self, ass_path: str, audio_path: str, output_path: str, audio_args: Optional[List[str]] = None) -> List[str]:
+        """Build FFmpeg command for video generation with hardware acceleration when available.
 
+        audio_args are the audio output options; by default the audio is re-encoded as FLAC.
+        """
         cmd = [
             "ffmpeg",
             "-hide_banner",
@@ -406,37 +552,126 @@ class VideoGenerator:
         cmd.extend(self.hwaccel_flags)
 
         # Input source (background)
-        if self.background_image:
-            # Resize background image first
-            resized_bg = self._resize_background_image(self.background_image)
-            self.logger.debug(f"Using resized background image: {resized_bg}")
-            cmd.extend([
-                "-loop", "1",  # Loop the image
-                "-i", resized_bg,
-            ])
-        else:
-            self.logger.debug(
-                f"Using solid {self.background_color} background "
-                f"with resolution: {width}x{height}"
-            )
-            cmd.extend([
-                "-f", "lavfi",
-                "-i", f"color=c={self.background_color}:s={width}x{height}:r=30"
-            ])
+        cmd.extend(self._build_background_input_args())
 
         cmd.extend([
             "-i", audio_path,
-            "-c:a", "flac",  # Re-encode audio as FLAC
+        ])
+        cmd.extend(audio_args or ["-c:a", "flac"])
+        cmd.extend([
             "-vf", self._build_ass_filter(ass_path),  # Add subtitles with font directories
             "-c:v", self.video_encoder,
         ])
 
         # Add encoder-specific settings
+        cmd.extend(self._build_video_encoder_args())
+
+        cmd.extend([
+            "-shortest",  # End encoding after shortest stream
+            "-y",         # Overwrite output without asking
+        ])
+
+        # Add output path
+        cmd.append(output_path)
+
+        return cmd
+
+    def _build_multi_output_ffmpeg_command(
+        self, ass_path: str, audio_path: str, targets: List[VideoOutputTarget], audio: Optional[Dict[str, AudioHandling]] = None
+    ) -> List[str]:
+        """Build one FFmpeg command rendering several videos from a single filter graph.
+
+        The background is generated and the subtitles are drawn once, at the generator's resolution, then
+        split into one stream per target and scaled where a target asks for another resolution. Each audio
+        file is read once, however many targets use it. audio maps output paths to how their audio is
+        produced (see _prepare_target_audio); targets without an entry encode their audio in the render.
+        """
+        audio = dict(audio or {})
+        for target in targets:
+            if target.output_path not in audio:
+                codec = target.audio_codec or self._ENCODE_AUDIO_CODECS.get(self._container_of(target.output_path), "aac")
+                audio[target.output_path] = AudioHandling("encode", codec, target.audio_path or audio_path)
+
+        cmd = [
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-r", str(self.FRAME_RATE),
+        ]
+        cmd.extend(self.hwaccel_flags)
+        cmd.extend(self._build_background_input_args())
+
+        # Input 0 is the background; audio files follow in order of first use
+        audio_inputs: List[str] = []
+        for path in [audio[target.output_path].source_path for target in targets]:
+            if path not in audio_inputs:
+                audio_inputs.append(path)
+                cmd.extend(["-i", path])
+
+        labels = [f"v{index}" for index in range(len(targets))]
+        graph = [f"[0:v]{self._build_ass_filter(ass_path)}" + (f",split={len(targets)}" if len(targets) > 1 else "")]
+        graph[0] += "".join(f"[{label}]" for label in labels)
+        for index, target in enumerate(targets):
+            if target.resolution and tuple(target.resolution) != tuple(self.video_resolution):
+                width, height = target.resolution
+                graph.append(f"[{labels[index]}]scale={width}:{height}[{labels[index]}s]")
+                labels[index] += "s"
+        cmd.extend(["-filter_complex", ";".join(graph), "-y"])
+
+        for label, target in zip(labels, targets):
+            target_audio = audio[target.output_path]
+            audio_index = audio_inputs.index(target_audio.source_path) + 1
+            cmd.extend(["-map", f"[{label}]", "-map", f"{audio_index}:a:0"])
+            cmd.extend(["-c:v", target.video_codec or self.video_encoder])
+            cmd.extend(self._build_target_encoder_args(target))
+            cmd.extend(target_audio.codec_args)
+            if target.audio_bitrate and target_audio.mode == "encode":
+                cmd.extend(["-b:a", target.audio_bitrate])
+            if target.output_path.lower().endswith(".mp4"):
+                cmd.extend(["-pix_fmt", "yuv420p", "-movflags", "+faststart"])  # Playable in browsers and players
+            cmd.extend(["-shortest", target.output_path])
+        return cmd
+
+    def _build_target_encoder_args(self, target: VideoOutputTarget) -> List[str]:
+        """Encoder settings for one target of a multi-output render."""
+        codec = target.video_codec or self.video_encoder
+        if codec != self.video_encoder:
+            # Other codecs get FFmpeg's defaults, plus the bitrate if one was given
+            return ["-b:v", target.video_bitrate] if target.video_bitrate else []
+        if not target.video_bitrate:
+            return self._build_video_encoder_args()
+        preset_args = self.get_nvenc_settings("high", is_preview=False) if self.nvenc_available else ["-preset", "fast"]
+        return preset_args + ["-b:v", target.video_bitrate]
+
+    def _build_background_input_args(self) -> List[str]:
+        """Build the FFmpeg input arguments for the video background (looped image or solid color)."""
+        width, height = self.video_resolution
+
+        if self.background_image:
+            # Resize background image first
+            resized_bg = self._resize_background_image(self.background_image)
+            self.logger.debug(f"Using resized background image: {resized_bg}")
+            return [
+                "-loop", "1",  # Loop the image
+                "-i", resized_bg,
+            ]
+
+        self.logger.debug(
+            f"Using solid {self.background_color} background "
+            f"with resolution: {width}x{height}"
+        )
+        return [
+            "-f", "lavfi",
+            "-i", f"color=c={self.background_color}:s={width}x{height}:r=30"
+        ]
+
+    def _build_video_encoder_args(self) -> List[str]:
+        """Build the encoder settings for the final (non-preview) video."""
         if self.nvenc_available:
             # NVENC settings optimized for subtitle content
-            cmd.extend(self.get_nvenc_settings("high", is_preview=False))
+            args = self.get_nvenc_settings("high", is_preview=False)
             # Use higher bitrate for NVENC as it's more efficient
-            cmd.extend([
+            args.extend([
                 "-b:v", "8000k",      # Higher base bitrate for NVENC
                 "-maxrate", "15000k", # Reasonable max for 4K
                 "-bufsize", "16000k", # Buffer size
@@ -444,30 +679,431 @@ class VideoGenerator:
             self.logger.debug("Using NVENC encoding for high-quality video generation")
         else:
             # Software encoding fallback settings
-            cmd.extend([
+            args = [
                 "-preset", "fast",     # Better compression efficiency
                 "-b:v", "5000k",       # Base video bitrate
                 "-minrate", "5000k",   # Minimum bitrate
                 "-maxrate", "20000k",  # Maximum bitrate
                 "-bufsize", "10000k",  # Buffer size (2x base rate)
-            ])
+            ]
             self.logger.debug("Using software encoding for video generation")
+        return args
+
+    def _probe_duration(self, media_path: str) -> Optional[float]:
+        """Return the duration of a media file in seconds, or None if ffprobe can't tell."""
+        info = MediaProbe.probe(media_path, cache_dir=self.cache_dir, logger=self.logger)
+        return info.duration if info else None
+
+    def _render_duration(self, media_path: str) -> Optional[float]:
+        """Expected length of a render of media_path, probed only when FFmpeg progress is being reported."""
+        if self.progress_callback is None and not self.stall_timeout:
+            return None
+        return self._probe_duration(media_path)
+
+    def _probe_audio_codec(self, media_path: str) -> Optional[str]:
+        """Return the codec of a media file's first audio stream, or None if ffprobe can't tell."""
+        info = MediaProbe.probe(media_path, cache_dir=self.cache_dir, logger=self.logger)
+        return info.audio_codec if info else None
+
+    @staticmethod
+    def _container_of(output_path: str) -> str:
+        return os.path.splitext(output_path)[1].lstrip(".").lower()
+
+    def _prepare_audio(self, audio_path: str, output_paths: List[str]) -> List[AudioHandling]:
+        """Decide how the audio of the given outputs is produced, encoding the shared intermediate if needed.
+
+        Under the "auto" policy the input stream is copied when every output container accepts its codec.
+        Otherwise it is encoded once, to a codec all the containers accept, into a file in the cache dir
+        that the outputs copy from (and later renders of the same audio reuse). The audio is encoded in
+        the render itself under the "encode" policy, or when the input codec can't be determined.
+        The choice for each output is recorded in audio_handling.
+        """
+        containers = [self._container_of(path) for path in output_paths]
+        codec = self._probe_audio_codec(audio_path) if self.audio_policy == "auto" else None
+        accepted = [self._CONTAINER_AUDIO_CODECS.get(container, set()) for container in containers]
+        intermediate_codec = next((c for c in self._INTERMEDIATE_AUDIO_FORMATS if all(c in codecs for codecs in accepted)), None)
+
+        if codec and all(codec in codecs for codecs in accepted):
+            handling = [AudioHandling("copy", codec, audio_path)] * len(output_paths)
+        elif codec and intermediate_codec:
+            intermediate_path = self._encode_audio_intermediate(audio_path, intermediate_codec)
+            handling = [AudioHandling("intermediate", intermediate_codec, intermediate_path)] * len(output_paths)
+        else:
+            handling = [AudioHandling("encode", self._ENCODE_AUDIO_CODECS.get(c, "aac"), audio_path) for c in containers]
+
+        for output_path, output_audio in zip(output_paths, handling):
+            self.logger.info(f"Audio for {os.path.basename(output_path)}: {output_audio.mode} ({output_audio.codec})")
+            self.audio_handling[output_path] = output_audio
+        return handling
+
+    def _prepare_target_audio(self, audio_path: str, targets: List[VideoOutputTarget]) -> Dict[str, AudioHandling]:
+        """Audio handling for each target of a multi-output render, by output path.
+
+        Targets with an explicit audio codec are encoded to it; the others follow the audio policy, decided
+        once per audio file.
+        """
+        audio = {}
+        for path in dict.fromkeys(target.audio_path or audio_path for target in targets):
+            output_paths = [t.output_path for t in targets if (t.audio_path or audio_path) == path and not t.audio_codec]
+            if output_paths:
+                audio.update(zip(output_paths, self._prepare_audio(path, output_paths)))
+        for target in targets:
+            if target.audio_codec:
+                audio[target.output_path] = AudioHandling("encode", target.audio_codec, target.audio_path or audio_path)
+                self.audio_handling[target.output_path] = audio[target.output_path]
+        return audio
+
+    def _encode_audio_intermediate(self, audio_path: str, codec: str) -> str:
+        """Encode the audio to codec once, in the cache dir, and return the path of the encoded file."""
+        extension, options = self._INTERMEDIATE_AUDIO_FORMATS[codec]
+        audio_hash = AudioFingerprint.md5(audio_path, cache_dir=self.cache_dir, logger=self.logger)
+        intermediate_path = os.path.join(self.cache_dir, f"audio_{audio_hash}_{codec}.{extension}")
+        if os.path.isfile(intermediate_path):
+            self.logger.debug(f"Reusing encoded audio: {intermediate_path}")
+            return intermediate_path
+
+        # Encoded under a temporary name, so a concurrent render never reads a partial file
+        temp_path = f"{intermediate_path}.{os.getpid()}.tmp.{extension}"
+        cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-i", audio_path, "-map", "0:a:0", "-c:a", codec, *options, "-y", temp_path]
+        self._run_ffmpeg_command(cmd, duration=self._render_duration(audio_path))
+        os.replace(temp_path, intermediate_path)
+        return intermediate_path
+
+    def _read_ass_events(self, ass_path: str) -> List[Tuple[float, float, str]]:
+        """Return the (start, end, text) of all Dialogue events in an ASS file, with times in seconds."""
+        with open(ass_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+
+        field_names: List[str] = []
+        in_events = False
+        events = []
+        for line in lines:
+            stripped = line.strip()
+            if stripped.startswith("["):
+                in_events = stripped.lower() == "[events]"
+            elif in_events and stripped.startswith("Format:"):
+                field_names = [name.strip() for name in stripped[len("Format:") :].split(",")]
+            elif in_events and stripped.startswith("Dialogue:") and field_names:
+                values = stripped[len("Dialogue:") :].split(",", len(field_names) - 1)
+                try:
+                    event_start = self._parse_ass_time(values[field_names.index("Start")])
+                    event_end = self._parse_ass_time(values[field_names.index("End")])
+                    text = values[field_names.index("Text")] if "Text" in field_names else ""
+                except (ValueError, IndexError):
+                    continue
+                events.append((event_start, event_end, text))
+        return events
+
+    def _plan_segments(self, ass_path: str, audio_path: str) -> List[RenderSegment]:
+        """Split the song into the segments the final video is encoded in.
+
+        With the static fast path, spans where the subtitles don't change (or only change slowly) get their
+        own cheap segments; with render_chunks > 1, the rest is split into parts of roughly equal length.
+        Returns an empty list if the video should be rendered in one piece.
+        """
+        if self.render_chunks == 1 and not self.static_fast_path:
+            return []
+        duration = self._probe_duration(audio_path)
+        if not duration:
+            self.logger.info("Rendering video in one piece: audio duration unknown")
+            return []
+
+        events = self._read_ass_events(ass_path)
+        if self.static_fast_path:
+            segments = self._classify_spans(events, duration)
+        else:
+            segments = [RenderSegment(0.0, duration)]
+
+        cut_points = self._get_chunk_cut_points(events, duration) if self.render_chunks > 1 else []
+        split_segments = []
+        for segment in segments:
+            start = segment.start
+            if segment.kind == "dynamic":
+                # Only spans with changing subtitles are worth splitting; the others are already cheap
+                for cut in (cut for cut in cut_points if segment.start < cut < segment.end):
+                    split_segments.append(RenderSegment(start, cut, segment.kind))
+                    start = cut
+            split_segments.append(RenderSegment(start, segment.end, segment.kind))
+        return split_segments
+
+    def _classify_spans(self, events: List[Tuple[float, float, str]], duration: float) -> List[RenderSegment]:
+        """Divide the song into spans by how much the rendered subtitles change, snapped to the frame grid.
+
+        Each event contributes a "dynamic" part while it fades or while its karaoke highlight moves word by
+        word, a "slow" part while a single highlight sweeps across it (section screens), and otherwise a
+        "static" part. A span takes the busiest kind of the event parts visible in it; spans without
+        visible events are "empty". Fast-path spans shorter than MIN_FAST_PATH_SECONDS are rendered as
+        dynamic, since a separate encode wouldn't pay off.
+        """
+        parts = []
+        for event_start, event_end, text in events:
+            if _DYNAMIC_TAGS_RE.search(text):
+                parts.append((event_start, event_end, "dynamic"))
+                continue
+            fade = _FADE_TAG_RE.search(text)
+            fade_in, fade_out = (int(fade.group(1)) / 1000, int(fade.group(2)) / 1000) if fade else (0.0, 0.0)
+            body_start, body_end = event_start + fade_in, max(event_start + fade_in, event_end - fade_out)
+            parts.append((event_start, body_start, "dynamic"))
+            parts.append((body_start, body_end, "slow" if _SWEEP_TAG_RE.search(text) else "static"))
+            parts.append((body_end, event_end, "dynamic"))
+        parts = [(max(0.0, start), min(duration, end), kind) for start, end, kind in parts if end > start]
+
+        # Between consecutive part boundaries the visible parts don't change
+        times = sorted({0.0, duration, *(start for start, _, _ in parts), *(end for _, end, _ in parts)})
+        spans: List[List] = []
+        for span_start, span_end in zip(times, times[1:]):
+            visible = [kind for start, end, kind in parts if start < span_end and end > span_start]
+            kind = max(visible, key=self._SPAN_KINDS.index, default="empty")
+            # Static spans draw their subtitles once a second, so they must not run across a change of content
+            mergeable = spans and spans[-1][2] == kind and kind != "static"
+            if mergeable:
+                spans[-1][1] = span_end
+            else:
+                spans.append([span_start, span_end, kind])
+
+        for span in spans:
+            if span[2] != "dynamic" and span[1] - span[0] < self.MIN_FAST_PATH_SECONDS:
+                span[2] = "dynamic"
+
+        segments: List[RenderSegment] = []
+        for span_start, span_end, kind in spans:
+            span_start = round(span_start * self.FRAME_RATE) / self.FRAME_RATE
+            span_end = duration if span_end == duration else round(span_end * self.FRAME_RATE) / self.FRAME_RATE
+            if segments and segments[-1].kind == kind == "dynamic":
+                segments[-1] = RenderSegment(segments[-1].start, span_end, kind)
+            elif span_end > span_start:
+                segments.append(RenderSegment(span_start, span_end, kind))
+        return segments
+
+    def _get_chunk_cut_points(self, events: List[Tuple[float, float, str]], duration: float) -> List[float]:
+        """Choose where to split the song into up to render_chunks parts of roughly equal length.
+
+        Cuts are placed at screen boundaries - gaps between ASS events, such as between a lyrics screen and
+        an instrumental section screen - nearest to the evenly spaced targets, and snapped to the frame grid.
+        """
+        if duration < self.render_chunks * self.MIN_CHUNK_SECONDS:
+            self.logger.info("Not splitting video render into chunks: audio too short")
+            return []
+
+        # Merge overlapping events into screens; a boundary is the middle of the gap between two screens
+        boundaries = []
+        screen_end = None
+        for start, end, _ in sorted(events):
+            if screen_end is not None and start >= screen_end:
+                boundaries.append((screen_end + start) / 2)
+            screen_end = end if screen_end is None else max(screen_end, end)
+
+        cut_points: List[float] = []
+        for i in range(1, self.render_chunks):
+            target = duration * i / self.render_chunks
+            # Any time is a valid cut since every chunk renders subtitles at their song times; boundaries are preferred
+            cut = min(boundaries, key=lambda boundary: abs(boundary - target)) if boundaries else target
+            if abs(cut - target) > duration / (2 * self.render_chunks):
+                cut = target
+            cut = round(cut * self.FRAME_RATE) / self.FRAME_RATE
+            previous = cut_points[-1] if cut_points else 0.0
+            if cut - previous >= self.MIN_CHUNK_SECONDS and duration - cut >= self.MIN_CHUNK_SECONDS:
+                cut_points.append(cut)
+        return cut_points
+
+    def _generate_video_in_segments(self, ass_path: str, audio: AudioHandling, output_path: str, segments: List[RenderSegment]) -> None:
+        """Encode the video segment by segment, then concatenate them losslessly and mux the audio once.
+
+        Up to render_chunks segments are encoded in parallel. Empty segments show only the background, so
+        they are assembled from one pre-encoded still clip repeated as often as needed, plus a clip for the
+        remaining frames.
+        """
+        segment_dir = tempfile.mkdtemp(prefix="video_segments_", dir=self.cache_dir)
+        summary = ", ".join(f"{segment.kind} {segment.start:.2f}s-{segment.end:.2f}s" for segment in segments)
+        self.logger.info(f"Rendering video in {len(segments)} segments: {summary}")
+        try:
+            background_args = self._build_background_input_args()
+            threads = max(1, (os.cpu_count() or 1) // self.render_chunks) if self.render_chunks > 1 else None
+            commands = {}  # output path -> FFmpeg command
+            durations = {}  # output path -> seconds of video it encodes
+            concat_paths = []
+
+            def still_clip(frames: int) -> str:
+                clip_path = os.path.join(segment_dir, f"still_{frames}.mkv")
+                if clip_path not in commands:
+                    commands[clip_path] = self._build_segment_ffmpeg_command(
+                        ass_path, background_args, RenderSegment(0.0, frames / self.FRAME_RATE, "empty"), clip_path, threads
+                    )
+                    durations[clip_path] = frames / self.FRAME_RATE
+                return clip_path
+
+            for index, segment in enumerate(segments):
+                if segment.kind == "empty":
+                    frames = self._frame_count(segment)
+                    concat_paths.extend([still_clip(self.STILL_CLIP_FRAMES)] * (frames // self.STILL_CLIP_FRAMES))
+                    if frames % self.STILL_CLIP_FRAMES:
+                        concat_paths.append(still_clip(frames % self.STILL_CLIP_FRAMES))
+                    continue
+                segment_path = os.path.join(segment_dir, f"segment_{index:03d}.mkv")
+                commands[segment_path] = self._build_segment_ffmpeg_command(ass_path, background_args, segment, segment_path, threads)
+                durations[segment_path] = segment.end - segment.start
+                concat_paths.append(segment_path)
 
+            with ThreadPoolExecutor(max_workers=self.render_chunks) as executor:
+                # list() re-raises the first FFmpeg failure
+                list(executor.map(lambda path: self._run_ffmpeg_command(commands[path], duration=durations[path]), commands))
+
+            concat_list_path = os.path.join(segment_dir, "segments.txt")
+            with open(concat_list_path, "w", encoding="utf-8") as f:
+                f.writelines(f"file '{path}'\n" for path in concat_paths)
+            self._run_ffmpeg_command(
+                self._build_concat_ffmpeg_command(concat_list_path, audio.source_path, output_path, audio.codec_args),
+                duration=sum(durations[path] for path in concat_paths),
+            )
+        finally:
+            shutil.rmtree(segment_dir, ignore_errors=True)
+
+    def _frame_count(self, segment: RenderSegment) -> int:
+        """Number of frames in a segment; boundaries are on the frame grid, so segments add up exactly."""
+        return round(segment.end * self.FRAME_RATE) - round(segment.start * self.FRAME_RATE)
+
+    def _build_segment_ffmpeg_command(
+        self, ass_path: str, background_args: List[str], segment: RenderSegment, output_path: str, threads: Optional[int] = None
+    ) -> List[str]:
+        """Build FFmpeg command encoding one segment of the video, without audio.
+
+        Video timestamps are offset by the segment start while the subtitles are drawn, so the ASS events
+        render at their song times, then reset so the segment starts at zero. The offset is a whole number
+        of frames in a 1/FRAME_RATE time base, so cuts on the frame grid don't drift a frame early. Slow and static segments draw
+        the subtitles at a reduced frame rate and repeat the frames; empty segments skip them entirely.
+        Each segment is a closed GOP sequence starting on a keyframe, so the segments can be concatenated
+        without re-encoding.
+        """
+        filters = []
+        if segment.kind != "empty":
+            subtitle_frame_rate = self._SUBTITLE_FRAME_RATES.get(segment.kind)
+            if subtitle_frame_rate:
+                # Reduce the rate before the offset, so the reduced frame grid starts at the segment start
+                # rather than at the nearest multiple of 1/rate in song time, which may precede the segment
+                filters.append(f"fps={subtitle_frame_rate}")
+            filters.append(f"settb=1/{self.FRAME_RATE}")
+            filters.append(f"setpts=PTS+{round(segment.start * self.FRAME_RATE)}")
+            filters.append(self._build_ass_filter(ass_path))
+            if subtitle_frame_rate:
+                filters.append(f"fps={self.FRAME_RATE}")
+            filters.append("setpts=PTS-STARTPTS")
+
+        cmd = [
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-r", str(self.FRAME_RATE),
+        ]
+        cmd.extend(self.hwaccel_flags)
+        cmd.extend(background_args)
+        if filters:
+            cmd.extend(["-vf", ",".join(filters)])
         cmd.extend([
-            "-shortest",  # End encoding after shortest stream
-            "-y",         # Overwrite output without asking
+            "-an",  # Audio is muxed once, after the segments are joined
+            "-c:v", self.video_encoder,
         ])
+        cmd.extend(self._build_video_encoder_args())
+        cmd.extend(["-flags", "+cgop"])  # Closed GOPs, so no frame references across a cut
+        if threads and not self.nvenc_available:
+            cmd.extend(["-threads", str(threads)])  # Share the CPU between the parallel segment encoders
+        # Frame counts rather than durations, so the segments add up exactly
+        cmd.extend(["-frames:v", str(self._frame_count(segment))])
+        cmd.extend(["-y", output_path])
+        return cmd
 
-        # Add output path
-        cmd.append(output_path)
+    def _build_concat_ffmpeg_command(
+        self, concat_list_path: str, audio_path: str, output_path: str, audio_args: Optional[List[str]] = None
+    ) -> List[str]:
+        """Build FFmpeg command joining encoded chunks without re-encoding and muxing in the audio.
 
-        return cmd
+        audio_args are the audio output options; by default the audio is re-encoded as FLAC.
+        """
+        return [
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", concat_list_path,
+            "-i", audio_path,
+            "-map", "0:v:0",
+            "-map", "1:a:0",
+            "-c:v", "copy",  # Chunks are joined losslessly
+            *(audio_args or ["-c:a", "flac"]),
+            "-shortest",
+            "-y",
+            output_path,
+        ]
+
+    @staticmethod
+    def _parse_ass_time(value: str) -> float:
+        """Convert an ASS timestamp (H:MM:SS.cc) to seconds."""
+        hours, minutes, seconds = value.strip().split(":")
+        return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+    def _trim_ass_events(self, ass_path: str, output_path: str, start: float, end: float) -> int:
+        """Copy an ASS file, keeping only Dialogue events that overlap [start, end].
+
+        Event times are left unchanged; the preview command shifts the video timestamps instead, so
+        karaoke timing inside events that started before the window stays correct.
+
+        Returns:
+            Number of Dialogue events kept
+        """
+        with open(ass_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+
+        field_names: List[str] = []
+        in_events = False
+        kept = 0
+        output_lines = []
+        for line in lines:
+            stripped = line.strip()
+            if stripped.startswith("["):
+                in_events = stripped.lower() == "[events]"
+            elif in_events and stripped.startswith("Format:"):
+                field_names = [name.strip() for name in stripped[len("Format:") :].split(",")]
+            elif in_events and stripped.startswith("Dialogue:") and field_names:
+                values = stripped[len("Dialogue:") :].split(",", len(field_names) - 1)
+                try:
+                    event_start = self._parse_ass_time(values[field_names.index("Start")])
+                    event_end = self._parse_ass_time(values[field_names.index("End")])
+                except (ValueError, IndexError):
+                    self.logger.warning(f"Keeping unparseable ASS event in preview: {stripped}")
+                else:
+                    if event_end <= start or event_start >= end:
+                        continue
+                kept += 1
+            output_lines.append(line)
 
-    def _build_preview_ffmpeg_command(self, ass_path: str, audio_path: str, output_path: str) -> List[str]:
-        """Build FFmpeg command for preview video generation with hardware acceleration when available."""
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.writelines(output_lines)
+        return kept
+
+    def _build_preview_ffmpeg_command(
+        self,
+        ass_path: str,
+        audio_path: str,
+        output_path: str,
+        time_window: Optional[Tuple[float, float]] = None,
+        audio_args: Optional[List[str]] = None,
+    ) -> List[str]:
+        """Build FFmpeg command for preview video generation with hardware acceleration when available.
+
+        With a time_window, the audio is seeked to the window and the output is limited to its duration.
+        Video timestamps are offset by the window start while the subtitles are drawn, so the ASS events
+        render at their original song times, then reset so the clip starts at zero. audio_args are the audio
+        output options; by default the audio is encoded as low bitrate AAC.
+        """
         # Use even lower resolution for preview (480x270 instead of 640x360 for faster encoding)
         width, height = 480, 270
 
+        ass_filter = self._build_ass_filter(ass_path)
+        if time_window is not None:
+            window_start, window_end = time_window
+            # Rounded to the nearest frame; setpts would otherwise truncate the offset and draw up to a frame early
+            ass_filter = f"setpts=PTS+round({window_start:.6f}/TB),{ass_filter},setpts=PTS-STARTPTS"
+
         cmd = [
             "ffmpeg",
             "-hide_banner",
@@ -487,7 +1123,7 @@ class VideoGenerator:
                 "-i", self.background_image,
             ])
             # Build video filter with scaling and ASS subtitles
-            video_filter = f"scale={width}:{height}:force_original_aspect_ratio=decrease,pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,{self._build_ass_filter(ass_path)}"
+            video_filter = f"scale={width}:{height}:force_original_aspect_ratio=decrease,pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,{ass_filter}"
         else:
             self.logger.debug(
                 f"Using solid {self.background_color} background "
@@ -498,15 +1134,19 @@ class VideoGenerator:
                 "-i", f"color=c={self.background_color}:s={width}x{height}:r=24",
             ])
             # Build video filter with just ASS subtitles (no scaling needed)
-            video_filter = self._build_ass_filter(ass_path)
+            video_filter = ass_filter
+
+        if time_window is not None:
+            # Input seeking: only the window of the audio is decoded
+            cmd.extend(["-ss", f"{window_start:.3f}", "-t", f"{window_end - window_start:.3f}"])
 
         cmd.extend([
             "-i", audio_path,
             "-vf", video_filter,    # Apply the video filter
-            "-c:a", "aac",          # Use AAC for audio compatibility
-            "-b:a", "96k",          # Reduced audio bitrate for faster encoding
-            "-c:v", self.video_encoder,
         ])
+        # AAC for browser compatibility, at a reduced bitrate for faster encoding
+        cmd.extend(audio_args or ["-c:a", "aac", "-b:a", "96k"])
+        cmd.extend(["-c:v", self.video_encoder])
 
         # Add encoder-specific settings for preview with maximum speed priority
         if self.nvenc_available:
@@ -542,8 +1182,10 @@ class VideoGenerator:
             "-sc_threshold", "0",   # Disable scene change detection for speed
             "-threads", "0",        # Use all available CPU threads
             "-shortest",            # End encoding after shortest stream
-            "-y"                    # Overwrite output without asking
         ])
+        if time_window is not None:
+            cmd.extend(["-t", f"{window_end - window_start:.3f}"])
+        cmd.append("-y")  # Overwrite output without asking
 
         # Add output path
         cmd.append(output_path)
@@ -557,12 +1199,38 @@ class VideoGenerator:
         self.logger.warning("_get_video_codec is deprecated, use self.video_encoder instead")
         return self.video_encoder
 
-    def _run_ffmpeg_command(self, cmd: List[str]) -> None:
-        """Execute FFmpeg command with output handling."""
+    def _run_ffmpeg_command(self, cmd: List[str], duration: Optional[float] = None) -> None:
+        """Execute FFmpeg command with output handling.
+
+        With a progress callback or stall timeout configured, FFmpeg's -progress output is parsed so live
+        metrics reach the callback, a summary is kept in render_metrics, and stalled encodes are killed.
+        duration is the expected output length in seconds, used for the progress fraction and ETA.
+        """
         self.logger.debug(f"Running FFmpeg command: {' '.join(cmd)}")
         try:
-            output = subprocess.check_output(cmd, universal_newlines=True, stderr=subprocess.STDOUT)
-            self.logger.debug(f"FFmpeg output: {output}")
+            if self.progress_callback is None and not self.stall_timeout:
+                output = subprocess.check_output(cmd, universal_newlines=True, stderr=subprocess.STDOUT)
+                self.logger.debug(f"FFmpeg output: {output}")
+                return
+            runner = FFmpegProgressRunner(logger=self.logger, on_progress=self._report_progress, stall_timeout=self.stall_timeout)
+            progress = runner.run(cmd, duration=duration)
         except subprocess.CalledProcessError as e:
             self.logger.error(f"FFmpeg error: {e.output}")
             raise
+
+        self.render_metrics.append(progress.to_dict())
+        speed = f", {progress.speed:.2f}x real time" if progress.speed else ""
+        self.logger.info(
+            f"FFmpeg wrote {progress.frame} frames to {os.path.basename(progress.output_path)} in {progress.elapsed:.1f}s "
+            f"({progress.fps:.1f} fps{speed})"
+        )
+
+    def _report_progress(self, progress: FFmpegProgress) -> None:
+        """Pass live FFmpeg metrics on to the progress callback."""
+        self.logger.debug(
+            f"FFmpeg progress {os.path.basename(progress.output_path)}: frame={progress.frame} fps={progress.fps} "
+            f"speed={progress.speed}x bitrate={progress.bitrate_kbps}kbits/s out_time={progress.out_time:.2f}s"
+        )
+        callback = self.progress_callback
+        if callback:
+            callback(progress)
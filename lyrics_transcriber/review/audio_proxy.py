@@ -0,0 +1,161 @@
+import json
+import logging
+import mimetypes
+import os
+import subprocess
+import threading
+from array import array
+from typing import Any, Dict, Optional
+
+from lyrics_transcriber.utils.media_probe import MediaProbe
+
+
+class ReviewAudio:
+    """Browser-friendly audio for the review UI: a transcoded proxy of the input audio plus waveform peaks.
+
+    Large WAV/FLAC masters are transcoded once per audio hash to a low-bitrate MP3, so the browser
+    downloads a few MB instead of the whole master and seeks cheaply with range requests. Compressed
+    inputs that are already small are served as they are. Waveform peaks are computed in the same pass
+    over the audio, so the frontend doesn't need to decode the full file to draw the waveform.
+    Both are stored in cache_dir and reused across review sessions.
+    """
+
+    PROXY_BITRATE = "96k"
+    PEAKS_PER_SECOND = 20
+    PEAKS_SAMPLE_RATE = 4000
+    # Inputs in these formats and below this size are streamed without a proxy
+    DIRECT_EXTENSIONS = (".mp3", ".m4a", ".aac", ".ogg", ".opus")
+    DIRECT_CODECS = ("mp3", "aac", "vorbis", "opus")  # Checked by probing, where the file can be probed
+    DIRECT_MAX_BYTES = 20 * 1024 * 1024
+
+    def __init__(self, cache_dir: str, logger: Optional[logging.Logger] = None):
+        self.cache_dir = cache_dir
+        self.logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+    def proxy_path(self, audio_hash: str) -> str:
+        return os.path.join(self.cache_dir, f"review_audio_{audio_hash}.mp3")
+
+    def peaks_path(self, audio_hash: str) -> str:
+        return os.path.join(self.cache_dir, f"review_audio_{audio_hash}_peaks.json")
+
+    def needs_proxy(self, audio_path: str) -> bool:
+        """Whether the input is too large or not compressed, so it shouldn't be sent to the browser as is."""
+        if not audio_path.lower().endswith(self.DIRECT_EXTENSIONS):
+            return True
+        info = MediaProbe.probe(audio_path, cache_dir=self.cache_dir, logger=self.logger)
+        if info and info.audio_codec and info.audio_codec not in self.DIRECT_CODECS:
+            return True  # e.g. an .m4a holding lossless ALAC
+        try:
+            return os.path.getsize(audio_path) > self.DIRECT_MAX_BYTES
+        except OSError:
+            return True
+
+    def get_stream_path(self, audio_path: str, audio_hash: str) -> str:
+        """Path of the file to serve: the proxy if it's ready, otherwise the original audio."""
+        if self.needs_proxy(audio_path):
+            proxy_path = self.proxy_path(audio_hash)
+            if os.path.isfile(proxy_path) and os.path.getsize(proxy_path) > 0:
+                return proxy_path
+        return audio_path
+
+    @staticmethod
+    def media_type(path: str) -> str:
+        """Content type for an audio file, from its extension."""
+        media_type, _ = mimetypes.guess_type(path)
+        if media_type:
+            return media_type
+        return {".flac": "audio/flac", ".opus": "audio/ogg", ".m4a": "audio/mp4"}.get(os.path.splitext(path)[1].lower(), "application/octet-stream")
+
+    def get_peaks(self, audio_hash: str) -> Optional[Dict[str, Any]]:
+        """Load precomputed waveform peaks, or None if they haven't been computed."""
+        try:
+            with open(self.peaks_path(audio_hash), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def prepare(self, audio_path: str, audio_hash: str) -> None:
+        """Create the proxy (if needed) and the waveform peaks for this audio, unless already cached."""
+        with self._lock:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            if self.needs_proxy(audio_path) and not os.path.isfile(self.proxy_path(audio_hash)):
+                self._write_proxy(audio_path, self.proxy_path(audio_hash))
+            if self.get_peaks(audio_hash) is None:
+                peaks = self._compute_peaks(audio_path)
+                self._write_json_atomic(self.peaks_path(audio_hash), peaks)
+
+    def _write_proxy(self, audio_path: str, proxy_path: str) -> None:
+        self.logger.info(f"Creating review audio proxy: {proxy_path}")
+        tmp_path = f"{proxy_path}.tmp.mp3"
+        cmd = [
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-i", audio_path,
+            "-vn",
+            "-c:a", "libmp3lame",
+            "-b:a", self.PROXY_BITRATE,
+            "-y", tmp_path,
+        ]  # fmt: skip
+        try:
+            subprocess.check_output(cmd, universal_newlines=True, stderr=subprocess.STDOUT)
+            os.replace(tmp_path, proxy_path)
+        except subprocess.CalledProcessError as e:
+            self.logger.error(f"Failed to create review audio proxy: {e.output}")
+            raise
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _compute_peaks(self, audio_path: str) -> Dict[str, Any]:
+        """Decode the audio to low-rate mono PCM with ffmpeg and keep the peak amplitude of each bucket."""
+        self.logger.info(f"Computing waveform peaks for {audio_path}")
+        cmd = [
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-i", audio_path,
+            "-vn",
+            "-ac", "1",
+            "-ar", str(self.PEAKS_SAMPLE_RATE),
+            "-f", "s16le",
+            "-",
+        ]  # fmt: skip
+        bucket_size = self.PEAKS_SAMPLE_RATE // self.PEAKS_PER_SECOND
+        peaks = []
+        pending = array("h")
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            for chunk in iter(lambda: process.stdout.read(bucket_size * 2 * 256), b""):
+                samples = array("h")
+                samples.frombytes(chunk[: len(chunk) - len(chunk) % 2])
+                pending.extend(samples)
+                usable = len(pending) - len(pending) % bucket_size
+                peaks.extend(self._bucket_peaks(pending[:usable], bucket_size))
+                del pending[:usable]
+            peaks.extend(self._bucket_peaks(pending, bucket_size))
+        finally:
+            process.stdout.close()
+            stderr = process.stderr.read().decode("utf-8", errors="replace")
+            process.stderr.close()
+            returncode = process.wait()
+        if returncode != 0:
+            raise RuntimeError(f"Failed to decode audio for waveform peaks: {stderr}")
+
+        return {
+            "peaks_per_second": self.PEAKS_PER_SECOND,
+            "duration": round(len(peaks) / self.PEAKS_PER_SECOND, 3),
+            "peaks": peaks,
+        }
+
+    @staticmethod
+    def _bucket_peaks(samples: array, bucket_size: int) -> list:
+        return [round(max(max(samples[i : i + bucket_size]), -min(samples[i : i + bucket_size])) / 32768, 3) for i in range(0, len(samples), bucket_size)]
+
+    @staticmethod
+    def _write_json_atomic(path: str, data: Dict[str, Any]) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
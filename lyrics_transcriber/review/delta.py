@@ -0,0 +1,155 @@
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class VersionConflictError(ValueError):
+    """A patch was based on a version of the review document that is no longer current."""
+
+
+class ReviewDocument:
+    """The review server's correction data, versioned so clients can exchange deltas instead of full documents.
+
+    Each top-level field of the serialized CorrectionResult is fingerprinted. Lists of objects
+    (segments, corrections, anchors, gaps, correction steps) are fingerprinted per item, keyed by the
+    item's "id" when every item has a unique one and by a content hash otherwise, so a delta only carries
+    the items that were added or changed. Other fields are sent whole when they change.
+
+    Delta format, used in both directions:
+        {field: {"replace": value}} or
+        {field: {"items": {item_key: item}, "removed": [item_key, ...], "order": [item_key, ...]}}
+
+    In a patch from a client, "order" is optional; without it existing items keep their place and new
+    items are appended.
+    """
+
+    def __init__(self, max_versions: int = 20):
+        self.max_versions = max_versions
+        self.version = 0
+        self.data: Optional[Dict[str, Any]] = None
+        self._fingerprints: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def update(self, data: Dict[str, Any]) -> int:
+        """Make data the current document; the version is bumped only if its content changed."""
+        fingerprint = self._fingerprint(data)
+        with self._lock:
+            current = self._fingerprints.get(self.version)
+            if current is None or current["fields"] != fingerprint["fields"]:
+                self.version += 1
+                self._fingerprints[self.version] = fingerprint
+                while len(self._fingerprints) > self.max_versions:
+                    self._fingerprints.popitem(last=False)
+            self.data = data
+            return self.version
+
+    def delta_since(self, base_version: Optional[int]) -> Dict[str, Any]:
+        """Describe the changes from base_version to the current version.
+
+        Returns the full document instead (with "full": True) if base_version is None or no longer known.
+        """
+        with self._lock:
+            version, data = self.version, self.data
+            base = self._fingerprints.get(base_version) if base_version is not None else None
+            current = self._fingerprints.get(version)
+
+        if base is None:
+            return {"version": version, "full": True, "data": data}
+        if base_version == version:
+            return {"version": version, "base_version": base_version, "changes": {}}
+
+        changes = {}
+        for field, value in data.items():
+            if base["fields"].get(field) == current["fields"][field]:
+                continue
+            base_items = base["items"].get(field)
+            current_items = current["items"].get(field)
+            if base_items is None or current_items is None or base_items[0] != current_items[0]:
+                changes[field] = {"replace": value}
+                continue
+
+            _, base_keys, base_hashes = base_items
+            _, keys, hashes = current_items
+            base_by_key = dict(zip(base_keys, base_hashes))
+            current_keys = set(keys)
+            changes[field] = {
+                "items": {key: item for key, item_hash, item in zip(keys, hashes, value) if base_by_key.get(key) != item_hash},
+                "removed": [key for key in dict.fromkeys(base_keys) if key not in current_keys],
+                "order": keys,
+            }
+        for field in base["fields"]:
+            if field not in data:
+                changes[field] = {"replace": None}
+
+        return {"version": version, "base_version": base_version, "changes": changes}
+
+    def apply(self, base_version: int, changes: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a copy of the current document with a client's changes applied.
+
+        Raises:
+            VersionConflictError: If base_version is not the current version
+            ValueError: If the changes are malformed
+        """
+        with self._lock:
+            version, data = self.version, self.data
+            current = self._fingerprints.get(version)
+        if data is None or base_version != version:
+            raise VersionConflictError(f"Changes are based on version {base_version}, but the current version is {version}")
+        if not isinstance(changes, dict):
+            raise ValueError("Changes must be an object keyed by field name")
+
+        patched = dict(data)
+        for field, change in changes.items():
+            if not isinstance(change, dict):
+                raise ValueError(f"Invalid change for field '{field}'")
+            if "replace" in change:
+                patched[field] = change["replace"]
+                continue
+
+            existing = data.get(field)
+            item_keys = current["items"].get(field)
+            if not isinstance(existing, list) or item_keys is None:
+                raise ValueError(f"Field '{field}' can only be replaced, not patched by item")
+            patched[field] = self._apply_items(field, existing, item_keys[1], change)
+        return copy.deepcopy(patched)
+
+    @staticmethod
+    def _apply_items(field: str, existing: List[Any], keys: List[str], change: Dict[str, Any]) -> List[Any]:
+        updated = change.get("items", {})
+        removed = set(change.get("removed", []))
+        order = change.get("order")
+        if order is None:
+            known = set(keys)
+            kept = [updated.get(key, item) for key, item in zip(keys, existing) if key not in removed]
+            return kept + [item for key, item in updated.items() if key not in known]
+
+        items = dict(zip(keys, existing))
+        items.update(updated)
+        missing = [key for key in order if key not in items or key in removed]
+        if missing:
+            raise ValueError(f"Unknown {field} items in order: {missing}")
+        return [items[key] for key in order]
+
+    @classmethod
+    def _fingerprint(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        fields: Dict[str, str] = {}
+        items: Dict[str, Tuple[str, List[str], List[str]]] = {}
+        for field, value in data.items():
+            if isinstance(value, list) and all(isinstance(item, dict) for item in value):
+                hashes = [cls._hash(item) for item in value]
+                ids = [item.get("id") for item in value]
+                if all(isinstance(item_id, str) for item_id in ids) and len(set(ids)) == len(ids):
+                    items[field] = ("id", ids, hashes)
+                else:
+                    items[field] = ("hash", hashes, hashes)
+                fields[field] = cls._hash(hashes)
+            else:
+                fields[field] = cls._hash(value)
+        return {"fields": fields, "items": items}
+
+    @staticmethod
+    def _hash(value: Any) -> str:
+        return hashlib.md5(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
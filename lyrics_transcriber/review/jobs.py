@@ -0,0 +1,234 @@
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a background job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINISHED_STATUSES = (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+@dataclass
+class Job:
+    """A unit of heavy review-server work (correction rerun, preview render) running off the event loop."""
+
+    id: str
+    kind: str
+    key: Optional[str] = None
+    status: JobStatus = JobStatus.QUEUED
+    progress: float = 0.0
+    message: str = ""
+    metrics: Optional[Dict[str, Any]] = None  # Live metrics of the current step, e.g. FFmpeg encode speed
+    result: Any = None
+    error: Optional[str] = None
+    exception: Optional[BaseException] = field(default=None, repr=False)
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    future: Optional[Future] = field(default=None, repr=False)
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+    applied: bool = field(default=False, repr=False)  # Result already made current; cancelling is no longer possible
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation was requested; long-running job functions may poll this to stop early."""
+        return self.cancel_event.is_set()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def set_progress(self, progress: float, message: Optional[str] = None) -> None:
+        """Report progress (0-1) and optionally a short description of the current step."""
+        self.progress = max(0.0, min(1.0, progress))
+        if message is not None:
+            self.message = message
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        """Convert to dictionary for the status endpoint."""
+        data = {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status.value,
+            "progress": self.progress,
+            "message": self.message,
+            "metrics": self.metrics,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+        if include_result and self.status == JobStatus.SUCCEEDED:
+            data["result"] = self.result
+        return data
+
+
+class JobManager:
+    """Runs jobs on per-lane single-worker executors and tracks their status.
+
+    Jobs in the same lane run one at a time in submission order, so jobs that replace shared state
+    (e.g. the current correction result) never interleave. A job submitted with a key that matches
+    an unfinished job returns that job instead of queueing a duplicate, and submitting with
+    supersede=True cancels unfinished jobs of the same kind, so only the newest edit gets rendered.
+    A running job isn't interrupted, but its function may poll job.cancelled and raise to stop early;
+    either way a cancelled job ends as cancelled and its result is discarded. Jobs that replace
+    shared state do so through apply_result, so a cancel can't land between the check and the update.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, max_finished_jobs: int = 50):
+        self.logger = logger or logging.getLogger(__name__)
+        self.max_finished_jobs = max_finished_jobs
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._active_by_key: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        kind: str,
+        fn: Callable[[Job], Any],
+        key: Optional[str] = None,
+        lane: Optional[str] = None,
+        supersede: bool = False,
+    ) -> Job:
+        """Queue fn(job) to run in the background and return its job.
+
+        Args:
+            kind: Type of work, e.g. "preview-video"; used for status reporting and supersede
+            fn: Function doing the work; receives the job to report progress and check cancellation
+            key: Identity of the request; an unfinished job with the same key is returned instead
+            lane: Executor lane to run in (defaults to kind)
+            supersede: Cancel unfinished jobs of the same kind first
+        """
+        with self._lock:
+            if key is not None and (existing := self._active_by_key.get(key)) and not existing.finished and not existing.cancelled:
+                self.logger.debug(f"Coalescing {kind} request into job {existing.id}")
+                return existing
+
+            if supersede:
+                for job in list(self._jobs.values()):
+                    if job.kind == kind and not job.finished:
+                        self.logger.info(f"Cancelling {kind} job {job.id}, superseded by a newer request")
+                        self._cancel_locked(job)
+
+            job = Job(id=uuid.uuid4().hex[:12], kind=kind, key=key)
+            self._jobs[job.id] = job
+            if key is not None:
+                self._active_by_key[key] = job
+            executor = self._executors.get(lane or kind)
+            if executor is None:
+                executor = self._executors[lane or kind] = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"review-{lane or kind}")
+            job.future = executor.submit(self._run, job, fn)
+            self._prune_locked()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job by id, or None if unknown (or pruned)."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Request cancellation of a job; returns the job, or None if unknown."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and not job.finished:
+                self._cancel_locked(job)
+            return job
+
+    async def wait(self, job: Job) -> Job:
+        """Wait for a job to finish without blocking the event loop."""
+        try:
+            await asyncio.wrap_future(job.future)
+        except asyncio.CancelledError:
+            if not job.future.cancelled():
+                raise  # The awaiting request itself was cancelled
+        return job
+
+    def shutdown(self) -> None:
+        """Cancel queued jobs and stop the executors without waiting for running jobs."""
+        with self._lock:
+            for job in self._jobs.values():
+                if not job.finished:
+                    self._cancel_locked(job)
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job: Job, fn: Callable[[Job], Any]) -> None:
+        try:
+            if job.cancelled:
+                job.status = JobStatus.CANCELLED
+                return
+            job.status = JobStatus.RUNNING
+            result = fn(job)
+            if job.cancelled:
+                self.logger.debug(f"Discarding result of cancelled {job.kind} job {job.id}")
+                job.status = JobStatus.CANCELLED
+            else:
+                job.result = result
+                job.set_progress(1.0)
+                job.status = JobStatus.SUCCEEDED
+        except Exception as e:
+            if job.cancelled:
+                self.logger.info(f"{job.kind} job {job.id} stopped after cancellation: {e}")
+                job.status = JobStatus.CANCELLED
+                return
+            self.logger.error(f"{job.kind} job {job.id} failed: {e}")
+            job.error = str(e)
+            job.exception = e
+            job.status = JobStatus.FAILED
+        finally:
+            self._finish(job)
+
+    def apply_result(self, job: Job, apply: Callable[[], Any]) -> bool:
+        """Call apply() from a job's function unless the job was cancelled, atomically with cancellation.
+
+        Once apply() has run the job can no longer be cancelled, so a job whose result was made
+        current is never reported as cancelled. Returns whether apply() was called.
+        """
+        with self._lock:
+            if job.cancelled:
+                return False
+            apply()
+            job.applied = True
+            return True
+
+    def _cancel_locked(self, job: Job) -> None:
+        if job.applied:
+            return
+        job.cancel_event.set()
+        # A cancelled job may keep running for a while; new requests with its key must get a fresh job
+        if job.key is not None and self._active_by_key.get(job.key) is job:
+            del self._active_by_key[job.key]
+        if job.future is not None and job.future.cancel():
+            # Never started; otherwise _run marks it cancelled when fn returns
+            job.status = JobStatus.CANCELLED
+            self._finish_locked(job)
+
+    def _finish(self, job: Job) -> None:
+        with self._lock:
+            self._finish_locked(job)
+
+    def _finish_locked(self, job: Job) -> None:
+        job.finished_at = time.time()
+        if job.key is not None and self._active_by_key.get(job.key) is job:
+            del self._active_by_key[job.key]
+
+    def _prune_locked(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
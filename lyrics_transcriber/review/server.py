@@ -1,25 +1,52 @@
+import asyncio
 import logging
-import socket
+import threading
 from fastapi import FastAPI, Body, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from typing import Dict, Any, List, Optional
 from lyrics_transcriber.types import CorrectionResult, WordCorrection, LyricsSegment, LyricsData, LyricsMetadata, Word
-import time
 import os
 import urllib.parse
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
-import hashlib
 from lyrics_transcriber.core.config import OutputConfig
-import uvicorn
 import webbrowser
-from threading import Thread
 from lyrics_transcriber.output.generator import OutputGenerator
+from lyrics_transcriber.output.ffmpeg_progress import FFmpegProgress
 import json
+import hashlib
 from lyrics_transcriber.correction.corrector import LyricsCorrector
 from lyrics_transcriber.types import TranscriptionResult, TranscriptionData
 from lyrics_transcriber.lyrics.user_input_provider import UserInputProvider
 from lyrics_transcriber.correction.operations import CorrectionOperations
+from lyrics_transcriber.utils.audio_fingerprint import AudioFingerprint
+from lyrics_transcriber.review.jobs import Job, JobManager, JobStatus
+from lyrics_transcriber.review.delta import ReviewDocument, VersionConflictError
+from lyrics_transcriber.review.audio_proxy import ReviewAudio
+from lyrics_transcriber.review.serving import BackgroundServer
+
+
+class _ApiCompressionMiddleware:
+    """Gzip API responses, leaving audio and preview video streams (which support range requests) untouched."""
+
+    UNCOMPRESSED_PREFIXES = ("/api/audio/", "/api/preview-video/")
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and self._compressible(scope):
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+    def _compressible(self, scope) -> bool:
+        path = scope.get("path", "")
+        if not path.startswith("/api/"):
+            return False
+        return scope.get("method") != "GET" or not path.startswith(self.UNCOMPRESSED_PREFIXES)
 
 
 class ReviewServer:
@@ -31,19 +58,45 @@ class ReviewServer:
         output_config: OutputConfig,
         audio_filepath: str,
         logger: logging.Logger,
+        corrector: Optional[LyricsCorrector] = None,
+        serve_frontend: bool = True,
     ):
-        """Initialize the review server."""
+        """Initialize the review server.
+
+        If a corrector is given (e.g. the one that produced correction_result) it is reused when the
+        reviewer toggles handlers; otherwise one is created on first use and kept for later toggles.
+        With serve_frontend=False only the API is served, e.g. as one session of a ReviewService.
+        """
         self.correction_result = correction_result
         self.output_config = output_config
         self.audio_filepath = audio_filepath
         self.logger = logger or logging.getLogger(__name__)
         self.review_completed = False
+        # Set when the reviewer completes the review; waited on instead of polling review_completed
+        self.completed = asyncio.Event()
+        self.corrector = corrector
+        self.preview_videos: Dict[str, str] = {}
+
+        # Versioned copy of the serialized correction result, for the delta endpoints
+        self.document = ReviewDocument()
+        self._document_source: Optional[CorrectionResult] = None
+        # Guards correction_result and document, which correction jobs replace from their worker threads
+        self._state_lock = threading.RLock()
+
+        # Correction reruns and preview renders run here, off the event loop
+        self.jobs = JobManager(logger=self.logger)
+
+        # Transcoded review audio and waveform peaks, prepared once per audio hash
+        self.review_audio = ReviewAudio(cache_dir=output_config.cache_dir, logger=self.logger)
+        self._review_audio_jobs: Dict[str, Job] = {}
 
         # Create FastAPI instance and configure
         self.app = FastAPI()
         self._configure_cors()
+        self.app.add_middleware(_ApiCompressionMiddleware)
         self._register_routes()
-        self._mount_frontend()
+        if serve_frontend:
+            self._mount_frontend()
 
     def _configure_cors(self) -> None:
         """Configure CORS middleware."""
@@ -70,17 +123,59 @@ class ReviewServer:
     def _register_routes(self) -> None:
         """Register API routes."""
         self.app.add_api_route("/api/correction-data", self.get_correction_data, methods=["GET"])
+        self.app.add_api_route("/api/correction-data/delta", self.get_correction_delta, methods=["GET"])
         self.app.add_api_route("/api/complete", self.complete_review, methods=["POST"])
+        self.app.add_api_route("/api/complete/delta", self.complete_review_delta, methods=["POST"])
         self.app.add_api_route("/api/preview-video", self.generate_preview_video, methods=["POST"])
+        self.app.add_api_route("/api/preview-video/delta", self.generate_preview_video_delta, methods=["POST"])
         self.app.add_api_route("/api/preview-video/{preview_hash}", self.get_preview_video, methods=["GET"])
         self.app.add_api_route("/api/audio/{audio_hash}", self.get_audio, methods=["GET"])
+        self.app.add_api_route("/api/audio/{audio_hash}/peaks", self.get_audio_peaks, methods=["GET"])
         self.app.add_api_route("/api/ping", self.ping, methods=["GET"])
         self.app.add_api_route("/api/handlers", self.update_handlers, methods=["POST"])
+        self.app.add_api_route("/api/handlers/delta", self.update_handlers_delta, methods=["POST"])
         self.app.add_api_route("/api/add-lyrics", self.add_lyrics, methods=["POST"])
+        self.app.add_api_route("/api/add-lyrics/delta", self.add_lyrics_delta, methods=["POST"])
+        self.app.add_api_route("/api/jobs/preview-video", self.submit_preview_video_job, methods=["POST"])
+        self.app.add_api_route("/api/jobs/handlers", self.submit_handlers_job, methods=["POST"])
+        self.app.add_api_route("/api/jobs/add-lyrics", self.submit_add_lyrics_job, methods=["POST"])
+        self.app.add_api_route("/api/jobs/{job_id}", self.get_job, methods=["GET"])
+        self.app.add_api_route("/api/jobs/{job_id}", self.cancel_job, methods=["DELETE"])
 
     async def get_correction_data(self):
         """Get the correction data."""
-        return self.correction_result.to_dict()
+        with self._state_lock:
+            return self._current_document().data
+
+    async def get_correction_delta(self, since: Optional[int] = None):
+        """Get the changes to the correction data since a version the client already has.
+
+        Returns {"version", "base_version", "changes"}, or {"version", "full": True, "data"} if since is
+        omitted or too old. The returned version is the base for the client's next delta request or patch.
+        """
+        with self._state_lock:
+            return self._current_document().delta_since(since)
+
+    def _current_document(self) -> ReviewDocument:
+        """Get the versioned document, re-serializing the correction result only if it was replaced.
+
+        Callers must hold _state_lock while using the document.
+        """
+        correction_result = self.correction_result
+        if self._document_source is not correction_result or self.document.data is None:
+            self.document.update(correction_result.to_dict())
+            self._document_source = correction_result
+        return self.document
+
+    def _apply_patch(self, patch: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild the full edited document from a client patch ({"base_version", "changes"})."""
+        try:
+            with self._state_lock:
+                return self._current_document().apply(patch.get("base_version"), patch.get("changes", {}))
+        except VersionConflictError as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
     def _update_correction_result(self, base_result: CorrectionResult, updated_data: Dict[str, Any]) -> CorrectionResult:
         """Update a CorrectionResult with new correction data."""
@@ -89,59 +184,137 @@ class ReviewServer:
     async def complete_review(self, updated_data: Dict[str, Any] = Body(...)):
         """Complete the review process."""
         try:
-            self.correction_result = self._update_correction_result(self.correction_result, updated_data)
-            self.review_completed = True
+            with self._state_lock:
+                self.correction_result = self._update_correction_result(self.correction_result, updated_data)
+                self.review_completed = True
+            self.completed.set()
             return {"status": "success"}
         except Exception as e:
             self.logger.error(f"Failed to update correction data: {str(e)}")
             return {"status": "error", "message": str(e)}
 
+    async def complete_review_delta(self, patch: Dict[str, Any] = Body(...)):
+        """Complete the review process with only the changed segments and corrections."""
+        return await self.complete_review(self._apply_patch(patch))
+
     async def ping(self):
         """Simple ping endpoint for testing."""
         return {"status": "ok"}
 
     async def get_audio(self, audio_hash: str):
-        """Stream the audio file."""
+        """Stream the review audio, with range request support.
+
+        Large or uncompressed inputs are served from a low-bitrate proxy once it has been created;
+        until then (or if creating it failed) the original file is served.
+        """
         try:
-            if (
-                not self.audio_filepath
-                or not os.path.exists(self.audio_filepath)
-                or not self.correction_result.metadata
-                or self.correction_result.metadata.get("audio_hash") != audio_hash
-            ):
+            if not self._is_current_audio(audio_hash):
                 raise FileNotFoundError("Audio file not found")
 
-            return FileResponse(self.audio_filepath, media_type="audio/mpeg", filename=os.path.basename(self.audio_filepath))
+            if self.review_audio.needs_proxy(self.audio_filepath):
+                self._submit_review_audio(audio_hash)
+            audio_path = self.review_audio.get_stream_path(self.audio_filepath, audio_hash)
+            return FileResponse(audio_path, media_type=ReviewAudio.media_type(audio_path), filename=os.path.basename(audio_path))
         except Exception as e:
             raise HTTPException(status_code=404, detail="Audio file not found")
 
+    async def get_audio_peaks(self, audio_hash: str):
+        """Get precomputed waveform peaks for the review audio, computing them first if needed."""
+        if not self._is_current_audio(audio_hash):
+            raise HTTPException(status_code=404, detail="Audio file not found")
+        peaks = self.review_audio.get_peaks(audio_hash)
+        if peaks is None:
+            peaks = await self._await_job(self._submit_review_audio(audio_hash))
+        return peaks
+
+    def _is_current_audio(self, audio_hash: str) -> bool:
+        return bool(
+            self.audio_filepath
+            and os.path.exists(self.audio_filepath)
+            and self.correction_result.metadata
+            and self.correction_result.metadata.get("audio_hash") == audio_hash
+        )
+
+    def _submit_review_audio(self, audio_hash: str) -> Job:
+        """Queue creating the review audio proxy and waveform peaks; only attempted once per audio hash."""
+        job = self._review_audio_jobs.get(audio_hash)
+        if job is None or job.status == JobStatus.CANCELLED:
+            audio_filepath = self.audio_filepath
+
+            def prepare(job: Job) -> Optional[Dict[str, Any]]:
+                job.set_progress(0.1, "Preparing review audio")
+                self.review_audio.prepare(audio_filepath, audio_hash)
+                return self.review_audio.get_peaks(audio_hash)
+
+            job = self.jobs.submit("review-audio", prepare, key=f"review-audio:{audio_hash}")
+            self._review_audio_jobs[audio_hash] = job
+        return job
+
     async def generate_preview_video(self, updated_data: Dict[str, Any] = Body(...)):
         """Generate a preview video with the current corrections."""
-        try:
+        return await self._await_job(self._submit_preview_video(updated_data))
+
+    async def generate_preview_video_delta(self, patch: Dict[str, Any] = Body(...)):
+        """Generate a preview video from a patch against the current correction data.
+
+        Preview options (preview_window, preview_segment_ids) go at the top level of the patch.
+        """
+        updated_data = self._apply_patch(patch)
+        for option in ("preview_window", "preview_segment_ids"):
+            if option in patch:
+                updated_data[option] = patch[option]
+        return await self._await_job(self._submit_preview_video(updated_data))
+
+    def _submit_preview_video(self, updated_data: Dict[str, Any], supersede: bool = False) -> Job:
+        """Queue a preview render; with supersede, any preview still in flight is cancelled first.
+
+        The request may include "preview_window" ([start, end] in seconds) or "preview_segment_ids"
+        to render only part of the song; these are removed before the data is applied. Only the jobs
+        API supersedes, since its clients poll for the newest job; clients of the blocking endpoints
+        would get a 409 for a preview they are still waiting on.
+        """
+        with self._state_lock:
+            correction_result = self.correction_result
+        updated_data = dict(updated_data)
+        time_window = updated_data.pop("preview_window", None)
+        segment_ids = updated_data.pop("preview_segment_ids", None)
+
+        def report_progress(job: Job, progress: FFmpegProgress) -> None:
+            if job.cancelled:
+                # Raising from the progress callback kills FFmpeg, so a superseded render stops right away
+                raise RuntimeError("Preview render cancelled")
+            speed = f", {progress.speed:.1f}x" if progress.speed else ""
+            job.set_progress(0.1 + 0.9 * (progress.fraction or 0.0), f"Rendering preview video: {progress.fps:.0f} fps{speed}")
+            job.metrics = progress.to_dict()
+
+        def render(job: Job) -> Dict[str, Any]:
+            job.set_progress(0.1, "Rendering preview video")
             # Use shared operation for preview generation
             result = CorrectionOperations.generate_preview_video(
-                correction_result=self.correction_result,
+                correction_result=correction_result,
                 updated_data=updated_data,
                 output_config=self.output_config,
                 audio_filepath=self.audio_filepath,
-                logger=self.logger
+                logger=self.logger,
+                time_window=tuple(time_window) if time_window else None,
+                segment_ids=segment_ids,
+                progress_callback=lambda progress: report_progress(job, progress),
             )
-            
-            # Store the path for later retrieval
-            if not hasattr(self, "preview_videos"):
-                self.preview_videos = {}
-            self.preview_videos[result["preview_hash"]] = result["video_path"]
 
-            return {"status": "success", "preview_hash": result["preview_hash"]}
+            # Store the path for later retrieval
+            if not job.cancelled:
+                self.preview_videos[result["preview_hash"]] = result["video_path"]
+            response = {"status": "success", "preview_hash": result["preview_hash"]}
+            if result.get("preview_window"):
+                response["preview_window"] = result["preview_window"]
+            return response
 
-        except Exception as e:
-            self.logger.error(f"Failed to generate preview video: {str(e)}")
-            raise HTTPException(status_code=500, detail=str(e))
+        return self.jobs.submit("preview-video", render, key=f"preview-video:{self._request_key([updated_data, time_window, segment_ids])}", supersede=supersede)
 
     async def get_preview_video(self, preview_hash: str):
         """Stream the preview video."""
         try:
-            if not hasattr(self, "preview_videos") or preview_hash not in self.preview_videos:
+            if preview_hash not in self.preview_videos:
                 raise FileNotFoundError("Preview video not found")
 
             video_path = self.preview_videos[preview_hash]
@@ -165,19 +338,40 @@ class ReviewServer:
 
     async def update_handlers(self, enabled_handlers: List[str] = Body(...)):
         """Update enabled correction handlers and rerun correction."""
-        try:
+        return await self._await_job(self._submit_update_handlers(enabled_handlers))
+
+    async def update_handlers_delta(self, enabled_handlers: List[str] = Body(...), since: Optional[int] = None):
+        """Update enabled correction handlers and return only the resulting changes since the client's version."""
+        await self.update_handlers(enabled_handlers)
+        with self._state_lock:
+            return {"status": "success", **self._current_document().delta_since(since)}
+
+    def _submit_update_handlers(self, enabled_handlers: List[str]) -> Job:
+        """Queue a correction rerun with the given handlers enabled."""
+
+        def rerun(job: Job) -> Dict[str, Any]:
+            job.set_progress(0.1, "Re-running correction handlers")
             # Use shared operation for handler updates
-            self.correction_result = CorrectionOperations.update_correction_handlers(
+            correction_result = CorrectionOperations.update_correction_handlers(
                 correction_result=self.correction_result,
                 enabled_handlers=enabled_handlers,
                 cache_dir=self.output_config.cache_dir,
-                logger=self.logger
+                logger=self.logger,
+                corrector=self._get_corrector(),
             )
+            return self._apply_job_result(job, correction_result)
 
-            return {"status": "success", "data": self.correction_result.to_dict()}
-        except Exception as e:
-            self.logger.error(f"Failed to update handlers: {str(e)}")
-            raise HTTPException(status_code=500, detail=str(e))
+        return self.jobs.submit("handlers", rerun, key=f"handlers:{self._request_key(sorted(enabled_handlers))}", lane="correction")
+
+    def _get_corrector(self) -> LyricsCorrector:
+        """Get the resident corrector, creating it with the currently enabled handlers on first use."""
+        if self.corrector is None:
+            self.corrector = LyricsCorrector(
+                cache_dir=self.output_config.cache_dir,
+                enabled_handlers=(self.correction_result.metadata or {}).get("enabled_handlers"),
+                logger=self.logger,
+            )
+        return self.corrector
 
     def _create_lyrics_data_from_text(self, text: str, source: str) -> LyricsData:
         """Create LyricsData object from plain text lyrics."""
@@ -238,88 +432,133 @@ class ReviewServer:
 
     async def add_lyrics(self, data: Dict[str, str] = Body(...)):
         """Add new lyrics source and rerun correction."""
-        try:
-            source = data.get("source", "").strip()
-            lyrics_text = data.get("lyrics", "").strip()
+        # ValueError means invalid input; convert it to a 400 for API consistency
+        return await self._await_job(self._submit_add_lyrics(data), client_errors=(ValueError,))
+
+    async def add_lyrics_delta(self, data: Dict[str, str] = Body(...), since: Optional[int] = None):
+        """Add a lyrics source and return only the resulting changes since the client's version."""
+        await self.add_lyrics(data)
+        with self._state_lock:
+            return {"status": "success", **self._current_document().delta_since(since)}
+
+    def _submit_add_lyrics(self, data: Dict[str, str]) -> Job:
+        """Queue adding a lyrics source and rerunning correction."""
+        source = data.get("source", "").strip()
+        lyrics_text = data.get("lyrics", "").strip()
 
-            self.logger.info(f"Received request to add lyrics source '{source}' with {len(lyrics_text)} characters")
+        self.logger.info(f"Received request to add lyrics source '{source}' with {len(lyrics_text)} characters")
 
+        def add(job: Job) -> Dict[str, Any]:
+            job.set_progress(0.1, f"Adding lyrics source '{source}'")
             # Use shared operation for adding lyrics source
-            self.correction_result = CorrectionOperations.add_lyrics_source(
+            correction_result = CorrectionOperations.add_lyrics_source(
                 correction_result=self.correction_result,
                 source=source,
                 lyrics_text=lyrics_text,
                 cache_dir=self.output_config.cache_dir,
-                logger=self.logger
+                logger=self.logger,
+                corrector=self._get_corrector(),
             )
-
-            return {"status": "success", "data": self.correction_result.to_dict()}
-
-        except ValueError as e:
-            # Convert ValueError to HTTPException for API consistency
-            raise HTTPException(status_code=400, detail=str(e))
-        except Exception as e:
-            self.logger.error(f"Failed to add lyrics: {str(e)}", exc_info=True)
-            raise HTTPException(status_code=500, detail=str(e))
-
-    def start(self) -> CorrectionResult:
-        """Start the review server and wait for completion."""
-        # Generate audio hash if audio file exists
+            return self._apply_job_result(job, correction_result)
+
+        return self.jobs.submit("add-lyrics", add, key=f"add-lyrics:{self._request_key([source, lyrics_text])}", lane="correction")
+
+    def _apply_job_result(self, job: Job, correction_result: CorrectionResult) -> Dict[str, Any]:
+        """Make a correction job's result current, unless the job was cancelled or the review completed meanwhile.
+
+        Called from the job's worker thread; the cancellation check and the replacement happen under
+        both the job manager's and the state lock, so neither a cancel nor a request can interleave.
+        """
+
+        def apply() -> None:
+            self.correction_result = correction_result
+
+        with self._state_lock:
+            if self.review_completed or not self.jobs.apply_result(job, apply):
+                return {}
+            return {"status": "success", "data": self._current_document().data}
+
+    @staticmethod
+    def _request_key(payload: Any) -> str:
+        """Hash a request payload, so identical in-flight requests share one job."""
+        return hashlib.md5(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    async def _await_job(self, job: Job, client_errors: tuple = ()) -> Dict[str, Any]:
+        """Wait for a job without blocking the event loop and return its result, or raise its error as HTTP."""
+        await self.jobs.wait(job)
+        if job.status == JobStatus.SUCCEEDED:
+            return job.result
+        if job.status == JobStatus.CANCELLED:
+            raise HTTPException(status_code=409, detail="Request was superseded or cancelled")
+        if isinstance(job.exception, client_errors):
+            raise HTTPException(status_code=400, detail=job.error)
+        raise HTTPException(status_code=500, detail=job.error)
+
+    async def submit_preview_video_job(self, updated_data: Dict[str, Any] = Body(...)):
+        """Start rendering a preview video in the background and return its job."""
+        return {"status": "accepted", "job": self._submit_preview_video(updated_data, supersede=True).to_dict()}
+
+    async def submit_handlers_job(self, enabled_handlers: List[str] = Body(...)):
+        """Start rerunning correction with updated handlers in the background and return its job."""
+        return {"status": "accepted", "job": self._submit_update_handlers(enabled_handlers).to_dict()}
+
+    async def submit_add_lyrics_job(self, data: Dict[str, str] = Body(...)):
+        """Start adding a lyrics source in the background and return its job."""
+        return {"status": "accepted", "job": self._submit_add_lyrics(data).to_dict()}
+
+    async def get_job(self, job_id: str):
+        """Get a background job's status and progress, and its result once it has succeeded."""
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return job.to_dict()
+
+    async def cancel_job(self, job_id: str):
+        """Cancel a background job; a running job's result is discarded when it finishes."""
+        job = self.jobs.cancel(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return job.to_dict(include_result=False)
+
+    def prepare_audio(self) -> None:
+        """Record the audio hash in the result metadata and start preparing the review audio."""
         if self.audio_filepath and os.path.exists(self.audio_filepath):
-            with open(self.audio_filepath, "rb") as f:
-                audio_hash = hashlib.md5(f.read()).hexdigest()
+            audio_hash = AudioFingerprint.md5(self.audio_filepath, cache_dir=self.output_config.cache_dir, logger=self.logger)
             if not self.correction_result.metadata:
                 self.correction_result.metadata = {}
             self.correction_result.metadata["audio_hash"] = audio_hash
+            # Transcode the audio and compute its waveform while the reviewer opens the page
+            self._submit_review_audio(audio_hash)
 
-        server = None
-        server_thread = None
-        sock = None
+    def start(self) -> CorrectionResult:
+        """Serve this review on its own port, open it in the browser and wait for completion.
+
+        The port comes from output_config.review_server_port; if it is in use (or set to 0), an
+        ephemeral port is used. To host many reviews in one process, use ReviewService instead.
+        """
+        self.prepare_audio()
+
+        server = BackgroundServer(
+            self.app,
+            host=self.output_config.review_server_host,
+            port=self.output_config.review_server_port,
+            logger=self.logger,
+        )
 
         try:
-            # Check port availability
-            while True:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(1)
-                if sock.connect_ex(("127.0.0.1", 8000)) == 0:
-                    # Port is in use, get process info
-                    process_info = ""
-                    if os.name != "nt":  # Unix-like systems
-                        try:
-                            process_info = os.popen("lsof -i:8000").read().strip()
-                        except:
-                            pass
-
-                    self.logger.warning(
-                        f"Port 8000 is in use. Waiting for it to become available...\n"
-                        f"Process using port 8000:\n{process_info}\n"
-                        f"To manually free the port, you can run: lsof -ti:8000 | xargs kill -9"
-                    )
-                    sock.close()
-                    time.sleep(30)
-                else:
-                    sock.close()
-                    break
-
-            # Start server
-            config = uvicorn.Config(self.app, host="127.0.0.1", port=8000, log_level="error")
-            server = uvicorn.Server(config)
-            server_thread = Thread(target=server.run, daemon=True)
-            server_thread.start()
-            time.sleep(0.5)  # Reduced wait time
+            server.start()
 
             # Open browser and wait for completion
-            base_api_url = "http://localhost:8000/api"
+            base_api_url = f"{server.base_url}/api"
             encoded_api_url = urllib.parse.quote(base_api_url, safe="")
             audio_hash_param = (
                 f"&audioHash={self.correction_result.metadata.get('audio_hash', '')}"
                 if self.correction_result.metadata and "audio_hash" in self.correction_result.metadata
                 else ""
             )
-            webbrowser.open(f"http://localhost:8000?baseApiUrl={encoded_api_url}{audio_hash_param}")
+            webbrowser.open(f"{server.base_url}?baseApiUrl={encoded_api_url}{audio_hash_param}")
 
-            while not self.review_completed:
-                time.sleep(0.1)
+            server.run_coroutine(self.completed.wait())
 
             return self.correction_result
 
@@ -330,18 +569,8 @@ class ReviewServer:
             self.logger.error(f"Error during review server operation: {e}")
             raise
         finally:
-            # Comprehensive cleanup
-            if sock:
-                try:
-                    sock.close()
-                except:
-                    pass
-
-            if server:
-                server.should_exit = True
-
-            if server_thread and server_thread.is_alive():
-                server_thread.join(timeout=1)
+            self.jobs.shutdown()
+            server.stop(timeout=1)
 
             # Force cleanup any remaining server resources
             try:
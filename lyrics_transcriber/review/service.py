@@ -0,0 +1,142 @@
+import logging
+import threading
+import time
+import urllib.parse
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.staticfiles import StaticFiles
+from starlette.routing import Mount
+
+from lyrics_transcriber.core.config import OutputConfig
+from lyrics_transcriber.correction.corrector import LyricsCorrector
+from lyrics_transcriber.review.server import ReviewServer
+from lyrics_transcriber.review.serving import BackgroundServer
+from lyrics_transcriber.types import CorrectionResult
+
+
+@dataclass
+class ReviewSession:
+    """One song under review, hosted by a ReviewService."""
+
+    id: str
+    server: ReviewServer
+    created_at: float = field(default_factory=time.time)
+
+
+class ReviewService:
+    """Hosts many review sessions on a single uvicorn server.
+
+    Each session is a ReviewServer (without its own frontend or port) whose API is served under
+    /sessions/{session_id}/api; the frontend is served once at the root and pointed at a session with
+    its baseApiUrl parameter. Completion is signalled by each session's asyncio event, so waiting for a
+    review costs nothing while the reviewer works.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, logger: Optional[logging.Logger] = None, serve_frontend: bool = True):
+        self.logger = logger or logging.getLogger(__name__)
+        self.sessions: Dict[str, ReviewSession] = {}
+        self._lock = threading.Lock()
+
+        self.app = FastAPI()
+        self.app.router.routes.append(Mount("/sessions/{session_id}", app=self._dispatch))
+        self.app.add_api_route("/api/sessions", self.list_sessions, methods=["GET"])
+        if serve_frontend:
+            from lyrics_transcriber.frontend import get_frontend_assets_dir
+
+            self.app.mount("/", StaticFiles(directory=get_frontend_assets_dir(), html=True), name="frontend")
+
+        self.server = BackgroundServer(self.app, host=host, port=port, logger=self.logger)
+
+    @property
+    def port(self) -> Optional[int]:
+        return self.server.port
+
+    def start(self) -> int:
+        """Start serving all sessions; returns the bound port."""
+        return self.server.start()
+
+    def stop(self) -> None:
+        """Stop the server and the background jobs of all sessions."""
+        with self._lock:
+            sessions = list(self.sessions.values())
+        for session in sessions:
+            session.server.jobs.shutdown()
+        self.server.stop()
+
+    def add_session(
+        self,
+        correction_result: CorrectionResult,
+        output_config: OutputConfig,
+        audio_filepath: str,
+        corrector: Optional[LyricsCorrector] = None,
+        session_id: Optional[str] = None,
+    ) -> ReviewSession:
+        """Register a correction result for review and return its session."""
+        session_id = session_id or uuid.uuid4().hex[:12]
+        review_server = ReviewServer(
+            correction_result=correction_result,
+            output_config=output_config,
+            audio_filepath=audio_filepath,
+            logger=self.logger,
+            corrector=corrector,
+            serve_frontend=False,
+        )
+        review_server.prepare_audio()
+        session = ReviewSession(id=session_id, server=review_server)
+        with self._lock:
+            if session_id in self.sessions:
+                raise ValueError(f"Review session already exists: {session_id}")
+            self.sessions[session_id] = session
+        self.logger.info(f"Added review session {session_id}")
+        return session
+
+    def remove_session(self, session_id: str) -> None:
+        """Stop serving a session and cancel its background jobs."""
+        with self._lock:
+            session = self.sessions.pop(session_id, None)
+        if session:
+            session.server.jobs.shutdown()
+
+    def session_url(self, session_id: str) -> str:
+        """URL of the review UI for a session."""
+        session = self.sessions[session_id]
+        api_url = urllib.parse.quote(f"{self.server.base_url}/sessions/{session_id}/api", safe="")
+        audio_hash = (session.server.correction_result.metadata or {}).get("audio_hash")
+        audio_hash_param = f"&audioHash={audio_hash}" if audio_hash else ""
+        return f"{self.server.base_url}?baseApiUrl={api_url}{audio_hash_param}"
+
+    async def wait_for_review(self, session_id: str) -> CorrectionResult:
+        """Wait until the reviewer completes a session and return the reviewed result."""
+        session = self.sessions[session_id]
+        await session.server.completed.wait()
+        return session.server.correction_result
+
+    def wait_for_review_blocking(self, session_id: str, timeout: Optional[float] = None) -> CorrectionResult:
+        """Wait for a session from a thread outside the server's event loop."""
+        return self.server.run_coroutine(self.wait_for_review(session_id), timeout)
+
+    async def list_sessions(self):
+        """List hosted sessions and whether their review is complete."""
+        with self._lock:
+            sessions = list(self.sessions.values())
+        return [
+            {
+                "id": session.id,
+                "completed": session.server.review_completed,
+                "created_at": session.created_at,
+                "audio_hash": (session.server.correction_result.metadata or {}).get("audio_hash"),
+            }
+            for session in sessions
+        ]
+
+    async def _dispatch(self, scope, receive, send) -> None:
+        session = self.sessions.get(scope.get("path_params", {}).get("session_id"))
+        if session is None:
+            if scope["type"] == "http":
+                await JSONResponse({"detail": "Review session not found"}, status_code=404)(scope, receive, send)
+            return
+        await session.server.app(scope, receive, send)
@@ -0,0 +1,84 @@
+import asyncio
+import errno
+import logging
+import socket
+import threading
+from typing import Any, Coroutine, Optional
+
+import uvicorn
+
+
+def bind_socket(host: str, port: int, logger: Optional[logging.Logger] = None) -> socket.socket:
+    """Bind a listening socket, falling back to an ephemeral port if the requested port is in use.
+
+    Port 0 always binds an ephemeral port. Binding before the server starts means connections made
+    while it is starting wait in the backlog instead of failing.
+    """
+    logger = logger or logging.getLogger(__name__)
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        sock.bind((host, port))
+    except OSError as e:
+        if port == 0 or e.errno != errno.EADDRINUSE:
+            sock.close()
+            raise
+        logger.warning(f"Port {port} is in use, using an ephemeral port instead")
+        sock.bind((host, 0))
+    sock.listen(128)
+    sock.setblocking(False)
+    return sock
+
+
+class BackgroundServer:
+    """Runs a uvicorn server for an ASGI app on its own event loop in a daemon thread."""
+
+    def __init__(self, app: Any, host: str = "127.0.0.1", port: int = 0, logger: Optional[logging.Logger] = None):
+        self.app = app
+        self.host = host
+        self.requested_port = port
+        self.logger = logger or logging.getLogger(__name__)
+        self.port: Optional[int] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[uvicorn.Server] = None
+        self._thread: Optional[threading.Thread] = None
+        self._socket: Optional[socket.socket] = None
+
+    @property
+    def base_url(self) -> str:
+        host = "localhost" if self.host in ("127.0.0.1", "0.0.0.0", "::1", "::") else self.host
+        return f"http://{host}:{self.port}"
+
+    def start(self) -> int:
+        """Bind the port and start serving; returns the port actually bound."""
+        self._socket = bind_socket(self.host, self.requested_port, self.logger)
+        self.port = self._socket.getsockname()[1]
+        self._server = uvicorn.Server(uvicorn.Config(self.app, log_level="error"))
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=f"review-server-{self.port}", daemon=True)
+        self._thread.start()
+        self.logger.info(f"Review server listening on {self.base_url}")
+        return self.port
+
+    def run_coroutine(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the server's event loop and wait for its result from another thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Ask the server to exit and wait briefly for its thread to finish."""
+        if self._server:
+            self._server.should_exit = True
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        if self._socket:
+            self._socket.close()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self._server.serve(sockets=[self._socket]))
+        except Exception as e:
+            self.logger.error(f"Review server stopped with an error: {e}")
+        finally:
+            self.loop.close()
@@ -168,6 +168,9 @@ class AudioShakeTranscriber(BaseTranscriber):
         self.config = config or AudioShakeConfig(api_token=os.getenv("AUDIOSHAKE_API_TOKEN"))
         self.api = api_client or AudioShakeAPI(self.config, self.logger)
 
+    def get_cache_inputs(self) -> Dict[str, Any]:
+        return {"base_url": self.config.base_url}
+
     def get_name(self) -> str:
         return "AudioShake"
 
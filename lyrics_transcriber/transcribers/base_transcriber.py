@@ -4,8 +4,10 @@ from pathlib import Path
 import logging
 import os
 import json
-import hashlib
 from lyrics_transcriber.types import TranscriptionData
+from lyrics_transcriber.utils import serialization
+from lyrics_transcriber.utils.audio_fingerprint import AudioFingerprint
+from lyrics_transcriber.utils.word_utils import WordUtils
 
 
 class TranscriptionError(Exception):
@@ -32,16 +34,16 @@ class BaseTranscriber(ABC):
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.logger.debug(f"Initialized {self.__class__.__name__} with cache dir: {self.cache_dir}")
 
+    def get_cache_inputs(self) -> Dict[str, Any]:
+        """Settings that change what this transcriber returns, for stage cache keys.
+
+        Credentials and timeouts are left out, so rotating a key doesn't invalidate cached transcriptions.
+        """
+        return {}
+
     def _get_file_hash(self, filepath: str) -> str:
-        """Calculate MD5 hash of a file."""
-        self.logger.debug(f"Calculating hash for file: {filepath}")
-        md5_hash = hashlib.md5()
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                md5_hash.update(chunk)
-        hash_result = md5_hash.hexdigest()
-        self.logger.debug(f"File hash: {hash_result}")
-        return hash_result
+        """Calculate MD5 hash of a file, shared with every other component hashing the same audio."""
+        return AudioFingerprint.md5(filepath, cache_dir=self.cache_dir, logger=self.logger)
 
     def _get_cache_path(self, file_hash: str, suffix: str) -> str:
         """Get the cache file path for a given file hash."""
@@ -52,18 +54,16 @@ class BaseTranscriber(ABC):
     def _save_to_cache(self, cache_path: str, raw_data: Dict[str, Any]) -> None:
         """Save raw API response data to cache."""
         self.logger.debug(f"Saving JSON to cache: {cache_path}")
-        with open(cache_path, "w") as f:
-            json.dump(raw_data, f, indent=2)
+        serialization.dump_file(raw_data, cache_path)
         self.logger.debug("Cache save completed")
 
     def _load_from_cache(self, cache_path: str) -> Optional[Dict[str, Any]]:
         """Load raw API response data from cache if it exists."""
         self.logger.debug(f"Attempting to load from cache: {cache_path}")
         try:
-            with open(cache_path, "r") as f:
-                data = json.load(f)
-                self.logger.debug("Raw API response loaded from cache")
-                return data
+            data = serialization.load_file(cache_path)
+            self.logger.debug("Raw API response loaded from cache")
+            return data
         except FileNotFoundError:
             self.logger.debug("Cache file not found")
             return None
@@ -75,7 +75,7 @@ class BaseTranscriber(ABC):
         """Convert raw result to TranscriptionData, save to cache, and return."""
         converted_cache_path = self._get_cache_path(file_hash, "converted")
         converted_result = self._convert_result_format(raw_result)
-        self._save_to_cache(converted_cache_path, converted_result.to_dict())
+        self._save_to_cache(converted_cache_path, converted_result.to_compact_dict())
         return converted_result
 
     def transcribe(self, audio_filepath: str) -> TranscriptionData:
@@ -94,32 +94,35 @@ class BaseTranscriber(ABC):
             self._validate_audio_file(audio_filepath)
             self.logger.debug("Audio file validation passed")
 
-            # Check converted cache first
             file_hash = self._get_file_hash(audio_filepath)
-            converted_cache_path = self._get_cache_path(file_hash, "converted")
-            converted_data = self._load_from_cache(converted_cache_path)
-            if converted_data:
-                self.logger.info(f"Using cached converted data for {audio_filepath}")
-                return TranscriptionData.from_dict(converted_data)
-
-            # Check raw cache next
-            raw_cache_path = self._get_cache_path(file_hash, "raw")
-            raw_data = self._load_from_cache(raw_cache_path)
-            if raw_data:
-                self.logger.info(f"Using cached raw data for {audio_filepath}")
-                converted_result = self._convert_result_format(raw_data)
-                self._save_to_cache(converted_cache_path, converted_result.to_dict())
-                return converted_result
-
-            # If not in cache, perform transcription
-            self.logger.info(f"No cache found, transcribing {audio_filepath}")
-            raw_result = self._perform_transcription(audio_filepath)
-            self.logger.debug("Transcription completed")
-
-            # Save raw result to cache
-            self._save_to_cache(raw_cache_path, raw_result)
-
-            return self._save_and_convert_result(file_hash, raw_result)
+
+            # Scope word/segment ids to this audio file so converting the same result twice gives identical ids
+            with WordUtils.id_scope(f"{self.get_name()}:{file_hash}"):
+                # Check converted cache first
+                converted_cache_path = self._get_cache_path(file_hash, "converted")
+                converted_data = self._load_from_cache(converted_cache_path)
+                if converted_data:
+                    self.logger.info(f"Using cached converted data for {audio_filepath}")
+                    return TranscriptionData.from_dict(converted_data)
+
+                # Check raw cache next
+                raw_cache_path = self._get_cache_path(file_hash, "raw")
+                raw_data = self._load_from_cache(raw_cache_path)
+                if raw_data:
+                    self.logger.info(f"Using cached raw data for {audio_filepath}")
+                    converted_result = self._convert_result_format(raw_data)
+                    self._save_to_cache(converted_cache_path, converted_result.to_compact_dict())
+                    return converted_result
+
+                # If not in cache, perform transcription
+                self.logger.info(f"No cache found, transcribing {audio_filepath}")
+                raw_result = self._perform_transcription(audio_filepath)
+                self.logger.debug("Transcription completed")
+
+                # Save raw result to cache
+                self._save_to_cache(raw_cache_path, raw_result)
+
+                return self._save_and_convert_result(file_hash, raw_result)
 
         except Exception as e:
             self.logger.error(f"Error during transcription: {str(e)}")
@@ -3,7 +3,6 @@ from dataclasses import dataclass
 import os
 import json
 import requests
-import hashlib
 import tempfile
 import time
 from typing import Optional, Dict, Any, Protocol, Union
@@ -12,6 +11,7 @@ from pydub import AudioSegment
 from lyrics_transcriber.types import TranscriptionData, LyricsSegment, Word
 from lyrics_transcriber.transcribers.base_transcriber import BaseTranscriber, TranscriptionError
 from lyrics_transcriber.utils.word_utils import WordUtils
+from lyrics_transcriber.utils.audio_fingerprint import AudioFingerprint
 
 
 @dataclass
@@ -144,11 +144,7 @@ class AudioProcessor:
 
     def get_file_md5(self, filepath: str) -> str:
         """Calculate MD5 hash of a file."""
-        md5_hash = hashlib.md5()
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                md5_hash.update(chunk)
-        return md5_hash.hexdigest()
+        return AudioFingerprint.md5(filepath, logger=self.logger)
 
     def convert_to_flac(self, filepath: str) -> str:
         """Convert WAV to FLAC if needed for faster upload."""
@@ -209,6 +205,9 @@ class WhisperTranscriber(BaseTranscriber):
         self.logger.debug("Initializing DropboxHandler with config")
         return DropboxHandler(config=config)
 
+    def get_cache_inputs(self) -> Dict[str, Any]:
+        return {"endpoint_id": self.config.endpoint_id}
+
     def get_name(self) -> str:
         return "Whisper"
 
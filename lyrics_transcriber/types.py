@@ -69,6 +69,88 @@ class LyricsSegment:
         )
 
 
+# Marker stored in compact payloads so from_dict() can tell them apart from the verbose JSON format
+COMPACT_FORMAT = "lyrics-transcriber-compact"
+COMPACT_FORMAT_VERSION = 1
+
+
+class _CompactTableWriter:
+    """Collects words and segments into shared tables so repeated copies serialize as integer references.
+
+    Words are de-duplicated by id together with their content, so a word whose id is reused with
+    different timing or text still round-trips exactly.
+    """
+
+    def __init__(self):
+        self.words: List[List[Any]] = []
+        self.segments: List[List[Any]] = []
+        self._word_refs: Dict[Tuple, int] = {}
+        self._segment_refs: Dict[Tuple, int] = {}
+
+    def add_word(self, word: Word) -> int:
+        record = (word.id, word.text, word.start_time, word.end_time, word.confidence, word.created_during_correction)
+        ref = self._word_refs.get(record)
+        if ref is None:
+            ref = self._word_refs[record] = len(self.words)
+            self.words.append(list(record))
+        return ref
+
+    def add_segment(self, segment: LyricsSegment) -> int:
+        word_refs = tuple(self.add_word(word) for word in segment.words)
+        record = (segment.id, segment.text, segment.start_time, segment.end_time, word_refs)
+        ref = self._segment_refs.get(record)
+        if ref is None:
+            ref = self._segment_refs[record] = len(self.segments)
+            self.segments.append([segment.id, segment.text, segment.start_time, segment.end_time, list(word_refs)])
+        return ref
+
+    def add_segments(self, segments: List[LyricsSegment]) -> List[int]:
+        return [self.add_segment(segment) for segment in segments]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"format": COMPACT_FORMAT, "version": COMPACT_FORMAT_VERSION, "words": self.words, "segments": self.segments}
+
+
+class _CompactTableReader:
+    """Resolves references written by _CompactTableWriter back into fresh Word/LyricsSegment objects."""
+
+    def __init__(self, data: Dict[str, Any]):
+        if data.get("version", COMPACT_FORMAT_VERSION) > COMPACT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported compact format version: {data.get('version')}")
+        self.words = data["words"]
+        self.segments = data["segments"]
+
+    def word(self, ref: int) -> Word:
+        word_id, text, start_time, end_time, confidence, created = self.words[ref]
+        return Word(
+            id=word_id,
+            text=text,
+            start_time=start_time,
+            end_time=end_time,
+            confidence=confidence,
+            created_during_correction=created,
+        )
+
+    def segment(self, ref: int) -> LyricsSegment:
+        # New objects per reference, so segments shared in the tables are not aliased after loading
+        segment_id, text, start_time, end_time, word_refs = self.segments[ref]
+        return LyricsSegment(
+            id=segment_id,
+            text=text,
+            words=[self.word(word_ref) for word_ref in word_refs],
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+    def segment_list(self, refs: List[int]) -> List[LyricsSegment]:
+        return [self.segment(ref) for ref in refs]
+
+
+def is_compact_dict(data: Any) -> bool:
+    """Return True if data was produced by one of the to_compact_dict() methods."""
+    return isinstance(data, dict) and data.get("format") == COMPACT_FORMAT
+
+
 @dataclass
 class LyricsMetadata:
     """Standardized metadata for lyrics results."""
@@ -202,9 +284,32 @@ class TranscriptionData:
             "metadata": self.metadata,
         }
 
+    def to_compact_dict(self) -> Dict[str, Any]:
+        """Convert TranscriptionData to the compact format, where segments and words reference shared tables."""
+        tables = _CompactTableWriter()
+        segment_refs = tables.add_segments(self.segments)
+        word_refs = [tables.add_word(word) for word in self.words]
+        return {
+            **tables.to_dict(),
+            "segment_refs": segment_refs,
+            "word_refs": word_refs,
+            "text": self.text,
+            "source": self.source,
+            "metadata": self.metadata,
+        }
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TranscriptionData":
-        """Create TranscriptionData from dictionary."""
+        """Create TranscriptionData from dictionary (verbose or compact format)."""
+        if is_compact_dict(data):
+            tables = _CompactTableReader(data)
+            return cls(
+                segments=tables.segment_list(data["segment_refs"]),
+                words=[tables.word(ref) for ref in data["word_refs"]],
+                text=data["text"],
+                source=data["source"],
+                metadata=data.get("metadata"),
+            )
         return cls(
             segments=[LyricsSegment.from_dict(s) for s in data["segments"]],
             words=[Word.from_dict(w) for w in data["words"]],
@@ -567,6 +672,32 @@ class CorrectionStep:
             "deleted_word_ids": self.deleted_word_ids,
         }
 
+    def _to_compact_dict(self, tables: _CompactTableWriter) -> Dict[str, Any]:
+        """Like to_dict(), but segment snapshots are stored as references into the shared tables."""
+        return {
+            "handler_name": self.handler_name,
+            "affected_word_ids": self.affected_word_ids,
+            "affected_segment_ids": self.affected_segment_ids,
+            "corrections": [c.to_dict() for c in self.corrections],
+            "segments_before": tables.add_segments(self.segments_before),
+            "segments_after": tables.add_segments(self.segments_after),
+            "created_word_ids": self.created_word_ids,
+            "deleted_word_ids": self.deleted_word_ids,
+        }
+
+    @classmethod
+    def _from_compact_dict(cls, data: Dict[str, Any], tables: _CompactTableReader) -> "CorrectionStep":
+        return cls(
+            handler_name=data["handler_name"],
+            affected_word_ids=data["affected_word_ids"],
+            affected_segment_ids=data["affected_segment_ids"],
+            corrections=[WordCorrection.from_dict(c) for c in data["corrections"]],
+            segments_before=tables.segment_list(data["segments_before"]),
+            segments_after=tables.segment_list(data["segments_after"]),
+            created_word_ids=data["created_word_ids"],
+            deleted_word_ids=data["deleted_word_ids"],
+        )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CorrectionStep":
         """Create CorrectionStep from dictionary."""
@@ -628,9 +759,65 @@ class CorrectionResult:
             "segment_id_map": self.segment_id_map,
         }
 
+    def to_compact_dict(self) -> Dict[str, Any]:
+        """Convert the correction result to the compact format.
+
+        Every segment (original, corrected, resized, reference and correction-step snapshots) is stored
+        once in a shared table and referenced by index, which avoids the per-gap segment copies that
+        dominate the size of the verbose format. from_dict() accepts either format.
+        """
+        tables = _CompactTableWriter()
+        data = {
+            "original_segments": tables.add_segments(self.original_segments),
+            "reference_lyrics": {
+                source: {"segments": tables.add_segments(lyrics.segments), "metadata": lyrics.metadata.to_dict(), "source": lyrics.source}
+                for source, lyrics in self.reference_lyrics.items()
+            },
+            "anchor_sequences": [a.to_dict() for a in self.anchor_sequences],
+            "gap_sequences": [g.to_dict() for g in self.gap_sequences],
+            "resized_segments": tables.add_segments(self.resized_segments),
+            "corrections_made": self.corrections_made,
+            "confidence": self.confidence,
+            "corrections": [c.to_dict() for c in self.corrections],
+            "corrected_segments": tables.add_segments(self.corrected_segments),
+            "metadata": self.metadata,
+            "correction_steps": [step._to_compact_dict(tables) for step in self.correction_steps],
+            "word_id_map": self.word_id_map,
+            "segment_id_map": self.segment_id_map,
+        }
+        return {**tables.to_dict(), **data}
+
+    @classmethod
+    def _from_compact_dict(cls, data: Dict[str, Any]) -> "CorrectionResult":
+        tables = _CompactTableReader(data)
+        return cls(
+            original_segments=tables.segment_list(data["original_segments"]),
+            corrected_segments=tables.segment_list(data["corrected_segments"]),
+            corrections=[WordCorrection.from_dict(c) for c in data["corrections"]],
+            corrections_made=data["corrections_made"],
+            confidence=data["confidence"],
+            reference_lyrics={
+                source: LyricsData(
+                    segments=tables.segment_list(lyrics["segments"]),
+                    metadata=LyricsMetadata.from_dict(lyrics["metadata"]),
+                    source=lyrics["source"],
+                )
+                for source, lyrics in data["reference_lyrics"].items()
+            },
+            anchor_sequences=[AnchorSequence.from_dict(a) for a in data["anchor_sequences"]],
+            gap_sequences=[GapSequence.from_dict(g) for g in data["gap_sequences"]],
+            resized_segments=tables.segment_list(data["resized_segments"]),
+            metadata=data["metadata"],
+            correction_steps=[CorrectionStep._from_compact_dict(step, tables) for step in data["correction_steps"]],
+            word_id_map=data["word_id_map"],
+            segment_id_map=data["segment_id_map"],
+        )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CorrectionResult":
-        """Create CorrectionResult from dictionary."""
+        """Create CorrectionResult from dictionary (verbose or compact format)."""
+        if is_compact_dict(data):
+            return cls._from_compact_dict(data)
         return cls(
             original_segments=[LyricsSegment.from_dict(s) for s in data["original_segments"]],
             corrected_segments=[LyricsSegment.from_dict(s) for s in data["corrected_segments"]],
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import logging
+import mmap
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+
+class AudioFingerprint:
+    """Shared MD5 fingerprint of audio files, computed once per file version.
+
+    Every component that needs the hash of the input audio (transcriber caches, Whisper uploads,
+    the review server, stage cache keys) goes through here, so a large WAV/FLAC master is read
+    once per run instead of once per caller. Results are memoized by (path, size, mtime, inode)
+    in-process and, when a cache_dir is given, in a small sidecar JSON file so later runs on an
+    unchanged file skip hashing entirely. MD5 is kept so existing cache file names stay valid.
+    """
+
+    SIDECAR_FILENAME = "audio_fingerprints.json"
+    MAX_SIDECAR_ENTRIES = 1000
+    MMAP_THRESHOLD = 8 * 1024 * 1024
+    CHUNK_SIZE = 1024 * 1024
+    MAX_MEMO_ENTRIES = 256
+
+    _memo: "OrderedDict[Tuple, str]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def md5(cls, filepath: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None, logger: Optional[logging.Logger] = None) -> str:
+        """Return the hex MD5 of a file, reusing a memoized value if the file is unchanged."""
+        logger = logger or logging.getLogger(__name__)
+        stat_key = cls._stat_key(filepath)
+
+        with cls._lock:
+            cached = cls._memo.get(stat_key)
+            if cached:
+                cls._memo.move_to_end(stat_key)
+        if cached:
+            return cached
+
+        sidecar_key = "|".join(str(part) for part in stat_key)
+        if cache_dir:
+            cached = cls._load_sidecar(cache_dir, logger).get(sidecar_key)
+            if cached:
+                logger.debug(f"Using stored fingerprint for {filepath}")
+                cls._remember(stat_key, cached)
+                return cached
+
+        logger.debug(f"Calculating fingerprint for file: {filepath}")
+        digest = cls._hash_file(filepath, stat_key[1])
+        cls._remember(stat_key, digest)
+        if cache_dir:
+            cls._store_sidecar(cache_dir, sidecar_key, digest, logger)
+        logger.debug(f"File fingerprint: {digest}")
+        return digest
+
+    @classmethod
+    def clear_memo(cls) -> None:
+        """Forget all in-process fingerprints (the sidecar file is left untouched)."""
+        with cls._lock:
+            cls._memo.clear()
+
+    @classmethod
+    def _remember(cls, stat_key: Tuple, digest: str) -> None:
+        """Memoize a fingerprint, dropping the least recently used ones beyond MAX_MEMO_ENTRIES."""
+        with cls._lock:
+            cls._memo[stat_key] = digest
+            cls._memo.move_to_end(stat_key)
+            while len(cls._memo) > cls.MAX_MEMO_ENTRIES:
+                cls._memo.popitem(last=False)
+
+    @staticmethod
+    def _stat_key(filepath: Union[str, Path]) -> Tuple[str, int, int, int]:
+        stat = os.stat(filepath)
+        return (os.path.realpath(filepath), stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+    @classmethod
+    def _hash_file(cls, filepath: Union[str, Path], size: int) -> str:
+        md5_hash = hashlib.md5()
+        with open(filepath, "rb") as f:
+            if size and size >= cls.MMAP_THRESHOLD:
+                # Hash straight from the page cache without copying the file into Python buffers
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    md5_hash.update(mapped)
+            else:
+                for chunk in iter(lambda: f.read(cls.CHUNK_SIZE), b""):
+                    md5_hash.update(chunk)
+        return md5_hash.hexdigest()
+
+    @classmethod
+    def _sidecar_path(cls, cache_dir: Union[str, Path]) -> str:
+        return os.path.join(cache_dir, cls.SIDECAR_FILENAME)
+
+    @classmethod
+    def _load_sidecar(cls, cache_dir: Union[str, Path], logger: logging.Logger) -> Dict[str, str]:
+        try:
+            with open(cls._sidecar_path(cache_dir), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug(f"Ignoring unreadable fingerprint sidecar: {e}")
+            return {}
+
+    @classmethod
+    def _store_sidecar(cls, cache_dir: Union[str, Path], key: str, digest: str, logger: logging.Logger) -> None:
+        with cls._lock:
+            entries = cls._load_sidecar(cache_dir, logger)
+            entries.pop(key, None)
+            entries[key] = digest
+            # Dicts keep insertion order, so the oldest fingerprints are dropped first
+            while len(entries) > cls.MAX_SIDECAR_ENTRIES:
+                entries.pop(next(iter(entries)))
+            tmp_path = None
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, cls._sidecar_path(cache_dir))
+            except OSError as e:
+                logger.debug(f"Failed to write fingerprint sidecar: {e}")
+                if tmp_path and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
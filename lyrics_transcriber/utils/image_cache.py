@@ -0,0 +1,146 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from PIL import Image
+
+
+class ImageAssetCache:
+    """Content-addressed cache of preprocessed images, shared by the video and CDG renderers.
+
+    Backgrounds are resized (video) or quantized to a palette (CDG) once per distinct source image and
+    set of preprocessing parameters, instead of once per render. Entries are keyed by the SHA-256 of
+    the source file plus the operation and its parameters (target size, mode, palette), so concurrent
+    jobs using different images never share an entry, and jobs using the same image share one. Files
+    are written atomically under cache_dir/image_assets; decoded images are also memoized in-process.
+    """
+
+    SUBDIR = "image_assets"
+    MAX_MEMO_ENTRIES = 32
+
+    _memo: "OrderedDict[str, Image.Image]" = OrderedDict()
+    _hash_memo: Dict[Tuple, str] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def make_key(cls, source_path: Union[str, Path], operation: str, *params: Any) -> str:
+        """Key of a preprocessed image: the source content hash, the operation and its parameters."""
+        hasher = hashlib.sha256()
+        hasher.update(cls.source_hash(source_path).encode("utf-8"))
+        hasher.update(operation.encode("utf-8"))
+        for value in params:
+            hasher.update(b"\x00")
+            hasher.update(json.dumps(value, sort_keys=True, default=str, separators=(",", ":")).encode("utf-8"))
+        return f"{operation}_{hasher.hexdigest()[:32]}"
+
+    @classmethod
+    def source_hash(cls, source_path: Union[str, Path]) -> str:
+        """SHA-256 of a source file, memoized by (path, size, mtime)."""
+        stat = os.stat(source_path)
+        stat_key = (os.path.realpath(source_path), stat.st_size, stat.st_mtime_ns)
+        with cls._lock:
+            cached = cls._hash_memo.get(stat_key)
+        if cached:
+            return cached
+
+        hasher = hashlib.sha256()
+        with open(source_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        with cls._lock:
+            cls._hash_memo[stat_key] = digest
+        return digest
+
+    @classmethod
+    def get_path(
+        cls,
+        source_path: Union[str, Path],
+        operation: str,
+        params: Tuple,
+        create: Callable[[str, str], None],
+        cache_dir: Union[str, Path],
+        logger: Optional[logging.Logger] = None,
+    ) -> str:
+        """Return the path of a preprocessed image file, creating it with create(source_path, dest_path) on a miss."""
+        logger = logger or logging.getLogger(__name__)
+        path = cls._path_for(cache_dir, cls.make_key(source_path, operation, *params))
+        if os.path.isfile(path):
+            logger.debug(f"Reusing preprocessed image: {path}")
+            return path
+
+        cls._write_atomically(path, lambda tmp_path: create(str(source_path), tmp_path))
+        logger.debug(f"Stored preprocessed image: {path}")
+        return path
+
+    @classmethod
+    def get_image(
+        cls,
+        source_path: Union[str, Path],
+        operation: str,
+        params: Tuple,
+        create: Callable[[str], Image.Image],
+        cache_dir: Optional[Union[str, Path]] = None,
+        logger: Optional[logging.Logger] = None,
+    ) -> Image.Image:
+        """Return a preprocessed image, creating it with create(source_path) on a miss.
+
+        The result is a copy, so callers may draw on it without affecting the cached image. Without a
+        cache_dir, results are only memoized in-process.
+        """
+        logger = logger or logging.getLogger(__name__)
+        key = cls.make_key(source_path, operation, *params)
+        with cls._lock:
+            image = cls._memo.get(key)
+            if image is not None:
+                cls._memo.move_to_end(key)
+        if image is not None:
+            return image.copy()
+
+        path = cls._path_for(cache_dir, key) if cache_dir else None
+        if path and os.path.isfile(path):
+            logger.debug(f"Reusing preprocessed image: {path}")
+            with Image.open(path) as stored:
+                stored.load()
+                image = stored.copy()
+        else:
+            image = create(str(source_path))
+            if path:
+                try:
+                    cls._write_atomically(path, lambda tmp_path: image.save(tmp_path, format="PNG"))
+                except OSError as e:
+                    logger.warning(f"Failed to store preprocessed image {path}: {e}")
+
+        with cls._lock:
+            cls._memo[key] = image
+            while len(cls._memo) > cls.MAX_MEMO_ENTRIES:
+                cls._memo.popitem(last=False)
+        return image.copy()
+
+    @classmethod
+    def clear_memo(cls) -> None:
+        """Forget all in-process images and hashes (files in the cache dir are left untouched)."""
+        with cls._lock:
+            cls._memo.clear()
+            cls._hash_memo.clear()
+
+    @classmethod
+    def _path_for(cls, cache_dir: Union[str, Path], key: str) -> str:
+        return os.path.join(cache_dir, cls.SUBDIR, f"{key}.png")
+
+    @staticmethod
+    def _write_atomically(path: str, write: Callable[[str], None]) -> None:
+        """Write a file under a temporary name, then move it into place, so readers never see a partial file."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path[:-len('.png')]}.{os.getpid()}.{threading.get_ident()}.tmp.png"
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
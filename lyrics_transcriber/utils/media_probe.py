@@ -0,0 +1,176 @@
+import json
+import logging
+import os
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+
+@dataclass(frozen=True)
+class MediaInfo:
+    """Metadata of a media file, as reported by ffprobe. Fields ffprobe didn't report are None."""
+
+    duration: Optional[float] = None  # Seconds
+    audio_codec: Optional[str] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    video_codec: Optional[str] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MediaInfo":
+        return cls(**{name: data.get(name) for name in cls.__dataclass_fields__})
+
+
+class MediaProbe:
+    """Shared media metadata service: each file is probed with ffprobe once per file version.
+
+    The subtitle, video, CDG and review components all ask here for durations, codecs, sample rates and
+    image dimensions, so a song costs one ffprobe per input file instead of one per question asked.
+    Results are memoized by (path, size, mtime) in-process and, when a cache_dir is given, in a small
+    sidecar JSON file so later runs on an unchanged file don't probe it at all. Failed probes are only
+    remembered in-process.
+    """
+
+    SIDECAR_FILENAME = "media_probe.json"
+    MAX_SIDECAR_ENTRIES = 1000
+    MAX_MEMO_ENTRIES = 256
+
+    _memo: "OrderedDict[Tuple, Optional[MediaInfo]]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def probe(
+        cls, filepath: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None, logger: Optional[logging.Logger] = None
+    ) -> Optional[MediaInfo]:
+        """Return the metadata of a media file, or None if ffprobe can't read it."""
+        logger = logger or logging.getLogger(__name__)
+        try:
+            stat_key = cls._stat_key(filepath)
+        except OSError:
+            # Nothing to key a cache entry on; let ffprobe report the problem
+            return cls._run_ffprobe(filepath, logger)
+
+        with cls._lock:
+            if stat_key in cls._memo:
+                cls._memo.move_to_end(stat_key)
+                return cls._memo[stat_key]
+
+        sidecar_key = "|".join(str(part) for part in stat_key)
+        if cache_dir:
+            stored = cls._load_sidecar(cache_dir, logger).get(sidecar_key)
+            if stored:
+                logger.debug(f"Using stored media info for {filepath}")
+                info = MediaInfo.from_dict(stored)
+                cls._remember(stat_key, info)
+                return info
+
+        info = cls._run_ffprobe(filepath, logger)
+        cls._remember(stat_key, info)
+        if cache_dir and info is not None:
+            cls._store_sidecar(cache_dir, sidecar_key, info, logger)
+        return info
+
+    @classmethod
+    def clear_memo(cls) -> None:
+        """Forget all in-process results (the sidecar file is left untouched)."""
+        with cls._lock:
+            cls._memo.clear()
+
+    @classmethod
+    def _remember(cls, stat_key: Tuple, info: Optional[MediaInfo]) -> None:
+        """Memoize a probe result, dropping the least recently used ones beyond MAX_MEMO_ENTRIES."""
+        with cls._lock:
+            cls._memo[stat_key] = info
+            cls._memo.move_to_end(stat_key)
+            while len(cls._memo) > cls.MAX_MEMO_ENTRIES:
+                cls._memo.popitem(last=False)
+
+    @staticmethod
+    def _stat_key(filepath: Union[str, Path]) -> Tuple[str, int, int]:
+        stat = os.stat(filepath)
+        return (os.path.realpath(filepath), stat.st_size, stat.st_mtime_ns)
+
+    @staticmethod
+    def _run_ffprobe(filepath: Union[str, Path], logger: logging.Logger) -> Optional[MediaInfo]:
+        probe_cmd = [
+            "ffprobe",
+            "-v", "error",
+            "-show_entries", "format=duration:stream=codec_type,codec_name,sample_rate,channels,width,height",
+            "-of", "json",
+            str(filepath),
+        ]
+        try:
+            probe_data = json.loads(subprocess.check_output(probe_cmd, universal_newlines=True))
+        except (subprocess.CalledProcessError, OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Failed to probe media file {filepath}: {e}")
+            return None
+        if not isinstance(probe_data, dict):
+            logger.warning(f"Unexpected ffprobe output for {filepath}")
+            return None
+
+        def number(value: Any, kind: type) -> Optional[Any]:
+            try:
+                return kind(float(value))
+            except (TypeError, ValueError):
+                return None  # ffprobe reports "N/A" for unknown values, e.g. the duration of an image
+
+        streams = probe_data.get("streams") or []
+        audio = next((s for s in streams if s.get("codec_type") == "audio"), {})
+        video = next((s for s in streams if s.get("codec_type") == "video"), {})
+        info = MediaInfo(
+            duration=number((probe_data.get("format") or {}).get("duration"), float),
+            audio_codec=audio.get("codec_name"),
+            sample_rate=number(audio.get("sample_rate"), int),
+            channels=number(audio.get("channels"), int),
+            video_codec=video.get("codec_name"),
+            width=number(video.get("width"), int),
+            height=number(video.get("height"), int),
+        )
+        logger.debug(f"Probed {filepath}: {info}")
+        return info
+
+    @classmethod
+    def _sidecar_path(cls, cache_dir: Union[str, Path]) -> str:
+        return os.path.join(cache_dir, cls.SIDECAR_FILENAME)
+
+    @classmethod
+    def _load_sidecar(cls, cache_dir: Union[str, Path], logger: logging.Logger) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(cls._sidecar_path(cache_dir), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug(f"Ignoring unreadable media info sidecar: {e}")
+            return {}
+
+    @classmethod
+    def _store_sidecar(cls, cache_dir: Union[str, Path], key: str, info: MediaInfo, logger: logging.Logger) -> None:
+        with cls._lock:
+            entries = cls._load_sidecar(cache_dir, logger)
+            entries.pop(key, None)
+            entries[key] = info.to_dict()
+            # Dicts keep insertion order, so the oldest entries are dropped first
+            while len(entries) > cls.MAX_SIDECAR_ENTRIES:
+                entries.pop(next(iter(entries)))
+            tmp_path = None
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, cls._sidecar_path(cache_dir))
+            except OSError as e:
+                logger.debug(f"Failed to write media info sidecar: {e}")
+                if tmp_path and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
@@ -0,0 +1,48 @@
+import json
+import os
+from typing import Any, Union
+
+ORJSON_AVAILABLE = True
+try:
+    import orjson
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes (no indentation or extra whitespace).
+
+    Uses orjson when it is installed, which is considerably faster for the multi-MB
+    correction payloads; falls back to the standard library otherwise.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson is stricter than json (e.g. about very large ints); let json decide
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON produced by either dumps() or the standard json module.
+
+    Raises json.JSONDecodeError on invalid input (orjson's error type subclasses it).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def dump_file(data: Any, path: Union[str, os.PathLike]) -> None:
+    """Write data to path as compact JSON."""
+    with open(path, "wb") as f:
+        f.write(dumps(data))
+
+
+def load_file(path: Union[str, os.PathLike]) -> Any:
+    """Read JSON from path, accepting both compact and pretty-printed files."""
+    with open(path, "rb") as f:
+        return loads(f.read())
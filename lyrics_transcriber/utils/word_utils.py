@@ -1,27 +1,91 @@
+import hashlib
+import itertools
+import os
 import random
 import string
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+_ID_ALPHABET = string.ascii_lowercase + string.digits
+
+
+def _to_base36(number: int, min_length: int = 0) -> str:
+    digits = []
+    while number:
+        number, remainder = divmod(number, 36)
+        digits.append(_ID_ALPHABET[remainder])
+    return "".join(reversed(digits)).rjust(min_length, _ID_ALPHABET[0])
+
+
+class _IdScope:
+    """Sequential id allocator for one document; ids are a seed-derived prefix plus a counter."""
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self.counter = itertools.count()
+        # A forked worker inherits the scope but not the parent's future counter values,
+        # so allocating from it there would repeat ids; such processes use their own fallback scope.
+        self.pid = os.getpid()
+
+    def next_id(self) -> str:
+        return self.prefix + _to_base36(next(self.counter), WordUtils._counter_length)
 
 
 class WordUtils:
     """Utility class for word-related operations."""
 
-    _used_ids = set()  # Keep track of used IDs
-    _id_length = 6  # Length of generated IDs
+    _id_length = 10  # Length of generated IDs (prefix + counter), until a scope allocates more than 36^2 ids
+    _prefix_length = 8
+    _counter_length = _id_length - _prefix_length
+    _key_id_length = 8  # Length of ids derived from a key; shorter than any sequential id, so the two never collide
+
+    _scope: ContextVar[Optional[_IdScope]] = ContextVar("word_id_scope", default=None)
+    _fallback_scope: Optional[_IdScope] = None
 
     @classmethod
-    def generate_id(cls) -> str:
+    def generate_id(cls, key: Optional[str] = None) -> str:
         """Generate a unique ID for words/segments.
 
-        Uses a combination of letters and numbers to create an 8-character ID.
-        With 36 possible characters (26 letters + 10 digits), this gives us
-        36^8 = ~2.8 trillion possible combinations, which is more than enough
-        for our use case while being much shorter than UUID.
+        Inside an id_scope() the ids are allocated sequentially from a prefix derived from the
+        scope's seed, so the same document processed twice gets the same ids (keeping caches
+        keyed on word ids, such as the anchor cache, stable across runs) and no global registry
+        of issued ids is needed. Outside a scope, ids come from a per-process scope with a random
+        prefix, which keeps them unique for the lifetime of the process.
+
+        If key is given the id is derived from the key and the current scope's seed alone,
+        independent of allocation order. Use this where ids are created in worker processes.
+        """
+        if key is not None:
+            # Forked workers may still use the inherited scope's seed here, since no counter is involved
+            scope = cls._scope.get()
+            digest = hashlib.sha1(f"{scope.prefix if scope else ''}:{key}".encode("utf-8")).digest()
+            return _to_base36(int.from_bytes(digest[:8], "big"), cls._key_id_length)[-cls._key_id_length :]
+        return cls._current_scope().next_id()
+
+    @classmethod
+    @contextmanager
+    def id_scope(cls, seed: str) -> Iterator[None]:
+        """Allocate ids deterministically from seed for the duration of the block.
+
+        The seed should identify the document being built, e.g. the source name plus a hash of
+        its input, so that distinct documents get distinct id prefixes.
         """
-        while True:
-            # Generate random string of letters and numbers
-            new_id = "".join(random.choices(string.ascii_lowercase + string.digits, k=cls._id_length))
-
-            # Make sure it's unique for this session
-            if new_id not in cls._used_ids:
-                cls._used_ids.add(new_id)
-                return new_id
+        prefix = _to_base36(int(hashlib.sha1(seed.encode("utf-8")).hexdigest(), 16), cls._prefix_length)[-cls._prefix_length :]
+        token = cls._scope.set(_IdScope(prefix))
+        try:
+            yield
+        finally:
+            cls._scope.reset(token)
+
+    @classmethod
+    def _current_scope(cls) -> _IdScope:
+        scope = cls._scope.get()
+        pid = os.getpid()
+        if scope is not None and scope.pid == pid:
+            return scope
+        if cls._fallback_scope is None or cls._fallback_scope.pid != pid:
+            prefix = "".join(random.SystemRandom().choices(_ID_ALPHABET, k=cls._prefix_length))
+            cls._fallback_scope = _IdScope(prefix)
+        return cls._fallback_scope
@@ -26,6 +26,7 @@ class MockOutputPaths:
     lrc: Optional[str] = None
     ass: Optional[str] = None
     video: Optional[str] = None
+    video_audio: Optional[dict] = None
     original_txt: Optional[str] = None
     corrected_txt: Optional[str] = None
     corrections_json: Optional[str] = None
@@ -0,0 +1,170 @@
+import os
+import pytest
+
+from lyrics_transcriber.core.config import OutputConfig
+from lyrics_transcriber.core.stage_cache import StageCache, LocalDirectoryStorage, ObjectStoreStorage
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return StageCache(storage=LocalDirectoryStorage(tmp_path / "stage_cache"), max_size_bytes=10_000)
+
+
+def test_make_key_is_deterministic_and_input_sensitive():
+    key1 = StageCache.make_key("anchors", {"b": 1, "a": [1, 2]}, "text")
+    key2 = StageCache.make_key("anchors", {"a": [1, 2], "b": 1}, "text")
+    key3 = StageCache.make_key("anchors", {"a": [1, 2], "b": 2}, "text")
+
+    assert key1 == key2
+    assert key1 != key3
+    assert key1.startswith("anchors/")
+    assert StageCache.make_key("gaps", {"a": [1, 2], "b": 1}, "text") != key1
+
+
+def test_get_put_records_hits_and_misses(cache):
+    key = StageCache.make_key("transcribe", "whisper", "hash")
+
+    assert cache.get(key) is None
+    assert cache.put(key, {"segments": [1, 2, 3]})
+    assert cache.get(key) == {"segments": [1, 2, 3]}
+
+    stats = cache.get_stats()["stages"]["transcribe"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["writes"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_get_or_compute_only_computes_on_miss(cache):
+    key = StageCache.make_key("resize", [1, 2, 3])
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return [4, 5]
+
+    assert cache.get_or_compute(key, compute, encode=lambda v: {"v": v}, decode=lambda d: d["v"]) == [4, 5]
+    assert cache.get_or_compute(key, compute, encode=lambda v: {"v": v}, decode=lambda d: d["v"]) == [4, 5]
+    assert len(calls) == 1
+
+
+def test_unserializable_value_is_not_cached(cache):
+    key = StageCache.make_key("fetch", "genius")
+
+    assert cache.put(key, object()) is False
+    assert cache.get(key) is None
+    assert cache.get_stats()["stages"]["fetch"]["errors"] == 1
+
+
+def test_corrupted_entry_is_treated_as_miss(cache):
+    key = StageCache.make_key("gaps", "x")
+    cache.storage.write_bytes(key, b"{not json")
+
+    assert cache.get(key) is None
+    assert not cache.storage.exists(key)
+
+
+def test_file_artifacts_roundtrip(cache, tmp_path):
+    src = tmp_path / "input.ass"
+    src.write_text("[Script Info]")
+    key = StageCache.make_key("ass", "segments")
+
+    dest = tmp_path / "out" / "restored.ass"
+    assert cache.get_file(key, str(dest)) is False
+    assert cache.put_file(key, str(src))
+    assert cache.get_file(key, str(dest)) is True
+    assert dest.read_text() == "[Script Info]"
+
+
+def test_linked_file_artifacts_share_data_until_detached(cache, tmp_path):
+    src = tmp_path / "video.mkv"
+    src.write_bytes(b"first render")
+    key = StageCache.make_key("video", "inputs")
+
+    assert cache.put_file(key, str(src), link=True)
+    assert os.path.samefile(src, cache.storage.path_for(key))
+
+    dest = tmp_path / "out" / "video.mkv"
+    dest.parent.mkdir()
+    dest.write_bytes(b"stale")
+    assert cache.get_file(key, str(dest), link=True) is True
+    assert dest.read_bytes() == b"first render"
+
+    # A re-render writes into a detached file, leaving the entry intact
+    StageCache.detach_file(str(src))
+    src.write_bytes(b"second render")
+    assert cache.storage.path_for(key).read_bytes() == b"first render"
+
+
+def test_lru_eviction_keeps_cache_within_size_limit(tmp_path):
+    cache = StageCache(storage=LocalDirectoryStorage(tmp_path), max_size_bytes=250)
+    keys = [StageCache.make_key("video", i) for i in range(3)]
+
+    cache.put(keys[0], "a" * 100)
+    cache.put(keys[1], "b" * 100)
+    # Touch the first entry so the second becomes least recently used
+    assert cache.get(keys[0]) is not None
+    cache.put(keys[2], "c" * 100)
+
+    assert cache.storage.exists(keys[0])
+    assert not cache.storage.exists(keys[1])
+    assert cache.storage.exists(keys[2])
+    assert cache.get_stats()["total_bytes"] <= 250
+    assert cache.get_stats()["stages"]["video"]["evictions"] == 1
+
+
+def test_index_persists_across_instances(tmp_path):
+    key = StageCache.make_key("cdg", "x")
+    StageCache(storage=LocalDirectoryStorage(tmp_path)).put(key, [1])
+
+    reopened = StageCache(storage=LocalDirectoryStorage(tmp_path))
+    assert reopened.get_stats()["entry_count"] == 1
+    assert reopened.get(key) == [1]
+
+
+def test_hits_batch_index_saves_until_flush(tmp_path):
+    cache = StageCache(storage=LocalDirectoryStorage(tmp_path))
+    key = StageCache.make_key("ass", "x")
+    cache.put(key, [1])
+    index_path = cache.storage.index_path()
+    saved = index_path.read_text()
+
+    assert cache.get(key) == [1]
+    assert cache.get(key) == [1]
+    assert index_path.read_text() == saved
+
+    cache.flush()
+    assert index_path.read_text() != saved
+
+
+def test_disabled_cache_never_hits(tmp_path):
+    cache = StageCache(storage=LocalDirectoryStorage(tmp_path), enabled=False)
+    key = StageCache.make_key("anchors", "x")
+
+    assert cache.put(key, [1]) is False
+    assert cache.get(key) is None
+
+
+def test_object_store_layout(tmp_path):
+    storage = ObjectStoreStorage(tmp_path, bucket="bucket")
+    cache = StageCache(storage=storage)
+    key = StageCache.make_key("corrections", "x")
+    digest = key.split("/", 1)[1]
+
+    cache.put(key, {"ok": True})
+
+    assert (tmp_path / "bucket" / "corrections" / digest[:2] / digest).is_file()
+    assert cache.get(key) == {"ok": True}
+
+
+def test_from_config(tmp_path):
+    config = OutputConfig(output_styles_json="", cache_dir=str(tmp_path), stage_cache_backend="object", stage_cache_max_size_mb=1)
+    cache = StageCache.from_config(config)
+
+    assert isinstance(cache.storage, ObjectStoreStorage)
+    assert cache.max_size_bytes == 1024 * 1024
+    assert os.path.isdir(tmp_path / "stage_cache")
+
+    config.stage_cache_backend = "s3"
+    with pytest.raises(ValueError):
+        StageCache.from_config(config)
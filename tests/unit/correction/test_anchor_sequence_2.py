@@ -667,3 +667,77 @@ def test_get_sequence_priority_real_case_1(finder):
     print(f"Long sequence position: {clean_context.find(' '.join(long_anchor.words))}")
 
     # The longer sequence should be preferred (this is more of a documentation test)
+
+
+class TestIncrementalSources:
+    """Adding a reference source reuses the match index instead of re-running the n-gram search."""
+
+    SCORE = PhraseScore(phrase_type=PhraseType.COMPLETE, natural_break_score=0.8, length_score=0.5)
+
+    @pytest.fixture
+    def make_finder(self, mocker):
+        analyzer = mocker.patch("lyrics_transcriber.correction.anchor_sequence.PhraseAnalyzer").return_value
+        analyzer.score_phrase.return_value = self.SCORE
+        # Mocks can't be pickled into worker processes, so use the sequential fallback
+        mocker.patch("lyrics_transcriber.correction.anchor_sequence.Pool", side_effect=OSError("no pool"))
+
+        def make(cache_dir):
+            finder = AnchorSequenceFinder(min_sequence_length=3, min_sources=1, cache_dir=cache_dir)
+            mocker.patch.object(finder, "_score_anchors", side_effect=lambda anchors, *_: [ScoredAnchor(a, self.SCORE) for a in anchors])
+            return finder
+
+        return make
+
+    @pytest.fixture
+    def inputs(self):
+        transcribed = "hello world this is a test the song goes on and the song goes on"
+        references = convert_references_to_lyrics_data(
+            {
+                "genius": "hello world this is a test the song goes on",
+                "pasted": "this is a test the song goes on and the song goes on and on",
+            }
+        )
+        return transcribed, create_test_transcription_result_from_text(transcribed), references
+
+    @staticmethod
+    def _summary(anchors):
+        return [
+            (a.anchor.id, a.anchor.transcription_position, a.anchor.transcribed_word_ids, a.anchor.reference_positions, a.anchor.confidence)
+            for a in anchors
+        ]
+
+    def test_added_source_matches_full_search(self, make_finder, inputs, tmp_path, mocker):
+        transcribed, transcription_result, references = inputs
+        finder = make_finder(tmp_path / "incremental")
+        finder.find_anchors(transcribed, {"genius": references["genius"]}, transcription_result)
+
+        search = mocker.spy(finder, "_process_ngram_length")
+        incremental = finder.find_anchors(transcribed, references, transcription_result)
+        full = make_finder(tmp_path / "full").find_anchors(transcribed, references, transcription_result)
+
+        assert search.call_count == 0
+        assert incremental
+        assert self._summary(incremental) == self._summary(full)
+
+    def test_index_is_reused_from_disk(self, make_finder, inputs, tmp_path, mocker):
+        transcribed, transcription_result, references = inputs
+        make_finder(tmp_path).find_anchors(transcribed, {"genius": references["genius"]}, transcription_result)
+
+        finder = make_finder(tmp_path)
+        search = mocker.spy(finder, "_process_ngram_length")
+        finder.find_anchors(transcribed, references, transcription_result)
+
+        assert search.call_count == 0
+        assert finder._score_anchors.call_count == 0
+
+    def test_match_source_agrees_with_ngram_search(self, make_finder, tmp_path):
+        finder = make_finder(tmp_path)
+        trans_words = "the song goes on and the song goes on and on".split()
+        source_words = "and the song goes on the song goes on".split()
+        all_words = create_test_transcription_result_from_text(" ".join(trans_words)).result.segments[0].words
+        ref_words = {"source": convert_references_to_lyrics_data({"source": " ".join(source_words)})["source"].segments[0].words}
+
+        indexed = finder._match_source(trans_words, source_words, [3, 4, 5, 6])
+        for n in (3, 4, 5, 6):
+            anchors = finder._process_ngram_length(n, trans_words, all_words, {"source": source_words}, ref_words, 1)
+            assert indexed[n] == {a.transcription_position: a.reference_positions["source"] for a in anchors}
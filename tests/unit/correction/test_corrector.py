@@ -8,6 +8,8 @@ from lyrics_transcriber.types import (
     TranscriptionResult,
     TranscriptionData,
     CorrectionResult,
+    GapSequence,
+    WordCorrection,
 )
 from lyrics_transcriber.correction.corrector import LyricsCorrector
 import os
@@ -195,3 +197,180 @@ class TestLyricsCorrector:
         assert "total_words" in result.metadata
         assert "available_handlers" in result.metadata
         assert "enabled_handlers" in result.metadata
+
+
+class TestCorrectorIndexes:
+    """The segment/word index helpers don't depend on handler setup, so use a bare instance."""
+
+    @pytest.fixture
+    def corrector(self):
+        return LyricsCorrector.__new__(LyricsCorrector)
+
+    @pytest.fixture
+    def segments(self):
+        return [create_test_segment(text=text) for text in ["one two", "three four", "five six", "seven eight"]]
+
+    def _gap(self, words):
+        return GapSequence(
+            id="gap",
+            transcribed_word_ids=[w.id for w in words],
+            transcription_position=0,
+            preceding_anchor_id=None,
+            following_anchor_id=None,
+            reference_word_ids={},
+        )
+
+    def test_build_word_locations(self, corrector, segments):
+        locations = corrector._build_word_locations(segments)
+
+        assert locations[segments[0].words[0].id] == (0, 0)
+        assert locations[segments[2].words[1].id] == (2, 1)
+        assert len(locations) == 8
+
+    @pytest.mark.parametrize(
+        "word_positions",
+        [[(1, 1), (2, 0)], [(0, 0)], [(3, 1)], [(1, 0), (1, 1), (2, 0), (2, 1)], [(0, 1), (2, 0)]],
+    )
+    def test_indexed_affected_segments_match_scan(self, corrector, segments, word_positions):
+        gap = self._gap([segments[s].words[w] for s, w in word_positions])
+        locations = corrector._build_word_locations(segments)
+
+        assert corrector._get_affected_segments(gap, segments, locations) == corrector._get_affected_segments(gap, segments)
+
+    def test_affected_words_with_shared_word_map(self, corrector, segments):
+        gap = self._gap([segments[1].words[1], segments[2].words[0]])
+        word_map = {w.id: w for s in segments for w in s.words}
+
+        assert corrector._get_affected_words(gap, segments, word_map) == [segments[1].words[1], segments[2].words[0]]
+
+    def test_get_new_words(self, corrector, segments):
+        new_word = create_test_word(text="new")
+        updated = [LyricsSegment(id="s", text="one new", words=[segments[0].words[0], new_word], start_time=0, end_time=1)]
+
+        assert corrector._get_new_words(updated, [w.id for w in segments[0].words]) == [new_word]
+
+
+class _RecordingHandler:
+    """Handler stub that corrects the words listed in fixes and counts how often it runs."""
+
+    def __init__(self, fixes=None):
+        self.fixes = fixes or {}
+        self.calls = 0
+
+    def can_handle(self, gap, data=None):
+        return True, {}
+
+    def handle(self, gap, data):
+        self.calls += 1
+        corrections = []
+        for position, word_id in enumerate(gap.transcribed_word_ids, gap.transcription_position):
+            word = data["word_map"][word_id]
+            if word.text in self.fixes:
+                corrections.append(
+                    WordCorrection(
+                        original_word=word.text,
+                        corrected_word=self.fixes[word.text],
+                        original_position=position,
+                        source="test",
+                        reason=self.__class__.__name__,
+                        confidence=1.0,
+                        word_id=word_id,
+                        corrected_word_id=f"{word_id}-fixed",
+                    )
+                )
+        return corrections
+
+
+class FirstHandler(_RecordingHandler):
+    pass
+
+
+class SecondHandler(_RecordingHandler):
+    pass
+
+
+class ThirdHandler(_RecordingHandler):
+    pass
+
+
+class TestRerunCorrections:
+    """Toggling handlers should only run the handlers whose outcome on a gap isn't already known."""
+
+    @pytest.fixture
+    def segments(self):
+        words = [create_test_word(text=t, start_time=i, end_time=i + 0.5) for i, t in enumerate(["hello", "wrold", "foo", "bar"])]
+        return [create_test_segment(text="hello wrold foo bar", words=words, start_time=0, end_time=3.5)]
+
+    @pytest.fixture
+    def gaps(self, segments):
+        words = segments[0].words
+        return [
+            GapSequence(
+                id=f"gap{position}",
+                transcribed_word_ids=[words[position].id],
+                transcription_position=position,
+                preceding_anchor_id=None,
+                following_anchor_id=None,
+                reference_word_ids={},
+            )
+            for position in (1, 3)
+        ]
+
+    def _corrector(self, registry, enabled):
+        for handler_id, handler in registry:
+            handler.name = handler_id  # Reported as the enabled handler ID, like the LLM handlers
+        corrector = LyricsCorrector.__new__(LyricsCorrector)
+        corrector.logger = Mock()
+        corrector._handler_registry = registry
+        corrector.all_handlers = [{"id": handler_id, "enabled": handler_id in enabled} for handler_id, _ in registry]
+        corrector.handlers = [handler for handler_id, handler in registry if handler_id in enabled]
+        corrector.reference_lyrics = {}
+        corrector._anchor_sequences = []
+        return corrector
+
+    def _initial_result(self, corrector, segments, gaps):
+        return corrector._build_correction_result(segments, {}, [], gaps, corrector._process_corrections(segments, gaps))
+
+    def test_known_outcomes_are_not_recomputed(self, segments, gaps):
+        first, second, third = FirstHandler(), SecondHandler({"wrold": "world"}), ThirdHandler({"bar": "baz"})
+        registry = [("First", first), ("Second", second), ("Third", third)]
+        corrector = self._corrector(registry, ["First", "Second"])
+        result = self._initial_result(corrector, segments, gaps)
+        assert [c.corrected_word for c in result.corrections] == ["world"]
+        first.calls = second.calls = 0
+
+        corrector.set_enabled_handlers(["First", "Second", "Third"])
+        rerun = corrector.rerun_corrections(result)
+
+        # gap1 reuses Second's corrections, gap3 only runs the newly enabled Third
+        assert (first.calls, second.calls, third.calls) == (0, 0, 1)
+        assert [c.corrected_word for c in rerun.corrections] == ["world", "baz"]
+        assert [w.text for w in rerun.corrected_segments[0].words] == ["hello", "world", "foo", "baz"]
+        assert rerun.metadata["enabled_handlers"] == ["First", "Second", "Third"]
+
+    def test_disabling_winner_runs_later_handlers(self, segments, gaps):
+        first, second, third = FirstHandler(), SecondHandler({"wrold": "world"}), ThirdHandler({"wrold": "word"})
+        registry = [("First", first), ("Second", second), ("Third", third)]
+        corrector = self._corrector(registry, ["First", "Second", "Third"])
+        result = self._initial_result(corrector, segments, gaps)
+        first.calls = second.calls = third.calls = 0
+
+        corrector.set_enabled_handlers(["First", "Third"])
+        rerun = corrector.rerun_corrections(result)
+
+        assert (first.calls, second.calls, third.calls) == (0, 0, 1)
+        assert [c.corrected_word for c in rerun.corrections] == ["word"]
+
+    def test_rerun_matches_full_run(self, segments, gaps):
+        def build(enabled):
+            registry = [("First", FirstHandler({"bar": "bah"})), ("Second", SecondHandler({"wrold": "world"})), ("Third", ThirdHandler({"bar": "baz"}))]
+            return self._corrector(registry, enabled)
+
+        corrector = build(["Second", "Third"])
+        result = self._initial_result(corrector, segments, gaps)
+        corrector.set_enabled_handlers(["First", "Second"])
+        rerun = corrector.rerun_corrections(result)
+
+        full = self._initial_result(build(["First", "Second"]), segments, gaps)
+        assert [(c.word_id, c.corrected_word) for c in rerun.corrections] == [(c.word_id, c.corrected_word) for c in full.corrections]
+        assert [w.text for w in rerun.corrected_segments[0].words] == [w.text for w in full.corrected_segments[0].words]
@@ -1,5 +1,7 @@
 import pytest
 import os
+import time
+from unittest.mock import patch
 
 
 from lyrics_transcriber.types import (
@@ -10,6 +12,7 @@ from lyrics_transcriber.types import (
 )
 
 from lyrics_transcriber.lyrics.base_lyrics_provider import BaseLyricsProvider, LyricsProviderConfig
+from lyrics_transcriber.lyrics.lookup_index import LyricsLookupIndex
 from tests.test_helpers import create_test_word, create_test_segment
 
 
@@ -174,3 +177,116 @@ def test_abstract_methods():
 
     with pytest.raises(TypeError, match="Can't instantiate abstract class"):
         AbstractProvider(config=LyricsProviderConfig())
+
+
+class CountingMockProvider(MockLyricsProvider):
+    """Mock provider that counts lookups and can be told to find nothing or fail"""
+
+    def __init__(self, config, result=None, inconclusive=False):
+        super().__init__(config=config)
+        self.result = result
+        self.inconclusive = inconclusive
+        self.calls = 0
+
+    def _fetch_data_from_source(self, artist, title):
+        self.calls += 1
+        if self.inconclusive:
+            self._report_fetch_error("API Error", Exception("API Error"))
+        return self.result
+
+
+def test_normalized_cache_key_matches_trivial_variations(test_provider):
+    key = test_provider._get_artist_title_hash("The Beatles", "Let It Be")
+    assert test_provider._get_artist_title_hash("beatles", "let it be!") == key
+    assert test_provider._get_artist_title_hash("The Beatles feat. Billy Preston", "Let It Be (feat. Billy Preston)") == key
+    assert test_provider._get_artist_title_hash("Beyoncé & Jay-Z", "Crazy in Love") == test_provider._get_artist_title_hash(
+        "Beyonce and JayZ", "Crazy In Love"
+    )
+    assert test_provider._get_artist_title_hash("The Beatles", "Let It Go") != key
+
+
+def test_legacy_cache_entries_are_still_used(tmp_path):
+    provider = CountingMockProvider(LyricsProviderConfig(cache_dir=str(tmp_path)))
+    legacy_key = provider._get_legacy_artist_title_hash("The Artist", "Song!")
+    provider._save_to_cache(provider._get_cache_path(legacy_key, "raw"), {"test": "data"})
+
+    assert provider.fetch_lyrics("The Artist", "Song!") is not None
+    assert provider.calls == 0
+
+
+def test_misses_are_cached_until_ttl_expires(tmp_path):
+    provider = CountingMockProvider(LyricsProviderConfig(cache_dir=str(tmp_path), negative_cache_ttl=60))
+
+    assert provider.fetch_lyrics("Artist", "Instrumental") is None
+    assert provider.fetch_lyrics("artist", "instrumental") is None
+    assert provider.calls == 1
+
+    with patch("time.time", return_value=time.time() + 61):
+        assert provider.fetch_lyrics("Artist", "Instrumental") is None
+    assert provider.calls == 2
+
+
+def test_errors_are_not_negatively_cached(tmp_path):
+    provider = CountingMockProvider(LyricsProviderConfig(cache_dir=str(tmp_path)), inconclusive=True)
+
+    provider.fetch_lyrics("Artist", "Song")
+    provider.fetch_lyrics("Artist", "Song")
+
+    assert provider.calls == 2
+
+
+def test_negative_caching_can_be_disabled(tmp_path):
+    provider = CountingMockProvider(LyricsProviderConfig(cache_dir=str(tmp_path), negative_cache_ttl=None))
+
+    provider.fetch_lyrics("Artist", "Song")
+    provider.fetch_lyrics("Artist", "Song")
+
+    assert provider.calls == 2
+
+
+class OtherCountingMockProvider(CountingMockProvider):
+    pass
+
+
+class ThirdCountingMockProvider(CountingMockProvider):
+    pass
+
+
+def test_lookup_index_skips_songs_other_providers_agree_are_unavailable(tmp_path):
+    config = LyricsProviderConfig(cache_dir=str(tmp_path), use_lookup_index=True, negative_cache_ttl=60)
+    first, second, third = CountingMockProvider(config), OtherCountingMockProvider(config), ThirdCountingMockProvider(config)
+    for provider in (first, second, third):
+        provider.fetch_lyrics("Artist", "Instrumental")
+
+    # Once their own misses expire, the first two providers check again and the third relies on their consensus
+    with patch("time.time", return_value=time.time() + 61):
+        first.fetch_lyrics("Artist", "Instrumental")
+        # One other provider's miss is not enough to skip a lookup
+        second.fetch_lyrics("Artist", "Instrumental")
+        third.fetch_lyrics("Artist (feat. Someone)", "Instrumental")
+
+    assert (first.calls, second.calls, third.calls) == (2, 2, 1)
+    key = first._get_artist_title_hash("Artist", "Instrumental")
+    assert LyricsLookupIndex(tmp_path).get(key, "OtherCountingMock")["found"] is False
+
+
+def test_lookup_index_never_skips_providers_that_have_not_looked(tmp_path):
+    config = LyricsProviderConfig(cache_dir=str(tmp_path), use_lookup_index=True)
+    CountingMockProvider(config).fetch_lyrics("Artist", "Song")
+    OtherCountingMockProvider(config).fetch_lyrics("Artist", "Song")
+    third = ThirdCountingMockProvider(config, result={"test": "data"})
+
+    assert third.fetch_lyrics("Artist", "Song") is not None
+    assert third.calls == 1
+
+
+def test_lookup_index_never_skips_songs_some_provider_found(tmp_path):
+    config = LyricsProviderConfig(cache_dir=str(tmp_path), use_lookup_index=True)
+    assert MockLyricsProvider(config=config).fetch_lyrics("Artist", "Song") is not None
+    CountingMockProvider(config).fetch_lyrics("Artist", "Song")
+    OtherCountingMockProvider(config).fetch_lyrics("Artist", "Song")
+    third = ThirdCountingMockProvider(config)
+
+    third.fetch_lyrics("Artist", "Song")
+
+    assert third.calls == 1
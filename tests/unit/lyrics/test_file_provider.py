@@ -84,6 +84,17 @@ Another line
                 assert file_provider.artist == artist
                 assert file_provider.title == title
 
+    def test_cache_keys_follow_the_file_contents(self, file_provider, temp_lyrics_file):
+        """Editing the lyrics file must not return lyrics cached from its old contents."""
+        inputs = file_provider.get_cache_inputs()
+        key = file_provider._get_artist_title_hash("Artist", "Song")
+
+        Path(temp_lyrics_file).write_text("Completely different lyrics\n")
+
+        assert file_provider.get_cache_inputs() != inputs
+        assert file_provider._get_artist_title_hash("Artist", "Song") != key
+        assert file_provider._get_legacy_artist_title_hash("Artist", "Song") == file_provider._get_artist_title_hash("Artist", "Song")
+
     def test_fetch_data_from_source_success(self, file_provider, temp_lyrics_file):
         """Test successful lyrics fetching from file."""
         with patch('lyrics_transcriber.lyrics.file_provider.KaraokeLyricsProcessor') as mock_processor_class:
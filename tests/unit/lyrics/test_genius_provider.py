@@ -149,7 +149,7 @@ class TestGeniusProvider:
         assert result is None
         provider.logger.error.assert_called_once()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_from_rapidapi_success(self, mock_get, mock_logger, config_with_rapidapi, 
                                         mock_rapidapi_search_response, mock_rapidapi_lyrics_response):
         """Test successful RapidAPI fetch"""
@@ -180,7 +180,7 @@ class TestGeniusProvider:
         assert "lyrics" in lyrics_call[0][0]
         assert lyrics_call[1]["params"]["id"] == "12345"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_from_rapidapi_no_results(self, mock_get, mock_logger, config_with_rapidapi):
         """Test RapidAPI fetch with no search results"""
         mock_get.return_value = Mock(status_code=200, json=lambda: {"hits": []})
@@ -191,7 +191,7 @@ class TestGeniusProvider:
         assert result is None
         mock_logger.warning.assert_called_with("No search results from RapidAPI")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_from_rapidapi_invalid_search_results(self, mock_get, mock_logger, config_with_rapidapi):
         """Test RapidAPI fetch with invalid search results"""
         mock_get.return_value = Mock(status_code=200, json=lambda: {
@@ -204,7 +204,7 @@ class TestGeniusProvider:
         assert result is None
         mock_logger.warning.assert_called_with("No valid song ID found in RapidAPI search results")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_from_rapidapi_no_lyrics(self, mock_get, mock_logger, config_with_rapidapi, 
                                           mock_rapidapi_search_response):
         """Test RapidAPI fetch with no lyrics in response"""
@@ -219,7 +219,7 @@ class TestGeniusProvider:
         assert result is None
         mock_logger.warning.assert_called_with("No lyrics found in RapidAPI response")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_from_rapidapi_request_error(self, mock_get, mock_logger, config_with_rapidapi):
         """Test RapidAPI fetch with request error"""
         mock_get.side_effect = requests.RequestException("Network error")
@@ -230,7 +230,7 @@ class TestGeniusProvider:
         assert result is None
         mock_logger.error.assert_called_with("RapidAPI request failed: Network error")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_from_rapidapi_http_error(self, mock_get, mock_logger, config_with_rapidapi):
         """Test RapidAPI fetch with HTTP error"""
         mock_response = Mock()
@@ -243,7 +243,7 @@ class TestGeniusProvider:
         assert result is None
         mock_logger.error.assert_called_with("RapidAPI request failed: 403 Forbidden")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_data_from_source_rapidapi_priority(self, mock_get, mock_logger, config_with_both,
                                                      mock_rapidapi_search_response, mock_rapidapi_lyrics_response):
         """Test that RapidAPI is tried first when both tokens are available"""
@@ -266,7 +266,7 @@ class TestGeniusProvider:
         # Verify Genius client was not used
         mock_genius.return_value.search_song.assert_not_called()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_data_from_source_rapidapi_fallback(self, mock_get, mock_logger, config_with_both, mock_song_data):
         """Test that when RapidAPI fails and rapidapi_key is set, no fallback occurs"""
         # Mock RapidAPI failure
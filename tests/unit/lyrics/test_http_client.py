@@ -0,0 +1,137 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from lyrics_transcriber.lyrics.http_client import ProviderHttpClient, RetryPolicy
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, so connection reuse can be observed
+
+    def do_GET(self):
+        server = self.server
+        server.client_ports.add(self.client_address[1])
+        server.request_count += 1  # Counted before responding, so the client never sees a stale count
+        status, headers = server.responses.pop(0) if server.responses else (200, {})
+        body = json.dumps({"path": self.path}).encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.responses = []
+    server.client_ports = set()
+    server.request_count = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server, path="/lyrics"):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_connections_are_reused(stub_server):
+    client = ProviderHttpClient()
+
+    for _ in range(3):
+        assert client.get(_url(stub_server)).json() == {"path": "/lyrics"}
+
+    assert stub_server.request_count == 3
+    assert len(stub_server.client_ports) == 1
+    client.close()
+
+
+def test_retryable_status_is_retried_honouring_retry_after(stub_server):
+    sleep = Mock()
+    stub_server.responses = [(503, {"Retry-After": "2"}), (502, {})]
+    client = ProviderHttpClient(sleep=sleep)
+
+    response = client.get(_url(stub_server))
+
+    assert response.status_code == 200
+    assert stub_server.request_count == 3
+    assert sleep.call_args_list[0].args == (2.0,)
+
+
+def test_last_retryable_response_is_returned(stub_server):
+    stub_server.responses = [(500, {})] * 3
+    client = ProviderHttpClient(sleep=Mock())
+
+    response = client.get(_url(stub_server))
+
+    assert response.status_code == 500
+    assert stub_server.request_count == 3
+
+
+def test_client_errors_are_not_retried(stub_server):
+    stub_server.responses = [(404, {})]
+    client = ProviderHttpClient(sleep=Mock())
+
+    assert client.get(_url(stub_server)).status_code == 404
+    assert stub_server.request_count == 1
+
+
+def test_too_many_requests_pauses_the_host(stub_server):
+    sleep = Mock()
+    stub_server.responses = [(429, {"Retry-After": "1"})]
+    client = ProviderHttpClient(sleep=sleep)
+
+    assert client.get(_url(stub_server)).status_code == 200
+
+    waited = sum(call.args[0] for call in sleep.call_args_list)
+    assert 0.9 < waited <= 1.0
+
+
+def test_connection_errors_are_retried_then_raised():
+    sleep = Mock()
+    session = Mock()
+    session.get.side_effect = requests.exceptions.ConnectionError("refused")
+    client = ProviderHttpClient(session=session, sleep=sleep)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.get("https://example.com/lyrics")
+
+    assert session.get.call_count == 3
+    assert sleep.call_count == 2
+    assert session.get.call_args.kwargs["timeout"] == ProviderHttpClient.DEFAULT_TIMEOUT
+
+
+def test_min_interval_per_host():
+    sleep = Mock()
+    session = Mock()
+    session.get.return_value = Mock(status_code=200)
+    client = ProviderHttpClient(session=session, host_min_intervals={"slow.example.com": 5.0}, sleep=sleep)
+
+    client.get("https://slow.example.com/a")
+    client.get("https://fast.example.com/a")
+    client.get("https://slow.example.com/b")
+
+    assert sleep.call_count == 1
+    assert 4.9 < sleep.call_args.args[0] <= 5.0
+
+
+def test_retry_policy_backoff_is_capped():
+    policy = RetryPolicy(backoff_base=1.0, backoff_max=3.0)
+    with patch("random.uniform", side_effect=lambda low, high: high):
+        assert [policy.delay(attempt) for attempt in range(4)] == [1.0, 2.0, 3.0, 3.0]
+
+
+def test_shared_client_is_reused():
+    assert ProviderHttpClient.shared() is ProviderHttpClient.shared()
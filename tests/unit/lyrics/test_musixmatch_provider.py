@@ -173,7 +173,7 @@ class TestMusixmatchProvider:
         provider = MusixmatchProvider(config=config_without_rapidapi_key, logger=mock_logger)
         assert provider.rapidapi_key is None
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_data_from_source_success(self, mock_get, provider, mock_musixmatch_response):
         """Test successful data fetch from Musixmatch"""
         mock_get.return_value = Mock(status_code=200, json=lambda: mock_musixmatch_response)
@@ -198,7 +198,7 @@ class TestMusixmatchProvider:
         assert result is None
         mock_logger.warning.assert_called_with("No RapidAPI key provided for Musixmatch")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_data_from_source_invalid_response(self, mock_get, provider, mock_musixmatch_invalid_response):
         """Test fetch with invalid response structure"""
         mock_get.return_value = Mock(status_code=200, json=lambda: mock_musixmatch_invalid_response)
@@ -208,7 +208,7 @@ class TestMusixmatchProvider:
         assert result is None
         provider.logger.warning.assert_called_with("Invalid response structure from Musixmatch API")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_data_from_source_no_lyrics(self, mock_get, provider, mock_musixmatch_no_lyrics_response):
         """Test fetch with no lyrics in response"""
         mock_get.return_value = Mock(status_code=200, json=lambda: mock_musixmatch_no_lyrics_response)
@@ -218,7 +218,7 @@ class TestMusixmatchProvider:
         assert result is None
         provider.logger.warning.assert_called_with("No lyrics found in Musixmatch response")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_data_from_source_request_error(self, mock_get, provider):
         """Test fetch with request error"""
         mock_get.side_effect = requests.RequestException("Network error")
@@ -228,7 +228,7 @@ class TestMusixmatchProvider:
         assert result is None
         provider.logger.error.assert_called_with("Musixmatch API request failed: Network error")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_data_from_source_http_error(self, mock_get, provider):
         """Test fetch with HTTP error"""
         mock_response = Mock()
@@ -240,7 +240,7 @@ class TestMusixmatchProvider:
         assert result is None
         provider.logger.error.assert_called_with("Musixmatch API request failed: 403 Forbidden")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_data_from_source_json_error(self, mock_get, provider):
         """Test fetch with JSON parsing error"""
         mock_response = Mock()
@@ -440,7 +440,7 @@ class TestMusixmatchProvider:
         """Test that the provider returns correct name"""
         assert provider.get_name() == "Musixmatch"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_lyrics_integration(self, mock_get, provider, mock_musixmatch_response):
         """Test the full fetch_lyrics workflow"""
         mock_get.return_value = Mock(status_code=200, json=lambda: mock_musixmatch_response)
@@ -454,7 +454,7 @@ class TestMusixmatchProvider:
         assert result.metadata.track_name == "Waterloo"
         assert result.metadata.artist_names == "ABBA"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_lyrics_no_results(self, mock_get, provider, mock_musixmatch_invalid_response):
         """Test fetch_lyrics with no results"""
         mock_get.return_value = Mock(status_code=200, json=lambda: mock_musixmatch_invalid_response)
@@ -463,7 +463,7 @@ class TestMusixmatchProvider:
         
         assert result is None
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_lyrics_api_error(self, mock_get, provider):
         """Test fetch_lyrics with API error"""
         mock_get.side_effect = requests.RequestException("API Error")
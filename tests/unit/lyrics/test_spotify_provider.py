@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import Mock, patch, call
 from lyrics_transcriber.lyrics.spotify import SpotifyProvider
 from lyrics_transcriber.lyrics.base_lyrics_provider import LyricsProviderConfig
+from lyrics_transcriber.lyrics.http_client import ProviderHttpClient, RetryPolicy
 from lyrics_transcriber.types import LyricsData
 import requests
 
@@ -121,7 +122,7 @@ class TestSpotifyProvider:
         result = provider.fetch_lyrics("Artist", "Title")
         assert result is None
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_from_rapidapi_success(self, mock_get, mock_logger):
         """Test successful RapidAPI fetch"""
         config = LyricsProviderConfig(rapidapi_key="test_key")
@@ -158,7 +159,7 @@ class TestSpotifyProvider:
         # Verify the API calls
         assert mock_get.call_count == 2
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_from_rapidapi_search_failure(self, mock_get, mock_logger):
         """Test RapidAPI search failure"""
         config = LyricsProviderConfig(rapidapi_key="test_key")
@@ -179,7 +180,7 @@ class TestSpotifyProvider:
         assert result is None
         mock_logger.warning.assert_called_with("RapidAPI search failed")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_from_rapidapi_no_track_id(self, mock_get, mock_logger):
         """Test RapidAPI response without track ID"""
         config = LyricsProviderConfig(rapidapi_key="test_key")
@@ -377,23 +378,24 @@ class TestSpotifyProvider:
         assert metadata.provider_metadata["api_source"] == "rapidapi"
 
     @patch('syrics.api.Spotify')
-    @patch('time.sleep')
-    def test_init_with_cookie_retry_logic(self, mock_sleep, mock_spotify, mock_logger):
+    @patch('random.uniform', side_effect=lambda low, high: high)
+    def test_init_with_cookie_retry_logic(self, mock_uniform, mock_spotify, mock_logger):
         """Test syrics client initialization with retry logic"""
         # Mock client to fail first few times then succeed
         mock_spotify.side_effect = [Exception("Connection failed"), Exception("Auth failed"), Mock()]
+        mock_sleep = Mock()
+        http_client = ProviderHttpClient(retry_policy=RetryPolicy(max_attempts=5, backoff_base=1.0), sleep=mock_sleep)
         
-        config = LyricsProviderConfig(spotify_cookie="test_cookie")
+        config = LyricsProviderConfig(spotify_cookie="test_cookie", http_client=http_client)
         provider = SpotifyProvider(config=config, logger=mock_logger)
         
-        # Should have called sleep twice (for first two failures)
-        assert mock_sleep.call_count == 2
-        mock_sleep.assert_called_with(5)
+        # Should have slept twice (for first two failures), with exponential backoff
+        assert mock_sleep.call_args_list == [call(1.0), call(2.0)]
         
         # Should have logged warnings for retries
         expected_calls = [
-            call("Attempt 1/5 failed, retrying in 5 seconds..."),
-            call("Attempt 2/5 failed, retrying in 5 seconds...")
+            call("Attempt 1/5 failed, retrying in 1.0 seconds..."),
+            call("Attempt 2/5 failed, retrying in 2.0 seconds...")
         ]
         mock_logger.warning.assert_has_calls(expected_calls)
 
@@ -402,16 +404,18 @@ class TestSpotifyProvider:
         """Test syrics client initialization when max retries exceeded"""
         # Mock client to always fail
         mock_spotify.side_effect = Exception("Connection failed")
+        http_client = ProviderHttpClient(sleep=Mock())
         
-        config = LyricsProviderConfig(spotify_cookie="test_cookie")
+        config = LyricsProviderConfig(spotify_cookie="test_cookie", http_client=http_client)
         provider = SpotifyProvider(config=config, logger=mock_logger)
         
         # Should have logged final error message
         mock_logger.error.assert_called_once()
         error_call = mock_logger.error.call_args[0][0]
-        assert "Failed to initialize Spotify client after 5 attempts" in error_call
+        assert "Failed to initialize Spotify client after 3 attempts" in error_call
+        assert mock_spotify.call_count == 3
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_from_rapidapi_request_exception(self, mock_get, mock_logger):
         """Test RapidAPI request exception handling"""
         config = LyricsProviderConfig(rapidapi_key="test_key")
@@ -425,7 +429,7 @@ class TestSpotifyProvider:
         assert result is None
         mock_logger.error.assert_called_with("RapidAPI request failed: Network error")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_from_rapidapi_general_exception(self, mock_get, mock_logger):
         """Test RapidAPI general exception handling"""
         config = LyricsProviderConfig(rapidapi_key="test_key")
@@ -510,22 +514,24 @@ class TestSpotifyProvider:
         assert result == ""
 
     @patch('syrics.api.Spotify')
-    @patch('time.sleep')
-    def test_init_with_cookie_single_retry(self, mock_sleep, mock_spotify, mock_logger):
+    @patch('random.uniform', side_effect=lambda low, high: high)
+    def test_init_with_cookie_single_retry(self, mock_uniform, mock_spotify, mock_logger):
         """Test syrics client initialization with single retry to ensure sleep is called"""
         # Mock client to fail once then succeed
         mock_spotify.side_effect = [Exception("Connection failed"), Mock()]
+        mock_sleep = Mock()
+        http_client = ProviderHttpClient(sleep=mock_sleep)
         
-        config = LyricsProviderConfig(spotify_cookie="test_cookie")
+        config = LyricsProviderConfig(spotify_cookie="test_cookie", http_client=http_client)
         provider = SpotifyProvider(config=config, logger=mock_logger)
         
         # Should have called sleep once
-        mock_sleep.assert_called_once_with(5)
+        mock_sleep.assert_called_once_with(0.5)
         
         # Should have logged warning for retry
-        mock_logger.warning.assert_called_with("Attempt 1/5 failed, retrying in 5 seconds...")
+        mock_logger.warning.assert_called_with("Attempt 1/3 failed, retrying in 0.5 seconds...")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_from_rapidapi_lyrics_request_failure(self, mock_get, mock_logger):
         """Test RapidAPI lyrics request failure after successful search"""
         config = LyricsProviderConfig(rapidapi_key="test_key")
@@ -234,6 +234,34 @@ class TestASS:
         for event in ass.events:
             assert event.Start < event.End
 
+    def test_write_streams_the_same_document_as_to_string(self, ass, tmp_path):
+        """Test ASS writing with the precompiled Format line fields"""
+        style = Style()
+        style.type = "Style"
+        style.Name = "Default"
+        style.Fontsize = 20
+        ass.styles_format = ["Name", "Fontsize", "PrimaryColour", "Bold"]
+        ass.events_format = ["Layer", "Style", "Start", "End", "Text"]
+        events = []
+        for i in range(3):
+            event = Event()
+            event.type = "Dialogue"
+            event.Style = style
+            event.Start = i * 61.5
+            event.End = i * 61.5 + 1
+            event.Text = f"Line {i}, with a comma"
+            events.append(event)
+        ass.extend(events)
+
+        output_file = tmp_path / "test.ass"
+        ass.write(str(output_file))
+
+        content = output_file.read_text(encoding="utf-8")
+        assert content == ass.to_string()
+        assert "Style: Default,20,&H00FFFFFF,0\n" in content
+        assert "Dialogue: 0,Default,0:01:01.50,0:01:02.50,Line 1, with a comma\n" in content
+        assert len(ass.styles) == 1
+
     def test_write_srt_basic(self, ass, sample_event, sample_style, tmp_path):
         """Test basic SRT file writing"""
         # Ensure event has proper style and timing
@@ -0,0 +1,26 @@
+from lyrics_transcriber.output.ass.screen_layout import IntervalIndex, ShiftedSegment
+from tests.test_helpers import create_test_segment, create_test_word
+
+
+def test_interval_index_lookups():
+    index = IntervalIndex([(30.0, 40.0), (10.0, 20.0), (12.0, 14.0)])
+
+    assert index.containing(15.0) == (10.0, 20.0)
+    assert index.containing(20.0) is None
+    assert index.containing(5.0) is None
+    assert index.within(9.0, 16.0) == (12.0, 14.0)
+    assert index.within(15.0, 41.0) == (30.0, 40.0)
+    assert index.within(21.0, 39.0) is None
+
+
+def test_shifted_segment_is_a_view():
+    word = create_test_word(text="hello", start_time=1.0, end_time=1.5)
+    segment = create_test_segment(text="hello", start_time=1.0, end_time=1.5, words=[word])
+
+    shifted = ShiftedSegment.shift_all([segment], -2.0)[0]
+
+    assert (shifted.start_time, shifted.end_time) == (0, -0.5)
+    assert (shifted.words[0].start_time, shifted.words[0].text) == (0, "hello")
+    assert shifted.id == segment.id
+    assert segment.start_time == 1.0  # The original is untouched
+    assert ShiftedSegment.shift_all([segment], 0.0)[0] is segment
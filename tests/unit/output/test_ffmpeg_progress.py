@@ -0,0 +1,114 @@
+import subprocess
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from lyrics_transcriber.output.ffmpeg_progress import FFmpegProgress, FFmpegProgressRunner, FFmpegStalledError
+
+
+def _block(out_time_us, progress="continue", frame=0, fps="0.00", speed="N/A", bitrate="N/A"):
+    return [
+        f"frame={frame}\n",
+        f"fps={fps}\n",
+        f"bitrate={bitrate}\n",
+        "total_size=1024\n",
+        f"out_time_us={out_time_us}\n",
+        f"speed={speed}\n",
+        f"progress={progress}\n",
+    ]
+
+
+class _FakeProcess:
+    """Popen stand-in that writes the given -progress lines, then optionally hangs until killed."""
+
+    def __init__(self, lines, returncode=0, stderr="", hang=False):
+        self._lines = lines
+        self._hang = hang
+        self._killed = threading.Event()
+        self.returncode = None
+        self._exit_code = returncode
+        self.stdout = self._stdout()
+        self.stderr = iter([stderr] if stderr else [])
+
+    def _stdout(self):
+        yield from self._lines
+        if self._hang:
+            self._killed.wait(5)
+
+    def wait(self):
+        if self.returncode is None:
+            self.returncode = -9 if self._killed.is_set() else self._exit_code
+        return self.returncode
+
+    def poll(self):
+        return self.returncode
+
+    def kill(self):
+        self._killed.set()
+
+
+def test_progress_blocks_are_parsed_and_reported():
+    lines = _block(1_000_000, frame=30, fps="30.0", speed="2.5x", bitrate="1500.2kbits/s") + _block(
+        4_000_000, progress="end", frame=120, fps="40.0", speed="3x", bitrate="1600.0kbits/s"
+    )
+    reports = []
+    runner = FFmpegProgressRunner(on_progress=lambda progress: reports.append(progress.to_dict()))
+
+    with patch("subprocess.Popen", return_value=_FakeProcess(lines)) as mock_popen:
+        result = runner.run(["ffmpeg", "-i", "in.mp3", "out.mp4"], duration=4.0)
+
+    assert mock_popen.call_args.args[0] == ["ffmpeg", "-progress", "pipe:1", "-nostats", "-i", "in.mp3", "out.mp4"]
+    assert [report["frame"] for report in reports] == [30, 120]
+    assert reports[0]["speed"] == 2.5 and reports[0]["bitrate_kbps"] == 1500.2
+    assert reports[0]["fraction"] == 0.25 and not reports[0]["finished"]
+    assert result.finished and result.output_path == "out.mp4"
+    assert result.out_time == 4.0 and result.fps == 40.0 and result.total_size == 1024
+
+
+def test_unknown_values_are_none():
+    progress = FFmpegProgress()
+    FFmpegProgressRunner._update(progress, {"speed": "N/A", "bitrate": "N/A", "out_time_ms": "500000"}, 1.0, finished=False)
+
+    assert progress.speed is None and progress.bitrate_kbps is None
+    assert progress.out_time == 0.5
+    assert progress.fraction is None and progress.eta is None
+
+
+def test_eta_uses_average_speed():
+    progress = FFmpegProgress(out_time=10.0, duration=40.0, elapsed=5.0)
+
+    assert progress.eta == 15.0
+
+
+def test_failure_raises_with_error_output():
+    runner = FFmpegProgressRunner()
+
+    with patch("subprocess.Popen", return_value=_FakeProcess([], returncode=1, stderr="Invalid argument\n")):
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            runner.run(["ffmpeg", "out.mp4"])
+
+    assert exc_info.value.returncode == 1
+    assert "Invalid argument" in exc_info.value.output
+
+
+def test_stalled_encode_is_killed():
+    process = _FakeProcess(_block(1_000_000), hang=True)
+    runner = FFmpegProgressRunner(stall_timeout=0.2)
+
+    with patch("subprocess.Popen", return_value=process):
+        with pytest.raises(FFmpegStalledError):
+            runner.run(["ffmpeg", "out.mp4"])
+
+    assert process._killed.is_set()
+
+
+def test_callback_exception_kills_ffmpeg():
+    process = _FakeProcess(_block(1_000_000), hang=True)
+    runner = FFmpegProgressRunner(on_progress=Mock(side_effect=RuntimeError("cancelled")))
+
+    with patch("subprocess.Popen", return_value=process):
+        with pytest.raises(RuntimeError, match="cancelled"):
+            runner.run(["ffmpeg", "out.mp4"])
+
+    assert process._killed.is_set()
@@ -82,6 +82,45 @@ class TestOutputGenerator:
         assert generator.font_size == 40
         assert generator.line_height == 50
 
+    def test_extra_video_targets(self, test_config_with_video):
+        """Extra resolutions become render targets; the main resolution is not rendered twice."""
+        test_config_with_video.video_extra_resolutions = ["720p", "360p"]
+        generator = OutputGenerator(config=test_config_with_video)
+
+        targets = generator._get_extra_video_targets("song")
+
+        assert [target.resolution for target in targets] == [(1280, 720)]
+        assert targets[0].output_path.endswith("song (With Vocals) 720p.mkv")
+
+    def test_referenced_file_hashes_follow_file_contents(self, tmp_path):
+        """Replacing an image under the same name changes the stage key inputs."""
+        image = tmp_path / "title.png"
+        image.write_bytes(b"first image")
+        styles = {"title_screen_background": str(image), "background_color": "#000000", "font_path": "missing.ttf"}
+
+        first = OutputGenerator._referenced_file_hashes(styles)
+        image.write_bytes(b"second image!")
+
+        assert list(first) == ["title_screen_background"]
+        assert OutputGenerator._referenced_file_hashes(styles) != first
+
+    def test_segment_resize_by_width(self, test_config_with_video):
+        """Width mode measures lines in the karaoke font, and falls back to characters without one."""
+        font_path = os.path.join(os.path.dirname(__file__), "..", "..", "..", "lyrics_transcriber", "output", "fonts", "arial.ttf")
+        test_config_with_video.segment_resize_mode = "width"
+        with open(test_config_with_video.output_styles_json, "w") as f:
+            json.dump({"karaoke": {"font_size": 40, "font_path": font_path, "margin_l": 20, "margin_r": 20}}, f)
+        generator = OutputGenerator(config=test_config_with_video)
+
+        assert generator.segment_resizer.max_line_width == 600
+        assert generator.segment_resizer.text_width.font.size == 28
+
+        with open(test_config_with_video.output_styles_json, "w") as f:
+            json.dump({"karaoke": {"font_size": 40, "font_path": "/missing/font.ttf"}}, f)
+        generator = OutputGenerator(config=test_config_with_video)
+
+        assert generator.segment_resizer.text_width is None
+
     def test_initialization_missing_styles_file(self, tmp_path):
         """Test OutputGenerator initialization with missing styles file."""
         config = OutputConfig(
@@ -0,0 +1,83 @@
+import os
+import threading
+import time
+
+import pytest
+
+from lyrics_transcriber.output.preview_cache import PreviewCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PreviewCache(tmp_path / "previews", max_size_mb=1)
+
+
+def _renderer(tmp_path, content=b"video", calls=None, delay=0.0):
+    def render():
+        if calls is not None:
+            calls.append(1)
+        time.sleep(delay)
+        path = tmp_path / f"rendered_{len(calls or [])}_{threading.get_ident()}.mp4"
+        path.write_bytes(content)
+        return str(path)
+
+    return render
+
+
+def test_render_then_hit(cache, tmp_path):
+    calls = []
+    path, rendered = cache.get_or_render("abc", _renderer(tmp_path, calls=calls))
+    again, rendered_again = cache.get_or_render("abc", _renderer(tmp_path, calls=calls))
+
+    assert rendered and not rendered_again
+    assert path == again == str(cache.path_for("abc"))
+    assert len(calls) == 1
+    assert open(path, "rb").read() == b"video"
+
+
+def test_existing_file_is_reused_across_instances(cache, tmp_path):
+    cache.get_or_render("abc", _renderer(tmp_path))
+
+    other = PreviewCache(cache.preview_dir)
+    assert other.get("abc") == str(cache.path_for("abc"))
+    assert other.get("missing") is None
+
+
+def test_concurrent_requests_share_one_render(cache, tmp_path):
+    calls = []
+    results = []
+
+    def request():
+        results.append(cache.get_or_render("abc", _renderer(tmp_path, calls=calls, delay=0.1)))
+
+    threads = [threading.Thread(target=request) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len({path for path, _ in results}) == 1
+    assert sum(rendered for _, rendered in results) == 1
+
+
+def test_failed_render_is_not_cached(cache, tmp_path):
+    def fail():
+        raise ValueError("Preview video generation failed")
+
+    with pytest.raises(ValueError):
+        cache.get_or_render("abc", fail)
+    assert cache.get("abc") is None
+
+
+def test_least_recently_used_previews_are_evicted(cache, tmp_path):
+    big = b"x" * (300 * 1024)
+    for i, preview_hash in enumerate(["old", "used", "new"]):
+        cache.get_or_render(preview_hash, _renderer(tmp_path, content=big))
+        os.utime(cache.path_for(preview_hash), (1000 + i, 1000 + i))
+    cache.get("old")  # Touch: now the most recently used
+
+    cache.get_or_render("newest", _renderer(tmp_path, content=big))
+
+    assert cache.get("used") is None
+    assert all(cache.get(preview_hash) for preview_hash in ["old", "new", "newest"])
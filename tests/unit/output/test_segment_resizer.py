@@ -521,3 +521,39 @@ class TestSegmentResizer:
                 Word '{word_clean}' from segment's word list not found in segment text '{seg.text}'
                 Segment words: {seg_words}
                 """
+
+
+class _FixedWidths:
+    """Text width model stand-in: every character is 10px wide, except "W" (30px)."""
+
+    def advance(self, char):
+        return 30.0 if char == "W" else 10.0
+
+    def width(self, text):
+        return sum(self.advance(char) for char in text)
+
+
+class TestSegmentResizerByWidth:
+    @pytest.fixture
+    def resizer(self):
+        return SegmentResizer(max_line_length=36, logger=logging.getLogger(__name__), text_width=_FixedWidths(), max_line_width=200)
+
+    def test_wide_characters_are_split_despite_fitting_in_characters(self, resizer):
+        text = "WWW WWW, and more"  # 17 characters, 290px
+        words = [create_word(word, i, i + 1) for i, word in enumerate(text.split())]
+
+        result = resizer.resize_segments([create_segment(text, words)])
+
+        assert [segment.text for segment in result] == ["WWW WWW,", "and more"]
+        assert [word.text for segment in result for word in segment.words] == text.split()
+
+    def test_breaks_are_chosen_for_all_lines_at_once(self, resizer):
+        lines = resizer._break_lines_by_width("one two three. four five six seven eight nine ten")
+
+        # Fewest lines, preferring the sentence end, then balanced lines
+        assert lines == ["one two three.", "four five six seven", "eight nine ten"]
+
+    def test_overlong_word_gets_its_own_line(self, resizer):
+        lines = resizer._break_lines_by_width("so supercalifragilisticexpialidocious it is")
+
+        assert lines == ["so", "supercalifragilisticexpialidocious", "it is"]
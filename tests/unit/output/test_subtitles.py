@@ -525,6 +525,20 @@ def test_generate_ass_failure(mock_check_output, generator, sample_segments):
     generator.logger.error.assert_called_once()
 
 
+def test_screen_plan_is_reused_when_only_the_offset_changes(generator, sample_segments):
+    """The screen layout is planned once per set of segments and shared across offsets."""
+    SubtitlesGenerator.clear_screen_plans()
+    generator._create_screens(sample_segments, 180.0)
+
+    generator.subtitle_offset_ms = 500
+    with patch.object(generator, "_plan_lyric_screens", wraps=generator._plan_lyric_screens) as mock_plan:
+        screens = generator._create_screens(sample_segments, 180.0)
+
+    mock_plan.assert_not_called()
+    lyric_screens = [screen for screen in screens if isinstance(screen, LyricsScreen)]
+    assert [len(screen.lines) for screen in lyric_screens] == [4, 4]
+    assert lyric_screens[0].lines[0].segment.start_time == sample_segments[0].start_time + 0.5
+
 def test_is_in_instrumental_section(generator):
     """Test instrumental section detection."""
     instrumental_times = [(10.0, 20.0), (30.0, 40.0)]
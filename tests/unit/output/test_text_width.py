@@ -0,0 +1,28 @@
+import os
+
+from lyrics_transcriber.output.text_width import TextWidthModel
+
+FONT_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "..", "lyrics_transcriber", "output", "fonts", "arial.ttf")
+
+
+def test_models_are_shared_per_font_and_size():
+    TextWidthModel.clear()
+
+    model = TextWidthModel.for_font(FONT_PATH, 40)
+
+    assert model is TextWidthModel.for_font(FONT_PATH, 40)
+    assert model is not TextWidthModel.for_font(FONT_PATH, 20)
+
+
+def test_width_is_sum_of_glyph_advances():
+    model = TextWidthModel.for_font(FONT_PATH, 40)
+
+    assert model.width("") == 0
+    assert model.width("WW") == 2 * model.advance("W")
+    assert model.width("W") > model.width("i")  # Proportional font
+    assert abs(model.width("Hello world") - model.font.getlength("Hello world")) < 3
+
+
+def test_missing_font_has_no_model():
+    assert TextWidthModel.for_font("/missing/font.ttf", 40) is None
+    assert TextWidthModel.for_font(None, 40) is None
@@ -6,7 +6,10 @@ import subprocess
 from unittest.mock import patch, Mock, call
 import logging
 
-from lyrics_transcriber.output.video import VideoGenerator
+from PIL import Image
+
+from lyrics_transcriber.output.ffmpeg_progress import FFmpegProgress
+from lyrics_transcriber.output.video import AudioHandling, RenderSegment, VideoGenerator, VideoOutputTarget
 
 
 @pytest.fixture
@@ -28,7 +31,7 @@ def video_generator(tmp_path):
 @pytest.fixture
 def mock_ffprobe_output():
     """Create sample ffprobe output for background image dimensions."""
-    return json.dumps({"streams": [{"width": 1920, "height": 1080}]})
+    return json.dumps({"streams": [{"codec_type": "video", "width": 1920, "height": 1080}]})
 
 
 def test_initialization(tmp_path):
@@ -105,6 +108,22 @@ def test_resize_background_image(mock_check_output, video_generator, mock_ffprob
     assert Path(resized_path).exists()
 
 
+def test_resize_background_image_with_pil_is_cached(video_generator, tmp_path):
+    """Readable images are fitted in-process, once per image and resolution."""
+    test_image = tmp_path / "background.png"
+    Image.new("RGB", (100, 100), "red").save(test_image)
+
+    with patch("subprocess.check_output") as mock_check_output:
+        resized_path = video_generator._resize_background_image(str(test_image))
+        assert video_generator._resize_background_image(str(test_image)) == resized_path
+        mock_check_output.assert_not_called()
+
+    resized = Image.open(resized_path)
+    assert resized.size == (1920, 1080)
+    assert resized.getpixel((0, 0)) == (0, 0, 0)  # Padded
+    assert resized.getpixel((960, 540))[0] > 200
+
+
 @patch("subprocess.check_output")
 def test_build_ffmpeg_command(mock_check_output, video_generator, mock_ffprobe_output):
     """Test _build_ffmpeg_command method."""
@@ -144,6 +163,22 @@ def test_run_ffmpeg_command(mock_check_output, video_generator):
         video_generator._run_ffmpeg_command(cmd)
 
 
+def test_run_ffmpeg_command_reports_progress(video_generator):
+    """With a progress callback, FFmpeg runs with -progress output and a summary of the encode is kept."""
+    progress = FFmpegProgress(output_path="out.mp4", frame=120, fps=60.0, speed=2.0, finished=True)
+    reports = []
+    video_generator.progress_callback = reports.append
+
+    with patch("lyrics_transcriber.output.video.FFmpegProgressRunner") as mock_runner:
+        mock_runner.return_value.run.return_value = progress
+        video_generator._run_ffmpeg_command(["ffmpeg", "out.mp4"], duration=4.0)
+        video_generator._report_progress(progress)
+
+    mock_runner.return_value.run.assert_called_once_with(["ffmpeg", "out.mp4"], duration=4.0)
+    assert reports == [progress]
+    assert video_generator.render_metrics[-1]["frame"] == 120
+
+
 @patch("subprocess.check_output")
 def test_generate_video(mock_check_output, video_generator):
     """Test generate_video method."""
@@ -295,3 +330,386 @@ def test_build_ass_filter_logging(video_generator, tmp_path, caplog):
     # Check that info log was generated
     assert "Returning ASS filter with fonts dir:" in caplog.text
     assert str(font_dir) in caplog.text
+
+
+ASS_WITH_EVENTS = """[Script Info]
+ScriptType: v4.00+
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:01.00,0:00:04.00,Default,,0,0,0,,{\\k50}first, line
+Dialogue: 0,0:00:09.50,0:00:12.00,Default,,0,0,0,,{\\k50}second
+Dialogue: 0,0:00:20.00,0:00:25.00,Default,,0,0,0,,{\\k50}third
+Dialogue: 0,0:01:05.00,0:01:08.00,Default,,0,0,0,,{\\k50}fourth
+"""
+
+
+def test_trim_ass_events_keeps_overlapping_events_unchanged(video_generator, tmp_path):
+    """Events overlapping the window are kept with their original times and text."""
+    source = tmp_path / "full.ass"
+    source.write_text(ASS_WITH_EVENTS, encoding="utf-8")
+    trimmed = tmp_path / "trimmed.ass"
+
+    kept = video_generator._trim_ass_events(str(source), str(trimmed), 10.0, 22.0)
+
+    content = trimmed.read_text(encoding="utf-8")
+    assert kept == 2
+    assert "[Script Info]" in content and "Format: Layer, Start" in content
+    assert "Dialogue: 0,0:00:09.50,0:00:12.00,Default,,0,0,0,,{\\k50}second" in content
+    assert "third" in content
+    assert "first, line" not in content
+    assert "fourth" not in content
+
+
+def test_preview_ffmpeg_command_with_time_window(video_generator):
+    """A windowed preview seeks the audio, limits the duration and offsets subtitle timestamps."""
+    cmd = video_generator._build_preview_ffmpeg_command("test.ass", "test.mp3", "out.mp4", time_window=(12.5, 20.0))
+
+    audio_index = cmd.index("test.mp3")
+    assert cmd[audio_index - 5 : audio_index - 1] == ["-ss", "12.500", "-t", "7.500"]
+    video_filter = cmd[cmd.index("-vf") + 1]
+    assert video_filter.startswith("setpts=PTS+round(12.500000/TB),ass=test.ass")
+    assert video_filter.endswith("setpts=PTS-STARTPTS")
+    assert cmd[-4:] == ["-t", "7.500", "-y", "out.mp4"]
+
+
+def test_preview_ffmpeg_command_without_time_window(video_generator):
+    """Full previews are unchanged: no seeking and no timestamp offset."""
+    cmd = video_generator._build_preview_ffmpeg_command("test.ass", "test.mp3", "out.mp4")
+
+    assert "-ss" not in cmd
+    assert cmd[cmd.index("-vf") + 1] == "ass=test.ass"
+    assert cmd[-2:] == ["-y", "out.mp4"]
+
+
+@patch("subprocess.check_output")
+def test_generate_preview_video_with_time_window(mock_check_output, video_generator, tmp_path):
+    """Only the events in the window are passed to ffmpeg."""
+    os.makedirs(video_generator.cache_dir, exist_ok=True)
+    ass_path = tmp_path / "full.ass"
+    ass_path.write_text(ASS_WITH_EVENTS, encoding="utf-8")
+    audio_path = tmp_path / "test.mp3"
+    audio_path.touch()
+    rendered_ass = []
+
+    def capture(cmd, *args, **kwargs):
+        ass_file = cmd[cmd.index("-vf") + 1].split("ass=")[1].split(",")[0]
+        rendered_ass.append(Path(ass_file).read_text(encoding="utf-8"))
+        return ""
+
+    mock_check_output.side_effect = capture
+
+    output_path = video_generator.generate_preview_video(str(ass_path), str(audio_path), "test", time_window=(0.0, 5.0))
+
+    assert output_path.endswith("test_preview.mp4")
+    assert "first, line" in rendered_ass[0]
+    assert "second" not in rendered_ass[0]
+
+
+def test_generate_preview_video_rejects_invalid_time_window(video_generator):
+    with pytest.raises(ValueError):
+        video_generator.generate_preview_video("test.ass", "test.mp3", "test", time_window=(5.0, 5.0))
+
+
+def test_chunk_cut_points_prefer_screen_boundaries(video_generator, tmp_path):
+    """Cuts go in the gaps between screens near evenly spaced targets, or at the target if no gap is close."""
+    ass_path = tmp_path / "full.ass"
+    ass_path.write_text(ASS_WITH_EVENTS, encoding="utf-8")
+    video_generator.render_chunks = 4
+    events = video_generator._read_ass_events(str(ass_path))
+
+    assert video_generator._get_chunk_cut_points(events, 80.0) == [16.0, 45.0, 60.0]
+    assert video_generator._get_chunk_cut_points(events, 30.0) == []
+
+
+def test_plan_segments_skips_unknown_duration(video_generator, tmp_path):
+    ass_path = tmp_path / "full.ass"
+    ass_path.write_text(ASS_WITH_EVENTS, encoding="utf-8")
+    video_generator.render_chunks = 4
+
+    with patch.object(video_generator, "_probe_duration", return_value=None):
+        assert video_generator._plan_segments(str(ass_path), "test.mp3") == []
+
+
+def test_segment_ffmpeg_command(video_generator):
+    """Segments are silent, closed-GOP encodes of an exact number of frames with subtitles at song time."""
+    segment = RenderSegment(16.0, 45.0)
+    cmd = video_generator._build_segment_ffmpeg_command("test.ass", ["-f", "lavfi", "-i", "color"], segment, "chunk.mkv", threads=2)
+
+    assert cmd[cmd.index("-vf") + 1] == "settb=1/30,setpts=PTS+480,ass=test.ass,setpts=PTS-STARTPTS"
+    assert "-an" in cmd
+    assert cmd[cmd.index("-flags") + 1] == "+cgop"
+    assert cmd[cmd.index("-threads") + 1] == "2"
+    assert cmd[cmd.index("-frames:v") + 1] == "870"
+    assert cmd[-2:] == ["-y", "chunk.mkv"]
+
+
+@patch("subprocess.check_output")
+def test_generate_video_in_chunks(mock_check_output, video_generator, tmp_path):
+    """Chunks are encoded separately, then concatenated with stream copy and the audio muxed once."""
+    os.makedirs(video_generator.output_dir, exist_ok=True)
+    os.makedirs(video_generator.cache_dir, exist_ok=True)
+    ass_path = tmp_path / "full.ass"
+    ass_path.write_text(ASS_WITH_EVENTS, encoding="utf-8")
+    audio_path = tmp_path / "test.mp3"
+    audio_path.touch()
+    video_generator.render_chunks = 2
+    concat_lists = []
+
+    def fake_ffmpeg(cmd, *args, **kwargs):
+        if cmd[0] == "ffprobe":
+            return json.dumps({"format": {"duration": "70.0"}})
+        if "concat" in cmd:
+            concat_lists.append(Path(cmd[cmd.index("-i") + 1]).read_text(encoding="utf-8"))
+        return ""
+
+    mock_check_output.side_effect = fake_ffmpeg
+
+    video_generator.generate_video(str(ass_path), str(audio_path), "test")
+
+    commands = [c.args[0] for c in mock_check_output.call_args_list if c.args[0][0] == "ffmpeg"]
+    chunk_commands, concat_command = commands[:-1], commands[-1]
+    assert len(chunk_commands) == 2
+    assert [cmd[cmd.index("-frames:v") + 1] for cmd in chunk_commands] == ["1350", "750"]
+    assert concat_command[concat_command.index("-c:v") + 1] == "copy"
+    assert str(audio_path) in concat_command
+    assert concat_lists[0].count("file '") == 2
+    assert not any(name.startswith("video_segments_") for name in os.listdir(video_generator.cache_dir))
+
+
+ASS_WITH_SECTIONS = """[Script Info]
+ScriptType: v4.00+
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:01.00,0:00:04.00,Default,,0,0,0,,{\\k50}first
+Dialogue: 0,0:00:10.00,0:00:30.00,Default,,0,0,0,,{\\fad(300,300)}{\\an8}{\\K1940}♪ INSTRUMENTAL (20 seconds) ♪
+Dialogue: 0,0:00:31.00,0:00:33.00,Default,,0,0,0,,{\\k50}second
+Dialogue: 0,0:00:40.00,0:00:50.00,Default,,0,0,0,,Static title
+"""
+
+
+def test_classify_spans(video_generator, tmp_path):
+    """Gaps are empty, section screens are slow apart from their fades, untagged text is static."""
+    ass_path = tmp_path / "sections.ass"
+    ass_path.write_text(ASS_WITH_SECTIONS, encoding="utf-8")
+
+    segments = video_generator._classify_spans(video_generator._read_ass_events(str(ass_path)), 60.0)
+
+    assert [(segment.kind, pytest.approx(segment.start), pytest.approx(segment.end)) for segment in segments] == [
+        ("dynamic", 0.0, 4.0),  # The 1s gap before the first line is too short for the fast path
+        ("empty", 4.0, 10.0),
+        ("dynamic", 10.0, 10.3),
+        ("slow", 10.3, 29.7),
+        ("dynamic", 29.7, 33.0),
+        ("empty", 33.0, 40.0),
+        ("static", 40.0, 50.0),
+        ("empty", 50.0, 60.0),
+    ]
+
+
+def test_segment_offset_is_a_whole_number_of_frames(video_generator):
+    """A cut at frame 373 is offset by exactly 373 frames, not a rounded 12.433s that setpts truncates to 372."""
+    segment = RenderSegment(373 / 30, 400 / 30)
+    cmd = video_generator._build_segment_ffmpeg_command("test.ass", ["-f", "lavfi", "-i", "color"], segment, "chunk.mkv")
+
+    assert cmd[cmd.index("-vf") + 1].startswith("settb=1/30,setpts=PTS+373,")
+    assert cmd[cmd.index("-frames:v") + 1] == "27"
+
+
+def test_fast_path_segment_commands(video_generator):
+    background = ["-f", "lavfi", "-i", "color"]
+
+    slow = video_generator._build_segment_ffmpeg_command("test.ass", background, RenderSegment(10.3, 29.7, "slow"), "slow.mkv")
+    assert slow[slow.index("-vf") + 1] == "fps=10,settb=1/30,setpts=PTS+309,ass=test.ass,fps=30,setpts=PTS-STARTPTS"
+    assert "-threads" not in slow
+
+    # The 1fps grid is anchored at the span start (frame 372), not at 12.0s in song time
+    static = video_generator._build_segment_ffmpeg_command("test.ass", background, RenderSegment(12.4, 20.0, "static"), "static.mkv")
+    assert static[static.index("-vf") + 1] == "fps=1,settb=1/30,setpts=PTS+372,ass=test.ass,fps=30,setpts=PTS-STARTPTS"
+
+    empty = video_generator._build_segment_ffmpeg_command("test.ass", background, RenderSegment(0.0, 2.0, "empty"), "still.mkv")
+    assert "-vf" not in empty
+    assert empty[empty.index("-frames:v") + 1] == "60"
+
+
+@patch("subprocess.check_output")
+def test_generate_video_with_static_fast_path(mock_check_output, video_generator, tmp_path):
+    """Empty spans reuse one still clip; only the other segments are encoded with subtitles."""
+    os.makedirs(video_generator.output_dir, exist_ok=True)
+    os.makedirs(video_generator.cache_dir, exist_ok=True)
+    ass_path = tmp_path / "sections.ass"
+    ass_path.write_text(ASS_WITH_SECTIONS, encoding="utf-8")
+    audio_path = tmp_path / "test.mp3"
+    audio_path.touch()
+    video_generator.static_fast_path = True
+    concat_lists = []
+
+    def fake_ffmpeg(cmd, *args, **kwargs):
+        if cmd[0] == "ffprobe":
+            return json.dumps({"format": {"duration": "60.0"}})
+        if "concat" in cmd:
+            concat_lists.append(Path(cmd[cmd.index("-i") + 1]).read_text(encoding="utf-8").splitlines())
+        return ""
+
+    mock_check_output.side_effect = fake_ffmpeg
+
+    video_generator.generate_video(str(ass_path), str(audio_path), "test")
+
+    encodes = [c.args[0] for c in mock_check_output.call_args_list if c.args[0][0] == "ffmpeg" and "concat" not in c.args[0]]
+    assert len(encodes) == 7  # 3 dynamic, 1 slow, 1 static, and still clips of 60 and 30 frames
+    assert sum("-vf" not in cmd for cmd in encodes) == 2
+    entries = concat_lists[0]
+    assert len(entries) == 17
+    assert sum(entry.endswith("still_60.mkv'") for entry in entries) == 11
+    assert sum(entry.endswith("still_30.mkv'") for entry in entries) == 1
+
+
+def test_multi_output_ffmpeg_command(video_generator):
+    """Subtitles are drawn once, then split, scaled and encoded per target; each audio track is an input once."""
+    video_generator.background_image = None
+    targets = [
+        VideoOutputTarget(output_path="main.mkv"),
+        VideoOutputTarget(output_path="small.mp4", resolution=(640, 360), video_bitrate="1M", audio_codec="aac", audio_bitrate="192k"),
+        VideoOutputTarget(output_path="instrumental.mkv", audio_path="instrumental.flac"),
+    ]
+
+    cmd = video_generator._build_multi_output_ffmpeg_command("test.ass", "vocals.flac", targets)
+
+    assert [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-i"][1:] == ["vocals.flac", "instrumental.flac"]
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    assert graph == "[0:v]ass=test.ass,split=3[v0][v1][v2];[v1]scale=640:360[v1s]"
+    maps = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-map"]
+    assert maps == ["[v0]", "1:a:0", "[v1s]", "1:a:0", "[v2]", "2:a:0"]
+    small = cmd[cmd.index("[v1s]") : cmd.index("small.mp4")]
+    assert small[small.index("-b:v") + 1] == "1M"
+    assert small[small.index("-c:a") + 1] == "aac"
+    assert "+faststart" in small
+    assert cmd.count("-shortest") == 3
+
+
+@patch("subprocess.check_output")
+def test_generate_video_with_extra_targets(mock_check_output, video_generator, tmp_path):
+    """Extra targets are rendered by a single FFmpeg run instead of the segmented render."""
+    os.makedirs(video_generator.output_dir, exist_ok=True)
+    os.makedirs(video_generator.cache_dir, exist_ok=True)
+    ass_path = tmp_path / "sections.ass"
+    ass_path.write_text(ASS_WITH_SECTIONS, encoding="utf-8")
+    audio_path = tmp_path / "test.mp3"
+    audio_path.touch()
+    video_generator.static_fast_path = True
+    mock_check_output.return_value = ""
+
+    output_path = video_generator.generate_video(
+        str(ass_path), str(audio_path), "test", extra_targets=[VideoOutputTarget(output_path="small.mkv", resolution=(640, 360))]
+    )
+
+    assert output_path.endswith("test (With Vocals).mkv")
+    assert mock_check_output.call_count == 1
+    cmd = mock_check_output.call_args.args[0]
+    assert cmd[-1] == "small.mkv" and output_path in cmd
+
+
+def test_generate_video_extra_target_audio_must_exist(video_generator, tmp_path):
+    ass_path = tmp_path / "test.ass"
+    audio_path = tmp_path / "test.mp3"
+    ass_path.touch()
+    audio_path.touch()
+
+    with pytest.raises(FileNotFoundError):
+        video_generator.generate_video(
+            str(ass_path), str(audio_path), "test", extra_targets=[VideoOutputTarget(output_path="x.mkv", audio_path="missing.flac")]
+        )
+
+
+def _fake_ffmpeg_with_audio_codec(codec):
+    """check_output stand-in: ffprobe reports codec for the audio, ffmpeg writes its output file."""
+
+    def fake(cmd, *args, **kwargs):
+        if cmd[0] == "ffprobe":
+            return json.dumps({"streams": [{"codec_type": "audio", "codec_name": codec}]})
+        Path(cmd[-1]).touch()
+        return ""
+
+    return fake
+
+
+def test_invalid_audio_policy(tmp_path):
+    with pytest.raises(ValueError):
+        VideoGenerator(str(tmp_path), str(tmp_path), (640, 360), {}, audio_policy="copy")
+
+
+@patch("subprocess.check_output")
+def test_audio_is_copied_when_container_accepts_codec(mock_check_output, video_generator, tmp_path):
+    video_generator.audio_policy = "auto"
+    audio_path = tmp_path / "song.mp3"
+    audio_path.touch()
+    mock_check_output.side_effect = _fake_ffmpeg_with_audio_codec("mp3")
+
+    mkv, mp4 = video_generator._prepare_audio(str(audio_path), ["out.mkv", "out.mp4"])
+
+    assert mkv == mp4 == AudioHandling("copy", "mp3", str(audio_path))
+    assert mkv.codec_args == ["-c:a", "copy"]
+    assert mock_check_output.call_count == 1  # Only the probe
+    assert video_generator.audio_handling["out.mp4"].to_dict() == {"mode": "copy", "codec": "mp3"}
+
+
+@patch("subprocess.check_output")
+def test_audio_is_encoded_once_to_shared_intermediate(mock_check_output, video_generator, tmp_path):
+    video_generator.audio_policy = "auto"
+    os.makedirs(video_generator.cache_dir, exist_ok=True)
+    audio_path = tmp_path / "song.wav"
+    audio_path.write_bytes(b"RIFF")
+    mock_check_output.side_effect = _fake_ffmpeg_with_audio_codec("pcm_s16le")
+
+    first = video_generator._prepare_audio(str(audio_path), ["out.mkv", "preview.mp4"])
+    second = video_generator._prepare_audio(str(audio_path), ["other.mp4"])
+
+    assert {handling.mode for handling in first + second} == {"intermediate"}
+    assert first[0].codec == "aac"  # The only intermediate codec MP4 accepts
+    assert first[0].source_path == second[0].source_path and os.path.isfile(first[0].source_path)
+    encodes = [c.args[0] for c in mock_check_output.call_args_list if c.args[0][0] == "ffmpeg"]
+    assert len(encodes) == 1
+
+
+@patch("subprocess.check_output")
+def test_wav_audio_is_not_copied_into_mkv(mock_check_output, video_generator, tmp_path):
+    """Raw PCM would make the MKV far larger than the FLAC it used to contain."""
+    video_generator.audio_policy = "auto"
+    os.makedirs(video_generator.cache_dir, exist_ok=True)
+    audio_path = tmp_path / "song.wav"
+    audio_path.write_bytes(b"RIFF")
+    mock_check_output.side_effect = _fake_ffmpeg_with_audio_codec("pcm_s16le")
+
+    (mkv,) = video_generator._prepare_audio(str(audio_path), ["out.mkv"])
+
+    assert (mkv.mode, mkv.codec) == ("intermediate", "flac")
+    assert mkv.source_path.endswith(".flac")
+
+
+@patch("subprocess.check_output")
+def test_audio_is_encoded_in_render_when_codec_unknown(mock_check_output, video_generator):
+    video_generator.audio_policy = "auto"
+    mock_check_output.side_effect = subprocess.CalledProcessError(1, "ffprobe")
+
+    mkv, mp4 = video_generator._prepare_audio("song.mp3", ["out.mkv", "out.mp4"])
+
+    assert (mkv.mode, mkv.codec, mp4.codec) == ("encode", "flac", "aac")
+
+
+@patch("subprocess.check_output")
+def test_generate_video_copies_audio(mock_check_output, video_generator, tmp_path):
+    video_generator.audio_policy = "auto"
+    os.makedirs(video_generator.output_dir, exist_ok=True)
+    os.makedirs(video_generator.cache_dir, exist_ok=True)
+    ass_path = tmp_path / "test.ass"
+    audio_path = tmp_path / "test.flac"
+    ass_path.touch()
+    audio_path.touch()
+    mock_check_output.side_effect = _fake_ffmpeg_with_audio_codec("flac")
+
+    output_path = video_generator.generate_video(str(ass_path), str(audio_path), "test")
+
+    cmd = mock_check_output.call_args.args[0]
+    assert cmd[cmd.index("-c:a") + 1] == "copy"
+    assert video_generator.audio_handling[output_path].mode == "copy"
@@ -0,0 +1,106 @@
+import io
+import json
+from array import array
+from unittest.mock import Mock, patch
+
+import pytest
+
+from lyrics_transcriber.review.audio_proxy import ReviewAudio
+from lyrics_transcriber.utils.media_probe import MediaInfo
+
+
+@pytest.fixture
+def review_audio(tmp_path):
+    return ReviewAudio(cache_dir=str(tmp_path / "cache"))
+
+
+def _pcm(samples):
+    return array("h", samples).tobytes()
+
+
+def _mock_popen(pcm: bytes, returncode: int = 0):
+    process = Mock()
+    process.stdout = io.BytesIO(pcm)
+    process.stderr = io.BytesIO(b"")
+    process.wait.return_value = returncode
+    return process
+
+
+def test_needs_proxy(review_audio, tmp_path):
+    small_mp3 = tmp_path / "song.mp3"
+    small_mp3.write_bytes(b"x" * 100)
+    wav = tmp_path / "song.wav"
+    wav.write_bytes(b"x" * 100)
+
+    assert not review_audio.needs_proxy(str(small_mp3))
+    assert review_audio.needs_proxy(str(wav))
+    with patch.object(ReviewAudio, "DIRECT_MAX_BYTES", 10):
+        assert review_audio.needs_proxy(str(small_mp3))
+
+
+def test_needs_proxy_uses_probed_codec(review_audio, tmp_path):
+    alac = tmp_path / "song.m4a"
+    alac.write_bytes(b"x" * 100)
+
+    with patch("lyrics_transcriber.review.audio_proxy.MediaProbe.probe", return_value=MediaInfo(audio_codec="alac")):
+        assert review_audio.needs_proxy(str(alac))
+
+
+def test_stream_path_falls_back_to_original_until_proxy_exists(review_audio, tmp_path):
+    wav = tmp_path / "song.wav"
+    wav.write_bytes(b"x" * 100)
+
+    assert review_audio.get_stream_path(str(wav), "abc") == str(wav)
+
+    (tmp_path / "cache").mkdir()
+    proxy = review_audio.proxy_path("abc")
+    with open(proxy, "wb") as f:
+        f.write(b"mp3 data")
+    assert review_audio.get_stream_path(str(wav), "abc") == proxy
+
+
+def test_media_type():
+    assert ReviewAudio.media_type("song.mp3") == "audio/mpeg"
+    assert ReviewAudio.media_type("song.flac") == "audio/flac"
+    assert ReviewAudio.media_type("song.unknown") == "application/octet-stream"
+
+
+def test_compute_peaks(review_audio):
+    bucket = ReviewAudio.PEAKS_SAMPLE_RATE // ReviewAudio.PEAKS_PER_SECOND
+    samples = [100] * bucket + [-16384] * bucket + [0] * (bucket // 2)
+
+    with patch("subprocess.Popen", return_value=_mock_popen(_pcm(samples))) as popen:
+        result = review_audio._compute_peaks("song.wav")
+
+    assert popen.call_args.args[0][-3:] == ["-f", "s16le", "-"]
+    assert result["peaks"] == [0.003, 0.5, 0.0]
+    assert result["peaks_per_second"] == ReviewAudio.PEAKS_PER_SECOND
+    assert result["duration"] == round(3 / ReviewAudio.PEAKS_PER_SECOND, 3)
+
+
+def test_compute_peaks_decode_error(review_audio):
+    with patch("subprocess.Popen", return_value=_mock_popen(b"", returncode=1)):
+        with pytest.raises(RuntimeError):
+            review_audio._compute_peaks("song.wav")
+
+
+def test_prepare_creates_proxy_and_peaks_once(review_audio, tmp_path):
+    wav = tmp_path / "song.wav"
+    wav.write_bytes(b"x" * 100)
+
+    def fake_transcode(cmd, **kwargs):
+        with open(cmd[-1], "wb") as f:
+            f.write(b"mp3 data")
+        return ""
+
+    with patch("subprocess.check_output", side_effect=fake_transcode) as check_output, patch(
+        "subprocess.Popen", side_effect=lambda *args, **kwargs: _mock_popen(_pcm([1000] * 400))
+    ) as popen:
+        review_audio.prepare(str(wav), "abc")
+        review_audio.prepare(str(wav), "abc")
+
+    assert check_output.call_count == 1
+    assert popen.call_count == 1
+    assert review_audio.get_stream_path(str(wav), "abc") == review_audio.proxy_path("abc")
+    with open(review_audio.peaks_path("abc"), encoding="utf-8") as f:
+        assert json.load(f)["peaks"] == [0.031, 0.031]
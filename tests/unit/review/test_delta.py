@@ -0,0 +1,112 @@
+import pytest
+
+from lyrics_transcriber.review.delta import ReviewDocument, VersionConflictError
+
+
+def _document_data(segment_texts, corrections=None, metadata=None):
+    return {
+        "corrected_segments": [{"id": f"seg{i}", "text": text} for i, text in enumerate(segment_texts)],
+        "corrections": corrections or [],
+        "corrections_made": len(corrections or []),
+        "metadata": metadata or {"title": "Song"},
+    }
+
+
+def test_unchanged_update_keeps_version():
+    document = ReviewDocument()
+    assert document.update(_document_data(["a", "b"])) == 1
+    assert document.update(_document_data(["a", "b"])) == 1
+    assert document.update(_document_data(["a", "c"])) == 2
+
+
+def test_delta_without_known_base_is_full():
+    document = ReviewDocument()
+    data = _document_data(["a"])
+    document.update(data)
+
+    assert document.delta_since(None) == {"version": 1, "full": True, "data": data}
+    assert document.delta_since(99)["full"] is True
+
+
+def test_delta_contains_only_changed_items():
+    document = ReviewDocument()
+    document.update(_document_data(["a", "b", "c"]))
+    document.update(_document_data(["a", "B", "c"], metadata={"title": "Song"}))
+
+    delta = document.delta_since(1)
+
+    assert delta["version"] == 2 and delta["base_version"] == 1
+    assert list(delta["changes"]) == ["corrected_segments"]
+    segments = delta["changes"]["corrected_segments"]
+    assert segments["items"] == {"seg1": {"id": "seg1", "text": "B"}}
+    assert segments["removed"] == []
+    assert segments["order"] == ["seg0", "seg1", "seg2"]
+
+
+def test_delta_for_lists_without_ids_uses_content_keys():
+    document = ReviewDocument()
+    first = {"word_id": "w1", "corrected_word": "one"}
+    second = {"word_id": "w2", "corrected_word": "two"}
+    document.update(_document_data(["a"], corrections=[first]))
+    document.update(_document_data(["a"], corrections=[second]))
+
+    changes = document.delta_since(1)["changes"]
+
+    assert list(changes["corrections"]["items"].values()) == [second]
+    assert len(changes["corrections"]["removed"]) == 1
+    assert "corrections_made" not in changes
+
+
+def test_apply_patches_segments_by_id():
+    document = ReviewDocument()
+    document.update(_document_data(["a", "b", "c"]))
+
+    patched = document.apply(
+        1,
+        {
+            "corrected_segments": {"items": {"seg1": {"id": "seg1", "text": "edited"}, "seg3": {"id": "seg3", "text": "new"}}, "removed": ["seg0"]},
+            "corrections": {"replace": [{"word_id": "w1"}]},
+        },
+    )
+
+    assert [s["text"] for s in patched["corrected_segments"]] == ["edited", "c", "new"]
+    assert patched["corrections"] == [{"word_id": "w1"}]
+    # The stored document is not modified
+    assert [s["text"] for s in document.data["corrected_segments"]] == ["a", "b", "c"]
+
+
+def test_apply_respects_order():
+    document = ReviewDocument()
+    document.update(_document_data(["a", "b"]))
+
+    patched = document.apply(1, {"corrected_segments": {"order": ["seg1", "seg0"]}})
+
+    assert [s["text"] for s in patched["corrected_segments"]] == ["b", "a"]
+    with pytest.raises(ValueError):
+        document.apply(1, {"corrected_segments": {"order": ["seg1", "missing"]}})
+
+
+def test_apply_rejects_stale_base_version():
+    document = ReviewDocument()
+    document.update(_document_data(["a"]))
+    document.update(_document_data(["b"]))
+
+    with pytest.raises(VersionConflictError):
+        document.apply(1, {})
+
+
+def test_apply_rejects_item_patch_of_scalar_field():
+    document = ReviewDocument()
+    document.update(_document_data(["a"]))
+
+    with pytest.raises(ValueError):
+        document.apply(1, {"metadata": {"items": {}}})
+
+
+def test_old_versions_are_forgotten():
+    document = ReviewDocument(max_versions=2)
+    for text in ["a", "b", "c"]:
+        document.update(_document_data([text]))
+
+    assert document.delta_since(1)["full"] is True
+    assert "changes" in document.delta_since(2)
@@ -0,0 +1,170 @@
+import asyncio
+import threading
+
+import pytest
+
+from lyrics_transcriber.review.jobs import JobManager, JobStatus
+
+
+@pytest.fixture
+def manager():
+    manager = JobManager()
+    yield manager
+    manager.shutdown()
+
+
+def _blocking(release: threading.Event, started: threading.Event = None, result="done"):
+    def run(job):
+        if started:
+            started.set()
+        release.wait(5)
+        return result
+
+    return run
+
+
+def test_job_runs_and_reports_result(manager):
+    job = manager.submit("work", lambda job: {"value": 42})
+    job.future.result(timeout=5)
+
+    assert job.status == JobStatus.SUCCEEDED
+    assert job.progress == 1.0
+    assert manager.get(job.id).to_dict()["result"] == {"value": 42}
+
+
+def test_failed_job_keeps_exception(manager):
+    def fail(job):
+        raise ValueError("bad input")
+
+    job = manager.submit("work", fail)
+    job.future.result(timeout=5)
+
+    assert job.status == JobStatus.FAILED
+    assert job.error == "bad input"
+    assert isinstance(job.exception, ValueError)
+    assert "result" not in job.to_dict()
+
+
+def test_duplicate_requests_are_coalesced(manager):
+    release = threading.Event()
+    first = manager.submit("work", _blocking(release), key="same")
+    second = manager.submit("work", _blocking(release), key="same")
+    other = manager.submit("work", _blocking(release), key="other")
+    release.set()
+    other.future.result(timeout=5)
+
+    assert first is second
+    assert other is not first
+    # Once finished, the same key starts a new job
+    assert manager.submit("work", lambda job: None, key="same") is not first
+
+
+def test_supersede_cancels_queued_and_discards_running(manager):
+    release, started = threading.Event(), threading.Event()
+    running = manager.submit("preview", _blocking(release, started), key="a", supersede=True)
+    started.wait(5)
+    queued = manager.submit("preview", _blocking(release), key="b", supersede=True)
+    latest = manager.submit("preview", lambda job: "latest", key="c", supersede=True)
+    release.set()
+    latest.future.result(timeout=5)
+
+    assert running.status == JobStatus.CANCELLED
+    assert queued.status == JobStatus.CANCELLED
+    assert latest.status == JobStatus.SUCCEEDED
+    assert running.result is None
+
+
+def test_returning_to_a_superseded_request_starts_a_new_job(manager):
+    release, started = threading.Event(), threading.Event()
+    first_a = manager.submit("preview", _blocking(release, started), key="a", supersede=True)
+    started.wait(5)
+    b = manager.submit("preview", _blocking(release), key="b", supersede=True)
+    # The first "a" job is cancelled but still running; asking for "a" again must not reuse it
+    second_a = manager.submit("preview", lambda job: "a", key="a", supersede=True)
+    release.set()
+    second_a.future.result(timeout=5)
+
+    assert second_a is not first_a
+    assert second_a.status == JobStatus.SUCCEEDED
+    assert b.status == JobStatus.CANCELLED
+    assert first_a.status == JobStatus.CANCELLED
+
+
+def test_cancelled_job_may_stop_early(manager):
+    started = threading.Event()
+
+    def run(job):
+        job.metrics = {"fps": 30.0}
+        started.set()
+        job.cancel_event.wait(5)
+        raise RuntimeError("stopped")
+
+    job = manager.submit("preview", run)
+    started.wait(5)
+    manager.cancel(job.id)
+    job.future.result(timeout=5)
+
+    assert job.status == JobStatus.CANCELLED
+    assert job.error is None
+    assert job.to_dict()["metrics"] == {"fps": 30.0}
+
+
+def test_applied_result_can_no_longer_be_cancelled(manager):
+    applied = threading.Event()
+    release = threading.Event()
+    state = {}
+
+    def run(job):
+        manager.apply_result(job, lambda: state.update(value="new"))
+        applied.set()
+        release.wait(5)
+        return state["value"]
+
+    job = manager.submit("correction", run)
+    applied.wait(5)
+    manager.cancel(job.id)
+    release.set()
+    job.future.result(timeout=5)
+
+    assert job.status == JobStatus.SUCCEEDED
+    assert job.result == "new"
+
+
+def test_cancelled_job_result_is_not_applied(manager):
+    job = manager.submit("correction", lambda job: None)
+    job.future.result(timeout=5)
+    job.cancel_event.set()
+
+    assert manager.apply_result(job, lambda: pytest.fail("applied a cancelled job's result")) is False
+
+
+def test_cancel_unknown_job(manager):
+    assert manager.cancel("missing") is None
+    assert manager.get("missing") is None
+
+
+def test_wait_does_not_block_event_loop(manager):
+    release = threading.Event()
+    job = manager.submit("work", _blocking(release))
+
+    async def scenario():
+        waiter = asyncio.ensure_future(manager.wait(job))
+        # The loop keeps serving other coroutines while the job runs
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        release.set()
+        return await waiter
+
+    assert asyncio.run(scenario()).status == JobStatus.SUCCEEDED
+
+
+def test_finished_jobs_are_pruned():
+    manager = JobManager(max_finished_jobs=2)
+    jobs = [manager.submit("work", lambda job: None) for _ in range(3)]
+    for job in jobs:
+        job.future.result(timeout=5)
+    manager.submit("work", lambda job: None).future.result(timeout=5)
+    manager.submit("work", lambda job: None)
+    manager.shutdown()
+
+    assert manager.get(jobs[0].id) is None
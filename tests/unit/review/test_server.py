@@ -3,6 +3,7 @@ import asyncio
 import json
 import tempfile
 import os
+import threading
 from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from pathlib import Path
 from fastapi.testclient import TestClient
@@ -220,6 +221,36 @@ class TestReviewServer:
         
         assert exc_info.value.status_code == 404
 
+    def test_get_audio_range_request(self, review_server):
+        """Test that audio supports range requests and reports its real content type."""
+        client = TestClient(review_server.app)
+
+        response = client.get("/api/audio/test_hash", headers={"Range": "bytes=5-9"})
+
+        assert response.status_code == 206
+        assert response.content == b"audio"
+        assert response.headers["content-type"] == "audio/mpeg"
+
+    @pytest.mark.asyncio
+    async def test_get_audio_peaks(self, review_server):
+        """Test that waveform peaks are computed in the background and returned."""
+        peaks = {"peaks_per_second": 20, "duration": 0.1, "peaks": [0.1, 0.5]}
+        with patch.object(review_server.review_audio, "prepare") as prepare, patch.object(
+            review_server.review_audio, "get_peaks", side_effect=[None, peaks]
+        ):
+            result = await review_server.get_audio_peaks("test_hash")
+
+        assert result == peaks
+        prepare.assert_called_once_with(review_server.audio_filepath, "test_hash")
+
+    @pytest.mark.asyncio
+    async def test_get_audio_peaks_unknown_hash(self, review_server):
+        """Test waveform peaks for audio that isn't being reviewed."""
+        with pytest.raises(HTTPException) as exc_info:
+            await review_server.get_audio_peaks("other_hash")
+
+        assert exc_info.value.status_code == 404
+
     @pytest.mark.asyncio
     async def test_generate_preview_video_success(self, review_server, tmp_path):
         """Test successful preview video generation."""
@@ -275,6 +306,20 @@ class TestReviewServer:
             
             assert exc_info.value.status_code == 500
 
+    @pytest.mark.asyncio
+    async def test_generate_preview_video_for_segments(self, review_server):
+        """Test that preview window options are passed through and not applied as correction data."""
+        mock_result = {"status": "success", "preview_hash": "part123", "video_path": "/tmp/preview_part123.mp4", "preview_window": [8.0, 14.0]}
+
+        with patch('lyrics_transcriber.correction.operations.CorrectionOperations.generate_preview_video', return_value=mock_result) as mock_generate:
+            result = await review_server.generate_preview_video({"corrections": [], "preview_segment_ids": ["seg2"]})
+
+        kwargs = mock_generate.call_args.kwargs
+        assert kwargs["segment_ids"] == ["seg2"]
+        assert kwargs["time_window"] is None
+        assert "preview_segment_ids" not in kwargs["updated_data"]
+        assert result["preview_window"] == [8.0, 14.0]
+
     @pytest.mark.asyncio
     async def test_get_preview_video_success(self, review_server, tmp_path):
         """Test successful preview video retrieval."""
@@ -297,6 +342,102 @@ class TestReviewServer:
         
         assert exc_info.value.status_code == 404
 
+    @pytest.mark.asyncio
+    async def test_preview_video_job(self, review_server):
+        """Test rendering a preview through the background job API."""
+        mock_result = {"status": "success", "preview_hash": "abc123", "video_path": "/tmp/preview_abc123.mp4"}
+
+        with patch('lyrics_transcriber.correction.operations.CorrectionOperations.generate_preview_video', return_value=mock_result):
+            response = await review_server.submit_preview_video_job({"corrections": []})
+            assert response["status"] == "accepted"
+            job_id = response["job"]["id"]
+            await review_server.jobs.wait(review_server.jobs.get(job_id))
+
+        status = await review_server.get_job(job_id)
+        assert status["status"] == "succeeded"
+        assert status["result"]["preview_hash"] == "abc123"
+        assert review_server.preview_videos["abc123"] == "/tmp/preview_abc123.mp4"
+
+    @pytest.mark.asyncio
+    async def test_blocking_preview_requests_are_not_superseded(self, review_server):
+        """Test that a second blocking preview request doesn't cancel one a client is still waiting on."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def render(**kwargs):
+            preview_hash = kwargs["updated_data"]["corrections"][0]
+            if preview_hash == "first":
+                started.set()
+                release.wait(5)
+            return {"status": "success", "preview_hash": preview_hash, "video_path": f"/tmp/preview_{preview_hash}.mp4"}
+
+        with patch('lyrics_transcriber.correction.operations.CorrectionOperations.generate_preview_video', side_effect=render):
+            first = asyncio.ensure_future(review_server.generate_preview_video({"corrections": ["first"]}))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            second = asyncio.ensure_future(review_server.generate_preview_video({"corrections": ["second"]}))
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(first, second)
+
+        assert [result["preview_hash"] for result in results] == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_get_unknown_job(self, review_server):
+        """Test job status for an unknown job id."""
+        with pytest.raises(HTTPException) as exc_info:
+            await review_server.get_job("missing")
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_add_lyrics_invalid_input(self, review_server):
+        """Test that invalid lyrics input from the background job is reported as a 400."""
+        review_server.corrector = Mock()
+
+        with patch('lyrics_transcriber.correction.operations.CorrectionOperations.add_lyrics_source', side_effect=ValueError("Source name and lyrics text are required")):
+            with pytest.raises(HTTPException) as exc_info:
+                await review_server.add_lyrics({"source": "", "lyrics": ""})
+
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_update_handlers_replaces_correction_result(self, review_server, sample_correction_result):
+        """Test that a handler update runs in the background and replaces the current result."""
+        review_server.corrector = Mock()
+        updated = Mock(to_dict=Mock(return_value={"updated": True}))
+
+        with patch('lyrics_transcriber.correction.operations.CorrectionOperations.update_correction_handlers', return_value=updated) as update:
+            result = await review_server.update_handlers(["ExtendAnchorHandler"])
+
+        assert result == {"status": "success", "data": {"updated": True}}
+        assert review_server.correction_result is updated
+        assert update.call_args.kwargs["corrector"] is review_server.corrector
+
+    @pytest.mark.asyncio
+    async def test_handler_update_after_review_completed_is_discarded(self, review_server):
+        """Test that a correction job finishing after the review was completed doesn't replace the reviewed result."""
+        review_server.corrector = Mock()
+        started = threading.Event()
+        release = threading.Event()
+        updated = Mock(to_dict=Mock(return_value={"updated": True}))
+
+        def rerun(**kwargs):
+            started.set()
+            release.wait(5)
+            return updated
+
+        with patch('lyrics_transcriber.correction.operations.CorrectionOperations.update_correction_handlers', side_effect=rerun):
+            job = review_server._submit_update_handlers(["ExtendAnchorHandler"])
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            with patch.object(review_server, '_update_correction_result', side_effect=lambda base, data: base):
+                await review_server.complete_review({})
+            reviewed = review_server.correction_result
+            release.set()
+            await review_server.jobs.wait(job)
+
+        assert job.result == {}
+        assert review_server.correction_result is reviewed
+
     def test_create_lyrics_data_from_text(self, review_server):
         """Test creating LyricsData from text."""
         text = "Line one\nLine two\nLine three"
@@ -331,6 +472,65 @@ class TestReviewServer:
             assert found, f"Route {path} not found in {route_paths}"
 
 
+class TestReviewServerDelta:
+    """Tests for the versioned delta endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_correction_delta_after_handler_update(self, review_server, sample_correction_result, sample_segments):
+        """Test that a handler update returns only the changed segments."""
+        full = await review_server.get_correction_delta()
+        assert full["full"] is True
+        version = full["version"]
+        review_server.corrector = Mock()
+
+        edited = LyricsSegment(id="seg1", text="Hello there", words=sample_segments[0].words, start_time=0.0, end_time=2.0)
+        updated = CorrectionResult(**{**sample_correction_result.__dict__, "corrected_segments": [edited]})
+        with patch('lyrics_transcriber.correction.operations.CorrectionOperations.update_correction_handlers', return_value=updated):
+            result = await review_server.update_handlers_delta(["ExtendAnchorHandler"], since=version)
+
+        assert result["status"] == "success"
+        assert result["base_version"] == version
+        assert list(result["changes"]) == ["corrected_segments"]
+        assert result["changes"]["corrected_segments"]["items"]["seg1"]["text"] == "Hello there"
+
+    @pytest.mark.asyncio
+    async def test_complete_review_delta(self, review_server):
+        """Test completing the review with a patch of one segment."""
+        version = (await review_server.get_correction_delta())["version"]
+        segment = review_server.correction_result.corrected_segments[0].to_dict()
+        segment["text"] = "Hello everyone"
+
+        result = await review_server.complete_review_delta({"base_version": version, "changes": {"corrected_segments": {"items": {"seg1": segment}}}})
+
+        assert result["status"] == "success"
+        assert review_server.review_completed
+        assert review_server.correction_result.corrected_segments[0].text == "Hello everyone"
+
+    @pytest.mark.asyncio
+    async def test_complete_review_delta_conflict(self, review_server):
+        """Test that a patch against an outdated version is rejected."""
+        version = (await review_server.get_correction_delta())["version"]
+
+        with pytest.raises(HTTPException) as exc_info:
+            await review_server.complete_review_delta({"base_version": version - 1, "changes": {}})
+
+        assert exc_info.value.status_code == 409
+        assert not review_server.review_completed
+
+    def test_api_responses_are_compressed(self, review_server):
+        """Test that JSON API responses are gzip-compressed but media streams are not."""
+        client = TestClient(review_server.app)
+        review_server.correction_result.metadata["padding"] = "x" * 4096
+
+        response = client.get("/api/correction-data", headers={"Accept-Encoding": "gzip"})
+        audio = client.get("/api/audio/test_hash", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers.get("content-encoding") == "gzip"
+        assert response.json()["metadata"]["padding"] == "x" * 4096
+        assert audio.status_code == 200
+        assert "content-encoding" not in audio.headers
+
+
 class TestReviewServerIntegration:
     """Integration tests for ReviewServer."""
 
@@ -0,0 +1,117 @@
+import json
+import threading
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from lyrics_transcriber.core.config import OutputConfig
+from lyrics_transcriber.review.server import ReviewServer
+from lyrics_transcriber.review.service import ReviewService
+from lyrics_transcriber.review.serving import bind_socket
+from lyrics_transcriber.types import CorrectionResult, LyricsSegment, Word
+
+
+def _correction_result(text):
+    segment = LyricsSegment(
+        id="seg1",
+        text=text,
+        words=[Word(id="w1", text=text, start_time=0.0, end_time=1.0)],
+        start_time=0.0,
+        end_time=1.0,
+    )
+    return CorrectionResult(
+        original_segments=[segment],
+        corrected_segments=[segment],
+        corrections=[],
+        corrections_made=0,
+        confidence=1.0,
+        reference_lyrics={},
+        anchor_sequences=[],
+        gap_sequences=[],
+        resized_segments=[],
+        metadata={},
+        correction_steps=[],
+        word_id_map={},
+        segment_id_map={},
+    )
+
+
+@pytest.fixture
+def output_config(tmp_path):
+    return OutputConfig(output_styles_json="{}", cache_dir=str(tmp_path / "cache"), review_server_port=0)
+
+
+@pytest.fixture
+def service():
+    service = ReviewService(serve_frontend=False)
+    yield service
+    service.stop()
+
+
+def _post_json(url, payload):
+    request = urllib.request.Request(url, data=json.dumps(payload).encode("utf-8"), headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return json.loads(response.read())
+
+
+def test_bind_socket_falls_back_to_ephemeral_port():
+    busy = bind_socket("127.0.0.1", 0)
+    busy_port = busy.getsockname()[1]
+    try:
+        sock = bind_socket("127.0.0.1", busy_port)
+        assert sock.getsockname()[1] not in (busy_port, 0)
+        sock.close()
+    finally:
+        busy.close()
+
+
+def test_sessions_are_routed_by_id(service, output_config):
+    first = service.add_session(_correction_result("first"), output_config, audio_filepath=None)
+    second = service.add_session(_correction_result("second"), output_config, audio_filepath=None, session_id="song-2")
+    client = TestClient(service.app)
+
+    assert client.get(f"/sessions/{first.id}/api/correction-data").json()["corrected_segments"][0]["text"] == "first"
+    assert client.get("/sessions/song-2/api/correction-data").json()["corrected_segments"][0]["text"] == "second"
+    assert client.get("/sessions/missing/api/correction-data").status_code == 404
+    assert {session["id"] for session in client.get("/api/sessions").json()} == {first.id, second.id}
+
+    service.remove_session("song-2")
+    assert client.get("/sessions/song-2/api/ping").status_code == 404
+
+
+def test_duplicate_session_id_is_rejected(service, output_config):
+    service.add_session(_correction_result("first"), output_config, audio_filepath=None, session_id="song")
+    with pytest.raises(ValueError):
+        service.add_session(_correction_result("again"), output_config, audio_filepath=None, session_id="song")
+
+
+def test_wait_for_review_returns_completed_result(service, output_config):
+    session = service.add_session(_correction_result("before"), output_config, audio_filepath=None)
+    port = service.start()
+    assert port > 0
+    assert f"/sessions/{session.id}/api" in urllib.request.unquote(service.session_url(session.id))
+
+    updated = session.server.correction_result.to_dict()
+    updated["corrected_segments"][0]["text"] = "after"
+    result = _post_json(f"http://127.0.0.1:{port}/sessions/{session.id}/api/complete", updated)
+    reviewed = service.wait_for_review_blocking(session.id, timeout=10)
+
+    assert result == {"status": "success"}
+    assert reviewed.corrected_segments[0].text == "after"
+
+
+def test_review_server_start_waits_for_completion(output_config):
+    server = ReviewServer(_correction_result("before"), output_config, audio_filepath=None, logger=None, serve_frontend=False)
+    updated = server.correction_result.to_dict()
+    updated["corrected_segments"][0]["text"] = "after"
+
+    def complete_in_background(url):
+        base_url = url.split("?")[0]
+        threading.Thread(target=_post_json, args=(f"{base_url}/api/complete", updated), daemon=True).start()
+
+    with patch("webbrowser.open", side_effect=complete_in_background):
+        reviewed = server.start()
+
+    assert reviewed.corrected_segments[0].text == "after"
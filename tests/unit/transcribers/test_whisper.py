@@ -323,6 +323,12 @@ class TestWhisperTranscriber:
     def test_get_name(self, transcriber):
         assert transcriber.get_name() == "Whisper"
 
+    def test_cache_inputs_leave_out_credentials(self, transcriber):
+        inputs = transcriber.get_cache_inputs()
+
+        assert inputs == {"endpoint_id": transcriber.config.endpoint_id}
+        assert transcriber.config.runpod_api_key not in inputs.values()
+
     @patch("builtins.open", new_callable=mock_open, read_data="test data")
     def test_upload_and_get_link_new_file(self, mock_file, transcriber):
         """Test uploading a new file and getting its link"""
@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+import pytest
+
+from lyrics_transcriber.utils.audio_fingerprint import AudioFingerprint
+
+
+@pytest.fixture(autouse=True)
+def clear_memo():
+    AudioFingerprint.clear_memo()
+    yield
+    AudioFingerprint.clear_memo()
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    path = tmp_path / "song.wav"
+    path.write_bytes(b"RIFF" + bytes(range(256)) * 100)
+    return path
+
+
+def test_md5_matches_hashlib(audio_file):
+    assert AudioFingerprint.md5(audio_file) == hashlib.md5(audio_file.read_bytes()).hexdigest()
+
+
+def test_md5_uses_mmap_for_large_files(audio_file, monkeypatch):
+    monkeypatch.setattr(AudioFingerprint, "MMAP_THRESHOLD", 1)
+    assert AudioFingerprint.md5(audio_file) == hashlib.md5(audio_file.read_bytes()).hexdigest()
+
+
+def test_md5_handles_empty_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(AudioFingerprint, "MMAP_THRESHOLD", 0)
+    path = tmp_path / "empty.wav"
+    path.write_bytes(b"")
+    assert AudioFingerprint.md5(path) == hashlib.md5(b"").hexdigest()
+
+
+def test_unchanged_file_is_hashed_once(audio_file, mocker):
+    spy = mocker.spy(AudioFingerprint, "_hash_file")
+
+    first = AudioFingerprint.md5(audio_file)
+    second = AudioFingerprint.md5(str(audio_file))
+
+    assert first == second
+    assert spy.call_count == 1
+
+
+def test_modified_file_is_rehashed(audio_file):
+    first = AudioFingerprint.md5(audio_file)
+    audio_file.write_bytes(b"different content")
+
+    assert AudioFingerprint.md5(audio_file) != first
+
+
+def test_sidecar_reused_across_processes(audio_file, tmp_path, mocker):
+    cache_dir = tmp_path / "cache"
+    digest = AudioFingerprint.md5(audio_file, cache_dir=cache_dir)
+    assert os.path.exists(cache_dir / AudioFingerprint.SIDECAR_FILENAME)
+
+    # Simulate a new process: in-memory memo is empty, sidecar still on disk
+    AudioFingerprint.clear_memo()
+    spy = mocker.spy(AudioFingerprint, "_hash_file")
+
+    assert AudioFingerprint.md5(audio_file, cache_dir=cache_dir) == digest
+    assert spy.call_count == 0
+
+
+def test_sidecar_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(AudioFingerprint, "MAX_SIDECAR_ENTRIES", 2)
+    cache_dir = tmp_path / "cache"
+    for i in range(3):
+        path = tmp_path / f"{i}.wav"
+        path.write_bytes(str(i).encode())
+        AudioFingerprint.md5(path, cache_dir=cache_dir)
+
+    with open(cache_dir / AudioFingerprint.SIDECAR_FILENAME) as f:
+        entries = json.load(f)
+    assert len(entries) == 2
+    assert not any(key.startswith(os.path.realpath(tmp_path / "0.wav") + "|") for key in entries)
+
+
+def test_corrupted_sidecar_is_ignored(audio_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / AudioFingerprint.SIDECAR_FILENAME).write_text("{not json")
+
+    assert AudioFingerprint.md5(audio_file, cache_dir=cache_dir) == hashlib.md5(audio_file.read_bytes()).hexdigest()
+
+
+def test_memo_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(AudioFingerprint, "MAX_MEMO_ENTRIES", 2)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"{i}.wav"
+        path.write_bytes(str(i).encode())
+        paths.append(path)
+        AudioFingerprint.md5(path)
+
+    assert len(AudioFingerprint._memo) == 2
+    assert AudioFingerprint._stat_key(paths[0]) not in AudioFingerprint._memo
+
+
+def test_failed_sidecar_write_leaves_no_temp_file(audio_file, tmp_path, mocker):
+    cache_dir = tmp_path / "cache"
+    mocker.patch("os.replace", side_effect=OSError("disk full"))
+
+    AudioFingerprint.md5(audio_file, cache_dir=cache_dir)
+
+    assert os.listdir(cache_dir) == []
@@ -0,0 +1,87 @@
+import os
+from unittest.mock import Mock
+
+import pytest
+from PIL import Image
+
+from lyrics_transcriber.utils.image_cache import ImageAssetCache
+
+
+@pytest.fixture(autouse=True)
+def clear_memo():
+    ImageAssetCache.clear_memo()
+    yield
+    ImageAssetCache.clear_memo()
+
+
+@pytest.fixture
+def image_file(tmp_path):
+    path = tmp_path / "background.png"
+    Image.new("RGB", (40, 20), (200, 30, 30)).save(path)
+    return path
+
+
+def _grey(source_path):
+    return Image.open(source_path).convert("L")
+
+
+def test_key_depends_on_content_and_params(image_file, tmp_path):
+    copy = tmp_path / "copy.png"
+    copy.write_bytes(image_file.read_bytes())
+
+    key = ImageAssetCache.make_key(image_file, "fit", (640, 360))
+    assert ImageAssetCache.make_key(copy, "fit", (640, 360)) == key
+    assert ImageAssetCache.make_key(image_file, "fit", (1920, 1080)) != key
+    assert ImageAssetCache.make_key(image_file, "quantize", (640, 360)) != key
+
+    Image.new("RGB", (40, 20), (0, 0, 0)).save(copy)
+    assert ImageAssetCache.make_key(copy, "fit", (640, 360)) != key
+
+
+def test_get_path_creates_file_once(image_file, tmp_path):
+    create = Mock(side_effect=lambda source, dest: Image.open(source).resize((10, 5)).save(dest, format="PNG"))
+
+    first = ImageAssetCache.get_path(image_file, "fit", (10, 5), create, tmp_path / "cache")
+    second = ImageAssetCache.get_path(image_file, "fit", (10, 5), create, tmp_path / "cache")
+
+    assert first == second
+    assert create.call_count == 1
+    assert Image.open(first).size == (10, 5)
+    assert os.listdir(os.path.dirname(first)) == [os.path.basename(first)]  # No temporary files left behind
+
+
+def test_failed_create_leaves_no_file(image_file, tmp_path):
+    def create(source, dest):
+        with open(dest, "wb") as f:
+            f.write(b"partial")
+        raise RuntimeError("resize failed")
+
+    with pytest.raises(RuntimeError):
+        ImageAssetCache.get_path(image_file, "fit", (10, 5), create, tmp_path / "cache")
+
+    assert os.listdir(tmp_path / "cache" / ImageAssetCache.SUBDIR) == []
+
+
+def test_get_image_is_memoized_and_returns_copies(image_file):
+    create = Mock(side_effect=_grey)
+
+    first = ImageAssetCache.get_image(image_file, "grey", (), create)
+    first.paste(0, (0, 0, 40, 20))
+    second = ImageAssetCache.get_image(image_file, "grey", (), create)
+
+    assert create.call_count == 1
+    assert second.getpixel((0, 0)) != 0
+
+
+def test_get_image_is_restored_from_cache_dir(image_file, tmp_path):
+    palette_image = Image.open(image_file).quantize(colors=4)
+    ImageAssetCache.get_image(image_file, "quantize", (4,), lambda source: palette_image, cache_dir=tmp_path)
+    ImageAssetCache.clear_memo()
+    create = Mock()
+
+    restored = ImageAssetCache.get_image(image_file, "quantize", (4,), create, cache_dir=tmp_path)
+
+    create.assert_not_called()
+    assert restored.mode == "P"
+    assert restored.tobytes() == palette_image.tobytes()
+    assert restored.getpalette() == palette_image.getpalette()
@@ -0,0 +1,83 @@
+import json
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from lyrics_transcriber.utils.media_probe import MediaInfo, MediaProbe
+
+FFPROBE_OUTPUT = json.dumps(
+    {
+        "streams": [
+            {"codec_type": "video", "codec_name": "mjpeg", "width": 600, "height": 600},
+            {"codec_type": "audio", "codec_name": "flac", "sample_rate": "44100", "channels": 2},
+        ],
+        "format": {"duration": "187.25"},
+    }
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_memo():
+    MediaProbe.clear_memo()
+    yield
+    MediaProbe.clear_memo()
+
+
+@pytest.fixture
+def media_file(tmp_path):
+    path = tmp_path / "song.flac"
+    path.write_bytes(b"fLaC" + bytes(100))
+    return path
+
+
+@patch("subprocess.check_output", return_value=FFPROBE_OUTPUT)
+def test_probe_parses_streams(mock_check_output, media_file):
+    info = MediaProbe.probe(media_file)
+
+    assert info == MediaInfo(duration=187.25, audio_codec="flac", sample_rate=44100, channels=2, video_codec="mjpeg", width=600, height=600)
+
+
+@patch("subprocess.check_output", return_value=json.dumps({"streams": [{"codec_type": "video", "codec_name": "png", "width": 10, "height": 5}], "format": {"duration": "N/A"}}))
+def test_probe_image_has_no_duration(mock_check_output, media_file):
+    info = MediaProbe.probe(media_file)
+
+    assert (info.duration, info.audio_codec, info.width, info.height) == (None, None, 10, 5)
+
+
+@patch("subprocess.check_output", return_value=FFPROBE_OUTPUT)
+def test_unchanged_file_is_probed_once(mock_check_output, media_file):
+    assert MediaProbe.probe(media_file) == MediaProbe.probe(str(media_file))
+    assert mock_check_output.call_count == 1
+
+    media_file.write_bytes(b"fLaC" + bytes(200))
+    MediaProbe.probe(media_file)
+    assert mock_check_output.call_count == 2
+
+
+@patch("subprocess.check_output", return_value=FFPROBE_OUTPUT)
+def test_sidecar_is_reused_across_processes(mock_check_output, media_file, tmp_path):
+    first = MediaProbe.probe(media_file, cache_dir=tmp_path / "cache")
+    MediaProbe.clear_memo()
+
+    assert MediaProbe.probe(media_file, cache_dir=tmp_path / "cache") == first
+    assert mock_check_output.call_count == 1
+
+
+@patch("subprocess.check_output", side_effect=subprocess.CalledProcessError(1, "ffprobe"))
+def test_failed_probe_is_not_stored(mock_check_output, media_file, tmp_path):
+    assert MediaProbe.probe(media_file, cache_dir=tmp_path) is None
+    assert MediaProbe.probe(media_file, cache_dir=tmp_path) is None
+
+    assert mock_check_output.call_count == 1
+    assert not (tmp_path / MediaProbe.SIDECAR_FILENAME).exists()
+
+
+@patch("subprocess.check_output", return_value=FFPROBE_OUTPUT)
+def test_failed_sidecar_write_leaves_no_temp_file(mock_check_output, media_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+
+    with patch("os.replace", side_effect=OSError("disk full")):
+        assert MediaProbe.probe(media_file, cache_dir=cache_dir) is not None
+
+    assert list(cache_dir.iterdir()) == []
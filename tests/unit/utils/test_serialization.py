@@ -0,0 +1,136 @@
+import json
+import pytest
+
+from lyrics_transcriber.types import (
+    CorrectionResult,
+    CorrectionStep,
+    LyricsData,
+    LyricsMetadata,
+    TranscriptionData,
+    WordCorrection,
+    is_compact_dict,
+)
+from lyrics_transcriber.utils import serialization
+from tests.test_helpers import create_test_segment, create_test_word
+
+
+@pytest.fixture
+def correction_result():
+    words = [create_test_word(text=t, start_time=i, end_time=i + 0.5) for i, t in enumerate(["hello", "wrold", "again"])]
+    original = create_test_segment(text="hello wrold again", words=words)
+    fixed_word = create_test_word(text="world", start_time=1, end_time=1.5, confidence=1.0, created_during_correction=True)
+    corrected = create_test_segment(
+        segment_id=original.id, text="hello world again", words=[words[0], fixed_word, words[2]], start_time=0, end_time=2.5
+    )
+    correction = WordCorrection(
+        original_word="wrold",
+        corrected_word="world",
+        original_position=1,
+        source="genius",
+        reason="test",
+        word_id=words[1].id,
+        corrected_word_id=fixed_word.id,
+    )
+    step = CorrectionStep(
+        handler_name="TestHandler",
+        affected_word_ids=[words[1].id],
+        affected_segment_ids=[original.id],
+        corrections=[correction],
+        segments_before=[original],
+        segments_after=[corrected],
+    )
+    reference = LyricsData(
+        segments=[create_test_segment(text="hello world again")],
+        metadata=LyricsMetadata(source="genius", track_name="Song", artist_names="Artist"),
+        source="genius",
+    )
+    return CorrectionResult(
+        original_segments=[original],
+        corrected_segments=[corrected],
+        corrections=[correction],
+        corrections_made=1,
+        confidence=0.66,
+        reference_lyrics={"genius": reference},
+        anchor_sequences=[],
+        gap_sequences=[],
+        resized_segments=[corrected],
+        metadata={"enabled_handlers": ["TestHandler"]},
+        correction_steps=[step, step],
+        word_id_map={words[1].id: fixed_word.id},
+        segment_id_map={original.id: original.id},
+    )
+
+
+def test_correction_result_compact_roundtrip(correction_result):
+    compact = correction_result.to_compact_dict()
+
+    assert is_compact_dict(compact)
+    restored = CorrectionResult.from_dict(serialization.loads(serialization.dumps(compact)))
+    assert restored.to_dict() == correction_result.to_dict()
+
+
+def test_compact_format_deduplicates_segments(correction_result):
+    compact = correction_result.to_compact_dict()
+
+    # original + corrected + reference; corrected is shared by resized_segments and every step snapshot
+    assert len(compact["segments"]) == 3
+    assert compact["correction_steps"][0]["segments_after"] == compact["corrected_segments"]
+    assert len(serialization.dumps(compact)) < len(json.dumps(correction_result.to_dict()))
+
+
+def test_compact_load_does_not_alias_segments(correction_result):
+    restored = CorrectionResult.from_dict(correction_result.to_compact_dict())
+
+    restored.corrected_segments[0].words[0].text = "changed"
+    assert restored.resized_segments[0].words[0].text == "hello"
+
+
+def test_verbose_format_still_loads(correction_result):
+    verbose = json.loads(json.dumps(correction_result.to_dict(), indent=2))
+
+    assert not is_compact_dict(verbose)
+    assert CorrectionResult.from_dict(verbose).to_dict() == correction_result.to_dict()
+
+
+def test_newer_compact_version_is_rejected(correction_result):
+    compact = correction_result.to_compact_dict()
+    compact["version"] = 99
+
+    with pytest.raises(ValueError):
+        CorrectionResult.from_dict(compact)
+
+
+def test_transcription_data_compact_roundtrip():
+    segment = create_test_segment(text="one two")
+    data = TranscriptionData(segments=[segment], words=segment.words, text="one two", source="test", metadata={"language": "en"})
+
+    compact = data.to_compact_dict()
+
+    assert len(compact["words"]) == 2
+    assert TranscriptionData.from_dict(compact).to_dict() == data.to_dict()
+    assert TranscriptionData.from_dict(data.to_dict()).to_dict() == data.to_dict()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dump_and_load_file(tmp_path, monkeypatch, use_orjson):
+    if use_orjson and not serialization.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", use_orjson)
+    path = tmp_path / "data.json"
+
+    serialization.dump_file({"text": "café", "values": [1, 2.5, None]}, path)
+
+    assert b"\n" not in path.read_bytes()
+    assert serialization.load_file(path) == {"text": "café", "values": [1, 2.5, None]}
+
+
+def test_load_file_reads_pretty_printed_json(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({"a": [1, 2]}, indent=2))
+
+    assert serialization.load_file(path) == {"a": [1, 2]}
+
+
+def test_loads_raises_json_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        serialization.loads(b"{not json")
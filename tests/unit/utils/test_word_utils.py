@@ -0,0 +1,83 @@
+import multiprocessing
+import pytest
+
+from lyrics_transcriber.utils.word_utils import WordUtils
+
+
+def _generate_in_child(queue):
+    queue.put([WordUtils.generate_id() for _ in range(3)])
+
+
+def test_ids_are_unique_without_scope():
+    ids = [WordUtils.generate_id() for _ in range(5000)]
+    assert len(set(ids)) == len(ids)
+
+
+def test_scoped_ids_are_deterministic():
+    with WordUtils.id_scope("whisper:abc"):
+        first = [WordUtils.generate_id() for _ in range(100)]
+    with WordUtils.id_scope("whisper:abc"):
+        second = [WordUtils.generate_id() for _ in range(100)]
+
+    assert first == second
+    assert len(set(first)) == 100
+    assert all(len(word_id) == 10 for word_id in first[:36**2])
+
+
+def test_different_seeds_give_different_ids():
+    with WordUtils.id_scope("genius:artist:title"):
+        genius = {WordUtils.generate_id() for _ in range(100)}
+    with WordUtils.id_scope("spotify:artist:title"):
+        spotify = {WordUtils.generate_id() for _ in range(100)}
+
+    assert not genius & spotify
+
+
+def test_nested_scope_restores_outer_scope():
+    with WordUtils.id_scope("outer"):
+        first = WordUtils.generate_id()
+        with WordUtils.id_scope("inner"):
+            WordUtils.generate_id()
+        after_inner = WordUtils.generate_id()
+    with WordUtils.id_scope("outer"):
+        expected = [WordUtils.generate_id(), WordUtils.generate_id()]
+
+    assert [first, after_inner] == expected
+
+
+def test_keyed_ids_depend_only_on_scope_and_key():
+    with WordUtils.id_scope("doc"):
+        WordUtils.generate_id()
+        first = WordUtils.generate_id(key="anchor:3:10")
+    with WordUtils.id_scope("doc"):
+        second = WordUtils.generate_id(key="anchor:3:10")
+        other = WordUtils.generate_id(key="anchor:3:11")
+
+    assert first == second
+    assert first != other
+    assert len(first) == 8
+
+
+def test_keyed_ids_never_share_a_length_with_sequential_ids():
+    with WordUtils.id_scope("large doc"):
+        sequential = [WordUtils.generate_id() for _ in range(36**3 + 1)]
+
+    assert min(len(word_id) for word_id in sequential) > WordUtils._key_id_length
+
+
+def test_no_global_registry_of_issued_ids():
+    assert not hasattr(WordUtils, "_used_ids")
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="fork start method unavailable")
+def test_forked_process_does_not_repeat_parent_ids():
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    with WordUtils.id_scope("parent"):
+        process = context.Process(target=_generate_in_child, args=(queue,))
+        process.start()
+        child_ids = queue.get(timeout=30)
+        process.join()
+        parent_ids = [WordUtils.generate_id() for _ in range(3)]
+
+    assert not set(child_ids) & set(parent_ids)